@@ -0,0 +1,227 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from typing_extensions import TypedDict
+
+INDEX_FILE_NAME = ".agbench_index.json"
+INDEX_VERSION = 1
+
+# Logs are read backwards in blocks of this size, since the markers are printed at the end of a run.
+TAIL_BLOCK_SIZE = 1024 * 1024
+# Blocks overlap by this many bytes, so that a pattern spanning two blocks is still found.
+PATTERN_OVERLAP = 4096
+
+ScorerFunc = Callable[[str], Optional[bool]]
+TimerFunc = Callable[[str], Optional[float]]
+# Returns both the score and the time of an instance
+ScoreFunc = Callable[[str], Tuple[Optional[bool], Optional[float]]]
+
+
+class ResultsIndexEntry(TypedDict):
+    task_id: str
+    trial: int
+    success: Optional[bool]
+    time: Optional[float]
+    mtime_ns: Optional[int]
+    size: Optional[int]
+
+
+def scan_console_log(
+    console_log: str,
+    success_strings: Sequence[str],
+    completed_strings: Sequence[str],
+    timer_regex: str,
+) -> Tuple[Optional[bool], Optional[float]]:
+    """
+    Score and time a run from its console log, in a single pass that starts from the end of the file.
+
+    Returns: True if any success string is found, False if any completed string is found but no success string,
+    and None otherwise; and the run time from the last match of the timer regex, or None.
+    The pass stops as soon as a success string and the run time are found.
+    """
+    success_patterns = [s.encode("utf-8") for s in success_strings]
+    completed_patterns = [s.encode("utf-8") for s in completed_strings]
+    timer_pattern = re.compile(timer_regex.encode("utf-8"))
+
+    succeeded = False
+    completed = False
+    run_time: Optional[float] = None
+
+    with open(console_log, "rb") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        overlap = b""
+        while end > 0:
+            start = max(0, end - TAIL_BLOCK_SIZE)
+            fh.seek(start)
+            block = fh.read(end - start) + overlap
+            end = start
+
+            if not succeeded:
+                succeeded = any(p in block for p in success_patterns)
+            if not succeeded and not completed:
+                completed = any(p in block for p in completed_patterns)
+            if run_time is None:
+                matches = list(timer_pattern.finditer(block))
+                if matches:
+                    run_time = float(matches[-1].group(1))
+
+            if succeeded and run_time is not None:
+                break
+            overlap = block[:PATTERN_OVERLAP]
+
+    if succeeded:
+        return True, run_time
+    elif completed:
+        return False, run_time
+    else:
+        return None, run_time
+
+
+def scorer_signature(*funcs: Callable[..., Any]) -> str:
+    """
+    A digest of the names and source files of the functions used to score results.
+
+    Results computed by different functions, or by edited ones, are not reused from the index.
+    """
+    digest = hashlib.sha256()
+    for func in funcs:
+        digest.update(f"{func.__module__}.{func.__qualname__}".encode("utf-8"))
+        try:
+            source_file = inspect.getsourcefile(func)
+        except TypeError:
+            source_file = None
+        if source_file is not None and os.path.isfile(source_file):
+            with open(source_file, "rb") as fh:
+                digest.update(fh.read())
+    return digest.hexdigest()
+
+
+def score_instance(scorer: ScorerFunc, timer: TimerFunc, instance_dir: str) -> Tuple[Optional[bool], Optional[float]]:
+    return scorer(instance_dir), timer(instance_dir)
+
+
+class ResultsIndex:
+    """
+    A persisted index of the scores and run times of all instances of a run.
+
+    Entries are keyed by the instance folder, and record the modification time and size of its console log.
+    When the index is refreshed, only instances whose console log changed are scored again with `score`, and
+    they are scored in `jobs` parallel processes. The index is saved as JSON at `index_path`, or not saved if it
+    is None. It is discarded if it was saved with a different `signature` (see :func:`scorer_signature`).
+    """
+
+    def __init__(
+        self,
+        runlogs: str,
+        score: ScoreFunc,
+        signature: str,
+        index_path: Optional[str] = None,
+        jobs: int = 1,
+    ) -> None:
+        self.runlogs = runlogs
+        self.score = score
+        self.index_path = index_path
+        self.jobs = max(1, jobs)
+        self.signature = signature
+        self.entries: Dict[str, ResultsIndexEntry] = {}
+        self.scanned = 0
+        self.reused = 0
+
+        if index_path is not None and os.path.isfile(index_path):
+            try:
+                with open(index_path, "rt") as fh:
+                    data = json.load(fh)
+                if data.get("version") == INDEX_VERSION and data.get("signature") == self.signature:
+                    self.entries = data["entries"]
+            except (OSError, ValueError, KeyError):
+                sys.stderr.write(f"Ignoring unreadable results index '{index_path}'.\n")
+
+    def refresh(self, instances: List[Tuple[str, int]]) -> Dict[str, ResultsIndexEntry]:
+        """
+        Bring the index up to date for the given (task id, trial) instances, and save it.
+
+        Returns: the entries of the instances, keyed by "task_id/trial". Entries of other instances are dropped.
+        """
+        entries: Dict[str, ResultsIndexEntry] = {}
+        stale: List[Tuple[str, ResultsIndexEntry]] = []
+        for task_id, trial in instances:
+            key = f"{task_id}/{trial}"
+            try:
+                st = os.stat(os.path.join(self.runlogs, task_id, str(trial), "console_log.txt"))
+                mtime_ns: Optional[int] = st.st_mtime_ns
+                size: Optional[int] = st.st_size
+            except FileNotFoundError:
+                mtime_ns, size = None, None
+
+            entry = self.entries.get(key)
+            # Instances without a console log are always scored, since the scorer may use other files.
+            if entry is not None and mtime_ns is not None and (entry["mtime_ns"], entry["size"]) == (mtime_ns, size):
+                self.reused += 1
+                entries[key] = entry
+            else:
+                entry = {
+                    "task_id": task_id,
+                    "trial": trial,
+                    "success": None,
+                    "time": None,
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                }
+                stale.append((key, entry))
+                entries[key] = entry
+
+        instance_dirs = [os.path.join(self.runlogs, entry["task_id"], str(entry["trial"])) for _, entry in stale]
+        for (_, entry), (success, run_time) in zip(stale, self._score(instance_dirs)):
+            entry["success"] = success
+            entry["time"] = run_time
+        self.scanned += len(stale)
+
+        changed = len(stale) > 0 or len(entries) != len(self.entries)
+        self.entries = entries
+        if changed:
+            self.save()
+        return entries
+
+    def _score(self, instance_dirs: List[str]) -> List[Tuple[Optional[bool], Optional[float]]]:
+        if self.jobs > 1 and len(instance_dirs) > 1:
+            try:
+                # Custom scorers must be importable by the worker processes.
+                pickle.dumps(self.score)
+                with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                    chunksize = max(1, len(instance_dirs) // (self.jobs * 4))
+                    return list(executor.map(self.score, instance_dirs, chunksize=chunksize))
+            except (pickle.PicklingError, AttributeError, TypeError, BrokenProcessPool):
+                sys.stderr.write("Could not score the results in parallel. Scoring them one at a time.\n")
+        return [self.score(instance_dir) for instance_dir in instance_dirs]
+
+    def save(self) -> None:
+        if self.index_path is None:
+            return
+        data = {"version": INDEX_VERSION, "signature": self.signature, "entries": self.entries}
+        # Write to a temporary file first, so an interrupted save does not corrupt the index.
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "wt") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_path, self.index_path)
+
+    def export(self, path: str) -> None:
+        """
+        Export the index as a table, in Parquet format if the path ends with ".parquet", and as JSON otherwise.
+        Parquet export requires pyarrow or fastparquet.
+        """
+        df = pd.DataFrame(
+            list(self.entries.values()), columns=["task_id", "trial", "success", "time", "mtime_ns", "size"]
+        )
+        if path.lower().endswith(".parquet"):
+            df.to_parquet(path, index=False)
+        else:
+            df.to_json(path, orient="records", indent=2)
@@ -12,7 +12,7 @@
 import sys
 import time
 import traceback
-from multiprocessing import Pool
+from multiprocessing import Pool, current_process
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import docker
@@ -45,6 +45,9 @@
 DEFAULT_ENV_FILE_YAML = "ENV.yaml"
 DEFAULT_CONFIG_YAML = "config.yaml"
 
+# Printed at the end of runs that finished, whether they succeeded, failed, or timed out
+RUN_COMPLETE_STRINGS = ["RUN.SH COMPLETE !#!#", "Docker timed out."]
+
 # Get a random number generator for subsampling
 subsample_rng = random.Random(425)
 
@@ -56,6 +59,13 @@ class ScenarioInstance(TypedDict):
     values: Dict[str, Dict[str, str]]
 
 
+class RunUnit(TypedDict):
+    scenario_name: str
+    scenario_dir: str
+    instance: ScenarioInstance
+    results_repetition: str
+
+
 def run_scenarios(
     scenario: str,
     n_repeats: int,
@@ -66,16 +76,52 @@ def run_scenarios(
     results_dir: str = "Results",
     subsample: Union[None, int, float] = None,
     env_file: Union[None, str] = None,
+    parallel: int = 1,
+    time_budget: Optional[float] = None,
 ) -> None:
     """
     Run a set agbench scenarios a given number of times.
 
+    Each repetition of each scenario instance is a unit of work. Units whose results folder is already
+    complete are skipped, so an interrupted run can be resumed by running the same command again.
+
     Args:
         scenario (path):    The file or folder containing the scenario JSONL instances. If given a folder, then
                             all JSONL files in the folder will be loaded and run.
         n_repeats (int):    The number of times each scenario instance will be repeated
         is_native (bool):   True if the scenario should be run locally rather than in Docker (proceed with caution!)
         results_dir (path): The folder were results will be saved.
+        parallel (int):     The number of worker processes. Workers take the next unit from a shared queue
+                            as soon as they finish one, so slow units do not hold up the others.
+        time_budget (float): If set, the number of seconds after which no new units are started.
+                            Units that were not started are run when the command is run again.
+    """
+    units = collect_run_units(scenario, n_repeats, results_dir, subsample)
+    deadline = None if time_budget is None else time.time() + time_budget
+    progress = RunProgress(len(units))
+
+    if parallel > 1 and len(units) > 1:
+        # Token providers can not be sent to the worker processes
+        worker_args = [(unit, is_native, config_file, None, docker_image, env_file, deadline) for unit in units]
+        with Pool(processes=min(parallel, len(units))) as pool:
+            # With a chunksize of 1, each idle worker pulls the next unit from the pool's task queue
+            for result in pool.imap_unordered(_run_unit_star, worker_args, chunksize=1):
+                progress.update(*result)
+    else:
+        for unit in units:
+            result = run_unit(unit, is_native, config_file, token_provider, docker_image, env_file, deadline)
+            progress.update(*result)
+
+    progress.finish()
+
+
+def collect_run_units(
+    scenario: str, n_repeats: int, results_dir: str = "Results", subsample: Union[None, int, float] = None
+) -> List[RunUnit]:
+    """
+    Read the scenario instances, and return the repetitions that still need to run.
+
+    Repetitions with a complete results folder are skipped. Folders left over from interrupted runs are removed.
     """
 
     files: List[str] = []
@@ -97,7 +143,7 @@ def run_scenarios(
     else:
         raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), scenario)
 
-    # Run all the scenario files
+    units: List[RunUnit] = []
     for scenario_file in files:
         scenario_name: Optional[str] = None
         scenario_dir: Optional[str] = None
@@ -116,7 +162,7 @@ def run_scenarios(
             file_handle = open(scenario_file, "rt")
 
         # Read all the lines, then subsample if needed
-        lines = [line for line in file_handle]
+        lines = [line for line in file_handle if line.strip() != ""]
         if subsample is not None:
             # How many lines are we sampling
             n = 0
@@ -132,51 +178,151 @@ def run_scenarios(
         for line in lines:
             instance = json.loads(line)
 
-            # Create a folder to store the results
-            # Results base
-            if not os.path.isdir(results_dir):
-                os.mkdir(results_dir)
-
-            # Results for the scenario
-            results_scenario = os.path.join(results_dir, scenario_name)
-            if not os.path.isdir(results_scenario):
-                os.mkdir(results_scenario)
-
-            # Results for the instance
-            results_instance = os.path.join(results_scenario, instance["id"])
-            if not os.path.isdir(results_instance):
-                os.mkdir(results_instance)
-
             # Results for the repeats
             for i in range(0, n_repeats):
-                results_repetition = os.path.join(results_instance, str(i))
+                results_repetition = os.path.join(results_dir, scenario_name, instance["id"], str(i))
 
                 # Skip it if it already exists
                 if os.path.isdir(results_repetition):
-                    print(f"Found folder {results_repetition} ... Skipping.")
-                    continue
-                print(f"Running scenario {results_repetition}")
-
-                # Expand the scenario
-                expand_scenario(scenario_dir, instance, results_repetition, config_file)
-
-                # Prepare the environment (keys/values that need to be added)
-                env = get_scenario_env(token_provider=token_provider, env_file=env_file)
-
-                # Run the scenario
-                if is_native:
-                    run_scenario_natively(results_repetition, env)
-                else:
-                    run_scenario_in_docker(
-                        results_repetition,
-                        env,
-                        docker_image=docker_image,
-                    )
+                    if is_run_complete(results_repetition):
+                        print(f"Found folder {results_repetition} ... Skipping.")
+                        continue
+                    print(f"Found incomplete folder {results_repetition} ... Removing.")
+                    shutil.rmtree(results_repetition)
+
+                units.append(
+                    {
+                        "scenario_name": scenario_name,
+                        "scenario_dir": scenario_dir,
+                        "instance": instance,
+                        "results_repetition": results_repetition,
+                    }
+                )
 
         # Close regular files
         if scenario_file != "-":
             file_handle.close()
 
+    return units
+
+
+def is_run_complete(results_repetition: str) -> bool:
+    """
+    Returns True if the results folder holds a run that ran to the end, whether or not it succeeded or timed out.
+    """
+    console_log = os.path.join(results_repetition, "console_log.txt")
+    if not os.path.isfile(console_log):
+        return False
+    with open(console_log, "rt", encoding="utf-8", errors="replace") as fh:
+        content = fh.read()
+    return any(s in content for s in RUN_COMPLETE_STRINGS)
+
+
+def run_unit(
+    unit: RunUnit,
+    is_native: bool,
+    config_file: Union[None, str],
+    token_provider: Optional[Callable[[], str]],
+    docker_image: Optional[str] = None,
+    env_file: Union[None, str] = None,
+    deadline: Optional[float] = None,
+) -> Tuple[str, str, str, float]:
+    """
+    Run one repetition of a scenario instance.
+
+    Returns: the name of the process that ran it, the results folder, the status ("done", "failed", or
+    "skipped" if the deadline passed before it started), and the run time in seconds.
+    """
+    worker = current_process().name
+    results_repetition = unit["results_repetition"]
+    if deadline is not None and time.time() >= deadline:
+        return worker, results_repetition, "skipped", 0.0
+
+    start_time = time.time()
+    print(f"Running scenario {results_repetition}")
+
+    # Create the folders for the scenario and instance
+    mkdir_p(os.path.dirname(results_repetition))
+
+    try:
+        # Expand the scenario
+        expand_scenario(unit["scenario_dir"], unit["instance"], results_repetition, config_file)
+
+        # Prepare the environment (keys/values that need to be added)
+        env = get_scenario_env(token_provider=token_provider, env_file=env_file)
+
+        # Run the scenario
+        if is_native:
+            run_scenario_natively(results_repetition, env)
+        else:
+            run_scenario_in_docker(
+                results_repetition,
+                env,
+                docker_image=docker_image,
+            )
+    except Exception:
+        if worker == "MainProcess":
+            raise
+        # Keep the other workers going. The folder is incomplete, so the unit runs again on the next invocation.
+        print(f"Scenario {results_repetition} failed:\n{traceback.format_exc()}")
+        return worker, results_repetition, "failed", time.time() - start_time
+
+    return worker, results_repetition, "done", time.time() - start_time
+
+
+def _run_unit_star(args: Tuple[Any, ...]) -> Tuple[str, str, str, float]:
+    return run_unit(*args)
+
+
+class RunProgress:
+    """
+    Prints the progress of a run, per worker and overall, with an estimate of the remaining time.
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.start_time = time.time()
+        self.finished = 0
+        self.failed = 0
+        self.skipped = 0
+        self.worker_counts: Dict[str, int] = {}
+
+    def update(self, worker: str, results_repetition: str, status: str, elapsed: float) -> None:
+        if status == "skipped":
+            self.skipped += 1
+            return
+        self.finished += 1
+        if status == "failed":
+            self.failed += 1
+        self.worker_counts[worker] = self.worker_counts.get(worker, 0) + 1
+
+        run_time = time.time() - self.start_time
+        remaining = self.total - self.finished - self.skipped
+        eta = run_time / self.finished * remaining
+        print(
+            f"[{self.finished}/{self.total}] {worker} finished {results_repetition} ({status}) in {elapsed:.1f}s, "
+            f"{self.worker_counts[worker]} by this worker. Elapsed: {_format_duration(run_time)}, "
+            f"ETA: {_format_duration(eta)}"
+        )
+
+    def finish(self) -> None:
+        summary = (
+            f"Ran {self.finished} of {self.total} scenario runs in {_format_duration(time.time() - self.start_time)}"
+        )
+        if self.failed > 0:
+            summary += f", {self.failed} failed"
+        if self.skipped > 0:
+            summary += (
+                f". {self.skipped} were not started because the time budget ran out; run the command again to resume"
+            )
+        print(summary + ".")
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
 
 def expand_scenario(
     scenario_dir: str, scenario: ScenarioInstance, output_dir: str, config_file: Union[str, None]
@@ -733,18 +879,6 @@ def find_autogen_repo(path: str) -> Optional[str]:
     return None
 
 
-def split_jsonl(file_path: str, num_parts: int) -> List[List[Dict[str, Any]]]:
-    """
-    Split a JSONL file into num_parts approximately equal parts.
-    """
-    with open(file_path, "r") as f:
-        data = [json.loads(line) for line in f]
-
-    random.shuffle(data)  # Shuffle the data for better distribution
-    chunk_size = len(data) // num_parts
-    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-
 def mkdir_p(path: str) -> None:
     """
     Create a directory if it doesn't exist, handling race conditions.
@@ -756,94 +890,6 @@ def mkdir_p(path: str) -> None:
             raise
 
 
-def run_scenarios_subset(
-    scenario_name: str,
-    scenarios: List[Dict[str, Any]],
-    n_repeats: int,
-    is_native: bool,
-    config_file: Union[None, str],
-    docker_image: Optional[str] = None,
-    results_dir: str = "Results",
-    subsample: Union[None, int, float] = None,
-    env_file: Union[None, str] = None,
-) -> None:
-    """
-    Run a subset of agbench scenarios a given number of times.
-    """
-    for instance in scenarios:
-        # Create a folder to store the results
-        # Results base
-
-        mkdir_p(results_dir)
-
-        # Results for the scenario
-
-        results_scenario = os.path.join(results_dir, scenario_name)
-        mkdir_p(results_scenario)
-
-        # Results for the instance
-        results_instance = os.path.join(results_scenario, instance["id"])
-        mkdir_p(results_instance)
-
-        # Results for the repeats
-        for i in range(0, n_repeats):
-            results_repetition = os.path.join(results_instance, str(i))
-
-            # Skip it if it already exists
-            if os.path.isdir(results_repetition):
-                print(f"Found folder {results_repetition} ... Skipping.")
-                continue
-            print(f"Running scenario {results_repetition}")
-
-            # Expand the scenario
-            expand_scenario(".", instance, results_repetition, config_file)  # type: ignore
-
-            # Prepare the environment (keys/values that need to be added)
-            env = get_scenario_env(env_file=env_file)
-
-            # Run the scenario
-            if is_native:
-                run_scenario_natively(results_repetition, env)
-            else:
-                run_scenario_in_docker(
-                    results_repetition,
-                    env,
-                    docker_image=docker_image,
-                )
-
-
-def run_parallel(args: argparse.Namespace) -> None:
-    """
-    Run scenarios in parallel.
-    """
-    # Read and split the JSONL file
-    scenarios = split_jsonl(args.scenario, args.parallel)
-    scenario_name_parts = os.path.basename(args.scenario).split(".")
-    scenario_name_parts.pop()
-    scenario_name = ".".join(scenario_name_parts)
-
-    # Create a pool of worker processes
-    with Pool(processes=args.parallel) as pool:
-        # Prepare arguments for each worker
-        worker_args = [
-            (
-                scenario_name,
-                scenario_subset,
-                args.repeat,
-                args.native,
-                args.config,
-                args.docker_image,
-                "Results",
-                args.subsample,
-                args.env,
-            )
-            for scenario_subset in scenarios
-        ]
-
-        # Run scenarios in parallel
-        pool.starmap(run_scenarios_subset, worker_args)
-
-
 def get_azure_token_provider() -> Optional[Callable[[], str]]:
     """
     Get the Azure bearer token generator if a token wasn't provided and there's any evidence of using Azure.
@@ -898,9 +944,16 @@ def run_cli(args: Sequence[str]) -> None:
         "-p",
         "--parallel",
         type=int,
-        help="The number of parallel processes to run (default: 1).",
+        help="The number of parallel processes to run. Each process takes the next scenario run as soon as it is done with one (default: 1).",
         default=1,
     )
+    parser.add_argument(
+        "-t",
+        "--time-budget",
+        type=float,
+        help="Stop starting new scenario runs after this many minutes. Runs in progress are finished, and the remaining runs are started when the command is run again (default: no limit).",
+        default=None,
+    )
     parser.add_argument(
         "-a",
         "--azure",
@@ -945,10 +998,6 @@ def run_cli(args: Sequence[str]) -> None:
         with open(parsed_args.config, "r"):
             pass
 
-    # don't support parallel and subsample together
-    if parsed_args.parallel > 1 and parsed_args.subsample is not None:
-        sys.exit("The options --parallel and --subsample can not be used together currently. Exiting.")
-
     # Don't allow both --docker-image and --native on the same command
     if parsed_args.docker_image is not None and parsed_args.native:
         sys.exit("The options --native and --docker-image can not be used together. Exiting.")
@@ -996,16 +1045,15 @@ def run_cli(args: Sequence[str]) -> None:
         azure_token_provider = get_azure_token_provider()
 
     # Run the scenario
-    if parsed_args.parallel > 1:
-        run_parallel(parsed_args)
-    else:
-        run_scenarios(
-            scenario=parsed_args.scenario,
-            n_repeats=parsed_args.repeat,
-            is_native=True if parsed_args.native else False,
-            config_file=parsed_args.config,
-            token_provider=azure_token_provider,
-            docker_image=parsed_args.docker_image,
-            subsample=subsample,
-            env_file=parsed_args.env,
-        )
+    run_scenarios(
+        scenario=parsed_args.scenario,
+        n_repeats=parsed_args.repeat,
+        is_native=True if parsed_args.native else False,
+        config_file=parsed_args.config,
+        token_provider=azure_token_provider,
+        docker_image=parsed_args.docker_image,
+        subsample=subsample,
+        env_file=parsed_args.env,
+        parallel=parsed_args.parallel,
+        time_budget=None if parsed_args.time_budget is None else parsed_args.time_budget * 60,
+    )
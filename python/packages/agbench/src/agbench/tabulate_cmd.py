@@ -1,13 +1,23 @@
 import argparse
+import functools
 import os
-import re
 import sys
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import tabulate as tb
 
 from .load_module import load_module
+from .results_index import (
+    INDEX_FILE_NAME,
+    ResultsIndex,
+    ScoreFunc,
+    ScorerFunc,
+    TimerFunc,
+    scan_console_log,
+    score_instance,
+    scorer_signature,
+)
 
 # Figure out where everything is
 SCRIPT_PATH = os.path.realpath(__file__)
@@ -68,21 +78,7 @@ def find_tabulate_module(search_dir: str, stop_dir: Optional[str] = None) -> Opt
 def default_scorer(instance_dir: str, success_strings: List[str] = SUCCESS_STRINGS) -> Optional[bool]:
     console_log = os.path.join(instance_dir, "console_log.txt")
     if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
-
-            # It succeeded
-            for s in success_strings:
-                if s in content:
-                    return True
-
-            # It completed without succeeding
-            for s in COMPLETED_STRINGS:
-                if s in content:
-                    return False
-
-            # Has not, or did not, complete
-            return None
+        return scan_console_log(console_log, success_strings, COMPLETED_STRINGS, TIMER_REGEX)[0]
     else:
         return None
 
@@ -90,21 +86,18 @@ def default_scorer(instance_dir: str, success_strings: List[str] = SUCCESS_STRIN
 def default_timer(instance_dir: str, timer_regex: str = TIMER_REGEX) -> Optional[float]:
     console_log = os.path.join(instance_dir, "console_log.txt")
     if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
-
-            # It succeeded
-            m = re.search(timer_regex, content)
-            if m:
-                return float(m.group(1))
-            else:
-                return None
+        return scan_console_log(console_log, [], [], timer_regex)[1]
     else:
         return None
 
 
-ScorerFunc = Callable[[str], Optional[bool]]
-TimerFunc = Callable[[str], Optional[float]]
+def _default_scorer_and_timer(instance_dir: str) -> Tuple[Optional[bool], Optional[float]]:
+    # Reads the log once for both the score and the time
+    console_log = os.path.join(instance_dir, "console_log.txt")
+    if os.path.isfile(console_log):
+        return scan_console_log(console_log, SUCCESS_STRINGS, COMPLETED_STRINGS, TIMER_REGEX)
+    else:
+        return None, None
 
 
 def default_tabulate(
@@ -138,12 +131,31 @@ def default_tabulate(
     parser.add_argument(
         "-e", "--excel", help="Output the results in Excel format. Please specify a path for the Excel file.", type=str
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The number of processes used to score new or changed results (default: the number of CPUs).",
+        default=os.cpu_count() or 1,
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"Score all results again, without reading or writing the results index ('{INDEX_FILE_NAME}' in the runlogs folder).",
+    )
+    parser.add_argument(
+        "--export-index",
+        type=str,
+        help="Export the results index to the given path, in Parquet format if the path ends with '.parquet', or as JSON otherwise.",
+        default=None,
+    )
 
     parsed_args = parser.parse_args(args)
     runlogs: str = parsed_args.runlogs
 
     all_results: List[Dict[str, Any]] = list()
     max_instances = 0
+    task_instances: List[Tuple[str, List[int]]] = list()
 
     for task_id in sorted(
         os.listdir(runlogs),
@@ -157,20 +169,41 @@ def default_tabulate(
         if not os.path.isdir(task_path):
             continue
 
-        # Collect the results vector
-        results: Dict[str, Any] = {"Task Id": task_id}
-
-        # Collect the results for each instance.
+        # Collect the instances
         instance_dirs = sorted(
             os.listdir(task_path),
             key=lambda s: os.path.getmtime(os.path.join(task_path, s)),
         )
         instances = [int(d) for d in instance_dirs if d.isdigit()]
+        task_instances.append((task_id, instances))
 
+    # Score the instances, reusing the indexed results of instances whose console log did not change
+    score: ScoreFunc
+    if scorer is default_scorer and timer is default_timer:
+        score = _default_scorer_and_timer
+    else:
+        score = functools.partial(score_instance, scorer, timer)
+    index = ResultsIndex(
+        runlogs,
+        score,
+        scorer_signature(scorer, timer),
+        index_path=None if parsed_args.no_index else os.path.join(runlogs, INDEX_FILE_NAME),
+        jobs=parsed_args.jobs,
+    )
+    entries = index.refresh([(task_id, instance) for task_id, instances in task_instances for instance in instances])
+    sys.stderr.write(f"Scored {index.scanned} new or changed results, and reused {index.reused} indexed results.\n\n")
+    if parsed_args.export_index is not None:
+        index.export(parsed_args.export_index)
+
+    for task_id, instances in task_instances:
+        # Collect the results vector
+        results: Dict[str, Any] = {"Task Id": task_id}
+
+        # Collect the results for each instance.
         for instance in instances:
-            instance_dir = os.path.join(task_path, str(instance))
-            results[f"Trial {instance} Success"] = scorer(instance_dir)
-            results[f"Trial {instance} Time"] = timer(instance_dir)
+            entry = entries[f"{task_id}/{instance}"]
+            results[f"Trial {instance} Success"] = entry["success"]
+            results[f"Trial {instance} Time"] = entry["time"]
 
         max_instances = max(instances)
 
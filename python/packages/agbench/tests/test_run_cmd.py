@@ -0,0 +1,84 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from agbench.run_cmd import is_run_complete, run_cli
+
+SCENARIO = """
+import time
+
+time.sleep(DELAY)
+print("ALL TESTS PASSED !#!#")
+"""
+
+
+@pytest.fixture
+def scenario_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGBENCH_ALLOW_NATIVE", "yes")
+    (tmp_path / "ENV.yaml").write_text("{}\n")
+    (tmp_path / "Templates").mkdir()
+    (tmp_path / "Templates" / "scenario.py").write_text(SCENARIO)
+    path = tmp_path / "tasks.jsonl"
+    with open(path, "wt") as fh:
+        # The first task is much slower than the second
+        for i, delay in enumerate(["3", "0"]):
+            instance = {"id": f"task_{i}", "template": "Templates", "substitutions": {"scenario.py": {"DELAY": delay}}}
+            fh.write(json.dumps(instance) + "\n")
+    return path
+
+
+def _run_times(results: Path) -> dict[str, float]:
+    return {str(path.parent.relative_to(results)): path.stat().st_mtime for path in results.glob("*/*/console_log.txt")}
+
+
+def test_run_native_parallel_and_resume(scenario_file: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    results = scenario_file.parent / "Results" / "tasks"
+    run_cli(["agbench run", str(scenario_file), "--native", "--parallel", "2", "--repeat", "2"])
+    output = capfd.readouterr().out
+    run_times = _run_times(results)
+    assert sorted(run_times) == ["task_0/0", "task_0/1", "task_1/0", "task_1/1"]
+    assert all(is_run_complete(str(results / run)) for run in run_times)
+    assert "ALL TESTS PASSED !#!#" in (results / "task_0" / "0" / "console_log.txt").read_text()
+    # Both workers took part, and the progress is reported for every run.
+    assert len({line.split()[1] for line in output.splitlines() if line.startswith("[")}) == 2
+    assert "[4/4]" in output
+    assert "Ran 4 of 4 scenario runs" in output
+
+    # Simulate a crash during a run, and a run that never started.
+    (results / "task_1" / "1" / "console_log.txt").write_text("SCENARIO.PY STARTING !#!#\n")
+    os.rename(results / "task_1" / "0", scenario_file.parent / "moved")
+    run_cli(["agbench run", str(scenario_file), "--native", "--parallel", "2", "--repeat", "2"])
+    output = capfd.readouterr().out
+    assert "Found incomplete folder" in output
+    assert "Ran 2 of 2 scenario runs" in output
+    new_run_times = _run_times(results)
+    assert {run for run in run_times if new_run_times[run] != run_times[run]} == {"task_1/0", "task_1/1"}
+    assert all(is_run_complete(str(results / run)) for run in new_run_times)
+
+
+def test_run_native_subsample_and_time_budget(scenario_file: Path, capfd: pytest.CaptureFixture[str]) -> None:
+    results = scenario_file.parent / "Results" / "tasks"
+    # A budget that runs out immediately does not start any runs.
+    run_cli(
+        [
+            "agbench run",
+            str(scenario_file),
+            "--native",
+            "--parallel",
+            "2",
+            "--repeat",
+            "2",
+            "--subsample",
+            "1",
+            "--time-budget",
+            "0",
+        ]
+    )
+    output = capfd.readouterr().out
+    assert "2 were not started because the time budget ran out" in output
+    assert _run_times(results) == {}
+
+    run_cli(["agbench run", str(scenario_file), "--native", "--parallel", "2", "--subsample", "1"])
+    assert len(_run_times(results)) == 1
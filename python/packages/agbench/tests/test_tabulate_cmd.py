@@ -0,0 +1,97 @@
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from agbench import results_index
+from agbench.results_index import INDEX_FILE_NAME, ResultsIndex, scan_console_log, score_instance, scorer_signature
+from agbench.tabulate_cmd import COMPLETED_STRINGS, SUCCESS_STRINGS, TIMER_REGEX, default_tabulate, default_timer
+
+SUCCESS_LOG = (
+    "SCENARIO.PY STARTING !#!#\nALL TESTS PASSED !#!#\nSCENARIO.PY COMPLETE !#!#\nSCENARIO.PY RUNTIME: 12 !#!#\n"
+)
+FAILURE_LOG = "SCENARIO.PY STARTING !#!#\nSCENARIO.PY COMPLETE !#!#\nSCENARIO.PY RUNTIME: 30 !#!#\n"
+
+
+def _write_log(path: Path, content: str) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "console_log.txt").write_text(content)
+
+
+@pytest.fixture
+def runlogs(tmp_path: Path) -> Path:
+    _write_log(tmp_path / "task_a" / "0", SUCCESS_LOG)
+    _write_log(tmp_path / "task_a" / "1", FAILURE_LOG)
+    _write_log(tmp_path / "task_b" / "0", "SCENARIO.PY STARTING !#!#\n")
+    (tmp_path / "task_b" / "1").mkdir()
+    return tmp_path
+
+
+def test_scan_console_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Small blocks, so the markers span block boundaries.
+    monkeypatch.setattr(results_index, "TAIL_BLOCK_SIZE", 16)
+    monkeypatch.setattr(results_index, "PATTERN_OVERLAP", 32)
+    log = tmp_path / "console_log.txt"
+    log.write_text(
+        "ALL TESTS PASSED !#!#\n" + "x" * 1000 + "\nSCENARIO.PY COMPLETE !#!#\nSCENARIO.PY RUNTIME: 7.5 !#!#\n"
+    )
+    assert scan_console_log(str(log), SUCCESS_STRINGS, COMPLETED_STRINGS, TIMER_REGEX) == (True, 7.5)
+    log.write_text(FAILURE_LOG + "y" * 1000)
+    assert scan_console_log(str(log), SUCCESS_STRINGS, COMPLETED_STRINGS, TIMER_REGEX) == (False, 30.0)
+    log.write_text("still running")
+    assert scan_console_log(str(log), SUCCESS_STRINGS, COMPLETED_STRINGS, TIMER_REGEX) == (None, None)
+
+
+def test_tabulate_uses_index(runlogs: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    default_tabulate(["agbench tabulate", str(runlogs), "--csv", "--jobs", "2"])
+    captured = capsys.readouterr()
+    assert "Scored 4 new or changed results, and reused 0 indexed results." in captured.err
+    lines = captured.out.strip().splitlines()
+    assert lines[0] == "Task Id,Trial 0 Success,Trial 0 Time,Trial 1 Success,Trial 1 Time"
+    assert lines[1:] == ["task_a,True,12.0,False,30.0", "task_b,,,,"]
+    assert (runlogs / INDEX_FILE_NAME).is_file()
+
+    # Only the run that changed is scored again.
+    _write_log(runlogs / "task_b" / "0", SUCCESS_LOG.replace("12", "5"))
+    default_tabulate(["agbench tabulate", str(runlogs), "--csv", "--export-index", str(runlogs / "index.json")])
+    captured = capsys.readouterr()
+    # The instance without a console log is always scored again.
+    assert "Scored 2 new or changed results, and reused 2 indexed results." in captured.err
+    assert captured.out.strip().splitlines()[2] == "task_b,True,5.0,,"
+    with open(runlogs / "index.json") as fh:
+        exported = json.load(fh)
+    assert {(row["task_id"], row["trial"], row["success"]) for row in exported} == {
+        ("task_a", 0, True),
+        ("task_a", 1, False),
+        ("task_b", 0, True),
+        ("task_b", 1, None),
+    }
+
+    default_tabulate(["agbench tabulate", str(runlogs), "--csv", "--no-index"])
+    assert "Scored 4 new or changed results" in capsys.readouterr().err
+
+
+def _custom_scorer(instance_dir: str) -> Optional[bool]:
+    return os.path.isfile(os.path.join(instance_dir, "console_log.txt"))
+
+
+def test_results_index_with_custom_scorer(runlogs: Path) -> None:
+    def score(instance_dir: str) -> tuple[Optional[bool], Optional[float]]:
+        return score_instance(_custom_scorer, default_timer, instance_dir)
+
+    index_path = str(runlogs / INDEX_FILE_NAME)
+    instances = [("task_a", 0), ("task_a", 1), ("task_b", 0)]
+    signature = scorer_signature(_custom_scorer, default_timer)
+    # A local function can not be sent to other processes, so the results are scored in this process.
+    index = ResultsIndex(str(runlogs), score, signature, index_path=index_path, jobs=4)
+    entries = index.refresh(instances)
+    assert [entries[f"{task}/{trial}"]["success"] for task, trial in instances] == [True, True, True]
+
+    index = ResultsIndex(str(runlogs), score, signature, index_path=index_path)
+    index.refresh(instances)
+    assert (index.scanned, index.reused) == (0, 3)
+    # A different scorer does not reuse the results.
+    index = ResultsIndex(str(runlogs), score, scorer_signature(default_timer), index_path=index_path)
+    index.refresh(instances)
+    assert (index.scanned, index.reused) == (3, 0)
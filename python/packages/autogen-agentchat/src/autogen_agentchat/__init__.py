@@ -3,7 +3,7 @@
 It includes logger names for trace and event logs, and retrieves the package version.
 """
 
-import importlib.metadata
+from typing import Any
 
 TRACE_LOGGER_NAME = "autogen_agentchat"
 """Logger name for trace logs."""
@@ -11,4 +11,12 @@
 EVENT_LOGGER_NAME = "autogen_agentchat.events"
 """Logger name for event logs."""
 
-__version__ = importlib.metadata.version("autogen_agentchat")
+
+def __getattr__(name: str) -> Any:
+    # The version is looked up on first access, since reading the package metadata is slow (PEP 562).
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = version("autogen_agentchat")
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import time
 import warnings
 from typing import (
     Any,
@@ -17,7 +18,8 @@
 )
 
 from autogen_core import CancellationToken, Component, ComponentModel, FunctionCall
-from autogen_core.memory import Memory
+from autogen_core.logging import AgentStepTimingEvent
+from autogen_core.memory import Memory, UpdateContextResult
 from autogen_core.model_context import (
     ChatCompletionContext,
     UnboundedChatCompletionContext,
@@ -36,7 +38,7 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from .. import EVENT_LOGGER_NAME
+from .. import EVENT_LOGGER_NAME, TRACE_LOGGER_NAME
 from ..base import Handoff as HandoffBase
 from ..base import Response
 from ..messages import (
@@ -58,6 +60,7 @@
 from ._base_chat_agent import BaseChatAgent
 
 event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
 
 class AssistantAgentConfig(BaseModel):
@@ -70,6 +73,7 @@ class AssistantAgentConfig(BaseModel):
     handoffs: List[HandoffBase | str] | None = None
     model_context: ComponentModel | None = None
     memory: List[ComponentModel] | None = None
+    memory_timeout: float | None = None
     description: str
     system_message: str | None = None
     model_client_stream: bool = False
@@ -207,6 +211,14 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
             Available variables: `{tool_name}`, `{arguments}`, `{result}`.
             For example, `"{tool_name}: {result}"` will create a summary like `"tool_name: result"`.
         memory (Sequence[Memory] | None, optional): The memory store to use for the agent. Defaults to `None`.
+            A single memory updates the agent's model context directly. When multiple memories are provided,
+            they are queried concurrently: each one updates its own
+            :class:`~autogen_core.model_context.UnboundedChatCompletionContext` copy of the model context, and
+            the messages each one appends are added to the model context in the order of the list. Other edits
+            a memory makes to its copy are not applied.
+        memory_timeout (float | None, optional): The maximum time in seconds to wait for each memory to update the
+            model context. A memory that does not finish in time is skipped for the current step and a warning is logged.
+            Defaults to `None`, meaning no timeout.
         metadata (Dict[str, str] | None, optional): Optional metadata for tracking.
 
     Raises:
@@ -655,6 +667,7 @@ def __init__(
         output_content_type: type[BaseModel] | None = None,
         output_content_type_format: str | None = None,
         memory: Sequence[Memory] | None = None,
+        memory_timeout: float | None = None,
         metadata: Dict[str, str] | None = None,
     ):
         super().__init__(name=name, description=description)
@@ -675,6 +688,9 @@ def __init__(
                 self._memory = memory
             else:
                 raise TypeError(f"Expected Memory, List[Memory], or None, got {type(memory)}")
+        if memory_timeout is not None and memory_timeout <= 0:
+            raise ValueError("memory_timeout must be a positive number or None.")
+        self._memory_timeout = memory_timeout
 
         self._system_messages: List[SystemMessage] = []
         if system_message is None:
@@ -795,6 +811,7 @@ async def on_messages_stream(
         agent_name = self.name
         model_context = self._model_context
         memory = self._memory
+        memory_timeout = self._memory_timeout
         system_messages = self._system_messages
         workbench = self._workbench
         handoff_tools = self._handoff_tools
@@ -812,18 +829,27 @@ async def on_messages_stream(
             messages=messages,
         )
 
+        # Wall-clock time spent in each step, logged as an AgentStepTimingEvent at the end.
+        step_timings: Dict[str, float] = {}
+
         # STEP 2: Update model context with any relevant memory
         inner_messages: List[BaseAgentEvent | BaseChatMessage] = []
-        for event_msg in await self._update_model_context_with_memory(
+        start_time = time.perf_counter()
+        memory_events = await self._update_model_context_with_memory(
             memory=memory,
             model_context=model_context,
             agent_name=agent_name,
-        ):
+            memory_timeout=memory_timeout,
+        )
+        if memory:
+            step_timings["memory"] = time.perf_counter() - start_time
+        for event_msg in memory_events:
             inner_messages.append(event_msg)
             yield event_msg
 
         # STEP 3: Run the first inference
         model_result = None
+        start_time = time.perf_counter()
         async for inference_output in self._call_llm(
             model_client=model_client,
             model_client_stream=model_client_stream,
@@ -842,6 +868,7 @@ async def on_messages_stream(
                 yield inference_output
 
         assert model_result is not None, "No model result was produced."
+        step_timings["inference"] = time.perf_counter() - start_time
 
         # --- NEW: If the model produced a hidden "thought," yield it as an event ---
         if model_result.thought:
@@ -875,7 +902,10 @@ async def on_messages_stream(
             tool_call_summary_format=tool_call_summary_format,
             output_content_type=output_content_type,
             format_string=format_string,
+            step_timings=step_timings,
         ):
+            if isinstance(output_event, Response):
+                event_logger.debug(AgentStepTimingEvent(agent_name=agent_name, timings=step_timings))
             yield output_event
 
     @staticmethod
@@ -897,20 +927,52 @@ async def _update_model_context_with_memory(
         memory: Optional[Sequence[Memory]],
         model_context: ChatCompletionContext,
         agent_name: str,
+        memory_timeout: float | None = None,
     ) -> List[MemoryQueryEvent]:
         """
         If memory modules are present, update the model context and return the events produced.
+
+        A single memory updates the model context itself. Several memories are queried concurrently,
+        each against its own unbounded copy of the current model context. The messages each memory
+        appends are then added to the model context in the order of the memory list, so the result
+        does not depend on which memory finishes first. A memory that exceeds `memory_timeout` is skipped.
         """
         events: List[MemoryQueryEvent] = []
-        if memory:
-            for mem in memory:
-                update_context_result = await mem.update_context(model_context)
-                if update_context_result and len(update_context_result.memories.results) > 0:
-                    memory_query_event_msg = MemoryQueryEvent(
-                        content=update_context_result.memories.results,
-                        source=agent_name,
-                    )
-                    events.append(memory_query_event_msg)
+        if not memory:
+            return events
+
+        staged = len(memory) > 1
+        snapshot = await model_context.get_messages() if staged else []
+
+        async def _query(mem: Memory) -> Tuple[List[LLMMessage], UpdateContextResult]:
+            context = UnboundedChatCompletionContext(initial_messages=snapshot) if staged else model_context
+            if memory_timeout is None:
+                result = await mem.update_context(context)
+            else:
+                result = await asyncio.wait_for(mem.update_context(context), timeout=memory_timeout)
+            if not staged:
+                return [], result
+            staged_messages = await context.get_messages()
+            return staged_messages[len(snapshot) :], result
+
+        outcomes = await asyncio.gather(*[_query(mem) for mem in memory], return_exceptions=True)
+        for mem, outcome in zip(memory, outcomes, strict=True):
+            if isinstance(outcome, asyncio.TimeoutError):
+                trace_logger.warning(
+                    f"Memory {type(mem).__name__} timed out after {memory_timeout} seconds and was skipped."
+                )
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            new_messages, update_context_result = outcome
+            for message in new_messages:
+                await model_context.add_message(message)
+            if update_context_result and len(update_context_result.memories.results) > 0:
+                memory_query_event_msg = MemoryQueryEvent(
+                    content=update_context_result.memories.results,
+                    source=agent_name,
+                )
+                events.append(memory_query_event_msg)
         return events
 
     @classmethod
@@ -978,11 +1040,15 @@ async def _process_model_result(
         tool_call_summary_format: str,
         output_content_type: type[BaseModel] | None,
         format_string: str | None = None,
+        step_timings: Dict[str, float] | None = None,
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
         """
         Handle final or partial responses from model_result, including tool calls, handoffs,
-        and reflection if needed.
+        and reflection if needed. If `step_timings` is provided, the time spent executing
+        tools and reflecting is recorded in it.
         """
+        if step_timings is None:
+            step_timings = {}
 
         # If direct text response (string)
         if isinstance(model_result.content, str):
@@ -1024,6 +1090,7 @@ async def _process_model_result(
         yield tool_call_msg
 
         # STEP 4B: Execute tool calls
+        start_time = time.perf_counter()
         executed_calls_and_results = await asyncio.gather(
             *[
                 cls._execute_tool_call(
@@ -1037,6 +1104,7 @@ async def _process_model_result(
             ]
         )
         exec_results = [result for _, result in executed_calls_and_results]
+        step_timings["tools"] = time.perf_counter() - start_time
 
         # Yield ToolCallExecutionEvent
         tool_call_result_msg = ToolCallExecutionEvent(
@@ -1062,6 +1130,7 @@ async def _process_model_result(
 
         # STEP 4D: Reflect or summarize tool results
         if reflect_on_tool_use:
+            start_time = time.perf_counter()
             async for reflection_response in cls._reflect_on_tool_use_flow(
                 system_messages=system_messages,
                 model_client=model_client,
@@ -1071,6 +1140,8 @@ async def _process_model_result(
                 inner_messages=inner_messages,
                 output_content_type=output_content_type,
             ):
+                if isinstance(reflection_response, Response):
+                    step_timings["reflection"] = time.perf_counter() - start_time
                 yield reflection_response
         else:
             yield cls._summarize_tool_use(
@@ -1347,6 +1418,7 @@ def _to_config(self) -> AssistantAgentConfig:
             handoffs=list(self._handoffs.values()) if self._handoffs else None,
             model_context=self._model_context.dump_component(),
             memory=[memory.dump_component() for memory in self._memory] if self._memory else None,
+            memory_timeout=self._memory_timeout,
             description=self.description,
             system_message=self._system_messages[0].content
             if self._system_messages and isinstance(self._system_messages[0].content, str)
@@ -1380,6 +1452,7 @@ def _from_config(cls, config: AssistantAgentConfig) -> Self:
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
             tools=[BaseTool.load_component(tool) for tool in config.tools] if config.tools else None,
             memory=[Memory.load_component(memory) for memory in config.memory] if config.memory else None,
+            memory_timeout=config.memory_timeout,
             description=config.description,
             system_message=config.system_message,
             model_client_stream=config.model_client_stream,
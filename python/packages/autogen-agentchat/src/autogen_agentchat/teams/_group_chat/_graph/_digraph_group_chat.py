@@ -228,7 +228,13 @@ def __init__(
         # They execute when all their parent nodes have executed.
         # Nodes are added to this dict when at least one of their parent nodes becomes active.
         # Start nodes (no parents) are added to this dict at initialization as they are always ready to run.
-        self._pending_execution: Dict[str, List[str]] = {node: [] for node in graph.get_start_nodes()}
+        self._pending_execution: Dict[str, List[str]] = {node: [] for node in self._start_nodes}
+
+        # Nodes in _pending_execution whose readiness must be (re-)checked, in the order they became candidates.
+        # A node's readiness only depends on its own pending entry, so a node is only added here when that entry
+        # changes. This keeps speaker selection proportional to the out-degree of the node that just finished
+        # rather than to the number of pending nodes.
+        self._ready_candidates: Dict[str, None] = dict.fromkeys(self._pending_execution)
 
     def _get_valid_target(self, node: DiGraphNode, content: str) -> str:
         """Check if a condition is met in the chat history."""
@@ -246,7 +252,7 @@ def _is_node_ready(self, node_name: str) -> bool:
         node = self._graph.nodes[node_name]
         if node.activation == "any":
             return bool(self._pending_execution[node_name])
-        return all(parent in self._pending_execution[node_name] for parent in self._parents[node_name])
+        return set(self._pending_execution[node_name]).issuperset(self._parents[node_name])
 
     async def _select_speakers(self, thread: List[BaseAgentEvent | BaseChatMessage], many: bool = True) -> List[str]:
         """Select the next set of agents to execute based on DAG constraints."""
@@ -289,6 +295,7 @@ async def _select_speakers(self, thread: List[BaseAgentEvent | BaseChatMessage],
                                 self._pending_execution.pop(other_node)
                             else:
                                 self._pending_execution[other_node] = other_active_parents
+                                self._ready_candidates[other_node] = None
 
                     else:
                         # Case: unconditional edges — mark this source as completed for all its children
@@ -296,19 +303,27 @@ async def _select_speakers(self, thread: List[BaseAgentEvent | BaseChatMessage],
 
                     for target in target_nodes_names:
                         self._pending_execution[target].append(source)
+                        self._ready_candidates[target] = None
             else:
                 # TODO: Check if there are any usecase where the User can decide on the next speaker
                 pass
 
-        # After updating _pending_execution, check which nodes are now unblocked
-        for node_name in list(self._pending_execution):
-            if self._use_default_start and not self._default_start_executed:
-                if node_name == self._graph.default_start_node:
-                    next_speakers.add(node_name)
-                    self._default_start_executed = True
-                    break
+        default_start_node = self._graph.default_start_node
+        if (
+            self._use_default_start
+            and not self._default_start_executed
+            and default_start_node in self._pending_execution
+        ):
+            # The default start node runs first, on its own.
+            next_speakers.add(default_start_node)
+            self._default_start_executed = True
+        else:
+            # After updating _pending_execution, check which of the affected nodes are now unblocked
+            for node_name in list(self._ready_candidates):
+                del self._ready_candidates[node_name]
+                if node_name not in self._pending_execution or not self._is_node_ready(node_name):
+                    continue
 
-            if self._is_node_ready(node_name):
                 next_speakers.add(node_name)
                 node = self._graph.nodes[node_name]
                 if node.activation == "all":
@@ -378,6 +393,7 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         self._current_turn = state["current_turn"]
         self._active_nodes = set(state["active_nodes"])
         self._pending_execution = state["pending_execution"]
+        self._ready_candidates = dict.fromkeys(self._pending_execution)
         self._active_node_count = state["active_node_count"]
         self._default_start_executed = state.get("default_start_executed", False)
 
@@ -391,6 +407,7 @@ async def reset(self) -> None:
         self._active_nodes = set()
         self._active_node_count = {node: 0 for node in self._graph.nodes}
         self._pending_execution = {node: [] for node in self._start_nodes}
+        self._ready_candidates = dict.fromkeys(self._pending_execution)
         self._default_start_executed = False
 
 
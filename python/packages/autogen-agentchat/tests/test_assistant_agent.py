@@ -1,9 +1,10 @@
+import asyncio
 import json
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 
 import pytest
-from autogen_agentchat import EVENT_LOGGER_NAME
+from autogen_agentchat import EVENT_LOGGER_NAME, TRACE_LOGGER_NAME
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.base import Handoff, TaskResult
 from autogen_agentchat.messages import (
@@ -19,9 +20,17 @@
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
-from autogen_core import ComponentModel, FunctionCall, Image
-from autogen_core.memory import ListMemory, Memory, MemoryContent, MemoryMimeType, MemoryQueryResult
-from autogen_core.model_context import BufferedChatCompletionContext
+from autogen_core import CancellationToken, ComponentModel, FunctionCall, Image
+from autogen_core.logging import AgentStepTimingEvent
+from autogen_core.memory import (
+    ListMemory,
+    Memory,
+    MemoryContent,
+    MemoryMimeType,
+    MemoryQueryResult,
+    UpdateContextResult,
+)
+from autogen_core.model_context import BufferedChatCompletionContext, ChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -1199,6 +1208,155 @@ class BadMemory:
     assert isinstance(ListMemory(), Memory)
 
 
+class _DelayedListMemory(ListMemory):
+    """A list memory that waits before updating the model context."""
+
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name=name)
+        self._delay = delay
+
+    async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
+        await asyncio.sleep(self._delay)
+        return await super().update_context(model_context)
+
+
+class _TimingLogHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: List[AgentStepTimingEvent] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if isinstance(record.msg, AgentStepTimingEvent):
+            self.events.append(record.msg)
+
+
+@pytest.mark.asyncio
+async def test_run_with_concurrent_memory(caplog: pytest.LogCaptureFixture) -> None:
+    slow_memory = _DelayedListMemory(name="slow", delay=0.2)
+    await slow_memory.add(MemoryContent(content="slow content", mime_type=MemoryMimeType.TEXT))
+    fast_memory = _DelayedListMemory(name="fast", delay=0.0)
+    await fast_memory.add(MemoryContent(content="fast content", mime_type=MemoryMimeType.TEXT))
+
+    # Memory results are merged in the configured order, not in completion order.
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=ReplayChatCompletionClient(["Hello"]),
+        memory=[slow_memory, fast_memory],
+    )
+    handler = _TimingLogHandler()
+    logger.addHandler(handler)
+    try:
+        result = await agent.run(task="test task")
+    finally:
+        logger.removeHandler(handler)
+    memory_events = [msg for msg in result.messages if isinstance(msg, MemoryQueryEvent)]
+    assert [event.content[0].content for event in memory_events] == ["slow content", "fast content"]
+    context_messages = await agent.model_context.get_messages()
+    assert len(context_messages) == 4
+    assert isinstance(context_messages[1], SystemMessage)
+    assert "slow content" in context_messages[1].content
+    assert isinstance(context_messages[2], SystemMessage)
+    assert "fast content" in context_messages[2].content
+
+    # A per-step timing breakdown is logged for each response.
+    assert len(handler.events) == 1
+    assert set(handler.events[0].timings.keys()) == {"memory", "inference"}
+
+    # A memory that exceeds the timeout is skipped.
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=ReplayChatCompletionClient(["Hello"]),
+        memory=[slow_memory, fast_memory],
+        memory_timeout=0.1,
+    )
+    with caplog.at_level(logging.WARNING, logger=TRACE_LOGGER_NAME):
+        result = await agent.run(task="test task")
+    memory_events = [msg for msg in result.messages if isinstance(msg, MemoryQueryEvent)]
+    assert [event.content[0].content for event in memory_events] == ["fast content"]
+    assert "_DelayedListMemory timed out" in caplog.text
+
+    # The timeout is part of the declarative configuration.
+    agent2 = AssistantAgent.load_component(agent.dump_component())
+    assert agent2._memory_timeout == 0.1  # type: ignore[reportPrivateUsage]
+
+    with pytest.raises(ValueError):
+        AssistantAgent("test_agent", model_client=ReplayChatCompletionClient(["Hello"]), memory_timeout=0)
+
+
+class _ContextRecordingMemory(ListMemory):
+    """A list memory that records the model contexts it updates, and trims them to the latest message."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.contexts: List[ChatCompletionContext] = []
+
+    async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
+        self.contexts.append(model_context)
+        messages = await model_context.get_messages()
+        await model_context.clear()
+        await model_context.add_message(messages[-1])
+        return await super().update_context(model_context)
+
+
+@pytest.mark.asyncio
+async def test_run_with_single_memory_updates_model_context() -> None:
+    memory = _ContextRecordingMemory()
+    await memory.add(MemoryContent(content="memory content", mime_type=MemoryMimeType.TEXT))
+    model_context = BufferedChatCompletionContext(buffer_size=10)
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=ReplayChatCompletionClient(["Hello", "Hello again"]),
+        memory=[memory],
+        model_context=model_context,
+    )
+    await agent.run(task="first task")
+    await agent.run(task="second task")
+
+    # The memory gets the agent's own model context, and its edits are kept
+    assert memory.contexts == [model_context, model_context]
+    messages = await model_context.get_messages()
+    assert [type(message) for message in messages] == [UserMessage, SystemMessage, AssistantMessage]
+    assert messages[0].content == "second task"
+
+
+@pytest.mark.asyncio
+async def test_step_timings_with_tools_and_reflection() -> None:
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                finish_reason="function_calls",
+                content=[FunctionCall(id="1", arguments=json.dumps({"input": "task"}), name="_pass_function")],
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+            "Done",
+        ],
+        model_info={
+            "function_calling": True,
+            "vision": False,
+            "json_output": False,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": False,
+        },
+    )
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=model_client,
+        tools=[_pass_function],
+        reflect_on_tool_use=True,
+    )
+    handler = _TimingLogHandler()
+    logger.addHandler(handler)
+    try:
+        await agent.on_messages([TextMessage(content="task", source="user")], CancellationToken())
+    finally:
+        logger.removeHandler(handler)
+    assert len(handler.events) == 1
+    timings: Dict[str, Any] = handler.events[0].timings
+    assert set(timings.keys()) == {"inference", "tools", "reflection"}
+    assert all(value >= 0 for value in timings.values())
+
+
 @pytest.mark.asyncio
 async def test_assistant_agent_declarative() -> None:
     model_client = ReplayChatCompletionClient(
@@ -381,6 +381,7 @@ def _create(
         manager._message_factory = MessageFactory()  # pyright: ignore[reportPrivateUsage]
         manager._message_thread = thread if thread is not None else []  # pyright: ignore[reportPrivateUsage]
         manager._pending_execution = pending if pending is not None else {node: [] for node in graph.get_start_nodes()}  # pyright: ignore[reportPrivateUsage]
+        manager._ready_candidates = dict.fromkeys(manager._pending_execution)  # pyright: ignore[reportPrivateUsage]
         manager._name = "test_manager"  # pyright: ignore[reportPrivateUsage]
         manager._use_default_start = False  # pyright: ignore[reportPrivateUsage]
         return manager
@@ -523,6 +524,63 @@ async def test_select_speakers_conditional_any_activation(
     assert "B" in manager._active_nodes  # pyright: ignore[reportPrivateUsage]
 
 
+async def _drive_graph(manager: GraphFlowManager, contents: Dict[str, List[str]] | None = None) -> List[str]:
+    """Drive a manager one speaker at a time until it selects the stop agent, returning the speaker order."""
+    order: List[str] = []
+    thread: List[BaseAgentEvent | BaseChatMessage] = []
+    while True:
+        speaker = await manager.select_speaker(thread)
+        if speaker == _DIGRAPH_STOP_AGENT_NAME:
+            return order
+        order.append(speaker)
+        content = contents[speaker].pop(0) if contents and contents.get(speaker) else "done"
+        thread = [TextChatMessage(source=speaker, content=content, metadata={})]
+
+
+@pytest.mark.asyncio
+async def test_select_speaker_large_layered_dag(digraph_manager: Callable[..., GraphFlowManager]) -> None:
+    # 20 layers of 25 nodes; every node joins on all nodes of the previous layer.
+    num_layers, width = 20, 25
+    layers = [[f"n{layer}_{i}" for i in range(width)] for layer in range(num_layers)]
+    nodes: Dict[str, DiGraphNode] = {}
+    for layer, names in enumerate(layers):
+        next_layer = layers[layer + 1] if layer + 1 < num_layers else []
+        for name in names:
+            nodes[name] = DiGraphNode(name=name, edges=[DiGraphEdge(target=target) for target in next_layer])
+    graph = DiGraph(nodes=nodes)
+    manager = digraph_manager(graph=graph)
+
+    order = await _drive_graph(manager)
+
+    assert sorted(order) == sorted(nodes)
+    position = {name: index for index, name in enumerate(order)}
+    for layer in range(1, num_layers):
+        assert min(position[name] for name in layers[layer]) > max(position[name] for name in layers[layer - 1])
+
+
+@pytest.mark.asyncio
+async def test_select_speaker_large_cyclic_graph(digraph_manager: Callable[..., GraphFlowManager]) -> None:
+    # A long chain whose last node loops back to the first node twice before exiting.
+    chain = [f"n{i}" for i in range(200)]
+    nodes = {
+        name: DiGraphNode(name=name, edges=[DiGraphEdge(target=chain[i + 1])]) for i, name in enumerate(chain[:-1])
+    }
+    nodes[chain[-1]] = DiGraphNode(
+        name=chain[-1],
+        edges=[DiGraphEdge(target="exit", condition="exit"), DiGraphEdge(target=chain[0], condition="loop")],
+    )
+    nodes["exit"] = DiGraphNode(name="exit", edges=[])
+    graph = DiGraph(nodes=nodes, default_start_node=chain[0])
+    graph.graph_validate()
+    manager = digraph_manager(graph=graph, pending={chain[0]: []})
+    manager._use_default_start = True  # pyright: ignore[reportPrivateUsage]
+    manager._default_start_executed = False  # pyright: ignore[reportPrivateUsage]
+
+    order = await _drive_graph(manager, contents={chain[-1]: ["loop", "loop", "exit"]})
+
+    assert order == chain * 3 + ["exit"]
+
+
 class _EchoAgent(BaseChatAgent):
     def __init__(self, name: str, description: str) -> None:
         super().__init__(name, description)
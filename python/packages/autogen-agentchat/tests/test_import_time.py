@@ -0,0 +1,23 @@
+import subprocess
+import sys
+from typing import List
+
+# Heavy dependencies that are only imported when they are used.
+DEFERRED_MODULES = ["PIL", "opentelemetry", "google.protobuf", "jsonref", "requests", "openai", "tiktoken"]
+
+
+def _imported_modules(statement: str) -> List[str]:
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()
+
+
+def test_import_agents_defers_heavy_dependencies() -> None:
+    modules = _imported_modules("import autogen_agentchat.agents")
+    assert [name for name in modules if any(name == m or name.startswith(m + ".") for m in DEFERRED_MODULES)] == []
+
+
+def test_version() -> None:
+    import autogen_agentchat
+
+    assert isinstance(autogen_agentchat.__version__, str)
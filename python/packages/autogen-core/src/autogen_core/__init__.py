@@ -1,6 +1,5 @@
-import importlib.metadata
-
-__version__ = importlib.metadata.version("autogen_core")
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 from ._agent import Agent
 from ._agent_id import AgentId
@@ -17,6 +16,7 @@
     Component,
     ComponentBase,
     ComponentFromConfig,
+    ComponentLoadContext,
     ComponentLoader,
     ComponentModel,
     ComponentSchemaType,
@@ -56,7 +56,6 @@
     UnknownPayload,
     try_get_known_serializers_for_type,
 )
-from ._single_threaded_agent_runtime import SingleThreadedAgentRuntime
 from ._subscription import Subscription
 from ._subscription_context import SubscriptionInstantiationContext
 from ._topic import TopicId
@@ -64,6 +63,9 @@
 from ._type_subscription import TypeSubscription
 from ._types import FunctionCall
 
+if TYPE_CHECKING:
+    from ._single_threaded_agent_runtime import SingleThreadedAgentRuntime
+
 EVENT_LOGGER_NAME = EVENT_LOGGER_NAME_ALIAS
 """The name of the logger used for structured events."""
 
@@ -122,6 +124,7 @@
     "Component",
     "ComponentBase",
     "ComponentFromConfig",
+    "ComponentLoadContext",
     "ComponentLoader",
     "ComponentModel",
     "ComponentSchemaType",
@@ -133,3 +136,26 @@
     "InterventionHandler",
     "DefaultInterventionHandler",
 ]
+
+# Attributes whose modules import heavy dependencies (such as OpenTelemetry) are imported
+# on first access, so that importing the package stays fast (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "SingleThreadedAgentRuntime": "._single_threaded_agent_runtime",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("autogen_core")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
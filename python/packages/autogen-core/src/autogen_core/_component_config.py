@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import importlib
+import json
+import logging
+import time
 import warnings
+from contextvars import ContextVar, Token
+from types import TracebackType
 from typing import Any, ClassVar, Dict, Generic, Literal, Type, TypeGuard, cast, overload
 
-from pydantic import BaseModel
+from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, TypeVar
 
 ComponentType = Literal["model", "agent", "tool", "termination", "token_provider", "workbench"] | str
@@ -14,6 +19,8 @@
 
 T = TypeVar("T", bound=BaseModel, covariant=True)
 
+logger = logging.getLogger("autogen_core")
+
 
 class ComponentModel(BaseModel):
     """Model class for a component. Contains all information required to instantiate a component."""
@@ -102,6 +109,8 @@ class ComponentToConfig(Generic[ToConfigT]):
     """A description of the component. If not provided, the docstring of the class will be used."""
     component_label: ClassVar[str | None] = None
     """A human readable label for the component. If not provided, the component class name will be used."""
+    component_shareable: ClassVar[bool] = False
+    """Whether one instance can stand in for every identical config of the component loaded in the same :py:class:`autogen_core.ComponentLoadContext`, for example a model client that is used by several agents of a team. Only set this for components that hold no per-user state."""
 
     def _to_config(self) -> ToConfigT:
         """Dump the configuration that would be requite to create a new instance of a component matching the configuration of this instance.
@@ -163,6 +172,147 @@ def dump_component(self) -> ComponentModel:
 ExpectedType = TypeVar("ExpectedType")
 
 
+def _secret_to_json(value: Any) -> Any:
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ComponentLoadContext:
+    """A context for loading many components, such as a team and everything nested in it.
+
+    Within the context, provider strings are resolved to component classes once, and shareable
+    components (see :py:attr:`autogen_core.ComponentToConfig.component_shareable`) with identical
+    configs are loaded as one shared instance. Every call to :py:meth:`autogen_core.ComponentLoader.load_component`
+    outside of a context opens one for the duration of the call, so the components nested in one config are shared.
+
+    The context also records how many components were loaded and how long loading took.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_core import ComponentLoadContext
+            from autogen_agentchat.base import Team
+
+            with ComponentLoadContext() as context:
+                teams = [Team.load_component(config) for config in team_configs]  # type: ignore
+            print(context.loaded, context.shared, context.load_seconds)
+    """
+
+    _COMPONENT_LOAD_CONTEXT_VAR: ClassVar[ContextVar[ComponentLoadContext | None]] = ContextVar(
+        "_COMPONENT_LOAD_CONTEXT_VAR", default=None
+    )
+
+    def __init__(self) -> None:
+        self._classes: Dict[str, Type[_ConcreteComponent[BaseModel]]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._tokens: list[Token[ComponentLoadContext | None]] = []
+        self._nested_seconds = 0.0
+        self.loaded = 0
+        """The number of components that were created."""
+        self.shared = 0
+        """The number of component configs that were loaded as an existing shared instance."""
+        self.load_seconds: Dict[str, float] = {}
+        """The total time spent loading each provider, not counting the components nested in it."""
+
+    @classmethod
+    def current(cls) -> ComponentLoadContext | None:
+        """Returns the context that is currently active, if any."""
+        return cls._COMPONENT_LOAD_CONTEXT_VAR.get()
+
+    def __enter__(self) -> Self:
+        self._tokens.append(self._COMPONENT_LOAD_CONTEXT_VAR.set(self))
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self._COMPONENT_LOAD_CONTEXT_VAR.reset(self._tokens.pop())
+
+    def resolve_provider(self, provider: str) -> Type[_ConcreteComponent[BaseModel]]:
+        """Imports the component class of a provider string, or returns it from the cache."""
+        component_class = self._classes.get(provider)
+        if component_class is not None:
+            return component_class
+
+        output = WELL_KNOWN_PROVIDERS.get(provider, provider).rsplit(".", maxsplit=1)
+        if len(output) != 2:
+            raise ValueError("Invalid")
+
+        module_path, class_name = output
+        module = importlib.import_module(module_path)
+        component_class = module.__getattribute__(class_name)
+
+        if not is_component_class(component_class):
+            raise TypeError("Invalid component class")
+
+        self._classes[provider] = component_class
+        return component_class
+
+    def _load(self, model: ComponentModel) -> Any:
+        # First, do a look up in well known providers
+        if model.provider in WELL_KNOWN_PROVIDERS:
+            model.provider = WELL_KNOWN_PROVIDERS[model.provider]
+
+        component_class = self.resolve_provider(model.provider)
+
+        # We need to check the schema is valid
+        if not hasattr(component_class, "component_config_schema"):
+            raise AttributeError("component_config_schema not defined")
+
+        if not hasattr(component_class, "component_type"):
+            raise AttributeError("component_type not defined")
+
+        loaded_config_version = model.component_version or component_class.component_version
+        shared_key = None
+        if component_class.component_shareable:
+            try:
+                shared_key = json.dumps(
+                    [model.provider, loaded_config_version, model.config], sort_keys=True, default=_secret_to_json
+                )
+            except TypeError:
+                # A config that can not be compared is never shared.
+                pass
+            else:
+                if shared_key in self._instances:
+                    self.shared += 1
+                    return self._instances[shared_key]
+
+        outer_nested_seconds, self._nested_seconds = self._nested_seconds, 0.0
+        start = time.perf_counter()
+        try:
+            instance = self._create(component_class, model, loaded_config_version)
+        finally:
+            elapsed = time.perf_counter() - start
+            own_seconds = elapsed - self._nested_seconds
+            self._nested_seconds = outer_nested_seconds + elapsed
+
+        self.loaded += 1
+        self.load_seconds[model.provider] = self.load_seconds.get(model.provider, 0.0) + own_seconds
+        if shared_key is not None:
+            self._instances[shared_key] = instance
+        return instance
+
+    @staticmethod
+    def _create(
+        component_class: Type[_ConcreteComponent[BaseModel]], model: ComponentModel, loaded_config_version: int
+    ) -> Any:
+        if loaded_config_version < component_class.component_version:
+            try:
+                return component_class._from_config_past_version(model.config, loaded_config_version)  # type: ignore
+            except NotImplementedError as e:
+                raise NotImplementedError(
+                    f"Tried to load component {component_class} which is on version {component_class.component_version} with a config on version {loaded_config_version} but _from_config_past_version is not implemented"
+                ) from e
+
+        schema = component_class.component_config_schema  # type: ignore
+        validated_config = schema.model_validate(model.config)
+
+        # We're allowed to use the private method here
+        return component_class._from_config(validated_config)  # type: ignore
+
+
 class ComponentLoader:
     @overload
     @classmethod
@@ -214,42 +364,20 @@ def load_component(
         else:
             loaded_model = model
 
-        # First, do a look up in well known providers
-        if loaded_model.provider in WELL_KNOWN_PROVIDERS:
-            loaded_model.provider = WELL_KNOWN_PROVIDERS[loaded_model.provider]
-
-        output = loaded_model.provider.rsplit(".", maxsplit=1)
-        if len(output) != 2:
-            raise ValueError("Invalid")
-
-        module_path, class_name = output
-        module = importlib.import_module(module_path)
-        component_class = module.__getattribute__(class_name)
-
-        if not is_component_class(component_class):
-            raise TypeError("Invalid component class")
-
-        # We need to check the schema is valid
-        if not hasattr(component_class, "component_config_schema"):
-            raise AttributeError("component_config_schema not defined")
-
-        if not hasattr(component_class, "component_type"):
-            raise AttributeError("component_type not defined")
-
-        loaded_config_version = loaded_model.component_version or component_class.component_version
-        if loaded_config_version < component_class.component_version:
-            try:
-                instance = component_class._from_config_past_version(loaded_model.config, loaded_config_version)  # type: ignore
-            except NotImplementedError as e:
-                raise NotImplementedError(
-                    f"Tried to load component {component_class} which is on version {component_class.component_version} with a config on version {loaded_config_version} but _from_config_past_version is not implemented"
-                ) from e
+        context = ComponentLoadContext.current()
+        if context is not None:
+            instance = context._load(loaded_model)  # type: ignore[reportPrivateUsage]
         else:
-            schema = component_class.component_config_schema  # type: ignore
-            validated_config = schema.model_validate(loaded_model.config)
-
-            # We're allowed to use the private method here
-            instance = component_class._from_config(validated_config)  # type: ignore
+            with ComponentLoadContext() as context:
+                start = time.perf_counter()
+                instance = context._load(loaded_model)  # type: ignore[reportPrivateUsage]
+            logger.debug(
+                "Loaded %s with %d components (%d shared) in %.3fs",
+                loaded_model.provider,
+                context.loaded,
+                context.shared,
+                time.perf_counter() - start,
+            )
 
         if expected is None and not isinstance(instance, cls):
             raise TypeError("Expected type does not match")
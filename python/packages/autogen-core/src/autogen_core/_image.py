@@ -4,13 +4,16 @@
 import re
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import TYPE_CHECKING, Any, Dict, Tuple, cast
 
-from PIL import Image as PILImage
 from pydantic import GetCoreSchemaHandler, ValidationInfo
 from pydantic_core import core_schema
 from typing_extensions import Literal
 
+if TYPE_CHECKING:
+    # PIL is only imported when images are decoded, since most images are passed on as encoded data.
+    from PIL import Image as PILImage
+
 
 class Image:
     """Represents an image.
@@ -23,7 +26,6 @@ class Image:
         .. code-block:: python
 
             from autogen_core import Image
-            from PIL import Image as PILImage
             import aiohttp
             import asyncio
 
@@ -32,7 +34,7 @@ async def from_url(url: str) -> Image:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url) as response:
                         content = await response.read()
-                        return Image.from_pil(PILImage.open(content))
+                        return Image.from_bytes(content)
 
 
             image = asyncio.run(from_url("https://example.com/image"))
@@ -40,34 +42,126 @@ async def from_url(url: str) -> Image:
     """
 
     def __init__(self, image: PILImage.Image):
-        self.image: PILImage.Image = image.convert("RGB")
+        self._set_state(image.convert("RGB"), None, None)
+
+    def _set_state(self, image: PILImage.Image | None, data: bytes | None, media_type: str | None) -> None:
+        # Either the decoded image or the encoded data is set, and the other one is created when needed.
+        self._image = image
+        self._data = data
+        self._media_type = media_type
+        self._size: Tuple[int, int] | None = image.size if image is not None else None
+        self._base64: str | None = None
+        self._data_uri: str | None = None
+
+    @property
+    def image(self) -> PILImage.Image:
+        """The image as an RGB PIL image. Images created from encoded data are decoded on first access."""
+        if self._image is None:
+            assert self._data is not None
+            from PIL import Image as PILImage
+
+            with PILImage.open(BytesIO(self._data)) as image:
+                self._image = image.convert("RGB")
+        return self._image
+
+    @image.setter
+    def image(self, image: PILImage.Image) -> None:
+        self._set_state(image.convert("RGB"), None, None)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """The width and height of the image, read from the image header without decoding the pixels."""
+        if self._size is None:
+            assert self._data is not None
+            from PIL import Image as PILImage
+
+            with PILImage.open(BytesIO(self._data)) as image:
+                self._size = image.size
+        return self._size
+
+    @property
+    def media_type(self) -> str:
+        """The media type of the data returned by :meth:`to_base64`."""
+        if self._media_type is None:
+            return "image/png"
+        return self._media_type
 
     @classmethod
     def from_pil(cls, pil_image: PILImage.Image) -> Image:
         return cls(pil_image)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Image:
+        """Create an image from encoded image data.
+
+        PNG and JPEG data is kept as is and sent to models without being decoded and
+        re-encoded. Other formats, including GIF and WebP which not every model provider
+        accepts, are converted to PNG when encoded.
+        """
+        media_type = _sniff_media_type(data)
+        size: Tuple[int, int] | None = None
+        if media_type is None:
+            # Fail early on data that is not an image. Opening only reads the header.
+            from PIL import Image as PILImage
+
+            with PILImage.open(BytesIO(data)) as pil_image:
+                size = pil_image.size
+        image = cls.__new__(cls)
+        image._set_state(None, data, media_type)
+        image._size = size
+        return image
+
     @classmethod
     def from_uri(cls, uri: str) -> Image:
-        if not re.match(r"data:image/(?:png|jpeg);base64,", uri):
+        match = _DATA_URI_PATTERN.match(uri)
+        if match is None:
             raise ValueError("Invalid URI format. It should be a base64 encoded image URI.")
 
         # A URI. Remove the prefix and decode the base64 string.
-        base64_data = re.sub(r"data:image/(?:png|jpeg);base64,", "", uri)
-        return cls.from_base64(base64_data)
+        return cls.from_base64(uri[match.end() :])
 
     @classmethod
     def from_base64(cls, base64_str: str) -> Image:
-        return cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
+        return cls.from_bytes(base64.b64decode(base64_str))
 
     def to_base64(self) -> str:
-        buffered = BytesIO()
-        self.image.save(buffered, format="PNG")
-        content = buffered.getvalue()
-        return base64.b64encode(content).decode("utf-8")
+        if self._base64 is None:
+            if self._data is None or self._media_type is None:
+                buffered = BytesIO()
+                self.image.save(buffered, format="PNG")
+                self._data = buffered.getvalue()
+                self._media_type = "image/png"
+            self._base64 = base64.b64encode(self._data).decode("utf-8")
+        return self._base64
 
     @classmethod
     def from_file(cls, file_path: Path) -> Image:
-        return cls(PILImage.open(file_path))
+        return cls.from_bytes(Path(file_path).read_bytes())
+
+    def downscale(self, max_long_edge: int | None = None, max_short_edge: int | None = None) -> Image:
+        """Return the image scaled down, keeping its aspect ratio, so that its longer side is at most
+        `max_long_edge` and its shorter side is at most `max_short_edge` pixels.
+
+        The image itself is returned if it already fits, without decoding it.
+        Scaled JPEG images are encoded as JPEG, other images as PNG.
+        """
+        width, height = self.size
+        scale = 1.0
+        if max_long_edge is not None:
+            scale = min(scale, max_long_edge / max(width, height))
+        if max_short_edge is not None:
+            scale = min(scale, max_short_edge / min(width, height))
+        if scale >= 1.0:
+            return self
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        from PIL import Image as PILImage
+
+        resized = self.image.resize(new_size, PILImage.Resampling.LANCZOS)
+        if self.media_type != "image/jpeg":
+            return Image(resized)
+        buffered = BytesIO()
+        resized.save(buffered, format="JPEG", quality=90)
+        return Image.from_bytes(buffered.getvalue())
 
     def _repr_html_(self) -> str:
         # Show the image in Jupyter notebook
@@ -75,7 +169,10 @@ def _repr_html_(self) -> str:
 
     @property
     def data_uri(self) -> str:
-        return _convert_base64_to_data_uri(self.to_base64())
+        if self._data_uri is None:
+            base64_image = self.to_base64()
+            self._data_uri = f"data:{self.media_type};base64,{base64_image}"
+        return self._data_uri
 
     # Returns openai.types.chat.ChatCompletionContentPartImageParam, which is a TypedDict
     # We don't use the explicit type annotation so that we can avoid a dependency on the OpenAI Python SDK in this package.
@@ -107,21 +204,13 @@ def serialize(value: Image) -> dict[str, Any]:
         )
 
 
-def _convert_base64_to_data_uri(base64_image: str) -> str:
-    def _get_mime_type_from_data_uri(base64_image: str) -> str:
-        # Decode the base64 string
-        image_data = base64.b64decode(base64_image)
-        # Check the first few bytes for known signatures
-        if image_data.startswith(b"\xff\xd8\xff"):
-            return "image/jpeg"
-        elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-            return "image/png"
-        elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-            return "image/gif"
-        elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
-            return "image/webp"
-        return "image/jpeg"  # use jpeg for unknown formats, best guess.
-
-    mime_type = _get_mime_type_from_data_uri(base64_image)
-    data_uri = f"data:{mime_type};base64,{base64_image}"
-    return data_uri
+_DATA_URI_PATTERN = re.compile(r"data:image/(?:png|jpeg|gif|webp);base64,")
+
+
+def _sniff_media_type(data: bytes) -> str | None:
+    # The formats that every model provider accepts, which are kept in their original encoding.
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    elif data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    return None
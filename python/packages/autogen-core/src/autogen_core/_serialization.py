@@ -1,13 +1,28 @@
 import json
+import sys
 from dataclasses import asdict, dataclass, fields
-from typing import Any, ClassVar, Dict, List, Protocol, Sequence, TypeVar, cast, get_args, get_origin, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Protocol,
+    Sequence,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+    runtime_checkable,
+)
 
-from google.protobuf import any_pb2
-from google.protobuf.message import Message
 from pydantic import BaseModel
 
 from ._type_helpers import is_union
 
+if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
 T = TypeVar("T")
 
 
@@ -150,7 +165,16 @@ def serialize(self, message: PydanticT) -> bytes:
         return message.model_dump_json().encode("utf-8")
 
 
-ProtobufT = TypeVar("ProtobufT", bound=Message)
+ProtobufT = TypeVar("ProtobufT", bound="Message")
+
+
+def _protobuf_message_type() -> "type[Message] | None":
+    # Protobuf is only imported by applications that use protobuf messages. No class or object
+    # can be a protobuf message before the module that defines the message base class is imported.
+    module = sys.modules.get("google.protobuf.message")
+    if module is None:
+        return None
+    return cast("type[Message]", module.Message)
 
 
 # This class serializes to and from a google.protobuf.Any message that has been serialized to a string
@@ -167,6 +191,8 @@ def type_name(self) -> str:
         return _type_name(self.cls)
 
     def deserialize(self, payload: bytes) -> ProtobufT:
+        from google.protobuf import any_pb2
+
         # Parse payload into a proto any
         any_proto = any_pb2.Any()
         any_proto.ParseFromString(payload)
@@ -179,6 +205,8 @@ def deserialize(self, payload: bytes) -> ProtobufT:
         return destination_message
 
     def serialize(self, message: ProtobufT) -> bytes:
+        from google.protobuf import any_pb2
+
         any_proto = any_pb2.Any()
         any_proto.Pack(message)  # type: ignore
         return any_proto.SerializeToString()
@@ -193,10 +221,10 @@ class UnknownPayload:
 
 def _type_name(cls: type[Any] | Any) -> str:
     # If cls is a protobuf, then we need to determine the descriptor
-    if isinstance(cls, type):
-        if issubclass(cls, Message):
-            return cast(str, cls.DESCRIPTOR.full_name)
-    elif isinstance(cls, Message):
+    message_type = _protobuf_message_type()
+    if message_type is not None and (
+        issubclass(cls, message_type) if isinstance(cls, type) else isinstance(cls, message_type)
+    ):
         return cast(str, cls.DESCRIPTOR.full_name)
 
     if isinstance(cls, type):
@@ -216,8 +244,10 @@ def try_get_known_serializers_for_type(cls: type[Any]) -> list[MessageSerializer
         serializers.append(PydanticJsonMessageSerializer(cls))
     elif is_dataclass(cls):
         serializers.append(DataclassJsonMessageSerializer(cls))
-    elif issubclass(cls, Message):
-        serializers.append(ProtobufMessageSerializer(cls))
+    else:
+        message_type = _protobuf_message_type()
+        if message_type is not None and issubclass(cls, message_type):
+            serializers.append(ProtobufMessageSerializer(cls))
 
     return serializers
 
@@ -199,6 +199,53 @@ def __str__(self) -> str:
         return json.dumps(self.kwargs)
 
 
+class AgentStepTimingEvent:
+    def __init__(
+        self,
+        *,
+        agent_name: str,
+        timings: Dict[str, float],
+        **kwargs: Any,
+    ) -> None:
+        """Used by agents to log the wall-clock time spent in each step of handling a request,
+        e.g., memory retrieval, model inference, tool execution and reflection.
+
+        Args:
+            agent_name (str): The name of the agent.
+            timings (Dict[str, float]): A mapping from step name to the elapsed time in seconds.
+                Steps that were not executed are omitted.
+
+        Example:
+
+            .. code-block:: python
+
+                import logging
+                from autogen_core import EVENT_LOGGER_NAME
+                from autogen_core.logging import AgentStepTimingEvent
+
+                logger = logging.getLogger(EVENT_LOGGER_NAME)
+                logger.info(AgentStepTimingEvent(agent_name="assistant", timings={"memory": 0.02, "inference": 1.3}))
+
+        """
+        self.kwargs = kwargs
+        self.kwargs["type"] = "AgentStepTiming"
+        self.kwargs["agent_name"] = agent_name
+        self.kwargs["timings"] = timings
+        try:
+            agent_id = MessageHandlerContext.agent_id()
+        except RuntimeError:
+            agent_id = None
+        self.kwargs["agent_id"] = None if agent_id is None else str(agent_id)
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        return cast(Dict[str, float], self.kwargs["timings"])
+
+    # This must output the event in a json serializable format
+    def __str__(self) -> str:
+        return json.dumps(self.kwargs)
+
+
 class MessageKind(Enum):
     DIRECT = 1
     PUBLISH = 2
@@ -26,11 +26,13 @@ class TokenLimitedChatCompletionContext(ChatCompletionContext, Component[TokenLi
     Args:
         model_client (ChatCompletionClient): The model client to use for token counting.
             The model client must implement the :meth:`~autogen_core.models.ChatCompletionClient.count_tokens`
-            and :meth:`~autogen_core.models.ChatCompletionClient.remaining_tokens` methods.
+            and :meth:`~autogen_core.models.ChatCompletionClient.remaining_tokens` methods. Tokens are counted
+            with their async versions, :meth:`~autogen_core.models.ChatCompletionClient.acount_tokens` and
+            :meth:`~autogen_core.models.ChatCompletionClient.aremaining_tokens`.
         token_limit (int | None): The maximum number of tokens to keep in the context
-            using the :meth:`~autogen_core.models.ChatCompletionClient.count_tokens` method.
+            using the :meth:`~autogen_core.models.ChatCompletionClient.acount_tokens` method.
             If None, the context will be limited by the model client using the
-            :meth:`~autogen_core.models.ChatCompletionClient.remaining_tokens` method.
+            :meth:`~autogen_core.models.ChatCompletionClient.aremaining_tokens` method.
         tools (List[ToolSchema] | None): A list of tool schema to use in the context.
         initial_messages (List[LLMMessage] | None): A list of initial messages to include in the context.
 
@@ -59,17 +61,17 @@ async def get_messages(self) -> List[LLMMessage]:
         provided, then return as many messages as the remaining token allowed by the model client."""
         messages = list(self._messages)
         if self._token_limit is None:
-            remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
+            remaining_tokens = await self._model_client.aremaining_tokens(messages, tools=self._tool_schema)
             while remaining_tokens < 0 and len(messages) > 0:
                 middle_index = len(messages) // 2
                 messages.pop(middle_index)
-                remaining_tokens = self._model_client.remaining_tokens(messages, tools=self._tool_schema)
+                remaining_tokens = await self._model_client.aremaining_tokens(messages, tools=self._tool_schema)
         else:
-            token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
+            token_count = await self._model_client.acount_tokens(messages, tools=self._tool_schema)
             while token_count > self._token_limit and len(messages) > 0:
                 middle_index = len(messages) // 2
                 messages.pop(middle_index)
-                token_count = self._model_client.count_tokens(messages, tools=self._tool_schema)
+                token_count = await self._model_client.acount_tokens(messages, tools=self._tool_schema)
         if messages and isinstance(messages[0], FunctionExecutionResultMessage):
             # Handle the first message is a function call result message.
             # Remove the first message from the list.
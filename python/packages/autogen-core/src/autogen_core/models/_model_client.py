@@ -228,6 +228,20 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
     @abstractmethod
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int: ...
 
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        """Async version of :meth:`count_tokens`.
+
+        Clients that tokenize locally should override this to keep the tokenization of
+        large contexts off the event loop. The default implementation calls :meth:`count_tokens`.
+        """
+        return self.count_tokens(messages, tools=tools)
+
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        """Async version of :meth:`remaining_tokens`. The default implementation calls :meth:`remaining_tokens`."""
+        return self.remaining_tokens(messages, tools=tools)
+
     # Deprecated
     @property
     @abstractmethod
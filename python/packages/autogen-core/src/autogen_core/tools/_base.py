@@ -4,8 +4,6 @@
 from collections.abc import Sequence
 from typing import Any, Dict, Generic, Mapping, Protocol, Type, TypeVar, cast, runtime_checkable
 
-import jsonref
-from opentelemetry.trace import get_tracer
 from pydantic import BaseModel
 from typing_extensions import NotRequired, TypedDict
 
@@ -87,6 +85,9 @@ def schema(self) -> ToolSchema:
         model_schema: Dict[str, Any] = self._args_type.model_json_schema()
 
         if "$defs" in model_schema:
+            # jsonref imports requests, so it is only imported for the models that need it.
+            import jsonref
+
             model_schema = cast(Dict[str, Any], jsonref.replace_refs(obj=model_schema, proxies=False))  # type: ignore
             del model_schema["$defs"]
 
@@ -148,6 +149,9 @@ def return_value_as_string(self, value: Any) -> str:
     async def run(self, args: ArgsT, cancellation_token: CancellationToken) -> ReturnT: ...
 
     async def run_json(self, args: Mapping[str, Any], cancellation_token: CancellationToken) -> Any:
+        # OpenTelemetry is imported when a tool is first run, not when tools are defined.
+        from opentelemetry.trace import get_tracer
+
         with get_tracer("base_tool").start_as_current_span(
             self._name,
             attributes={
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List
 
 import pytest
-from autogen_core import CancellationToken, Component, ComponentBase, ComponentLoader, ComponentModel
+from autogen_core import (
+    CancellationToken,
+    Component,
+    ComponentBase,
+    ComponentLoadContext,
+    ComponentLoader,
+    ComponentModel,
+)
 from autogen_core._component_config import _type_to_provider_str  # type: ignore
 from autogen_core.code_executor import ImportFromModule
 from autogen_core.models import ChatCompletionClient
 from autogen_core.tools import FunctionTool
 from autogen_test_utils import MyInnerComponent, MyOuterComponent
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, SecretStr, ValidationError
 from typing_extensions import Self
 
 
@@ -367,3 +375,95 @@ def test_component_descriptions() -> None:
     assert ComponentWithDocstring("test").dump_component().description == "A component using just docstring."
     assert ComponentWithDescription("test").dump_component().description == "Explicit description"
     assert ComponentWithDescription("test").dump_component().label == "Custom Component"
+
+
+class SharedConfig(BaseModel):
+    api_key: SecretStr
+
+
+class SharedComponent(ComponentBase[SharedConfig], Component[SharedConfig]):
+    component_config_schema = SharedConfig
+    component_type = "custom"
+    component_shareable = True
+
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+
+    def _to_config(self) -> SharedConfig:
+        return SharedConfig(api_key=SecretStr(self.api_key))
+
+    @classmethod
+    def _from_config(cls, config: SharedConfig) -> SharedComponent:
+        return cls(api_key=config.api_key.get_secret_value())
+
+
+class GroupConfig(BaseModel):
+    members: List[ComponentModel]
+
+
+class GroupComponent(ComponentBase[GroupConfig], Component[GroupConfig]):
+    component_config_schema = GroupConfig
+    component_type = "custom"
+
+    def __init__(self, members: List[Any]) -> None:
+        self.members = members
+
+    def _to_config(self) -> GroupConfig:
+        return GroupConfig(members=[member.dump_component() for member in self.members])
+
+    @classmethod
+    def _from_config(cls, config: GroupConfig) -> GroupComponent:
+        return cls(members=[ComponentLoader.load_component(member, object) for member in config.members])
+
+
+def test_shared_components_in_one_load() -> None:
+    members = [SharedComponent("key-1"), SharedComponent("key-1"), SharedComponent("key-2"), MyComponent("a")]
+    dumped = GroupComponent(members + [MyComponent("a")]).dump_component()
+
+    loaded = GroupComponent.load_component(dumped)
+    # Identical configs of a shareable component are one instance, unlike other components.
+    assert loaded.members[0] is loaded.members[1]
+    # Secrets are compared by their value.
+    assert loaded.members[2] is not loaded.members[0]
+    assert loaded.members[2].api_key == "key-2"
+    assert loaded.members[3] is not loaded.members[4]
+
+    # Every load outside a context shares nothing with an earlier one.
+    loaded_again = GroupComponent.load_component(dumped)
+    assert loaded_again.members[0] is not loaded.members[0]
+
+
+def test_component_load_context() -> None:
+    dumped = GroupComponent([SharedComponent("key"), MyComponent("a")]).dump_component()
+    with ComponentLoadContext() as context:
+        assert ComponentLoadContext.current() is context
+        first = GroupComponent.load_component(dumped)
+        second = GroupComponent.load_component(dumped)
+        shared = SharedComponent.load_component(SharedComponent("key").dump_component())
+    assert ComponentLoadContext.current() is None
+
+    assert first.members[0] is second.members[0] is shared
+    assert first.members[1] is not second.members[1]
+    assert (context.loaded, context.shared) == (5, 2)
+    assert set(context.load_seconds) == {
+        "test_component_config.GroupComponent",
+        "test_component_config.SharedComponent",
+        "test_component_config.MyComponent",
+    }
+    assert context.resolve_provider("test_component_config.MyComponent") is MyComponent
+
+
+def test_load_large_config_benchmark() -> None:
+    # A gallery-sized config, with one model client config repeated under every agent.
+    agents = [GroupComponent([SharedComponent("key"), MyComponent(f"agent {i}")]) for i in range(200)]
+    dumped = json.loads(GroupComponent([GroupComponent(agents) for _ in range(5)]).dump_component().model_dump_json())
+
+    start = time.perf_counter()
+    with ComponentLoadContext() as context:
+        GroupComponent.load_component(dumped)
+    elapsed = time.perf_counter() - start
+
+    assert (context.loaded, context.shared) == (1 + 5 + 1000 + 1 + 1000, 999)
+    assert sum(context.load_seconds.values()) <= elapsed
+    # About 0.1s on a laptop.
+    assert elapsed < 10
@@ -0,0 +1,127 @@
+import base64
+import io
+import time
+from pathlib import Path
+
+import pytest
+from autogen_core import Image
+from PIL import Image as PILImage
+from PIL import ImageDraw, UnidentifiedImageError
+from pydantic import BaseModel
+
+
+class ImageMessage(BaseModel):
+    image: Image
+
+
+def _encode(image: PILImage.Image, format: str, **kwargs: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **kwargs)
+    return buffer.getvalue()
+
+
+def _make_screenshot(size: tuple[int, int]) -> bytes:
+    # A page-like screenshot: a photo-like noisy header over a white page with text.
+    image = PILImage.new("RGB", size, "white")
+    image.paste(PILImage.effect_noise((size[0], size[1] // 4), 64).convert("RGB"))
+    draw = ImageDraw.Draw(image)
+    for y in range(size[1] // 4 + 20, size[1], 24):
+        draw.text((40, y), "The quick brown fox jumps over the lazy dog. " * 8, fill="black")
+    return _encode(image, "PNG")
+
+
+@pytest.mark.parametrize("format,media_type", [("PNG", "image/png"), ("JPEG", "image/jpeg")])
+def test_image_keeps_encoded_bytes(format: str, media_type: str) -> None:
+    data = _encode(PILImage.new("RGB", (64, 32), "red"), format)
+    image = Image.from_bytes(data)
+    assert image.media_type == media_type
+    assert image.size == (64, 32)
+    assert base64.b64decode(image.to_base64()) == data
+    assert image.data_uri == f"data:{media_type};base64,{image.to_base64()}"
+    assert image.to_openai_format()["image_url"]["url"] == image.data_uri
+    # None of the above needs the pixels.
+    assert image._image is None  # type: ignore[reportPrivateUsage]
+
+    assert image.image.mode == "RGB"
+    assert image.image.size == (64, 32)
+    assert Image.from_uri(image.data_uri).to_base64() == image.to_base64()
+
+
+def test_image_from_pil_encodes_once() -> None:
+    image = Image.from_pil(PILImage.new("RGBA", (16, 16), "blue"))
+    assert image.image.mode == "RGB"
+    assert image.media_type == "image/png"
+    encoded = image.to_base64()
+    assert image.to_base64() is encoded
+    assert image.data_uri is image.data_uri
+    assert image.data_uri.startswith("data:image/png;base64,")
+
+    # Replacing the pixels drops the cached encodings.
+    image.image = PILImage.new("RGB", (8, 8), "green")
+    assert image.to_base64() != encoded
+    assert image.size == (8, 8)
+
+
+@pytest.mark.parametrize("format", ["BMP", "GIF", "WEBP"])
+def test_image_other_formats_are_converted_to_png(format: str, tmp_path: Path) -> None:
+    # Not every model provider accepts GIF and WebP, and OpenAI rejects animated GIFs.
+    path = tmp_path / f"image.{format.lower()}"
+    PILImage.new("RGB", (10, 20), "red").save(path, format=format)
+    image = Image.from_file(path)
+    assert image.size == (10, 20)
+    assert image.media_type == "image/png"
+    assert base64.b64decode(image.to_base64()).startswith(b"\x89PNG")
+    assert image.data_uri.startswith("data:image/png;base64,")
+    assert Image.from_uri(image.data_uri).media_type == "image/png"
+
+    with pytest.raises(UnidentifiedImageError):
+        Image.from_bytes(b"not an image")
+    with pytest.raises(ValueError):
+        Image.from_uri("data:text/plain;base64,aGVsbG8=")
+
+
+def test_image_serialization_keeps_format() -> None:
+    data = _encode(PILImage.new("RGB", (32, 32), "red"), "JPEG")
+    message = ImageMessage(image=Image.from_bytes(data))
+    deserialized = ImageMessage.model_validate_json(message.model_dump_json())
+    assert deserialized.image.media_type == "image/jpeg"
+    assert base64.b64decode(deserialized.image.to_base64()) == data
+
+
+def test_image_downscale() -> None:
+    image = Image.from_bytes(_encode(PILImage.new("RGB", (4000, 1000), "red"), "JPEG"))
+    assert image.downscale(max_long_edge=4000) is image
+    assert image._image is None  # type: ignore[reportPrivateUsage]
+
+    scaled = image.downscale(max_long_edge=2000)
+    assert scaled.size == (2000, 500)
+    assert scaled.media_type == "image/jpeg"
+    assert image.downscale(max_long_edge=2048, max_short_edge=100).size == (400, 100)
+
+    png = Image.from_pil(PILImage.new("RGB", (1000, 1000), "red"))
+    assert png.downscale(max_short_edge=500).media_type == "image/png"
+
+
+def test_image_encoding_benchmark() -> None:
+    # A QHD screenshot as captured by a browser, sent to a model, logged and persisted.
+    screenshot = _make_screenshot((2560, 1440))
+    uses = 3
+
+    start = time.perf_counter()
+    for _ in range(uses):
+        # Decoding and encoding the image again on every use.
+        with PILImage.open(io.BytesIO(screenshot)) as pil_image:
+            base64.b64encode(_encode(pil_image.convert("RGB"), "PNG"))
+    reencoding = time.perf_counter() - start
+
+    start = time.perf_counter()
+    image = Image.from_bytes(screenshot)
+    for _ in range(uses):
+        image.to_openai_format()
+        ImageMessage(image=image).model_dump_json()
+    encode_once = time.perf_counter() - start
+
+    assert image._image is None  # type: ignore[reportPrivateUsage]
+    assert base64.b64decode(image.to_base64()) == screenshot
+    # About 1.8s against 0.02s on a laptop.
+    assert encode_once < reencoding
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+# Heavy dependencies that are only imported when they are used.
+DEFERRED_MODULES = ["PIL", "opentelemetry", "google.protobuf", "jsonref", "requests"]
+
+# A generous upper bound on the cumulative import time, to catch large regressions without flaky failures.
+IMPORT_TIME_BUDGET_US = 2_000_000
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Returns the cumulative import time in microseconds of every module imported by the statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement,package",
+    [
+        ("import autogen_core", "autogen_core"),
+        ("import autogen_core.models, autogen_core.tools, autogen_core.memory", "autogen_core.memory"),
+    ],
+)
+def test_import_defers_heavy_dependencies(statement: str, package: str) -> None:
+    times = _import_times(statement)
+    imported: List[str] = [
+        name for name in times if any(name == m or name.startswith(m + ".") for m in DEFERRED_MODULES)
+    ]
+    assert imported == []
+    assert times[package] < IMPORT_TIME_BUDGET_US
+
+
+def test_lazy_attributes() -> None:
+    import autogen_core
+
+    assert isinstance(autogen_core.__version__, str)
+    assert "SingleThreadedAgentRuntime" in dir(autogen_core)
+    from autogen_core import SingleThreadedAgentRuntime
+
+    assert SingleThreadedAgentRuntime.__module__ == "autogen_core._single_threaded_agent_runtime"
+    with pytest.raises(AttributeError):
+        autogen_core.NotAnAttribute  # type: ignore[attr-defined] # noqa: B018
@@ -1,3 +1,11 @@
-import importlib.metadata
+from typing import Any
 
-__version__ = importlib.metadata.version("autogen_ext")
+
+def __getattr__(name: str) -> Any:
+    # The version is looked up on first access, since reading the package metadata is slow (PEP 562).
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = version("autogen_ext")
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
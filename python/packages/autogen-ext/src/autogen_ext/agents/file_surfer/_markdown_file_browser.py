@@ -1,14 +1,84 @@
 # ruff: noqa: E722
 import datetime
+import functools
 import io
 import os
 import re
 import time
-from typing import List, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Pattern, Set, Tuple, Union
 
 # TODO: Fix unfollowed import
 from markitdown import FileConversionException, MarkItDown, UnsupportedFormatException  # type: ignore
 
+_WHITESPACE = re.compile(r"[ \t\r\n]")
+_NON_WORD = re.compile(r"\W+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase the text and collapse every run of non-word characters to a single space."""
+    return " " + (" ".join(_NON_WORD.split(text))).strip().lower() + " "
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_query(query: str) -> Optional[Tuple[Pattern[str], FrozenSet[str]]]:
+    """Convert a find-on-page query to a regular expression over normalized text.
+
+    Returns:
+        The compiled expression and the words that any matching page must contain in full,
+        or None if the query is empty.
+    """
+    nquery = re.sub(r"\*", "__STAR__", query)
+    nquery = " " + (" ".join(re.split(r"\W+", nquery))).strip() + " "
+    nquery = nquery.replace(" __STAR__ ", "__STAR__ ")  # Merge isolated stars with prior word
+    nquery = nquery.replace("__STAR__", ".*").lower()
+
+    if nquery.strip() == "":
+        return None
+
+    # Words next to a wildcard may match part of a word, all others must match a whole word
+    words = frozenset(token for token in nquery.split() if ".*" not in token)
+    return re.compile(nquery), words
+
+
+class _Document:
+    """The converted content of a page, split into viewports, with a lazily built search index."""
+
+    def __init__(self, title: Optional[str], content: str, viewport_pages: List[Tuple[int, int]]) -> None:
+        self.title = title
+        self.content = content
+        self.viewport_pages = viewport_pages
+        self._normalized_pages: Optional[List[str]] = None
+        self._word_index: Optional[Dict[str, Set[int]]] = None
+
+    def normalized_page(self, index: int) -> str:
+        if self._normalized_pages is None:
+            self._build_index()
+        assert self._normalized_pages is not None
+        return self._normalized_pages[index]
+
+    def pages_with_words(self, words: FrozenSet[str]) -> Set[int]:
+        """Return the indices of the viewports that contain all the given words."""
+        if self._word_index is None:
+            self._build_index()
+        index = self._word_index
+        assert index is not None
+        pages: Optional[Set[int]] = None
+        # Intersect starting from the rarest word
+        for word in sorted(words, key=lambda w: len(index.get(w, ()))):
+            word_pages = index.get(word, set())
+            pages = set(word_pages) if pages is None else pages & word_pages
+            if not pages:
+                break
+        return set(range(len(self.viewport_pages))) if pages is None else pages
+
+    def _build_index(self) -> None:
+        self._normalized_pages = [_normalize(self.content[start:end]) for start, end in self.viewport_pages]
+        self._word_index = {}
+        for i, page in enumerate(self._normalized_pages):
+            for word in set(page.split()):
+                self._word_index.setdefault(word, set()).add(i)
+
 
 class MarkdownFileBrowser:
     """
@@ -21,6 +91,7 @@ def __init__(  # type: ignore
         viewport_size: Union[int, None] = 1024 * 8,
         base_path: str | None = os.getcwd(),
         cwd: str | None = None,
+        document_cache_size: int = 16,
     ):
         """
         Instantiate a new MarkdownFileBrowser.
@@ -29,6 +100,7 @@ def __init__(  # type: ignore
             viewport_size: Approximately how many *characters* fit in the viewport. Viewport dimensions are adjusted dynamically to avoid cutting off words (default: 8192).
             base_path: The base path to use for the file browser. Files outside this path cannot be accessed. Defaults to the current working directory.
             cwd: The browser's current working directory. Defaults to the system's current working directory.
+            document_cache_size: How many converted files to keep in memory, so that reopening an unchanged file does not convert it again (default: 16).
         """
         self.viewport_size = viewport_size  # Applies only to the standard uri types
         self.history: List[Tuple[str, float]] = list()
@@ -37,7 +109,9 @@ def __init__(  # type: ignore
         self.viewport_pages: List[Tuple[int, int]] = list()
         self._markdown_converter = MarkItDown()
         self._base_path = None if base_path is None else os.path.realpath(base_path)
-        self._page_content: str = ""
+        self._document = _Document(None, "", [(0, 0)])
+        self._document_cache: OrderedDict[Tuple[str, int, int, Optional[int]], _Document] = OrderedDict()
+        self._document_cache_size = document_cache_size
         self._find_on_page_query: Union[str, None] = None
         self._find_on_page_last_result: Union[int, None] = None  # Location of the last result
 
@@ -120,16 +194,18 @@ def viewport(self) -> str:
     @property
     def page_content(self) -> str:
         """Return the full contents of the current page."""
-        return self._page_content
+        return self._document.content
 
     def _set_page_content(self, content: str, split_pages: bool = True) -> None:
         """Sets the text content of the current page."""
-        self._page_content = content
+        viewport_pages = self._split_pages(content) if split_pages else [(0, len(content))]
+        self._set_document(_Document(self.page_title, content, viewport_pages))
 
-        if split_pages:
-            self._split_pages()
-        else:
-            self.viewport_pages = [(0, len(self._page_content))]
+    def _set_document(self, document: _Document) -> None:
+        """Sets the current page to an already converted document."""
+        self._document = document
+        self.page_title = document.title
+        self.viewport_pages = document.viewport_pages
 
         if self.viewport_current_page >= len(self.viewport_pages):
             self.viewport_current_page = len(self.viewport_pages) - 1
@@ -191,25 +267,18 @@ def _find_next_viewport(self, query: Optional[str], starting_viewport: int) -> U
             return None
 
         # Normalize the query, and convert to a regular expression
-        nquery = re.sub(r"\*", "__STAR__", query)
-        nquery = " " + (" ".join(re.split(r"\W+", nquery))).strip() + " "
-        nquery = nquery.replace(" __STAR__ ", "__STAR__ ")  # Merge isolated stars with prior word
-        nquery = nquery.replace("__STAR__", ".*").lower()
-
-        if nquery.strip() == "":
+        compiled = _compile_query(query)
+        if compiled is None:
             return None
+        nquery, words = compiled
 
-        idxs: List[int] = list()
-        idxs.extend(range(starting_viewport, len(self.viewport_pages)))
-        idxs.extend(range(0, starting_viewport))
-
-        for i in idxs:
-            bounds = self.viewport_pages[i]
-            content = self.page_content[bounds[0] : bounds[1]]
+        # Only viewports containing every whole word of the query can match
+        candidates = sorted(self._document.pages_with_words(words))
+        split = next((n for n, i in enumerate(candidates) if i >= starting_viewport), len(candidates))
 
+        for i in candidates[split:] + candidates[:split]:
             # TODO: Remove markdown links and images
-            ncontent = " " + (" ".join(re.split(r"\W+", content))).strip().lower() + " "
-            if re.search(nquery, ncontent):
+            if nquery.search(self._document.normalized_page(i)):
                 return i
 
         return None
@@ -219,23 +288,24 @@ def open_path(self, path: str) -> str:
         self.set_path(path)
         return self.viewport
 
-    def _split_pages(self) -> None:
+    def _split_pages(self, content: str) -> List[Tuple[int, int]]:
         """Split the page contents into pages that are approximately the viewport size. Small deviations are permitted to ensure words are not broken."""
         # Handle empty pages
-        if len(self._page_content) == 0:
-            self.viewport_pages = [(0, 0)]
-            return
+        if len(content) == 0:
+            return [(0, 0)]
 
         # Break the viewport into pages
-        self.viewport_pages = []
+        viewport_pages: List[Tuple[int, int]] = []
         start_idx = 0
-        while start_idx < len(self._page_content):
-            end_idx = min(start_idx + self.viewport_size, len(self._page_content))  # type: ignore[operator]
+        while start_idx < len(content):
+            end_idx = min(start_idx + self.viewport_size, len(content))  # type: ignore[operator]
             # Adjust to end on a space
-            while end_idx < len(self._page_content) and self._page_content[end_idx - 1] not in [" ", "\t", "\r", "\n"]:
-                end_idx += 1
-            self.viewport_pages.append((start_idx, end_idx))
+            if end_idx < len(content):
+                match = _WHITESPACE.search(content, end_idx - 1)
+                end_idx = match.end() if match else len(content)
+            viewport_pages.append((start_idx, end_idx))
             start_idx = end_idx
+        return viewport_pages
 
     def _open_path(
         self,
@@ -262,10 +332,18 @@ def _open_path(
                     self.page_title = res.title
                     self._set_page_content(res.text_content, split_pages=False)
                 else:
-                    res = self._markdown_converter.convert_local(path)
-                    assert self._validate_path(path)
-                    self.page_title = res.title
-                    self._set_page_content(res.text_content)
+                    stat = os.stat(path)
+                    cache_key = (path, stat.st_mtime_ns, stat.st_size, self.viewport_size)
+                    document = self._document_cache.get(cache_key)
+                    if document is None:
+                        res = self._markdown_converter.convert_local(path)
+                        assert self._validate_path(path)
+                        self.page_title = res.title
+                        self._set_page_content(res.text_content)
+                        self._cache_document(cache_key, self._document)
+                    else:
+                        self._document_cache.move_to_end(cache_key)
+                        self._set_document(document)
             except UnsupportedFormatException:
                 self.page_title = "UnsupportedFormatException"
                 self._set_page_content(f"# UnsupportedFormatException\n\nCannot preview '{path}' as Markdown.")
@@ -276,6 +354,14 @@ def _open_path(
                 self.page_title = "FileNotFoundError"
                 self._set_page_content(f"# FileNotFoundError\n\nFile not found: {path}")
 
+    def _cache_document(self, key: Tuple[str, int, int, Optional[int]], document: _Document) -> None:
+        """Keep a converted file for reuse, evicting the least recently opened one if the cache is full."""
+        if self._document_cache_size <= 0:
+            return
+        self._document_cache[key] = document
+        while len(self._document_cache) > self._document_cache_size:
+            self._document_cache.popitem(last=False)
+
     def _fetch_local_dir(self, local_path: str) -> str:
         """Render a local directory listing in HTML to assist with local file browsing via the "file://" protocol.
         Through rendered in HTML, later parts of the pipeline will convert the listing to Markdown.
@@ -1,4 +1,12 @@
+import asyncio
 import base64
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import cv2
@@ -11,16 +19,93 @@
     UserMessage,
 )
 
+WHISPER_MODEL_NAME = "base"
+
+# Frames further apart than this are reached by seeking instead of decoding every frame in between.
+_MAX_SEQUENTIAL_FRAME_GAP = 120
+
+_whisper_models: Dict[str, Any] = {}
+_whisper_lock = threading.Lock()
+# Content digests by path, size and modification time, least recently used first.
+_MAX_DIGESTS = 1024
+_digests: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+_digests_lock = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory where extracted audio and transcripts are cached.
+
+    Defaults to ``~/.cache/autogen/video_surfer`` and can be changed with the
+    ``AUTOGEN_VIDEO_SURFER_CACHE_DIR`` environment variable.
+    """
+    cache_dir = os.environ.get("AUTOGEN_VIDEO_SURFER_CACHE_DIR")
+    path = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "autogen" / "video_surfer"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _get_whisper_model(name: str = WHISPER_MODEL_NAME) -> Any:
+    """Loads a Whisper model once per process and returns the shared instance."""
+    with _whisper_lock:
+        model = _whisper_models.get(name)
+        if model is None:
+            model = whisper.load_model(name)  # type: ignore
+            _whisper_models[name] = model
+        return model
+
+
+def _file_digest(path: str) -> str:
+    """Returns the SHA-256 of a file's content, rehashing only if its size or modification time changed."""
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    with _digests_lock:
+        digest = _digests.get(key)
+        if digest is not None:
+            _digests.move_to_end(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        with _digests_lock:
+            _digests[key] = digest
+            while len(_digests) > _MAX_DIGESTS:
+                _digests.popitem(last=False)
+    return digest
+
+
+def _write_cache_file(path: Path, write: Any) -> None:
+    """Writes a cache entry through a temporary file so concurrent readers never see a partial entry."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
 def extract_audio(video_path: str, audio_output_path: str) -> str:
     """
     Extracts audio from a video file and saves it as an MP3 file.
 
+    The extracted audio is cached by the content hash of the video, so extracting
+    the audio of the same video again only copies the cached file.
+
     :param video_path: Path to the video file.
     :param audio_output_path: Path to save the extracted audio file.
     :return: Confirmation message with the path to the saved audio file.
     """
-    (ffmpeg.input(video_path).output(audio_output_path, format="mp3").run(quiet=True, overwrite_output=True))  # type: ignore
+    cached_audio = get_cache_dir() / f"{_file_digest(video_path)}.mp3"
+    if not cached_audio.exists():
+        _write_cache_file(
+            cached_audio,
+            lambda path: ffmpeg.input(video_path).output(path, format="mp3").run(quiet=True, overwrite_output=True),  # type: ignore
+        )
+    shutil.copyfile(cached_audio, audio_output_path)
     return f"Audio extracted and saved to {audio_output_path}."
 
 
@@ -28,10 +113,17 @@ def transcribe_audio_with_timestamps(audio_path: str) -> str:
     """
     Transcribes the audio file with timestamps using the Whisper model.
 
+    The Whisper model is loaded once per process, and transcripts are cached by
+    the content hash of the audio file.
+
     :param audio_path: Path to the audio file.
     :return: Transcription with timestamps.
     """
-    model = whisper.load_model("base")  # type: ignore
+    cached_transcript = get_cache_dir() / f"{_file_digest(audio_path)}.{WHISPER_MODEL_NAME}.txt"
+    if cached_transcript.exists():
+        return cached_transcript.read_text(encoding="utf-8")
+
+    model = _get_whisper_model()
     result: Dict[str, Any] = model.transcribe(audio_path, task="transcribe", language="en", verbose=False)  # type: ignore
 
     segments: List[Dict[str, Any]] = result["segments"]
@@ -43,6 +135,7 @@ def transcribe_audio_with_timestamps(audio_path: str) -> str:
         text: str = segment["text"]
         transcription_with_timestamps += f"[{start:.2f} - {end:.2f}] {text}\n"
 
+    _write_cache_file(cached_transcript, lambda path: Path(path).write_text(transcription_with_timestamps, "utf-8"))
     return transcription_with_timestamps
 
 
@@ -72,18 +165,8 @@ def save_screenshot(video_path: str, timestamp: float, output_path: str) -> None
     :param timestamp: Timestamp in seconds.
     :param output_path: Path to save the screenshot. The file format is determined by the extension in the path.
     """
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        raise IOError(f"Cannot open video file {video_path}")
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    frame_number = int(timestamp * fps)
-    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-    ret, frame = cap.read()
-    if ret:
-        cv2.imwrite(output_path, frame)
-    else:
-        raise IOError(f"Failed to capture frame at {timestamp:.2f}s")
-    cap.release()
+    _, frame = get_screenshot_at(video_path, [timestamp])[0]
+    cv2.imwrite(output_path, frame)
 
 
 async def transcribe_video_screenshot(video_path: str, timestamp: float, model_client: ChatCompletionClient) -> str:
@@ -95,15 +178,20 @@ async def transcribe_video_screenshot(video_path: str, timestamp: float, model_c
     :param model_client: ChatCompletionClient instance.
     :return: Description of the screenshot content.
     """
-    screenshots = get_screenshot_at(video_path, [timestamp])
-    if not screenshots:
-        return "Failed to capture screenshot."
 
-    _, frame = screenshots[0]
-    # Convert the frame to bytes and then to base64 encoding
-    _, buffer = cv2.imencode(".jpg", frame)
-    frame_bytes = buffer.tobytes()
-    frame_base64 = base64.b64encode(frame_bytes).decode("utf-8")
+    def capture() -> str | None:
+        screenshots = get_screenshot_at(video_path, [timestamp])
+        if not screenshots:
+            return None
+        _, frame = screenshots[0]
+        # Convert the frame to bytes and then to base64 encoding
+        _, buffer = cv2.imencode(".jpg", frame)
+        return base64.b64encode(buffer.tobytes()).decode("utf-8")
+
+    # Decoding and encoding the frame is CPU-bound, so keep it off the event loop.
+    frame_base64 = await asyncio.to_thread(capture)
+    if frame_base64 is None:
+        return "Failed to capture screenshot."
     screenshot_uri = f"data:image/jpeg;base64,{frame_base64}"
 
     messages = [
@@ -124,33 +212,46 @@ def get_screenshot_at(video_path: str, timestamps: List[float]) -> List[Tuple[fl
     """
     Captures screenshots at the specified timestamps and returns them as Python objects.
 
+    The requested frames are decoded in a single forward pass over the video: the
+    timestamps are sorted, nearby frames are reached by decoding sequentially and
+    only distant frames are reached by seeking.
+
     :param video_path: Path to the video file.
     :param timestamps: List of timestamps in seconds.
-    :return: List of tuples containing timestamp and the corresponding frame (image).
+    :return: List of tuples containing timestamp and the corresponding frame (image), in the order of `timestamps`.
              Each frame is a NumPy array (height x width x channels).
     """
-    screenshots: List[Tuple[float, np.ndarray[Any, Any]]] = []
-
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         raise IOError(f"Cannot open video file {video_path}")
 
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    total_frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-    duration = total_frames / fps
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+        duration = total_frames / fps
+
+        for timestamp in timestamps:
+            if not 0 <= timestamp <= duration:
+                raise ValueError(f"Timestamp {timestamp:.2f}s is out of range [0s, {duration:.2f}s]")
 
-    for timestamp in timestamps:
-        if 0 <= timestamp <= duration:
+        frames: Dict[int, np.ndarray[Any, Any]] = {}
+        position = -1  # Index of the next frame the decoder will return, -1 if unknown
+        for timestamp in sorted(timestamps):
             frame_number = int(timestamp * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            if frame_number in frames:
+                continue
+            if position < 0 or not 0 <= frame_number - position <= _MAX_SEQUENTIAL_FRAME_GAP:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                position = frame_number
+            # Skip the frames in between without converting them to images
+            while position < frame_number and cap.grab():
+                position += 1
             ret, frame = cap.read()
-            if ret:
-                # Append the timestamp and frame to the list
-                screenshots.append((timestamp, frame))
-            else:
+            if not ret or position != frame_number:
                 raise IOError(f"Failed to capture frame at {timestamp:.2f}s")
-        else:
-            raise ValueError(f"Timestamp {timestamp:.2f}s is out of range [0s, {duration:.2f}s]")
+            frames[frame_number] = frame
+            position += 1
+    finally:
+        cap.release()
 
-    cap.release()
-    return screenshots
+    return [(timestamp, frames[int(timestamp * fps)]) for timestamp in timestamps]
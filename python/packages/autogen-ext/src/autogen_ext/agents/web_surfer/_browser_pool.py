@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Set
+
+from autogen_core import EVENT_LOGGER_NAME
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+logger = logging.getLogger(EVENT_LOGGER_NAME + ".BrowserPool")
+
+
+@dataclass
+class BrowserPoolStats:
+    """Statistics of a :class:`BrowserPool`. Times are in seconds."""
+
+    browsers: int = 0
+    """Number of browser processes currently running."""
+    contexts_in_use: int = 0
+    """Number of browser contexts currently handed out."""
+    idle_contexts: int = 0
+    """Number of browser contexts ready to be handed out again."""
+    acquisitions: int = 0
+    """Number of contexts acquired from the pool."""
+    total_acquire_time: float = 0.0
+    """Total time spent waiting to acquire a context, including launching browsers and creating contexts."""
+    max_acquire_time: float = 0.0
+    """Longest time spent waiting to acquire a context."""
+    recycled_contexts: int = 0
+    """Number of released contexts that were closed and replaced by a fresh one."""
+
+    @property
+    def mean_acquire_time(self) -> float:
+        return self.total_acquire_time / self.acquisitions if self.acquisitions else 0.0
+
+
+class _PooledBrowser:
+    def __init__(self, browser: Browser) -> None:
+        self.browser = browser
+        # Contexts of this browser that are handed out or idle
+        self.contexts = 0
+
+
+class _PooledContext:
+    def __init__(self, context: BrowserContext, browser: _PooledBrowser, context_args: Dict[str, Any]) -> None:
+        self.context = context
+        self.browser = browser
+        # The options the context was created with
+        self.context_args = context_args
+
+
+class BrowserPool:
+    """
+    A pool of browser contexts shared by several :class:`MultimodalWebSurfer` agents.
+
+    A single Playwright driver runs up to `max_browsers` Chromium processes, each serving
+    up to `max_contexts_per_browser` contexts. Each agent acquires its own
+    :class:`~playwright.async_api.BrowserContext`, so agents do not share pages, and
+    starting an agent costs a new context rather than a new browser process.
+    When all browsers are at capacity, :meth:`acquire` waits for a context to be released.
+
+    Released contexts are closed, so no pages, cookies, storage or cache carry over to the
+    next agent, and a fresh context with the same options is created in their place, ready
+    to be handed out. Agents can pass their own context options, such as the user agent and
+    viewport, to :meth:`acquire`.
+
+    Args:
+        max_browsers (int): The maximum number of browser processes. Defaults to 2.
+        max_contexts_per_browser (int): The maximum number of contexts per browser process. Defaults to 8.
+        headless (bool): Whether the browsers are headless. Defaults to True.
+        browser_channel (str, optional): The browser channel, e.g. "chrome" or "msedge". Defaults to None.
+        launch_args (Mapping[str, Any], optional): Extra keyword arguments to launch the browsers with.
+        context_args (Mapping[str, Any], optional): Extra keyword arguments to create the contexts with.
+        playwright (Playwright, optional): A started Playwright instance to use. Defaults to None,
+            in which case the pool starts and stops its own.
+
+    Example usage:
+
+        .. code-block:: python
+
+            import asyncio
+            from autogen_agentchat.teams import RoundRobinGroupChat
+            from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+            async def main() -> None:
+                model_client = OpenAIChatCompletionClient(model="gpt-4o-2024-08-06")
+                async with BrowserPool(max_browsers=1, max_contexts_per_browser=4) as pool:
+                    surfers = [
+                        MultimodalWebSurfer(f"WebSurfer{i}", model_client=model_client, browser_pool=pool) for i in range(4)
+                    ]
+                    team = RoundRobinGroupChat(surfers, max_turns=4)
+                    await team.run(task="Find the AutoGen readme on GitHub.")
+                    for surfer in surfers:
+                        await surfer.close()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        *,
+        max_browsers: int = 2,
+        max_contexts_per_browser: int = 8,
+        headless: bool = True,
+        browser_channel: str | None = None,
+        launch_args: Mapping[str, Any] | None = None,
+        context_args: Mapping[str, Any] | None = None,
+        playwright: Playwright | None = None,
+    ) -> None:
+        if max_browsers < 1:
+            raise ValueError("max_browsers must be at least 1.")
+        if max_contexts_per_browser < 1:
+            raise ValueError("max_contexts_per_browser must be at least 1.")
+        self._max_browsers = max_browsers
+        self._max_contexts_per_browser = max_contexts_per_browser
+        self._launch_args: Dict[str, Any] = {"headless": headless, **(launch_args or {})}
+        if browser_channel is not None:
+            self._launch_args["channel"] = browser_channel
+        self._context_args: Dict[str, Any] = dict(context_args or {})
+
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
+        self._browsers: List[_PooledBrowser] = []
+        self._launching = 0
+        self._idle: List[_PooledContext] = []
+        self._in_use: Dict[BrowserContext, _PooledContext] = {}
+        # Contexts that were handed out when the pool was stopped, and were closed with it
+        self._closed_by_stop: Set[BrowserContext] = set()
+        self._condition = asyncio.Condition()
+        self._stats = BrowserPoolStats()
+
+    @property
+    def stats(self) -> BrowserPoolStats:
+        """A snapshot of the pool statistics."""
+        return BrowserPoolStats(
+            browsers=len(self._browsers),
+            contexts_in_use=len(self._in_use),
+            idle_contexts=len(self._idle),
+            acquisitions=self._stats.acquisitions,
+            total_acquire_time=self._stats.total_acquire_time,
+            max_acquire_time=self._stats.max_acquire_time,
+            recycled_contexts=self._stats.recycled_contexts,
+        )
+
+    async def start(self) -> None:
+        """Start the Playwright driver. Browsers are launched on demand."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+    async def stop(self) -> None:
+        """Close all contexts and browsers, and stop the Playwright driver if the pool started it."""
+        async with self._condition:
+            browsers = list(self._browsers)
+            self._browsers.clear()
+            self._idle.clear()
+            self._closed_by_stop.update(self._in_use)
+            self._in_use.clear()
+            self._condition.notify_all()
+        for pooled_browser in browsers:
+            try:
+                await pooled_browser.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        if self._owns_playwright and self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    async def acquire(self, **context_args: Any) -> BrowserContext:
+        """Acquire a browser context for exclusive use. It must be returned with :meth:`release`.
+
+        Args:
+            **context_args: Options to create the context with, in addition to the `context_args` of the pool.
+        """
+        await self.start()
+        args = {**self._context_args, **context_args}
+        stale: List[_PooledContext] = []
+        start_time = time.perf_counter()
+        pooled: _PooledContext | None = None
+        target: _PooledBrowser | None = None
+        async with self._condition:
+            while True:
+                # Prefer a context that was already created with the same options
+                for candidate in list(self._idle):
+                    if candidate.browser not in self._browsers or not candidate.browser.browser.is_connected():
+                        self._idle.remove(candidate)
+                        candidate.browser.contexts -= 1
+                    elif pooled is None and candidate.context_args == args:
+                        self._idle.remove(candidate)
+                        pooled = candidate
+                if pooled is not None:
+                    break
+                # Otherwise create a context in the least loaded browser with spare capacity
+                self._browsers = [b for b in self._browsers if b.browser.is_connected()]
+                available = [b for b in self._browsers if b.contexts < self._max_contexts_per_browser]
+                if not available and self._idle and len(self._browsers) + self._launching >= self._max_browsers:
+                    # Make room by closing an idle context that was created with other options
+                    evicted = self._idle.pop(0)
+                    stale.append(evicted)
+                    target = evicted.browser
+                    break
+                if available:
+                    target = min(available, key=lambda b: b.contexts)
+                    target.contexts += 1
+                    break
+                if len(self._browsers) + self._launching < self._max_browsers:
+                    self._launching += 1
+                    break
+                await self._condition.wait()
+
+        for evicted in stale:
+            await self._close_context(evicted.context)
+
+        if pooled is None:
+            try:
+                if target is None:
+                    target = await self._launch_browser()
+                pooled = _PooledContext(await target.browser.new_context(**args), target, args)
+            except BaseException:
+                async with self._condition:
+                    if target is not None:
+                        target.contexts -= 1
+                    self._condition.notify()
+                raise
+
+        self._in_use[pooled.context] = pooled
+        acquire_time = time.perf_counter() - start_time
+        self._stats.acquisitions += 1
+        self._stats.total_acquire_time += acquire_time
+        self._stats.max_acquire_time = max(self._stats.max_acquire_time, acquire_time)
+        return pooled.context
+
+    async def release(self, context: BrowserContext) -> None:
+        """Return a context acquired with :meth:`acquire` to the pool.
+
+        The context is closed, and a fresh one with the same options takes its place.
+        Releasing a context after the pool was stopped does nothing.
+        """
+        pooled = self._in_use.pop(context, None)
+        if pooled is None:
+            if context in self._closed_by_stop:
+                self._closed_by_stop.discard(context)
+                return
+            raise ValueError("The context was not acquired from this pool.")
+
+        await self._close_context(context)
+        replacement: _PooledContext | None = None
+        if pooled.browser in self._browsers and pooled.browser.browser.is_connected():
+            try:
+                replacement = _PooledContext(
+                    await pooled.browser.browser.new_context(**pooled.context_args), pooled.browser, pooled.context_args
+                )
+                self._stats.recycled_contexts += 1
+            except Exception as e:
+                logger.warning(f"Error creating browser context: {e}")
+
+        async with self._condition:
+            kept = replacement is not None and pooled.browser in self._browsers
+            if replacement is not None and kept:
+                self._idle.append(replacement)
+            else:
+                pooled.browser.contexts -= 1
+            self._condition.notify()
+        if replacement is not None and not kept:
+            # The pool was stopped while the replacement was created
+            await self._close_context(replacement.context)
+
+    @asynccontextmanager
+    async def context(self) -> AsyncGenerator[BrowserContext, None]:
+        """Acquire a browser context and release it on exit."""
+        context = await self.acquire()
+        try:
+            yield context
+        finally:
+            await self.release(context)
+
+    async def _close_context(self, context: BrowserContext) -> None:
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+    async def _launch_browser(self) -> _PooledBrowser:
+        assert self._playwright is not None
+        try:
+            browser = await self._playwright.chromium.launch(**self._launch_args)
+        except BaseException:
+            async with self._condition:
+                self._launching -= 1
+                self._condition.notify()
+            raise
+        pooled_browser = _PooledBrowser(browser)
+        pooled_browser.contexts = 1
+        async with self._condition:
+            self._launching -= 1
+            self._browsers.append(pooled_browser)
+            self._condition.notify_all()
+        return pooled_browser
@@ -21,13 +21,11 @@
 from urllib.parse import quote_plus
 
 import aiofiles
-import PIL.Image
 from autogen_agentchat.agents import BaseChatAgent
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, MultiModalMessage, TextMessage
 from autogen_agentchat.utils import content_to_str, remove_images
 from autogen_core import EVENT_LOGGER_NAME, CancellationToken, Component, ComponentModel, FunctionCall
-from autogen_core import Image as AGImage
 from autogen_core.models import (
     AssistantMessage,
     ChatCompletionClient,
@@ -37,11 +35,11 @@
     SystemMessage,
     UserMessage,
 )
-from PIL import Image
 from playwright.async_api import BrowserContext, Download, Page, Playwright, async_playwright
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ._browser_pool import BrowserPool
 from ._events import WebSurferEvent
 from ._prompts import (
     WEB_SURFER_QA_PROMPT,
@@ -49,7 +47,7 @@
     WEB_SURFER_TOOL_PROMPT_MM,
     WEB_SURFER_TOOL_PROMPT_TEXT,
 )
-from ._set_of_mark import add_set_of_mark
+from ._screenshot_pipeline import ScreenshotFormat, ScreenshotPipeline
 from ._tool_definitions import (
     TOOL_CLICK,
     TOOL_HISTORY_BACK,
@@ -83,6 +81,8 @@ class MultimodalWebSurferConfig(BaseModel):
     browser_channel: str | None = None
     browser_data_dir: str | None = None
     to_resize_viewport: bool = True
+    screenshot_format: ScreenshotFormat = "png"
+    screenshot_quality: int = 85
 
 
 class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
@@ -142,8 +142,14 @@ class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
         browser_channel (str, optional): The browser channel. Defaults to None.
         browser_data_dir (str, optional): The browser data directory. Defaults to None.
         to_resize_viewport (bool, optional): Whether to resize the viewport. Defaults to True.
+        screenshot_format (str, optional): The image format of the screenshots sent to the model: "png" or "jpeg".
+            JPEG is much smaller than PNG. Defaults to "png".
+        screenshot_quality (int, optional): The encoding quality (1-100) of JPEG screenshots. Defaults to 85.
         playwright (Playwright, optional): The playwright instance. Defaults to None.
         context (BrowserContext, optional): The browser context. Defaults to None.
+        browser_pool (BrowserPool, optional): A pool to acquire the browser context from, so that several agents share
+            browser processes. Ignored if `context` is given. The context is returned to the pool by :meth:`close`.
+            Defaults to None, in which case the agent launches its own browser.
 
 
 
@@ -199,6 +205,8 @@ async def main() -> None:
     VIEWPORT_HEIGHT = 900
     VIEWPORT_WIDTH = 1440
 
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
+
     # Size of the image we send to the MLM
     # Current values represent a 0.85 scaling to fit within the GPT-4v short-edge constraints (768px)
     MLM_HEIGHT = 765
@@ -221,8 +229,11 @@ def __init__(
         browser_channel: str | None = None,
         browser_data_dir: str | None = None,
         to_resize_viewport: bool = True,
+        screenshot_format: ScreenshotFormat = "png",
+        screenshot_quality: int = 85,
         playwright: Playwright | None = None,
         context: BrowserContext | None = None,
+        browser_pool: BrowserPool | None = None,
     ):
         """
         Initialize the MultimodalWebSurfer.
@@ -248,10 +259,19 @@ def __init__(
         self.use_ocr = use_ocr
         self.to_resize_viewport = to_resize_viewport
         self.animate_actions = animate_actions
+        self.screenshot_format: ScreenshotFormat = screenshot_format
+        self.screenshot_quality = screenshot_quality
+
+        # Decodes, annotates and encodes screenshots off the event loop, skipping unchanged work
+        self._screenshot_pipeline = ScreenshotPipeline(
+            (self.MLM_WIDTH, self.MLM_HEIGHT), image_format=screenshot_format, quality=screenshot_quality
+        )
 
         # Call init to set these in case not set
         self._playwright: Playwright | None = playwright
         self._context: BrowserContext | None = context
+        self._browser_pool = browser_pool
+        self._context_from_pool = False
         self._page: Page | None = None
         self._last_download: Download | None = None
         self._prior_metadata_hash: str | None = None
@@ -315,16 +335,21 @@ async def _lazy_init(
         launch_args: Dict[str, Any] = {"headless": self.headless}
         if self.browser_channel is not None:
             launch_args["channel"] = self.browser_channel
-        if self._playwright is None:
+        if self._context is None and self._browser_pool is not None:
+            context_args: Dict[str, Any] = {"user_agent": self.USER_AGENT}
+            if self.to_resize_viewport:
+                context_args["viewport"] = {"width": self.VIEWPORT_WIDTH, "height": self.VIEWPORT_HEIGHT}
+            self._context = await self._browser_pool.acquire(**context_args)
+            self._context_from_pool = True
+        if self._playwright is None and self._context is None:
             self._playwright = await async_playwright().start()
 
         # Create the context -- are we launching persistent?
         if self._context is None:
+            assert self._playwright is not None
             if self.browser_data_dir is None:
                 browser = await self._playwright.chromium.launch(**launch_args)
-                self._context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
-                )
+                self._context = await browser.new_context(user_agent=self.USER_AGENT)
             else:
                 self._context = await self._playwright.chromium.launch_persistent_context(
                     self.browser_data_dir, **launch_args
@@ -357,7 +382,12 @@ async def close(self) -> None:
             await self._page.close()
             self._page = None
         if self._context is not None:
-            await self._context.close()
+            if self._context_from_pool:
+                assert self._browser_pool is not None
+                await self._browser_pool.release(self._context)
+                self._context_from_pool = False
+            else:
+                await self._context.close()
             self._context = None
         if self._playwright is not None:
             await self._playwright.stop()
@@ -491,12 +521,15 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
         rects = await self._playwright_controller.get_interactive_rects(self._page)
         viewport = await self._playwright_controller.get_visual_viewport(self._page)
         screenshot = await self._page.screenshot()
-        som_screenshot, visible_rects, rects_above, rects_below = add_set_of_mark(screenshot, rects)
+        som_screenshot = await self._screenshot_pipeline.set_of_mark(screenshot, rects)
+        visible_rects = som_screenshot.visible_rects
+        rects_above = som_screenshot.rects_above
+        rects_below = som_screenshot.rects_below
 
         if self.to_save_screenshots:
             current_timestamp = "_" + int(time.time()).__str__()
             screenshot_png_name = "screenshot_som" + current_timestamp + ".png"
-            som_screenshot.save(os.path.join(self.debug_dir, screenshot_png_name))  # type: ignore
+            som_screenshot.annotated.save(os.path.join(self.debug_dir, screenshot_png_name))  # type: ignore
             self.logger.info(
                 WebSurferEvent(
                     source=self.name,
@@ -569,15 +602,13 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
                 url=self._page.url,
             ).strip()
 
-            # Scale the screenshot for the MLM, and close the original
-            scaled_screenshot = som_screenshot.resize((self.MLM_WIDTH, self.MLM_HEIGHT))
-            som_screenshot.close()
+            # The screenshot is already scaled for the MLM
             if self.to_save_screenshots:
-                scaled_screenshot.save(os.path.join(self.debug_dir, "screenshot_scaled.png"))  # type: ignore
+                som_screenshot.image.image.save(os.path.join(self.debug_dir, "screenshot_scaled.png"))  # type: ignore
 
             # Create the message
             prompt_message = UserMessage(
-                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), AGImage.from_pil(scaled_screenshot)],
+                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), som_screenshot.image],
                 source=self.name,
             )
         else:
@@ -814,7 +845,8 @@ async def _execute_tool(
 
         return [
             re.sub(r"(\n\s*){3,}", "\n\n", message_content),  # Removing blank lines
-            AGImage.from_pil(PIL.Image.open(io.BytesIO(new_screenshot))),
+            # An unchanged page reuses the image encoded for the previous screenshot
+            await self._screenshot_pipeline.encode(new_screenshot),
         ]
 
     async def _get_state_description(self) -> str:
@@ -887,10 +919,9 @@ async def _summarize_page(
             pass
 
         # Take a screenshot and scale it
-        screenshot = Image.open(io.BytesIO(await self._page.screenshot()))
-        scaled_screenshot = screenshot.resize((self.MLM_WIDTH, self.MLM_HEIGHT))
-        screenshot.close()
-        ag_image = AGImage.from_pil(scaled_screenshot)
+        ag_image = await self._screenshot_pipeline.encode(
+            await self._page.screenshot(), size=(self.MLM_WIDTH, self.MLM_HEIGHT)
+        )
 
         # Prepare the system prompt
         messages: List[LLMMessage] = []
@@ -906,10 +937,10 @@ async def _summarize_page(
             )
 
             try:
-                remaining = self._model_client.remaining_tokens(messages + [trial_message])
+                remaining = await self._model_client.aremaining_tokens(messages + [trial_message])
             except KeyError:
                 # Use the default if the model isn't found
-                remaining = DEFAULT_CONTEXT_SIZE - self._model_client.count_tokens(messages + [trial_message])
+                remaining = DEFAULT_CONTEXT_SIZE - await self._model_client.acount_tokens(messages + [trial_message])
 
             if self._model_client.model_info["vision"] and remaining <= 0:
                 break
@@ -948,7 +979,6 @@ async def _summarize_page(
         # Generate the response
         response = await self._model_client.create(messages, cancellation_token=cancellation_token)
         self.model_usage.append(response.usage)
-        scaled_screenshot.close()
         assert isinstance(response.content, str)
         return response.content
 
@@ -967,6 +997,8 @@ def _to_config(self) -> MultimodalWebSurferConfig:
             browser_channel=self.browser_channel,
             browser_data_dir=self.browser_data_dir,
             to_resize_viewport=self.to_resize_viewport,
+            screenshot_format=self.screenshot_format,
+            screenshot_quality=self.screenshot_quality,
         )
 
     @classmethod
@@ -985,4 +1017,6 @@ def _from_config(cls, config: MultimodalWebSurferConfig) -> Self:
             browser_channel=config.browser_channel,
             browser_data_dir=config.browser_data_dir,
             to_resize_viewport=config.to_resize_viewport,
+            screenshot_format=config.screenshot_format,
+            screenshot_quality=config.screenshot_quality,
         )
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import io
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional, Tuple
+
+from autogen_core import Image as AGImage
+from PIL import Image
+
+from ._set_of_mark import draw_set_of_mark_overlay
+from ._types import InteractiveRegion
+
+ScreenshotFormat = Literal["png", "jpeg"]
+
+
+@dataclass
+class SetOfMarkScreenshot:
+    """A set-of-mark screenshot prepared for the model."""
+
+    image: AGImage
+    """The annotated screenshot, scaled and encoded for the model."""
+    annotated: Image.Image
+    """The annotated screenshot at full size."""
+    visible_rects: List[str]
+    rects_above: List[str]
+    rects_below: List[str]
+
+
+@dataclass
+class ScreenshotPipelineStats:
+    """Counts of the work done and avoided by a :class:`ScreenshotPipeline`."""
+
+    captures: int = 0
+    """Number of screenshots processed."""
+    reused: int = 0
+    """Number of screenshots for which a previous result was returned as is."""
+    decodes: int = 0
+    """Number of screenshots decoded."""
+    overlays: int = 0
+    """Number of set-of-mark overlays drawn."""
+    encodes: int = 0
+    """Number of images encoded for the model."""
+
+
+class ScreenshotPipeline:
+    """Turns raw PNG screenshots into images for the model, doing the image work in a worker thread.
+
+    Work is skipped when its inputs did not change since the previous screenshot:
+
+    - If both the screenshot and the interactive regions are identical, the previous
+      set-of-mark result is returned without any decoding or encoding.
+    - If only the regions changed, the decoded screenshot is reused.
+    - If only the screenshot changed, the set-of-mark overlay is reused.
+
+    :meth:`encode` keeps the latest image for each size, so encoding an unchanged screenshot again,
+    such as the observation after an action that did not change the page, returns the previous image.
+
+    Images are encoded in `image_format` with `quality` (ignored for PNG). The returned
+    images keep their encoded bytes, so they are not converted back to PNG when sent to the model.
+    Not safe for concurrent use; each agent owns its pipeline.
+    """
+
+    def __init__(self, model_size: Tuple[int, int], image_format: ScreenshotFormat = "png", quality: int = 85) -> None:
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported screenshot format '{image_format}'. Use 'png' or 'jpeg'.")
+        if not 1 <= quality <= 100:
+            raise ValueError("quality must be between 1 and 100.")
+        self.model_size = model_size
+        self.image_format = image_format
+        self.quality = quality
+        self.stats = ScreenshotPipelineStats()
+
+        self._base_key: Optional[bytes] = None
+        self._base: Optional[Image.Image] = None
+        self._overlay_key: Optional[Tuple[bytes, Tuple[int, int]]] = None
+        self._overlay: Optional[Tuple[Image.Image, List[str], List[str], List[str]]] = None
+        self._som_key: Optional[Tuple[bytes, bytes]] = None
+        self._som: Optional[SetOfMarkScreenshot] = None
+        # The latest encoded screenshot and its digest, by size
+        self._encoded: Dict[Optional[Tuple[int, int]], Tuple[bytes, AGImage]] = {}
+
+    async def set_of_mark(self, screenshot: bytes, rects: Dict[str, InteractiveRegion]) -> SetOfMarkScreenshot:
+        """Annotate a screenshot with the interactive regions, and scale and encode it for the model."""
+        self.stats.captures += 1
+        key = (_digest(screenshot), _digest(json.dumps(rects, sort_keys=True).encode("utf-8")))
+        if self._som is not None and self._som_key == key:
+            self.stats.reused += 1
+            return self._som
+        som = await asyncio.to_thread(self._set_of_mark, screenshot, key, rects)
+        self._som_key = key
+        self._som = som
+        return som
+
+    async def encode(self, screenshot: bytes, size: Optional[Tuple[int, int]] = None) -> AGImage:
+        """Encode a screenshot for the model, optionally scaled to `size`."""
+        self.stats.captures += 1
+        digest = _digest(screenshot)
+        cached = self._encoded.get(size)
+        if cached is not None and cached[0] == digest:
+            self.stats.reused += 1
+            return cached[1]
+        image = await asyncio.to_thread(self._encode_screenshot, screenshot, size)
+        # Only the latest screenshot of each size is likely to be requested again
+        self._encoded[size] = (digest, image)
+        return image
+
+    def _set_of_mark(
+        self, screenshot: bytes, key: Tuple[bytes, bytes], rects: Dict[str, InteractiveRegion]
+    ) -> SetOfMarkScreenshot:
+        pixels_key, rects_key = key
+        if self._base is None or self._base_key != pixels_key:
+            self.stats.decodes += 1
+            with Image.open(io.BytesIO(screenshot)) as image:
+                self._base = image.convert("L").convert("RGBA")
+            self._base_key = pixels_key
+        base = self._base
+
+        if self._overlay is None or self._overlay_key != (rects_key, base.size):
+            self.stats.overlays += 1
+            self._overlay = draw_set_of_mark_overlay(base.size, rects)
+            self._overlay_key = (rects_key, base.size)
+        overlay, visible_rects, rects_above, rects_below = self._overlay
+
+        annotated = Image.alpha_composite(base, overlay)
+        scaled = annotated.resize(self.model_size)
+        return SetOfMarkScreenshot(
+            image=AGImage.from_bytes(self._encode(scaled)),
+            annotated=annotated,
+            visible_rects=list(visible_rects),
+            rects_above=list(rects_above),
+            rects_below=list(rects_below),
+        )
+
+    def _encode_screenshot(self, screenshot: bytes, size: Optional[Tuple[int, int]]) -> AGImage:
+        if size is None and self.image_format == "png":
+            # Already a PNG, no need to decode or encode it again
+            return AGImage.from_bytes(screenshot)
+        self.stats.decodes += 1
+        with Image.open(io.BytesIO(screenshot)) as image:
+            resized = image.resize(size) if size is not None else image.copy()
+        return AGImage.from_bytes(self._encode(resized))
+
+    def _encode(self, image: Image.Image) -> bytes:
+        self.stats.encodes += 1
+        buffer = io.BytesIO()
+        if self.image_format == "png":
+            image.save(buffer, format="PNG")
+        else:
+            image.convert("RGB").save(buffer, format="JPEG", quality=self.quality)
+        return buffer.getvalue()
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
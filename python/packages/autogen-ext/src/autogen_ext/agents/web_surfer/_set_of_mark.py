@@ -28,13 +28,27 @@ def add_set_of_mark(
 def _add_set_of_mark(
     screenshot: Image.Image, ROIs: Dict[str, InteractiveRegion]
 ) -> Tuple[Image.Image, List[str], List[str], List[str]]:
+    base = screenshot.convert("L").convert("RGBA")
+    overlay, visible_rects, rects_above, rects_below = draw_set_of_mark_overlay(base.size, ROIs)
+    comp = Image.alpha_composite(base, overlay)
+    overlay.close()
+    return comp, visible_rects, rects_above, rects_below
+
+
+def draw_set_of_mark_overlay(
+    size: Tuple[int, int], ROIs: Dict[str, InteractiveRegion]
+) -> Tuple[Image.Image, List[str], List[str], List[str]]:
+    """Draw the set-of-mark boxes and labels on a transparent overlay of the given size.
+
+    The overlay only depends on the interactive regions, so it can be reused across
+    screenshots of the same viewport while the regions do not change.
+    """
     visible_rects: List[str] = list()
     rects_above: List[str] = list()  # Scroll up to see
     rects_below: List[str] = list()  # Scroll down to see
 
     fnt = ImageFont.load_default(14)
-    base = screenshot.convert("L").convert("RGBA")
-    overlay = Image.new("RGBA", base.size)
+    overlay = Image.new("RGBA", size)
 
     draw = ImageDraw.Draw(overlay)
     for r in ROIs:
@@ -47,18 +61,16 @@ def _add_set_of_mark(
 
             mid = ((rect["right"] + rect["left"]) / 2.0, (rect["top"] + rect["bottom"]) / 2.0)
 
-            if 0 <= mid[0] and mid[0] < base.size[0]:
+            if 0 <= mid[0] and mid[0] < size[0]:
                 if mid[1] < 0:
                     rects_above.append(r)
-                elif mid[1] >= base.size[1]:
+                elif mid[1] >= size[1]:
                     rects_below.append(r)
                 else:
                     visible_rects.append(r)
                     _draw_roi(draw, int(r), fnt, rect)
 
-    comp = Image.alpha_composite(base, overlay)
-    overlay.close()
-    return comp, visible_rects, rects_above, rects_below
+    return overlay, visible_rects, rects_above, rects_below
 
 
 def _draw_roi(
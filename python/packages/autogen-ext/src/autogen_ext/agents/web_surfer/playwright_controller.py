@@ -85,6 +85,29 @@ async def sleep(self, page: Page, duration: Union[int, float]) -> None:
         assert page is not None
         await page.wait_for_timeout(duration * 1000)
 
+    async def _call_page_script(self, page: Page, function: str) -> Any:
+        """
+        Call a function of the page script in a single round trip, evaluating the script
+        first only if the page does not have it yet (it is usually added as an init script).
+
+        Args:
+            page (Page): The Playwright page object.
+            function (str): The name of the function of the `MultimodalWebSurfer` page object to call.
+
+        Returns:
+            Any: The result of the function.
+        """
+        installed, result = await page.evaluate(
+            f"typeof MultimodalWebSurfer === 'undefined' ? [false, null] : [true, MultimodalWebSurfer.{function}()];"
+        )
+        if installed:
+            return result
+        try:
+            await page.evaluate(self._page_script)
+        except Exception:
+            pass
+        return await page.evaluate(f"MultimodalWebSurfer.{function}();")
+
     async def get_interactive_rects(self, page: Page) -> Dict[str, InteractiveRegion]:
         """
         Retrieve interactive regions from the web page.
@@ -97,11 +120,7 @@ async def get_interactive_rects(self, page: Page) -> Dict[str, InteractiveRegion
         """
         assert page is not None
         # Read the regions from the DOM
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = cast(Dict[str, Dict[str, Any]], await page.evaluate("MultimodalWebSurfer.getInteractiveRects();"))
+        result = cast(Dict[str, Dict[str, Any]], await self._call_page_script(page, "getInteractiveRects"))
 
         # Convert the results into appropriate types
         assert isinstance(result, dict)
@@ -123,11 +142,7 @@ async def get_visual_viewport(self, page: Page) -> VisualViewport:
             VisualViewport: The visual viewport of the page.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        return visualviewport_from_dict(await page.evaluate("MultimodalWebSurfer.getVisualViewport();"))
+        return visualviewport_from_dict(await self._call_page_script(page, "getVisualViewport"))
 
     async def get_focused_rect_id(self, page: Page) -> str | None:
         """
@@ -140,11 +155,7 @@ async def get_focused_rect_id(self, page: Page) -> str | None:
             str: The ID of the focused element or None if no control has focus.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getFocusedElementId();")
+        result = await self._call_page_script(page, "getFocusedElementId")
         return None if result is None else str(result)
 
     async def get_page_metadata(self, page: Page) -> Dict[str, Any]:
@@ -158,11 +169,7 @@ async def get_page_metadata(self, page: Page) -> Dict[str, Any]:
             Dict[str, Any]: A dictionary of page metadata.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getPageMetadata();")
+        result = await self._call_page_script(page, "getPageMetadata")
         assert isinstance(result, dict)
         return cast(Dict[str, Any], result)
 
@@ -545,11 +552,7 @@ async def get_visible_text(self, page: Page) -> str:
             str: The text content of the page.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getVisibleText();")
+        result = await self._call_page_script(page, "getVisibleText")
         assert isinstance(result, str)
         return result
 
@@ -1,8 +1,9 @@
 import os
-import pickle
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, TypedDict
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
+from ._sqlite_map import SqliteMap
 from ._string_similarity_map import StringSimilarityMap
 from .utils.page_logger import PageLogger
 
@@ -24,6 +25,17 @@ class MemoryBankConfig(TypedDict, total=False):
     relevance_conversion_threshold: float
     n_results: int
     distance_threshold: int
+    save_interval: int
+
+
+def _decode_memo(value: Dict[str, Any]) -> Memo:
+    return Memo(**value)
+
+
+def _close_stores(uid_memo_dict: SqliteMap[Memo], string_map: StringSimilarityMap) -> None:
+    # Memos are saved before the string pairs that point to them, so a saved string pair never points to a lost memo.
+    uid_memo_dict.close()
+    string_map.close()
 
 
 class MemoryBank:
@@ -38,6 +50,8 @@ class MemoryBank:
             - relevance_conversion_threshold: The threshold used to normalize relevance.
             - n_results: The maximum number of most relevant results to return for any given topic.
             - distance_threshold: The maximum string-pair distance for a memo to be retrieved.
+            - save_interval: The number of memos added between saves to disk. Unsaved memos are saved by close(),
+              which also runs when the app exits normally, and are lost if the app crashes.
 
         logger: An optional logger. If None, no logging will be performed.
     """
@@ -58,6 +72,7 @@ def __init__(
         self.relevance_conversion_threshold = 1.7
         self.n_results = 25
         self.distance_threshold = 100
+        self.save_interval = 1
         if config is not None:
             memory_dir_path = config.get("path", memory_dir_path)
             self.relevance_conversion_threshold = config.get(
@@ -65,30 +80,42 @@ def __init__(
             )
             self.n_results = config.get("n_results", self.n_results)
             self.distance_threshold = config.get("distance_threshold", self.distance_threshold)
+            self.save_interval = config.get("save_interval", self.save_interval)
 
         memory_dir_path = os.path.expanduser(memory_dir_path)
         self.logger.info("\nMEMORY BANK DIRECTORY  {}".format(memory_dir_path))
         path_to_db_dir = os.path.join(memory_dir_path, "string_map")
-        self.path_to_dict = os.path.join(memory_dir_path, "uid_memo_dict.pkl")
+        self.path_to_dict = os.path.join(memory_dir_path, "memos.sqlite")
+        # Memos were pickled by earlier versions.
+        self.path_to_pickle = os.path.join(memory_dir_path, "uid_memo_dict.pkl")
 
         self.string_map = StringSimilarityMap(reset=reset, path_to_db_dir=path_to_db_dir, logger=self.logger)
 
-        # Load or create the associated memo dict on disk.
-        self.uid_memo_dict: Dict[str, Memo] = {}
-        self.last_memo_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.info("\nLOADING MEMOS FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_memo_dict = pickle.load(f)
-                self.last_memo_id = len(self.uid_memo_dict)
-                self.logger.info("\n{} MEMOS LOADED".format(len(self.uid_memo_dict)))
+        # Open or create the associated memo dict on disk. Memos are only loaded when they are retrieved.
+        self.uid_memo_dict: SqliteMap[Memo] = SqliteMap(self.path_to_dict, encode=asdict, decode=_decode_memo)
+        self.num_unsaved_memos = 0
+        if not reset:
+            num_migrated = self.uid_memo_dict.migrate_from_pickle(self.path_to_pickle)
+            if num_migrated > 0:
+                self.logger.info("\n{} MEMOS MIGRATED FROM  {}".format(num_migrated, self.path_to_pickle))
+            self.logger.info("\n{} MEMOS FOUND ON DISK  at {}".format(len(self.uid_memo_dict), self.path_to_dict))
+        # Continue after the largest memo id in use. Any saved string pair points to a saved memo.
+        self.last_memo_id = self.uid_memo_dict.max_int_key()
 
         # Clear the DB if requested.
         if reset:
             self._reset_memos()
 
+        self._finalizer = weakref.finalize(self, _close_stores, self.uid_memo_dict, self.string_map)
+
         self.logger.leave_function()
 
+    def close(self) -> None:
+        """
+        Saves any unsaved memos and string pairs to disk, and closes the memory bank.
+        """
+        self._finalizer()
+
     def reset(self) -> None:
         """
         Forces immediate deletion of all contents, in memory and on disk.
@@ -101,17 +128,21 @@ def _reset_memos(self) -> None:
         Forces immediate deletion of the memos, in memory and on disk.
         """
         self.logger.info("\nCLEARING MEMOS")
-        self.uid_memo_dict = {}
+        self.uid_memo_dict.clear()
+        if os.path.exists(self.path_to_pickle):
+            os.remove(self.path_to_pickle)
+        self.last_memo_id = 0
         self.save_memos()
 
     def save_memos(self) -> None:
         """
-        Saves the current memo structures (possibly empty) to disk.
+        Saves the memos and string pairs added since the last save to disk.
         """
+        self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
+        # Memos are saved before the string pairs that point to them.
+        self.uid_memo_dict.commit()
         self.string_map.save_string_pairs()
-        with open(self.path_to_dict, "wb") as file:
-            self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
-            pickle.dump(self.uid_memo_dict, file)
+        self.num_unsaved_memos = 0
 
     def contains_memos(self) -> bool:
         """
@@ -129,7 +160,9 @@ def _map_topics_to_memo(self, topics: List[str], memo_id: str, memo: Memo) -> No
             self.logger.info("\n TOPIC = {}".format(topic))
             self.string_map.add_input_output_pair(topic, memo_id)
         self.uid_memo_dict[memo_id] = memo
-        self.save_memos()
+        self.num_unsaved_memos += 1
+        if self.num_unsaved_memos >= self.save_interval:
+            self.save_memos()
         self.logger.leave_function()
 
     def add_memo(self, insight_str: str, topics: List[str], task_str: Optional[str] = None) -> None:
@@ -163,16 +196,22 @@ def get_relevant_memos(self, topics: List[str]) -> List[Memo]:
         """
         self.logger.enter_function()
 
-        # Retrieve all topic matches, and gather them into a single list.
+        # Retrieve the matches of all distinct topics in a single query, and gather them into a single list.
+        unique_topics = list(dict.fromkeys(topics))
         matches: List[Tuple[str, str, float]] = []  # Each match is a tuple: (topic, memo_id, distance)
-        for topic in topics:
-            matches.extend(self.string_map.get_related_string_pairs(topic, self.n_results, self.distance_threshold))
+        for topic_matches in self.string_map.get_related_string_pairs_for_queries(
+            unique_topics, self.n_results, self.distance_threshold
+        ):
+            matches.extend(topic_matches)
 
         # Build a dict of memo-relevance pairs from the matches.
         memo_relevance_dict: Dict[str, float] = {}
         for match in matches:
             relevance = self.relevance_conversion_threshold - match[2]
             memo_id = match[1]
+            if memo_id not in self.uid_memo_dict:
+                # The memo was not saved before the app exited.
+                continue
             if memo_id in memo_relevance_dict:
                 memo_relevance_dict[memo_id] += relevance
             else:
@@ -248,6 +248,8 @@ async def validate_insight(self, insight: str, task_description: str) -> bool:
             summary="Ask the model to validate the insight",
             system_message_content=sys_message,
             user_content=user_message,
+            # Several insights may be validated concurrently, so none of them is kept in the chat history.
+            keep_these_messages=False,
         )
         return response == "1"
 
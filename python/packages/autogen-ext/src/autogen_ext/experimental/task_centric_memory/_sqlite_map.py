@@ -0,0 +1,118 @@
+import json
+import os
+import pickle
+import sqlite3
+from typing import Any, Callable, Dict, Iterator, MutableMapping, TypeVar
+
+V = TypeVar("V")
+
+
+class SqliteMap(MutableMapping[str, V]):
+    """
+    A persistent dict from string keys to values, stored as JSON in a SQLite table.
+    Each write is a single-row upsert, values are only loaded when they are looked up,
+    and writes are batched into one transaction until commit() is called.
+
+    Args:
+        - path: Path to the SQLite database file.
+        - encode: Converts a value to a JSON-serializable object.
+        - decode: Converts a deserialized JSON object back to a value.
+    """
+
+    def __init__(self, path: str, encode: Callable[[V], Any], decode: Callable[[Any], V]) -> None:
+        self.path = path
+        self.encode = encode
+        self.decode = decode
+        self.connection = sqlite3.connect(path)
+        # Commits are much cheaper with a write-ahead log, and are still durable across app crashes.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.connection.commit()
+        self._cache: Dict[str, V] = {}
+        self._length: int = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __getitem__(self, key: str) -> V:
+        if key in self._cache:
+            return self._cache[key]
+        row = self.connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        value = self.decode(json.loads(row[0]))
+        self._cache[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        if key not in self:
+            self._length += 1
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", (key, json.dumps(self.encode(value)))
+        )
+        self._cache[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._cache.pop(key, None)
+        self._length -= 1
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._cache:
+            return True
+        return self.connection.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        # Read all keys first, so that the map can be modified while iterating.
+        keys = [row[0] for row in self.connection.execute("SELECT key FROM entries ORDER BY rowid")]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def max_int_key(self) -> int:
+        """
+        Returns the largest key that is an integer, or 0 if there is none.
+        """
+        row = self.connection.execute(
+            "SELECT MAX(CAST(key AS INTEGER)) FROM entries WHERE key GLOB '[0-9]*' AND key NOT GLOB '*[^0-9]*'"
+        ).fetchone()
+        return row[0] or 0
+
+    def clear(self) -> None:
+        """
+        Deletes all entries, and commits.
+        """
+        self.connection.execute("DELETE FROM entries")
+        self.connection.commit()
+        self._cache = {}
+        self._length = 0
+
+    def commit(self) -> None:
+        """
+        Writes all changes since the last commit to disk.
+        """
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Commits any changes and closes the database.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    def migrate_from_pickle(self, pickle_path: str) -> int:
+        """
+        Imports the entries of a dict pickled by an earlier version, if the map is still empty.
+        The pickle file is then renamed, so that it is not imported again.
+        Returns the number of imported entries.
+        """
+        if not os.path.exists(pickle_path) or len(self) > 0:
+            return 0
+        with open(pickle_path, "rb") as f:
+            entries: Dict[str, V] = pickle.load(f)
+        for key, value in entries.items():
+            self[key] = value
+        self.commit()
+        os.replace(pickle_path, pickle_path + ".migrated")
+        return len(entries)
@@ -1,6 +1,5 @@
 import os
-import pickle
-from typing import Dict, List, Tuple, Union
+from typing import List, Tuple, Union
 
 import chromadb
 from chromadb.api.types import (
@@ -8,9 +7,14 @@
 )
 from chromadb.config import Settings
 
+from ._sqlite_map import SqliteMap
 from .utils.page_logger import PageLogger
 
 
+def _decode_string_pair(value: List[str]) -> Tuple[str, str]:
+    return value[0], value[1]
+
+
 class StringSimilarityMap:
     """
     Provides storage and similarity-based retrieval of string pairs using a vector database.
@@ -38,22 +42,43 @@ def __init__(self, reset: bool, path_to_db_dir: str, logger: PageLogger | None =
         self.db_client = chromadb.Client(chromadb_settings)
         self.vec_db = self.db_client.create_collection("string-pairs", get_or_create=True)  # The collection is the DB.
 
-        # Load or create the associated string-pair dict on disk.
-        self.path_to_dict = os.path.join(path_to_db_dir, "uid_text_dict.pkl")
-        self.uid_text_dict: Dict[str, Tuple[str, str]] = {}
-        self.last_string_pair_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.debug("\nLOADING STRING SIMILARITY MAP FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_text_dict = pickle.load(f)
-                self.last_string_pair_id = len(self.uid_text_dict)
-                if len(self.uid_text_dict) > 0:
-                    self.logger.debug("\n{} STRING PAIRS LOADED".format(len(self.uid_text_dict)))
+        # Open or create the associated string-pair dict on disk. String pairs are only loaded when they are retrieved.
+        self.path_to_dict = os.path.join(path_to_db_dir, "string_pairs.sqlite")
+        # String pairs were pickled by earlier versions.
+        self.path_to_pickle = os.path.join(path_to_db_dir, "uid_text_dict.pkl")
+        self.uid_text_dict: SqliteMap[Tuple[str, str]] = SqliteMap(
+            self.path_to_dict, encode=list, decode=_decode_string_pair
+        )
+        if not reset:
+            num_migrated = self.uid_text_dict.migrate_from_pickle(self.path_to_pickle)
+            if num_migrated > 0:
+                self.logger.debug("\n{} STRING PAIRS MIGRATED FROM  {}".format(num_migrated, self.path_to_pickle))
+            if len(self.uid_text_dict) > 0:
+                self.logger.debug("\n{} STRING PAIRS FOUND ON DISK".format(len(self.uid_text_dict)))
+                # Reading every string pair is slow for large maps, so only do it when it will be logged.
+                if self.logger.level <= self.logger.levels["DEBUG"]:
                     self._log_string_pairs()
 
         # Clear the DB if requested.
         if reset:
             self.reset_db()
+        else:
+            self._remove_unsaved_string_pairs()
+
+    def _remove_unsaved_string_pairs(self) -> None:
+        """
+        Deletes the vector DB entries of any string pairs that were not saved before the app exited,
+        and continues the string-pair ids after the largest one in use, so that no id is reused.
+        """
+        vec_db_ids: List[str] = self.vec_db.get(include=[])["ids"]
+        saved_ids = set(self.uid_text_dict)
+        unsaved_ids = [uid for uid in vec_db_ids if uid not in saved_ids]
+        if len(unsaved_ids) > 0:
+            self.logger.debug("\n{} UNSAVED STRING PAIRS REMOVED FROM VECTOR DATABASE".format(len(unsaved_ids)))
+            self.vec_db.delete(ids=unsaved_ids)
+        self.last_string_pair_id = max(
+            [self.uid_text_dict.max_int_key()] + [int(uid) for uid in unsaved_ids if uid.isdigit()]
+        )
 
     def _log_string_pairs(self) -> None:
         """
@@ -66,11 +91,16 @@ def _log_string_pairs(self) -> None:
 
     def save_string_pairs(self) -> None:
         """
-        Saves the string-pair dict (self.uid_text_dict) to disk.
+        Saves the string pairs added to the string-pair dict (self.uid_text_dict) since the last save to disk.
         """
         self.logger.debug("\nSAVING STRING SIMILARITY MAP TO DISK  at {}".format(self.path_to_dict))
-        with open(self.path_to_dict, "wb") as file:
-            pickle.dump(self.uid_text_dict, file)
+        self.uid_text_dict.commit()
+
+    def close(self) -> None:
+        """
+        Saves any unsaved string pairs, and closes the string-pair dict.
+        """
+        self.uid_text_dict.close()
 
     def reset_db(self) -> None:
         """
@@ -79,8 +109,10 @@ def reset_db(self) -> None:
         self.logger.debug("\nCLEARING STRING-PAIR MAP")
         self.db_client.delete_collection("string-pairs")
         self.vec_db = self.db_client.create_collection("string-pairs")
-        self.uid_text_dict = {}
-        self.save_string_pairs()
+        self.uid_text_dict.clear()
+        if os.path.exists(self.path_to_pickle):
+            os.remove(self.path_to_pickle)
+        self.last_string_pair_id = 0
 
     def add_input_output_pair(self, input_text: str, output_text: str) -> None:
         """
@@ -102,23 +134,34 @@ def get_related_string_pairs(
         """
         Retrieves up to n string pairs that are related to the given query text within the specified distance threshold.
         """
-        string_pairs_with_distances: List[Tuple[str, str, float]] = []
+        return self.get_related_string_pairs_for_queries([query_text], n_results, threshold)[0]
+
+    def get_related_string_pairs_for_queries(
+        self, query_texts: List[str], n_results: int, threshold: Union[int, float]
+    ) -> List[List[Tuple[str, str, float]]]:
+        """
+        Retrieves up to n related string pairs for each of the given query texts, within the specified distance threshold.
+        All query texts are embedded and looked up in a single query to the vector DB.
+        """
+        string_pairs_with_distances: List[List[Tuple[str, str, float]]] = [[] for _ in query_texts]
         if n_results > len(self.uid_text_dict):
             n_results = len(self.uid_text_dict)
-        if n_results > 0:
-            results: QueryResult = self.vec_db.query(query_texts=[query_text], n_results=n_results)
-            num_results = len(results["ids"][0])
-            for i in range(num_results):
-                uid = results["ids"][0][i]
-                input_text = results["documents"][0][i] if results["documents"] else ""
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                if distance < threshold:
-                    input_text_2, output_text = self.uid_text_dict[uid]
-                    assert input_text == input_text_2
-                    self.logger.debug(
-                        "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
-                            input_text, output_text, distance
+        if n_results > 0 and len(query_texts) > 0:
+            results: QueryResult = self.vec_db.query(query_texts=query_texts, n_results=n_results)
+            for query_index, query_pairs in enumerate(string_pairs_with_distances):
+                num_results = len(results["ids"][query_index])
+                for i in range(num_results):
+                    uid = results["ids"][query_index][i]
+                    input_text = results["documents"][query_index][i] if results["documents"] else ""
+                    distance = results["distances"][query_index][i] if results["distances"] else 0.0
+                    # Skip any string pair that was not saved before the app exited.
+                    if distance < threshold and uid in self.uid_text_dict:
+                        input_text_2, output_text = self.uid_text_dict[uid]
+                        assert input_text == input_text_2
+                        self.logger.debug(
+                            "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
+                                input_text, output_text, distance
+                            )
                         )
-                    )
-                    string_pairs_with_distances.append((input_text, output_text, distance))
+                        query_pairs.append((input_text, output_text, distance))
         return string_pairs_with_distances
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Awaitable, Callable, List, Tuple, TypedDict
+import asyncio
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, List, Tuple, TypedDict
 
 from autogen_core.models import (
     ChatCompletionClient,
@@ -9,6 +11,7 @@
 
 if TYPE_CHECKING:
     from ._memory_bank import MemoryBankConfig
+from .utils.chat_completion_client_recorder import ChatCompletionClientRecorder
 from .utils.grader import Grader
 from .utils.page_logger import PageLogger
 
@@ -21,6 +24,8 @@ class MemoryControllerConfig(TypedDict, total=False):
     generate_topics: bool
     validate_memos: bool
     max_memos_to_retrieve: int
+    max_concurrent_validations: int
+    validation_cache_size: int
     max_train_trials: int
     max_test_trials: int
     MemoryBank: "MemoryBankConfig"
@@ -43,6 +48,8 @@ class MemoryController:
             - generate_topics: Whether to base retrieval directly on tasks, or on topics extracted from tasks.
             - validate_memos: Whether to apply a final validation stage to retrieved memos.
             - max_memos_to_retrieve: The maximum number of memos to return from retrieve_relevant_memos().
+            - max_concurrent_validations: The maximum number of memos validated by the model at the same time.
+            - validation_cache_size: The maximum number of memo validation verdicts kept for reuse.
             - max_train_trials: The maximum number of learning iterations to attempt when training on a task.
             - max_test_trials: The total number of attempts made when testing for failure on a task.
             - MemoryBank: A config dict passed to MemoryBank.
@@ -106,6 +113,8 @@ def __init__(
         self.generate_topics = True
         self.validate_memos = True
         self.max_memos_to_retrieve = 10
+        self.max_concurrent_validations = 5
+        self.validation_cache_size = 1000
         self.max_train_trials = 10
         self.max_test_trials = 3
         memory_bank_config = None
@@ -115,6 +124,8 @@ def __init__(
             self.generate_topics = config.get("generate_topics", self.generate_topics)
             self.validate_memos = config.get("validate_memos", self.validate_memos)
             self.max_memos_to_retrieve = config.get("max_memos_to_retrieve", self.max_memos_to_retrieve)
+            self.max_concurrent_validations = config.get("max_concurrent_validations", self.max_concurrent_validations)
+            self.validation_cache_size = config.get("validation_cache_size", self.validation_cache_size)
             self.max_train_trials = config.get("max_train_trials", self.max_train_trials)
             self.max_test_trials = config.get("max_test_trials", self.max_test_trials)
             memory_bank_config = config.get("MemoryBank", memory_bank_config)
@@ -124,13 +135,22 @@ def __init__(
         self.prompter = Prompter(client, logger)
         self.memory_bank = MemoryBank(reset=reset, config=memory_bank_config, logger=logger)
         self.grader = Grader(client, logger)
+        # Validation verdicts of memos, keyed by (insight, generalized task), with the most recently used last.
+        self.validation_cache: OrderedDict[Tuple[str, str], bool] = OrderedDict()
         self.logger.leave_function()
 
+    def close(self) -> None:
+        """
+        Saves any unsaved memories to disk, and closes the memory bank.
+        """
+        self.memory_bank.close()
+
     def reset_memory(self) -> None:
         """
         Empties the memory bank in RAM and on disk.
         """
         self.memory_bank.reset()
+        self.validation_cache.clear()
 
     async def train_on_task(self, task: str, expected_answer: str) -> None:
         """
@@ -282,12 +302,10 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
             memo_list = self.memory_bank.get_relevant_memos(topics=task_topics)
 
             # Apply a final validation stage to keep only the memos that the LLM concludes are sufficiently relevant.
-            validated_memos: List[Memo] = []
-            for memo in memo_list:
-                if len(validated_memos) >= self.max_memos_to_retrieve:
-                    break
-                if (not self.validate_memos) or await self.prompter.validate_insight(memo.insight, task):
-                    validated_memos.append(memo)
+            if self.validate_memos:
+                validated_memos = await self._validate_memos(memo_list, task, generalized_task)
+            else:
+                validated_memos = memo_list[: self.max_memos_to_retrieve]
 
             self.logger.info("\n{} VALIDATED MEMOS".format(len(validated_memos)))
             for memo in validated_memos:
@@ -301,6 +319,63 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
         self.logger.leave_function()
         return validated_memos
 
+    async def _validate_memos(self, memo_list: List[Memo], task: str, generalized_task: str) -> List[Memo]:
+        """
+        Returns the first max_memos_to_retrieve memos in the list that the LLM concludes are relevant to the task.
+        Up to max_concurrent_validations memos are validated at the same time, in list order, and no more memos
+        are validated once enough have passed. Verdicts are cached by insight and generalized task.
+        Memos are validated one at a time when the client is a ChatCompletionClientRecorder, since a recorded
+        session must be replayed in the order its calls were made.
+        """
+        max_concurrent_validations = self.max_concurrent_validations
+        if isinstance(self.client, ChatCompletionClientRecorder):
+            max_concurrent_validations = 1
+        validated_memos: List[Memo] = []
+        pending: Deque[Tuple[Memo, Tuple[str, str], "asyncio.Future[bool]"]] = deque()
+        in_flight: Dict[Tuple[str, str], "asyncio.Future[bool]"] = {}
+        next_index = 0
+        num_cached = 0
+
+        def start_validations() -> None:
+            nonlocal next_index, num_cached
+            # Validate no more memos ahead than may still be needed.
+            max_pending = min(max_concurrent_validations, self.max_memos_to_retrieve - len(validated_memos))
+            while len(pending) < max(1, max_pending) and next_index < len(memo_list):
+                memo = memo_list[next_index]
+                next_index += 1
+                key = (memo.insight, generalized_task)
+                verdict = in_flight.get(key)
+                if verdict is None:
+                    if key in self.validation_cache:
+                        self.validation_cache.move_to_end(key)
+                        verdict = asyncio.get_running_loop().create_future()
+                        verdict.set_result(self.validation_cache[key])
+                        num_cached += 1
+                    else:
+                        verdict = asyncio.ensure_future(self.prompter.validate_insight(memo.insight, task))
+                    in_flight[key] = verdict
+                pending.append((memo, key, verdict))
+
+        try:
+            start_validations()
+            while len(pending) > 0 and len(validated_memos) < self.max_memos_to_retrieve:
+                memo, key, verdict = pending.popleft()
+                is_valid = await verdict
+                self.validation_cache[key] = is_valid
+                self.validation_cache.move_to_end(key)
+                if is_valid:
+                    validated_memos.append(memo)
+                start_validations()
+        finally:
+            # Cancel the validations that are no longer needed.
+            for _, _, verdict in pending:
+                verdict.cancel()
+            while len(self.validation_cache) > self.validation_cache_size:
+                self.validation_cache.popitem(last=False)
+
+        self.logger.info("\n{} VALIDATION VERDICTS REUSED FROM CACHE".format(num_cached))
+        return validated_memos
+
     def _format_memory_section(self, memories: List[str]) -> str:
         """
         Formats a list of memories as a section for appending to a task description.
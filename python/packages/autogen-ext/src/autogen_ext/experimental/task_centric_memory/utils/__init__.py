@@ -1,7 +1,7 @@
 from .apprentice import Apprentice, ApprenticeConfig
 from .chat_completion_client_recorder import ChatCompletionClientRecorder
 from .grader import Grader
-from .page_logger import PageLogger, PageLoggerConfig
+from .page_logger import PageLogger, PageLoggerConfig, render_page_log
 from .teachability import Teachability
 
 __all__ = [
@@ -12,4 +12,5 @@
     "Teachability",
     "ApprenticeConfig",
     "PageLoggerConfig",
+    "render_page_log",
 ]
@@ -181,10 +181,20 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
         # Calls base_client.count_tokens() and returns the result.
         return self.base_client.count_tokens(messages, tools=tools)
 
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        # Calls base_client.acount_tokens() and returns the result.
+        return await self.base_client.acount_tokens(messages, tools=tools)
+
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         # Calls base_client.remaining_tokens() and returns the result.
         return self.base_client.remaining_tokens(messages, tools=tools)
 
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        # Calls base_client.aremaining_tokens() and returns the result.
+        return await self.base_client.aremaining_tokens(messages, tools=tools)
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         # Calls base_client.capabilities and returns the result.
@@ -1,8 +1,11 @@
+import base64
 import inspect
 import json
 import os
+import queue
 import shutil
-from typing import Any, Dict, List, Mapping, Optional, Sequence, TypedDict
+import threading
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypedDict, Union
 
 from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
@@ -19,6 +22,15 @@
 
 from ._functions import MessageContent, hash_directory
 
+CALL_TREE_NAME = "0  Call Tree"
+LOG_SEGMENT_PREFIX = "log-"
+LOG_SEGMENT_SUFFIX = ".jsonl"
+
+_SOURCE_COLORS = {"SYSTEM": "purple", "USER": "blue", "ASSISTANT": "green", "FUNCTION": "red"}
+
+# An event, with the files to save to the log directory before it is written: (file name, image or source path).
+_LogItem = Union[Tuple[Dict[str, Any], List[Tuple[str, Union[Image, str]]]], threading.Event, None]
+
 
 def _html_opening(file_title: str, finished: bool = False) -> str:
     """
@@ -47,22 +59,57 @@ def _html_closing() -> str:
     return """</body></html>"""
 
 
+def _decorate_text(text: str, color: str, weight: str = "bold", demarcate: bool = False) -> str:
+    """
+    Returns a string of text with HTML styling for weight and color.
+    """
+    if demarcate:
+        text = f"<<<<<  {text}  >>>>>"
+    return f'<span style="color: {color}; font-weight: {weight};">{text}</span>'
+
+
+def _link_to_image(image_path: str, description: str) -> str:
+    """
+    Returns an HTML string defining a thumbnail link to an image.
+    """
+    # To avoid a bug in heml rendering aht displays underscores to the left of thumbnails,
+    # define the following string on a single line.
+    link = f"""<a href="{image_path}"><img src="{image_path}" alt="{description}" style="width: 300px; height: auto;"></a>"""
+    return link
+
+
 # Following the nested-config pattern, this TypedDict minimizes code changes by encapsulating
 # the settings that change frequently, as when loading many settings from a single YAML file.
 class PageLoggerConfig(TypedDict, total=False):
     level: str
     path: str
+    sample_rate: float
+    max_buffered: int
+    segment_size: int
+    render_html: bool
 
 
 class PageLogger:
     """
     Logs text and images to a set of HTML pages, one per function/method, linked to each other in a call tree.
 
+    Logged events are appended to JSONL segment files in the log directory by a background thread,
+    so that logging calls do not wait for file I/O. The HTML pages are rendered from these segments
+    when the logger is finalized, or at any other time by calling :meth:`render_html`
+    (or :func:`render_page_log` after the run).
+
     Args:
         config: An optional dict that can be used to override the following values:
 
             - level: The logging level, one of DEBUG, INFO, WARNING, ERROR, CRITICAL, or NONE.
             - path: The path to the directory where the log files will be written.
+            - sample_rate: The fraction of model calls that are logged in full, with all messages and images.
+              The other model calls are logged as one-line summaries. Defaults to 1.0.
+            - max_buffered: The maximum number of events waiting to be written to disk.
+              When the buffer is full, logging calls wait for the writer to catch up. Defaults to 1000.
+            - segment_size: The size in bytes after which the log continues in a new segment file.
+              Defaults to 16 MiB.
+            - render_html: Whether to render the HTML pages when the logger is finalized. Defaults to True.
     """
 
     def __init__(self, config: PageLoggerConfig | None = None) -> None:
@@ -78,9 +125,17 @@ def __init__(self, config: PageLoggerConfig | None = None) -> None:
         # Apply default settings and any config overrides.
         level_str = "NONE"  # Default to no logging at all.
         self.log_dir = "./pagelogs/default"
+        self.sample_rate = 1.0
+        max_buffered = 1000
+        segment_size = 16 * 1024 * 1024
+        self.render_on_finalize = True
         if config is not None:
             level_str = config.get("level", level_str)
             self.log_dir = config.get("path", self.log_dir)
+            self.sample_rate = config.get("sample_rate", self.sample_rate)
+            max_buffered = config.get("max_buffered", max_buffered)
+            segment_size = config.get("segment_size", segment_size)
+            self.render_on_finalize = config.get("render_html", self.render_on_finalize)
         self.level = self.levels[level_str]
         self.log_dir = os.path.expanduser(self.log_dir)
 
@@ -89,18 +144,21 @@ def __init__(self, config: PageLoggerConfig | None = None) -> None:
             return
 
         self.page_stack = PageStack()
-        self.pages: List[Page] = []
         self.last_page_id = 0
-        self.name = "0  Call Tree"
+        self.sample_credit = 0.0
+        self.name = CALL_TREE_NAME
         self._create_run_dir()
-        self.flush()
+        self._writer = _LogWriter(self.log_dir, max_buffered=max_buffered, segment_size=segment_size)
         self.finalized = False
 
     def __del__(self) -> None:
         self.finalize()
+        writer: Optional[_LogWriter] = getattr(self, "_writer", None)
+        if writer is not None:
+            writer.close()
 
     def finalize(self) -> None:
-        # Writes a hash of the log directory to a file for change detection.
+        # Renders the HTML pages, and writes a hash of the log directory to a file for change detection.
         if self.level >= self.levels["NONE"]:
             return
 
@@ -112,7 +170,9 @@ def finalize(self) -> None:
         if self.page_stack.size() > 0:
             return
 
-        self.flush(finished=True)
+        self.flush()
+        if self.render_on_finalize:
+            render_page_log(self.log_dir)
 
         # Write the hash and other details to a file.
         hash_str, num_files, num_subdirs = hash_directory(self.log_dir)
@@ -125,25 +185,6 @@ def finalize(self) -> None:
 
         self.finalized = True
 
-    @staticmethod
-    def _decorate_text(text: str, color: str, weight: str = "bold", demarcate: bool = False) -> str:
-        """
-        Returns a string of text with HTML styling for weight and color.
-        """
-        if demarcate:
-            text = f"<<<<<  {text}  >>>>>"
-        return f'<span style="color: {color}; font-weight: {weight};">{text}</span>'
-
-    @staticmethod
-    def _link_to_image(image_path: str, description: str) -> str:
-        """
-        Returns an HTML string defining a thumbnail link to an image.
-        """
-        # To avoid a bug in heml rendering aht displays underscores to the left of thumbnails,
-        # define the following string on a single line.
-        link = f"""<a href="{image_path}"><img src="{image_path}" alt="{description}" style="width: 300px; height: auto;"></a>"""
-        return link
-
     def _get_next_page_id(self) -> int:
         """Returns the next page id and increments the counter."""
         self.last_page_id += 1
@@ -155,23 +196,33 @@ def _create_run_dir(self) -> None:
             shutil.rmtree(self.log_dir)
         os.makedirs(self.log_dir)
 
-    def _add_page(self, summary: str, show_in_call_tree: bool = True, finished: bool = True) -> "Page":
+    def _add_page(self, summary: str, show_in_call_tree: bool = True, push: bool = False) -> "Page":
         """
-        Adds a new page to the log.
+        Adds a new page to the log, optionally pushing it onto the call stack.
         """
+        parent = self.page_stack.top()
         page = Page(
-            page_logger=self,
             index=self._get_next_page_id(),
             summary=summary,
-            indent_level=len(self.page_stack.stack),
+            indent_level=self.page_stack.size(),
             show_in_call_tree=show_in_call_tree,
-            finished=finished,
+            finished=not push,
+        )
+        if push:
+            self.page_stack.push(page)
+        self._writer.write(
+            {
+                "type": "page",
+                "id": page.index,
+                "summary": summary,
+                "indent": page.indent_level,
+                "call_tree": show_in_call_tree,
+                "finished": page.finished,
+                # The calling page gets a link to the new page.
+                "parent": parent.index if parent is not None else None,
+                "stack": [stack_page.index for stack_page in self.page_stack.stack],
+            }
         )
-        self.pages.append(page)
-        self.flush()
-        if len(self.page_stack.stack) > 0:
-            # Insert a link to the new page into the calling page.
-            self.info("\n" + page.full_link)
         return page
 
     def _log_text(self, text: str) -> None:
@@ -180,7 +231,7 @@ def _log_text(self, text: str) -> None:
         """
         page = self.page_stack.top()
         if page is not None:
-            page.add_lines(text, flush=True)
+            self._writer.write({"type": "text", "page": page.index, "text": text})
 
     def debug(self, line: str) -> None:
         """
@@ -217,60 +268,49 @@ def critical(self, line: str) -> None:
         if self.level <= self.levels["CRITICAL"]:
             self._log_text(line)
 
-    def _message_source(self, message: LLMMessage) -> str:
+    @staticmethod
+    def _message_source(message: LLMMessage) -> str:
         """
-        Returns a decorated string indicating the source of a message.
+        Returns a string indicating the source of a message.
         """
-        source = "UNKNOWN"
-        color = "black"
         if isinstance(message, SystemMessage):
-            source = "SYSTEM"
-            color = "purple"
+            return "SYSTEM"
         elif isinstance(message, UserMessage):
-            source = "USER"
-            color = "blue"
+            return "USER"
         elif isinstance(message, AssistantMessage):
-            source = "ASSISTANT"
-            color = "green"
+            return "ASSISTANT"
         elif isinstance(message, FunctionExecutionResultMessage):
-            source = "FUNCTION"
-            color = "red"
-        return self._decorate_text(source, color, demarcate=True)
+            return "FUNCTION"
+        return "UNKNOWN"
 
-    def _format_message_content(self, message_content: MessageContent) -> str:
+    def _content_items(
+        self, message_content: MessageContent, attachments: List[Tuple[str, Union[Image, str]]]
+    ) -> List[Dict[str, Any]]:
         """
-        Formats the message content for logging.
+        Converts the message content to a list of loggable items, adding any images to the attachments.
+        The strings and dicts are not copied, since they are serialized by the writer thread.
         """
-        # Start by converting the message content to a list of strings.
-        content_list: List[str] = []
+        items: List[Dict[str, Any]] = []
         content = message_content
         if isinstance(content, str):
-            content_list.append(content)
+            items.append({"text": content})
         elif isinstance(content, list):
             for item in content:
                 if isinstance(item, str):
-                    content_list.append(item.rstrip())
+                    items.append({"text": item})
                 elif isinstance(item, Image):
-                    # Save the image to disk.
-                    image_filename = str(self._get_next_page_id()) + " image.jpg"
-                    image_path = os.path.join(self.log_dir, image_filename)
-                    item.image.save(image_path)
-                    # Add a link to the image.
-                    content_list.append(self._link_to_image(image_filename, "message_image"))
+                    # The writer saves the encoded image as it is, without decoding it.
+                    extension = item.media_type.split("/")[-1].replace("jpeg", "jpg")
+                    image_filename = f"{self._get_next_page_id()} image.{extension}"
+                    attachments.append((image_filename, item))
+                    items.append({"image": image_filename})
                 elif isinstance(item, Dict):
-                    # Add a dictionary to the log.
-                    json_str = json.dumps(item, indent=4)
-                    content_list.append(json_str)
+                    items.append({"json": item})
                 else:
-                    content_list.append(str(item).rstrip())
+                    items.append({"text": str(item)})
         else:
-            content_list.append("<UNKNOWN MESSAGE CONTENT>")
-
-        # Convert the list of strings to a single string containing newline separators.
-        output = ""
-        for item in content_list:
-            output += f"\n{item}\n"
-        return output
+            items.append({"text": "<UNKNOWN MESSAGE CONTENT>"})
+        return items
 
     def log_message_content(self, message_content: MessageContent, summary: str) -> None:
         """
@@ -279,9 +319,9 @@ def log_message_content(self, message_content: MessageContent, summary: str) ->
         if self.level > self.levels["INFO"]:
             return None
         page = self._add_page(summary=summary, show_in_call_tree=False)
-        self.page_stack.write_stack_to_page(page)
-        page.add_lines(self._format_message_content(message_content=message_content))
-        page.flush()
+        attachments: List[Tuple[str, Union[Image, str]]] = []
+        content = self._content_items(message_content, attachments)
+        self._writer.write({"type": "content", "page": page.index, "content": content}, attachments)
 
     def log_dict_list(self, content: List[Mapping[str, Any]], summary: str) -> None:
         """
@@ -290,32 +330,61 @@ def log_dict_list(self, content: List[Mapping[str, Any]], summary: str) -> None:
         if self.level > self.levels["INFO"]:
             return None
         page = self._add_page(summary=summary, show_in_call_tree=False)
-        self.page_stack.write_stack_to_page(page)
+        self._writer.write({"type": "dicts", "page": page.index, "items": list(content)})
 
-        for item in content:
-            json_str = json.dumps(item, indent=4)
-            page.add_lines(json_str)
-
-        page.flush()
+    def _sample_model_call(self) -> bool:
+        """
+        Returns whether the next model call should be logged in full, so that a fraction
+        sample_rate of the calls are, spread evenly over the run.
+        """
+        self.sample_credit += self.sample_rate
+        if self.sample_credit >= 1.0:
+            self.sample_credit -= 1.0
+            return True
+        return False
 
     def _log_model_messages(
         self, summary: str, input_messages: List[LLMMessage], response_str: str, usage: RequestUsage | None
     ) -> Optional["Page"]:
         """
         Adds a page containing the messages to a model (including any input images) and its response.
+        Model calls that are not sampled are summarized on the current page instead.
         """
-        page = self._add_page(summary=summary, show_in_call_tree=False)
-        self.page_stack.write_stack_to_page(page)
-
+        usage_dict = None
         if usage is not None:
-            page.add_lines("{} prompt tokens".format(usage.prompt_tokens))
-            page.add_lines("{} completion tokens".format(usage.completion_tokens))
-        for m in input_messages:
-            page.add_lines("\n" + self._message_source(m))
-            page.add_lines(self._format_message_content(message_content=m.content))
-        page.add_lines("\n" + self._decorate_text("ASSISTANT RESPONSE", "green", demarcate=True))
-        page.add_lines("\n" + response_str + "\n")
-        page.flush()
+            usage_dict = {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens}
+
+        if not self._sample_model_call():
+            page = self.page_stack.top()
+            if page is not None:
+                self._writer.write(
+                    {
+                        "type": "model_call_summary",
+                        "page": page.index,
+                        "summary": summary,
+                        "num_messages": len(input_messages),
+                        "usage": usage_dict,
+                        "response_length": len(response_str),
+                    }
+                )
+            return None
+
+        page = self._add_page(summary=summary, show_in_call_tree=False)
+        attachments: List[Tuple[str, Union[Image, str]]] = []
+        messages = [
+            {"source": self._message_source(m), "content": self._content_items(m.content, attachments)}
+            for m in input_messages
+        ]
+        self._writer.write(
+            {
+                "type": "model_call",
+                "page": page.index,
+                "usage": usage_dict,
+                "messages": messages,
+                "response": response_str,
+            },
+            attachments,
+        )
         return page
 
     def log_model_call(
@@ -369,32 +438,34 @@ def add_link_to_image(self, description: str, source_image_path: str) -> None:
         """
         Inserts a thumbnail link to an image to the page.
         """
+        page = self.page_stack.top()
+        if page is None:
+            return
         # Remove every character from the string 'description' that is not alphanumeric or a space.
         description = "".join(e for e in description if e.isalnum() or e.isspace())
         target_image_filename = str(self._get_next_page_id()) + " - " + description
-        # Copy the image to the log directory.
-        local_image_path = os.path.join(self.log_dir, target_image_filename)
-        shutil.copyfile(source_image_path, local_image_path)
-        self._log_text("\n" + description)
-        self._log_text(self._link_to_image(target_image_filename, description))
+        # The writer copies the image to the log directory.
+        self._writer.write(
+            {"type": "image", "page": page.index, "file": target_image_filename, "description": description},
+            [(target_image_filename, source_image_path)],
+        )
 
-    def flush(self, finished: bool = False) -> None:
+    def flush(self) -> None:
         """
-        Writes the current state of the log to disk.
+        Waits until all logged events are written to disk.
         """
         if self.level > self.levels["INFO"]:
             return
-        # Create a call tree of the log.
-        call_tree_path = os.path.join(self.log_dir, self.name + ".html")
-        with open(call_tree_path, "w") as f:
-            f.write(_html_opening("0 Call Tree", finished=finished))
-            f.write(f"<h3>{self.name}</h3>")
-            f.write("\n")
-            for page in self.pages:
-                if page.show_in_call_tree:
-                    f.write(page.line_text + "\n")
-            f.write("\n")
-            f.write(_html_closing())
+        self._writer.flush()
+
+    def render_html(self) -> None:
+        """
+        Renders the HTML pages from the events logged so far.
+        """
+        if self.level > self.levels["INFO"]:
+            return
+        self.flush()
+        render_page_log(self.log_dir, finished=self.finalized)
 
     def enter_function(self) -> Optional["Page"]:
         """
@@ -422,11 +493,7 @@ def enter_function(self) -> Optional["Page"]:
                     caller_name = class_name + "." + frame.f_code.co_name
 
                 # Create a new page for this function.
-                page = self._add_page(summary=caller_name, show_in_call_tree=True, finished=False)
-                self.page_stack.push(page)
-                self.page_stack.write_stack_to_page(page)
-
-                page.add_lines("\nENTER {}".format(caller_name), flush=True)
+                page = self._add_page(summary=caller_name, show_in_call_tree=True, push=True)
         return page
 
     def leave_function(self) -> None:
@@ -438,16 +505,220 @@ def leave_function(self) -> None:
         page = self.page_stack.top()
         if page is not None:
             page.finished = True
-            page.add_lines("\nLEAVE {}".format(page.summary), flush=True)
+            self._writer.write({"type": "leave", "page": page.index})
             self.page_stack.pop()
 
 
+class _LogWriter:
+    """
+    Appends events to JSONL segment files on a background thread, after saving any files attached to them.
+
+    At most `max_buffered` items wait in the queue, so that a slow disk holds back the logging calls
+    instead of letting the buffered events grow without limit.
+    """
+
+    def __init__(self, log_dir: str, max_buffered: int, segment_size: int) -> None:
+        self.log_dir = log_dir
+        self.segment_size = segment_size
+        self.error: Exception | None = None
+        self._queue: "queue.Queue[_LogItem]" = queue.Queue(maxsize=max(1, max_buffered))
+        self._thread = threading.Thread(target=self._run, name="PageLoggerWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, event: Dict[str, Any], attachments: Optional[List[Tuple[str, Union[Image, str]]]] = None) -> None:
+        """Queues an event to be written, waiting while the buffer is full."""
+        self._queue.put((event, attachments or []))
+
+    def flush(self) -> None:
+        """Waits until all queued events are written, and raises the first error the writer ran into, if any."""
+        if self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            # The thread stops without warning when the interpreter exits.
+            while not done.wait(0.1):
+                if not self._thread.is_alive():
+                    break
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def close(self) -> None:
+        """Writes the remaining events and stops the thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        segment: Optional[BinaryIO] = None
+        segment_index = 0
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if isinstance(item, threading.Event):
+                    if segment is not None:
+                        segment.flush()
+                    item.set()
+                    continue
+
+                event, attachments = item
+                try:
+                    for file_name, source in attachments:
+                        self._save_file(file_name, source)
+                    data = (json.dumps(event, default=str) + "\n").encode("utf-8")
+                    if segment is None or (segment.tell() > 0 and segment.tell() + len(data) > self.segment_size):
+                        if segment is not None:
+                            segment.close()
+                        segment_index += 1
+                        segment_name = f"{LOG_SEGMENT_PREFIX}{segment_index:05d}{LOG_SEGMENT_SUFFIX}"
+                        segment = open(os.path.join(self.log_dir, segment_name), "wb")
+                    segment.write(data)
+                except Exception as e:
+                    # Keep writing the other events, and report the error to the logging thread on the next flush.
+                    if self.error is None:
+                        self.error = e
+        finally:
+            if segment is not None:
+                segment.close()
+
+    def _save_file(self, file_name: str, source: Union[Image, str]) -> None:
+        path = os.path.join(self.log_dir, file_name)
+        if isinstance(source, Image):
+            with open(path, "wb") as f:
+                f.write(base64.b64decode(source.to_base64()))
+        else:
+            shutil.copyfile(source, path)
+
+
+def _read_log_events(log_dir: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the events logged to the segment files in a log directory, in order.
+    """
+    segment_names = sorted(
+        name
+        for name in os.listdir(log_dir)
+        if name.startswith(LOG_SEGMENT_PREFIX) and name.endswith(LOG_SEGMENT_SUFFIX)
+    )
+    for segment_name in segment_names:
+        with open(os.path.join(log_dir, segment_name), "rb") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # The last line is incomplete if the app exited while it was being written.
+                    continue
+
+
+def _format_content_items(items: List[Dict[str, Any]]) -> str:
+    """
+    Formats logged message content as HTML.
+    """
+    output = ""
+    for item in items:
+        if "image" in item:
+            text = _link_to_image(item["image"], "message_image")
+        elif "json" in item:
+            text = json.dumps(item["json"], indent=4)
+        else:
+            text = item["text"].rstrip()
+        output += f"\n{text}\n"
+    return output
+
+
+def render_page_log(log_dir: str, finished: bool = True) -> None:
+    """
+    Renders the HTML pages of a :class:`PageLogger` log directory from the events logged to it.
+
+    Args:
+        log_dir: The log directory.
+        finished: Whether the run has finished. Otherwise, the unfinished pages reload themselves in the browser.
+    """
+    pages: Dict[int, Page] = {}
+    for event in _read_log_events(log_dir):
+        event_type = event.get("type")
+        if event_type == "page":
+            new_page = Page(
+                index=event["id"],
+                summary=event["summary"],
+                indent_level=event["indent"],
+                show_in_call_tree=event["call_tree"],
+                finished=event["finished"],
+            )
+            pages[new_page.index] = new_page
+            parent = pages.get(event["parent"]) if event["parent"] is not None else None
+            if parent is not None:
+                parent.add_lines("\n" + new_page.full_link)
+            new_page.add_lines("\nCALL STACK")
+            for stack_id in event["stack"]:
+                new_page.add_lines(pages[stack_id].line_text)
+            new_page.add_lines("")
+            new_page.add_lines("")
+            if new_page.show_in_call_tree:
+                new_page.add_lines("\nENTER {}".format(new_page.summary))
+            continue
+
+        page = pages.get(event.get("page", -1))
+        if page is None:
+            continue
+        if event_type == "text":
+            page.add_lines(event["text"])
+        elif event_type == "leave":
+            page.finished = True
+            page.add_lines("\nLEAVE {}".format(page.summary))
+        elif event_type == "content":
+            page.add_lines(_format_content_items(event["content"]))
+        elif event_type == "dicts":
+            for item in event["items"]:
+                page.add_lines(json.dumps(item, indent=4))
+        elif event_type == "image":
+            page.add_lines("\n" + event["description"])
+            page.add_lines(_link_to_image(event["file"], event["description"]))
+        elif event_type == "model_call":
+            usage = event["usage"]
+            if usage is not None:
+                page.add_lines("{} prompt tokens".format(usage["prompt_tokens"]))
+                page.add_lines("{} completion tokens".format(usage["completion_tokens"]))
+            for message in event["messages"]:
+                source = message["source"]
+                page.add_lines("\n" + _decorate_text(source, _SOURCE_COLORS.get(source, "black"), demarcate=True))
+                page.add_lines(_format_content_items(message["content"]))
+            page.add_lines("\n" + _decorate_text("ASSISTANT RESPONSE", "green", demarcate=True))
+            page.add_lines("\n" + event["response"] + "\n")
+        elif event_type == "model_call_summary":
+            usage = event["usage"]
+            tokens = ""
+            if usage is not None:
+                tokens = ", {} prompt tokens, {} completion tokens".format(
+                    usage["prompt_tokens"], usage["completion_tokens"]
+                )
+            page.add_lines(
+                "\n{}: {} messages{}, {} response characters".format(
+                    event["summary"], event["num_messages"], tokens, event["response_length"]
+                )
+            )
+
+    for page in pages.values():
+        page.write(log_dir, finished=finished)
+
+    # Create a call tree of the log.
+    call_tree_path = os.path.join(log_dir, CALL_TREE_NAME + ".html")
+    with open(call_tree_path, "w", encoding="utf-8") as f:
+        f.write(_html_opening("0 Call Tree", finished=finished))
+        f.write(f"<h3>{CALL_TREE_NAME}</h3>")
+        f.write("\n")
+        for page in pages.values():
+            if page.show_in_call_tree:
+                f.write(page.line_text + "\n")
+        f.write("\n")
+        f.write(_html_closing())
+
+
 class Page:
     """
     Represents a single HTML page in the logger output.
 
     Args:
-        page_logger: The PageLogger object that created this page.
         index: The index of the page.
         summary: A brief summary of the page's contents for display.
         indent_level: The level of indentation in the call tree.
@@ -457,17 +728,13 @@ class Page:
 
     def __init__(
         self,
-        page_logger: PageLogger,
         index: int,
         summary: str,
         indent_level: int,
         show_in_call_tree: bool = True,
         finished: bool = True,
     ):
-        """
-        Initializes and writes to a new HTML page.
-        """
-        self.page_logger = page_logger
+        self.index = index
         self.index_str = str(index)
         self.summary = summary
         self.indent_level = indent_level
@@ -477,29 +744,22 @@ def __init__(
         self.indentation_text = "|&emsp;" * self.indent_level
         self.full_link = f'<a href="{self.index_str}.html">{self.file_title}</a>'
         self.line_text = self.indentation_text + self.full_link
+        # Only filled in when the page is rendered from the log.
         self.lines: List[str] = []
-        self.flush()
 
-    def add_lines(self, lines: str, flush: bool = False) -> None:
+    def add_lines(self, lines: str) -> None:
         """
         Adds one or more lines to the page.
         """
-        lines_to_add: List[str] = []
-        if "\n" in lines:
-            lines_to_add = lines.split("\n")
-        else:
-            lines_to_add.append(lines)
-        self.lines.extend(lines_to_add)
-        if flush:
-            self.flush()
+        self.lines.extend(lines.split("\n"))
 
-    def flush(self) -> None:
+    def write(self, log_dir: str, finished: bool = True) -> None:
         """
         Writes the HTML page to disk.
         """
-        page_path = os.path.join(self.page_logger.log_dir, self.index_str + ".html")
-        with open(page_path, "w") as f:
-            f.write(_html_opening(self.file_title, finished=self.finished))
+        page_path = os.path.join(log_dir, self.index_str + ".html")
+        with open(page_path, "w", encoding="utf-8") as f:
+            f.write(_html_opening(self.file_title, finished=finished or self.finished))
             f.write(f"<h3>{self.file_title}</h3>\n")
             for line in self.lines:
                 try:
@@ -507,7 +767,6 @@ def flush(self) -> None:
                 except UnicodeEncodeError:
                     f.write("UnicodeEncodeError in this line.\n")
             f.write(_html_closing())
-            f.flush()
 
 
 class PageStack:
@@ -535,12 +794,3 @@ def top(self) -> Page | None:
         if self.size() == 0:
             return None
         return self.stack[-1]
-
-    def write_stack_to_page(self, page: Page) -> None:
-        # Logs a properly indented string displaying the current call stack.
-        page.add_lines("\nCALL STACK")
-        for stack_page in self.stack:
-            page.add_lines(stack_page.line_text)
-        page.add_lines("")
-        page.add_lines("")
-        page.flush()
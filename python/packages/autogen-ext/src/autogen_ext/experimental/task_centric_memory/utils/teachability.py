@@ -129,5 +129,5 @@ async def clear(self) -> None:
         self._memory_controller.reset_memory()
 
     async def close(self) -> None:
-        """Clean up memory resources."""
-        pass  # No cleanup needed for this memory implementation
+        """Saves any unsaved memories to disk. The memory controller stays open, since it is owned by the caller."""
+        self._memory_controller.memory_bank.save_memos()
@@ -1,5 +1,5 @@
 import difflib
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 try:  # pragma: no cover
     from unidiff import PatchSet
@@ -8,15 +8,95 @@
 
 from ._canvas import BaseCanvas
 
+# A line delta replaces the old lines [start:end] with new lines, in order of increasing start.
+_LineDelta = List[Tuple[int, int, List[str]]]
 
-class FileRevision:
-    """Tracks the history of one file's content."""
 
-    __slots__ = ("content", "revision")
+def _line_delta(old_lines: List[str], new_lines: List[str]) -> _LineDelta:
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    return [(i1, i2, new_lines[j1:j2]) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
 
-    def __init__(self, content: str, revision: int) -> None:
-        self.content: str = content
-        self.revision: int = revision  # e.g. an integer, a timestamp, or git hash
+
+def _apply_line_delta(old_lines: List[str], delta: _LineDelta) -> List[str]:
+    new_lines: List[str] = []
+    position = 0
+    for start, end, lines in delta:
+        new_lines.extend(old_lines[position:start])
+        new_lines.extend(lines)
+        position = end
+    new_lines.extend(old_lines[position:])
+    return new_lines
+
+
+def _unified_diff(filename: str, from_revision: int, from_content: str, to_revision: int, to_content: str) -> str:
+    diff = difflib.unified_diff(
+        from_content.splitlines(keepends=True),
+        to_content.splitlines(keepends=True),
+        fromfile=f"{filename}@r{from_revision}",
+        tofile=f"{filename}@r{to_revision}",
+    )
+    return "".join(diff)
+
+
+class FileHistory:
+    """Tracks the history of one file's content.
+
+    Revisions are numbered from 1. Every ``snapshot_interval``-th revision is stored in full,
+    and the others as a line delta from the revision before, so any revision is rebuilt from
+    at most ``snapshot_interval - 1`` deltas. The latest content is always kept in full.
+    """
+
+    __slots__ = ("snapshot_interval", "snapshots", "deltas", "latest", "diffs")
+
+    def __init__(self, content: str, snapshot_interval: int) -> None:
+        self.snapshot_interval = snapshot_interval
+        self.snapshots: Dict[int, str] = {1: content}
+        self.deltas: Dict[int, _LineDelta] = {}  # keyed by the revision they produce
+        self.latest = content
+        self.diffs: List[str] = []  # cached diffs between consecutive revisions, starting at 1 → 2
+
+    @property
+    def revision(self) -> int:
+        """The latest revision number."""
+        return len(self.snapshots) + len(self.deltas)
+
+    def append(self, content: str) -> None:
+        revision = self.revision + 1
+        if (revision - 1) % self.snapshot_interval == 0:
+            self.snapshots[revision] = content
+        else:
+            self.deltas[revision] = _line_delta(
+                self.latest.splitlines(keepends=True), content.splitlines(keepends=True)
+            )
+        self.latest = content
+
+    def content(self, revision: int) -> Optional[str]:
+        """Return the content of *revision*, or None if it does not exist."""
+        if revision == self.revision:
+            return self.latest
+        if not 1 <= revision < self.revision:
+            return None
+        snapshot = revision - (revision - 1) % self.snapshot_interval
+        lines = self.snapshots[snapshot].splitlines(keepends=True)
+        for delta_revision in range(snapshot + 1, revision + 1):
+            lines = _apply_line_delta(lines, self.deltas[delta_revision])
+        return "".join(lines)
+
+    def contents_from(self, revision: int) -> Iterator[str]:
+        """Yield the content of every revision from *revision* to the latest, in order."""
+        content = self.content(revision)
+        if content is None:
+            return
+        yield content
+        lines = content.splitlines(keepends=True)
+        for next_revision in range(revision + 1, self.revision + 1):
+            if next_revision in self.snapshots:
+                content = self.snapshots[next_revision]
+                lines = content.splitlines(keepends=True)
+            else:
+                lines = _apply_line_delta(lines, self.deltas[next_revision])
+                content = "".join(lines)
+            yield content
 
 
 class TextCanvas(BaseCanvas):
@@ -34,26 +114,31 @@ class TextCanvas(BaseCanvas):
     * **get_revision_diffs** – obtain the list of diffs applied between every
       consecutive pair of revisions so that a caller can replay or audit the
       full change history.
+    * **get_changes_for_context** – a view of only the files that changed since
+      given revisions, as diffs.
+
+    Only every ``snapshot_interval``-th revision of a file is stored in full, and the
+    revisions in between as line deltas, so long editing sessions on large files
+    stay small. Diffs between consecutive revisions are computed once and cached.
+
+    Args:
+        snapshot_interval (int): Store every n-th revision of a file in full. Defaults to 16.
     """
 
     # ----------------------------------------------------------------------------------
     # Construction helpers
     # ----------------------------------------------------------------------------------
 
-    def __init__(self) -> None:
-        # For each file we keep an *ordered* list of FileRevision where the last
-        # element is the most recent.  Using a list keeps the memory footprint
-        # small and preserves order without any extra bookkeeping.
-        self._files: Dict[str, List[FileRevision]] = {}
+    def __init__(self, snapshot_interval: int = 16) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+        self._snapshot_interval = snapshot_interval
+        self._files: Dict[str, FileHistory] = {}
 
     # ----------------------------------------------------------------------------------
     # Internal utilities
     # ----------------------------------------------------------------------------------
 
-    def _latest_idx(self, filename: str) -> int:
-        """Return the index (not revision number) of the newest revision."""
-        return len(self._files.get(filename, [])) - 1
-
     def _ensure_file(self, filename: str) -> None:
         if filename not in self._files:
             raise ValueError(f"File '{filename}' does not exist on the canvas; create it first.")
@@ -68,10 +153,9 @@ def get_revision_content(self, filename: str, revision: int) -> str:  # NEW 🚀
         If the revision does not exist an empty string is returned so that
         downstream code can handle the "not found" case without exceptions.
         """
-        for rev in self._files.get(filename, []):
-            if rev.revision == revision:
-                return rev.content
-        return ""
+        history = self._files.get(filename)
+        content = history.content(revision) if history is not None else None
+        return content if content is not None else ""
 
     def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         """Return a *chronological* list of unified‑diffs for *filename*.
@@ -79,18 +163,18 @@ def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         Each element in the returned list represents the diff that transformed
         revision *n* into revision *n+1* (starting at revision 1 → 2).
         """
-        revisions = self._files.get(filename, [])
-        diffs: List[str] = []
-        for i in range(1, len(revisions)):
-            older, newer = revisions[i - 1], revisions[i]
-            diff = difflib.unified_diff(
-                older.content.splitlines(keepends=True),
-                newer.content.splitlines(keepends=True),
-                fromfile=f"{filename}@r{older.revision}",
-                tofile=f"{filename}@r{newer.revision}",
-            )
-            diffs.append("".join(diff))
-        return diffs
+        history = self._files.get(filename)
+        if history is None:
+            return []
+        # Only the diffs for revisions added since the last call are computed.
+        first = len(history.diffs) + 1
+        if first < history.revision:
+            contents = history.contents_from(first)
+            older = next(contents)
+            for revision, newer in enumerate(contents, start=first + 1):
+                history.diffs.append(_unified_diff(filename, revision - 1, older, revision, newer))
+                older = newer
+        return list(history.diffs)
 
     # ----------------------------------------------------------------------------------
     # BaseCanvas interface implementation
@@ -98,12 +182,12 @@ def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
 
     def list_files(self) -> Dict[str, int]:
         """Return a mapping of *filename → latest revision number*."""
-        return {fname: revs[-1].revision for fname, revs in self._files.items() if revs}
+        return {fname: history.revision for fname, history in self._files.items()}
 
     def get_latest_content(self, filename: str) -> str:  # noqa: D401 – keep API identical
         """Return the most recent content or an empty string if the file is new."""
-        revs = self._files.get(filename, [])
-        return revs[-1].content if revs else ""
+        history = self._files.get(filename)
+        return history.latest if history is not None else ""
 
     def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any]) -> None:
         """Create *filename* or append a new revision containing *new_content*."""
@@ -112,28 +196,23 @@ def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any])
         if not isinstance(new_content, str):
             raise ValueError(f"Expected str or bytes, got {type(new_content)}")
         if filename not in self._files:
-            self._files[filename] = [FileRevision(new_content, 1)]
+            self._files[filename] = FileHistory(new_content, self._snapshot_interval)
         else:
-            last_rev_num = self._files[filename][-1].revision
-            self._files[filename].append(FileRevision(new_content, last_rev_num + 1))
+            self._files[filename].append(new_content)
 
     def get_diff(self, filename: str, from_revision: int, to_revision: int) -> str:
         """Return a unified diff between *from_revision* and *to_revision*."""
-        revisions = self._files.get(filename, [])
-        if not revisions:
+        history = self._files.get(filename)
+        if history is None:
             return ""
+        if to_revision == from_revision + 1 and 1 <= from_revision <= len(history.diffs):
+            return history.diffs[from_revision - 1]
         # Fetch the contents for the requested revisions.
         from_content = self.get_revision_content(filename, from_revision)
         to_content = self.get_revision_content(filename, to_revision)
         if from_content == "" and to_content == "":  # one (or both) revision ids not found
             return ""
-        diff = difflib.unified_diff(
-            from_content.splitlines(keepends=True),
-            to_content.splitlines(keepends=True),
-            fromfile=f"{filename}@r{from_revision}",
-            tofile=f"{filename}@r{to_revision}",
-        )
-        return "".join(diff)
+        return _unified_diff(filename, from_revision, from_content, to_revision, to_content)
 
     def apply_patch(self, filename: str, patch_data: Union[str, bytes, Any]) -> None:
         """Apply *patch_text* (unified diff) to the latest revision and save a new revision.
@@ -185,8 +264,33 @@ def apply_patch(self, filename: str, patch_data: Union[str, bytes, Any]) -> None
     def get_all_contents_for_context(self) -> str:  # noqa: D401 – keep public API stable
         """Return a summarised view of every file and its *latest* revision."""
         out: List[str] = ["=== CANVAS FILES ==="]
-        for fname, revs in self._files.items():
-            latest = revs[-1]
-            out.append(f"File: {fname} (rev {latest.revision}):\n{latest.content}\n")
+        for fname, history in self._files.items():
+            out.append(f"File: {fname} (rev {history.revision}):\n{history.latest}\n")
         out.append("=== END OF CANVAS ===")
         return "\n".join(out)
+
+    def get_changes_for_context(self, since: Mapping[str, int]) -> str:
+        """Return a view of the files that changed after the revisions in *since*.
+
+        Changed files are shown as a diff from the revision in *since*, or in full when
+        that is shorter, and files missing from *since* in full. Unchanged files are only
+        listed. Returns an empty string if nothing changed.
+        """
+        out: List[str] = ["=== CANVAS CHANGES ==="]
+        unchanged: List[str] = []
+        for fname, history in self._files.items():
+            seen = since.get(fname)
+            if seen == history.revision:
+                unchanged.append(f"{fname} (rev {history.revision})")
+                continue
+            diff = self.get_diff(fname, seen, history.revision) if seen is not None else None
+            if diff is None or len(diff) >= len(history.latest):
+                out.append(f"File: {fname} (rev {history.revision}):\n{history.latest}\n")
+            else:
+                out.append(f"File: {fname} (rev {seen} → rev {history.revision}):\n{diff}")
+        if len(out) == 1:
+            return ""
+        if unchanged:
+            out.append(f"Unchanged: {', '.join(unchanged)}")
+        out.append("=== END OF CANVAS CHANGES ===")
+        return "\n".join(out)
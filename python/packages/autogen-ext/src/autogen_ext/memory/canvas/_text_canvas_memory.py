@@ -1,4 +1,6 @@
-from typing import Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from autogen_core import CancellationToken
 from autogen_core.memory import (
@@ -14,6 +16,20 @@
 from ._canvas_writer import ApplyPatchTool, UpdateFileTool
 from ._text_canvas import TextCanvas
 
+# The number of canvas messages tracked in changes mode. A model context whose last canvas message
+# is no longer tracked gets the full canvas again.
+_MAX_INJECTIONS = 1024
+
+
+@dataclass
+class _Injection:
+    """A canvas message injected into a model context in changes mode."""
+
+    revisions: Dict[str, int]
+    """The file revisions the model has seen once it reads this message."""
+    messages: List[SystemMessage]
+    """The full canvas message and every change message since, ending with this message."""
+
 
 class TextCanvasMemory(Memory):
     """
@@ -38,6 +54,18 @@ class TextCanvasMemory(Memory):
     - Creating or updating files with new content
     - Applying patches (unified diff format) to existing files
 
+    By default the full content of every file is injected on every turn. With ``context_mode="changes"``,
+    the full canvas is injected once per model context, and after that only the diffs of the files
+    that changed since the last canvas message in that context. The canvas messages already in the
+    model context tell what it has seen, so agents sharing the memory each get their own changes.
+    The full canvas is injected again when an earlier canvas message is no longer in the model context,
+    for example after it was cleared or truncated, or restored from a saved state.
+
+    Args:
+        canvas (TextCanvas, optional): The canvas to use. Defaults to a new, empty canvas.
+        context_mode (Literal["full", "changes"], optional): What to inject into the model context on each turn.
+            Defaults to "full".
+
     Examples:
 
         **Example: Using TextCanvasMemory with an AssistantAgent**
@@ -171,19 +199,32 @@ async def main():
                 asyncio.run(main())
     """
 
-    def __init__(self, canvas: Optional[TextCanvas] = None):
+    def __init__(self, canvas: Optional[TextCanvas] = None, context_mode: Literal["full", "changes"] = "full"):
         super().__init__()
         self.canvas = canvas if canvas is not None else TextCanvas()
+        self.context_mode = context_mode
+        # Canvas messages injected in changes mode, by id, least recently used first. Holding the messages
+        # keeps their ids from being reused while they are tracked.
+        self._injections: OrderedDict[int, _Injection] = OrderedDict()
 
     async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
         """
         Inject the entire canvas summary (or a selected subset) as reference data.
         Here, we just put it into a system message, but you could customize.
         """
-        snapshot = self.canvas.get_all_contents_for_context()
+        base: List[SystemMessage] = []
+        if self.context_mode == "changes":
+            snapshot, base = await self._get_changes_for_context(model_context)
+        else:
+            snapshot = self.canvas.get_all_contents_for_context()
+        revisions = self.canvas.list_files()
         if snapshot.strip():
             msg = SystemMessage(content=snapshot)
             await model_context.add_message(msg)
+            if self.context_mode == "changes":
+                self._injections[id(msg)] = _Injection(revisions=revisions, messages=base + [msg])
+                while len(self._injections) > _MAX_INJECTIONS:
+                    self._injections.popitem(last=False)
 
             # Return it for debugging/logging
             memory_content = MemoryContent(content=snapshot, mime_type=MemoryMimeType.TEXT)
@@ -191,6 +232,21 @@ async def update_context(self, model_context: ChatCompletionContext) -> UpdateCo
 
         return UpdateContextResult(memories=MemoryQueryResult(results=[]))
 
+    async def _get_changes_for_context(self, model_context: ChatCompletionContext) -> Tuple[str, List[SystemMessage]]:
+        """Return the canvas changes since the last canvas message in the model context, and the canvas
+        messages they build on. Returns the full canvas if any of those messages is missing."""
+        messages = await model_context.get_messages()
+        present = {id(message) for message in messages}
+        for message in reversed(messages):
+            injection = self._injections.get(id(message))
+            if injection is None or injection.messages[-1] is not message:
+                continue
+            if all(id(earlier) in present for earlier in injection.messages):
+                self._injections.move_to_end(id(message))
+                return self.canvas.get_changes_for_context(injection.revisions), injection.messages
+            break
+        return self.canvas.get_all_contents_for_context(), []
+
     async def query(
         self, query: str | MemoryContent, cancellation_token: Optional[CancellationToken] = None, **kwargs: Any
     ) -> MemoryQueryResult:
@@ -212,6 +268,7 @@ async def clear(self) -> None:
         """Clear the entire canvas by replacing it with a new empty instance."""
         # Create a new TextCanvas instance instead of calling __init__ directly
         self.canvas = TextCanvas()
+        self._injections.clear()
 
     async def close(self) -> None:
         pass
@@ -1,6 +1,10 @@
+import asyncio
+import functools
 import logging
 import uuid
-from typing import Any, Dict, List, Literal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Sequence, TypeVar
 
 from autogen_core import CancellationToken, Component, Image
 from autogen_core.memory import Memory, MemoryContent, MemoryMimeType, MemoryQueryResult, UpdateContextResult
@@ -8,12 +12,14 @@
 from autogen_core.models import SystemMessage
 from chromadb import HttpClient, PersistentClient
 from chromadb.api.models.Collection import Collection
-from chromadb.api.types import Document, Metadata
+from chromadb.api.types import Document, Embedding, EmbeddingFunction, Embeddings, Metadata, QueryResult
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 try:
     from chromadb.api import ClientAPI
@@ -34,6 +40,10 @@ class ChromaDBVectorMemoryConfig(BaseModel):
     allow_reset: bool = Field(default=False, description="Whether to allow resetting the ChromaDB client")
     tenant: str = Field(default="default_tenant", description="Tenant to use")
     database: str = Field(default="default_database", description="Database to use")
+    batch_size: int = Field(default=64, description="Number of documents embedded and inserted together in add_many")
+    query_embedding_cache_size: int = Field(
+        default=256, description="Number of query embeddings to keep in an LRU cache. Set to 0 to disable"
+    )
 
 
 class PersistentChromaDBVectorMemoryConfig(ChromaDBVectorMemoryConfig):
@@ -66,6 +76,11 @@ class ChromaDBVectorMemory(Memory, Component[ChromaDBVectorMemoryConfig]):
     For advanced use cases requiring specialized formatting of retrieved content, users should extend
     this class and override the `update_context()` method.
 
+    All ChromaDB operations, including embedding computation, run on a dedicated worker thread so
+    that they do not block the event loop. Use :meth:`add_many` to embed and insert documents in batches
+    and :meth:`query_many` to run several queries in a single ChromaDB call. Query embeddings are kept
+    in an LRU cache so that repeated queries are not embedded again.
+
     .. note::
 
         This implementation requires the ChromaDB extra to be installed. Install with:
@@ -132,12 +147,24 @@ def __init__(self, config: ChromaDBVectorMemoryConfig | None = None) -> None:
         self._config = config or PersistentChromaDBVectorMemoryConfig()
         self._client: ClientAPI | None = None
         self._collection: Collection | None = None
+        self._embedding_function: EmbeddingFunction[Any] | None = None
+        self._query_embedding_cache: OrderedDict[str, Embedding] = OrderedDict()
+        # A single worker thread serializes access to the ChromaDB client off the event loop.
+        self._executor: ThreadPoolExecutor | None = None
 
     @property
     def collection_name(self) -> str:
         """Get the name of the ChromaDB collection."""
         return self._config.collection_name
 
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking ChromaDB operation on the worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chromadb_memory")
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
     def _ensure_initialized(self) -> None:
         """Ensure ChromaDB client and collection are initialized."""
         if self._client is None:
@@ -171,8 +198,15 @@ def _ensure_initialized(self) -> None:
 
         if self._collection is None:
             try:
+                from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+                # Keep a reference to the embedding function so that query embeddings can be cached.
+                if self._embedding_function is None:
+                    self._embedding_function = DefaultEmbeddingFunction()
                 self._collection = self._client.get_or_create_collection(
-                    name=self._config.collection_name, metadata={"distance_metric": self._config.distance_metric}
+                    name=self._config.collection_name,
+                    metadata={"distance_metric": self._config.distance_metric},
+                    embedding_function=self._embedding_function,
                 )
             except Exception as e:
                 logger.error(f"Failed to get/create collection: {e}")
@@ -292,25 +326,53 @@ async def update_context(
 
     async def add(self, content: MemoryContent, cancellation_token: CancellationToken | None = None) -> None:
         """Add a memory content to ChromaDB."""
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
-
-        try:
-            # Extract text from content
-            text = self._extract_text(content)
+        await self.add_many([content], cancellation_token=cancellation_token)
 
-            # Use metadata directly from content
-            metadata_dict = content.metadata or {}
-            metadata_dict["mime_type"] = str(content.mime_type)
+    async def add_many(
+        self, contents: Sequence[MemoryContent], cancellation_token: CancellationToken | None = None
+    ) -> None:
+        """Add several memory contents to ChromaDB.
 
-            # Add to ChromaDB
-            self._collection.add(documents=[text], metadatas=[metadata_dict], ids=[str(uuid.uuid4())])
+        The contents are embedded and inserted in batches of `batch_size` documents on the worker thread.
 
+        Args:
+            contents (Sequence[MemoryContent]): The memory contents to add.
+            cancellation_token (CancellationToken | None): Token to cancel the operation.
+        """
+        if not contents:
+            return
+        try:
+            documents: List[str] = []
+            metadatas: List[Metadata] = []
+            for content in contents:
+                # Extract text from content
+                documents.append(self._extract_text(content))
+
+                # Use metadata directly from content
+                metadata_dict = content.metadata or {}
+                metadata_dict["mime_type"] = str(content.mime_type)
+                metadatas.append(metadata_dict)
+
+            future = asyncio.ensure_future(self._run_in_executor(self._add_sync, documents, metadatas))
+            if cancellation_token is not None:
+                cancellation_token.link_future(future)
+            await future
         except Exception as e:
             logger.error(f"Failed to add content to ChromaDB: {e}")
             raise
 
+    def _add_sync(self, documents: List[str], metadatas: List[Metadata]) -> None:
+        self._ensure_initialized()
+        if self._collection is None:
+            raise RuntimeError("Failed to initialize ChromaDB")
+        batch_size = max(1, self._config.batch_size)
+        for start in range(0, len(documents), batch_size):
+            self._collection.add(
+                documents=documents[start : start + batch_size],
+                metadatas=metadatas[start : start + batch_size],
+                ids=[str(uuid.uuid4()) for _ in documents[start : start + batch_size]],
+            )
+
     async def query(
         self,
         query: str | MemoryContent,
@@ -318,66 +380,113 @@ async def query(
         **kwargs: Any,
     ) -> MemoryQueryResult:
         """Query memory content based on vector similarity."""
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
+        results = await self.query_many([query], cancellation_token=cancellation_token, **kwargs)
+        return results[0]
 
+    async def query_many(
+        self,
+        queries: Sequence[str | MemoryContent],
+        cancellation_token: CancellationToken | None = None,
+        **kwargs: Any,
+    ) -> List[MemoryQueryResult]:
+        """Query memory content for several queries in a single ChromaDB call.
+
+        This is useful when several agents share the memory and their contexts are queried together.
+
+        Args:
+            queries (Sequence[str | MemoryContent]): The queries.
+            cancellation_token (CancellationToken | None): Token to cancel the operation.
+            **kwargs: Additional arguments passed to the ChromaDB collection query, such as `where`.
+
+        Returns:
+            List[MemoryQueryResult]: One result per query, in the same order as the queries.
+        """
+        if not queries:
+            return []
         try:
             # Extract text for query
-            query_text = self._extract_text(query)
-
-            # Query ChromaDB
-            results = self._collection.query(
-                query_texts=[query_text],
-                n_results=self._config.k,
-                include=["documents", "metadatas", "distances"],
-                **kwargs,
-            )
+            query_texts = [self._extract_text(query) for query in queries]
 
-            # Convert results to MemoryContent list
-            memory_results: List[MemoryContent] = []
-
-            if (
-                not results
-                or not results.get("documents")
-                or not results.get("metadatas")
-                or not results.get("distances")
-            ):
-                return MemoryQueryResult(results=memory_results)
-
-            documents: List[Document] = results["documents"][0] if results["documents"] else []
-            metadatas: List[Metadata] = results["metadatas"][0] if results["metadatas"] else []
-            distances: List[float] = results["distances"][0] if results["distances"] else []
-            ids: List[str] = results["ids"][0] if results["ids"] else []
-
-            for doc, metadata_dict, distance, doc_id in zip(documents, metadatas, distances, ids, strict=False):
-                # Calculate score
-                score = self._calculate_score(distance)
-                metadata = dict(metadata_dict)
-                metadata["score"] = score
-                metadata["id"] = doc_id
-                if self._config.score_threshold is not None and score < self._config.score_threshold:
-                    continue
-
-                # Extract mime_type from metadata
-                mime_type = str(metadata_dict.get("mime_type", MemoryMimeType.TEXT.value))
-
-                # Create MemoryContent
-                content = MemoryContent(
-                    content=doc,
-                    mime_type=mime_type,
-                    metadata=metadata,
-                )
-                memory_results.append(content)
+            future = asyncio.ensure_future(self._run_in_executor(self._query_sync, query_texts, **kwargs))
+            if cancellation_token is not None:
+                cancellation_token.link_future(future)
+            results = await future
 
-            return MemoryQueryResult(results=memory_results)
+            return [self._to_memory_query_result(results, index) for index in range(len(query_texts))]
 
         except Exception as e:
             logger.error(f"Failed to query ChromaDB: {e}")
             raise
 
+    def _query_sync(self, query_texts: List[str], **kwargs: Any) -> QueryResult:
+        self._ensure_initialized()
+        if self._collection is None:
+            raise RuntimeError("Failed to initialize ChromaDB")
+
+        # Query ChromaDB
+        return self._collection.query(
+            query_embeddings=self._embed_queries(query_texts),
+            n_results=self._config.k,
+            include=["documents", "metadatas", "distances"],
+            **kwargs,
+        )
+
+    def _embed_queries(self, query_texts: List[str]) -> Embeddings:
+        """Embed query texts, reusing cached embeddings of previously seen queries."""
+        assert self._embedding_function is not None
+        cache = self._query_embedding_cache
+        missing = list(dict.fromkeys(text for text in query_texts if text not in cache))
+        if missing:
+            for text, embedding in zip(missing, self._embedding_function(missing), strict=True):
+                cache[text] = embedding
+        embeddings: Embeddings = []
+        for text in query_texts:
+            embeddings.append(cache[text])
+            cache.move_to_end(text)
+        while len(cache) > max(0, self._config.query_embedding_cache_size):
+            cache.popitem(last=False)
+        return embeddings
+
+    def _to_memory_query_result(self, results: QueryResult, index: int) -> MemoryQueryResult:
+        """Convert the results of the query at `index` to a memory query result."""
+        # Convert results to MemoryContent list
+        memory_results: List[MemoryContent] = []
+
+        if not results or not results.get("documents") or not results.get("metadatas") or not results.get("distances"):
+            return MemoryQueryResult(results=memory_results)
+
+        documents: List[Document] = results["documents"][index] if results["documents"] else []
+        metadatas: List[Metadata] = results["metadatas"][index] if results["metadatas"] else []
+        distances: List[float] = results["distances"][index] if results["distances"] else []
+        ids: List[str] = results["ids"][index] if results["ids"] else []
+
+        for doc, metadata_dict, distance, doc_id in zip(documents, metadatas, distances, ids, strict=False):
+            # Calculate score
+            score = self._calculate_score(distance)
+            metadata = dict(metadata_dict)
+            metadata["score"] = score
+            metadata["id"] = doc_id
+            if self._config.score_threshold is not None and score < self._config.score_threshold:
+                continue
+
+            # Extract mime_type from metadata
+            mime_type = str(metadata_dict.get("mime_type", MemoryMimeType.TEXT.value))
+
+            # Create MemoryContent
+            content = MemoryContent(
+                content=doc,
+                mime_type=mime_type,
+                metadata=metadata,
+            )
+            memory_results.append(content)
+
+        return MemoryQueryResult(results=memory_results)
+
     async def clear(self) -> None:
         """Clear all entries from memory."""
+        await self._run_in_executor(self._clear_sync)
+
+    def _clear_sync(self) -> None:
         self._ensure_initialized()
         if self._collection is None:
             raise RuntimeError("Failed to initialize ChromaDB")
@@ -392,11 +501,20 @@ async def clear(self) -> None:
 
     async def close(self) -> None:
         """Clean up ChromaDB client and resources."""
+        if self._executor is not None:
+            # Let pending operations finish on the worker thread before releasing the client.
+            executor = self._executor
+            self._executor = None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
         self._collection = None
         self._client = None
+        self._query_embedding_cache.clear()
 
     async def reset(self) -> None:
         """Reset the memory by deleting all data."""
+        await self._run_in_executor(self._reset_sync)
+
+    def _reset_sync(self) -> None:
         self._ensure_initialized()
         if not self._config.allow_reset:
             raise RuntimeError("Reset not allowed. Set allow_reset=True in config to enable.")
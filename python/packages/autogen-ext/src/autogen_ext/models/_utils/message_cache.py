@@ -0,0 +1,133 @@
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, List, Tuple, TypeVar
+
+from autogen_core.models import LLMMessage
+
+T = TypeVar("T")
+
+# Number of messages whose conversions are kept by default.
+DEFAULT_MAX_CACHED_MESSAGES = 4096
+
+
+@dataclass
+class PromptCacheStats:
+    """Statistics of message conversion and provider-side prompt caching of a model client."""
+
+    conversion_hits: int = 0
+    """Number of messages whose provider format was reused from an earlier request."""
+    conversion_misses: int = 0
+    """Number of messages converted to the provider format."""
+    prompt_tokens: int = 0
+    """Total number of prompt tokens reported by the provider."""
+    cached_prompt_tokens: int = 0
+    """Number of prompt tokens read from the provider's prompt cache."""
+    cache_creation_tokens: int = 0
+    """Number of prompt tokens written to the provider's prompt cache, for providers that report them."""
+
+    @property
+    def cached_token_ratio(self) -> float:
+        """The fraction of prompt tokens that were read from the provider's prompt cache."""
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    @property
+    def conversion_hit_ratio(self) -> float:
+        total = self.conversion_hits + self.conversion_misses
+        return self.conversion_hits / total if total else 0.0
+
+
+def _fingerprint(message: LLMMessage) -> Tuple[Any, ...]:
+    values = tuple(message.__dict__.values())
+    content = message.content
+    if isinstance(content, list):
+        return values + tuple(content)
+    return values
+
+
+class _Entry:
+    def __init__(self, ref: "weakref.ref[LLMMessage]") -> None:
+        self.ref = ref
+        # The fingerprint holds references to the field values, so comparing by identity is safe.
+        self.conversions: Dict[Hashable, Tuple[Tuple[Any, ...], Any]] = {}
+
+
+class MessageConversionCache(Generic[T]):
+    """Memoizes the conversion of :class:`~autogen_core.models.LLMMessage` objects to a provider format.
+
+    Agents send the same message objects with every request of a conversation, so the
+    conversion of the history (name normalization, image encoding, ...) only needs to be done
+    once. Conversions are keyed by the identity of the message and a `key` for the conversion
+    options, such as the model family. Replacing a field of a message, or a part of its content,
+    invalidates its conversions, but in-place changes to nested objects are not detected.
+    Entries are dropped when their message is garbage collected, or least recently used first
+    beyond `max_messages` messages.
+
+    Reusing the converted objects also keeps the serialization of a conversation prefix
+    byte-identical across requests, which provider-side prompt caching relies on. The returned
+    values are shared and must not be modified.
+    """
+
+    def __init__(self, max_messages: int = DEFAULT_MAX_CACHED_MESSAGES) -> None:
+        self._max_messages = max_messages
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        # Weak reference callbacks can run during any allocation, so they only queue the removals.
+        self._pending_removals: List[Tuple[int, "weakref.ref[LLMMessage]"]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Weak references cannot be pickled, so a pickled cache starts empty.
+        return (type(self), (self._max_messages,))
+
+    def __len__(self) -> int:
+        self._remove_pending()
+        return len(self._entries)
+
+    def get_or_convert(self, message: LLMMessage, key: Hashable, convert: Callable[[LLMMessage], T]) -> T:
+        self._remove_pending()
+        message_id = id(message)
+        entry = self._entries.get(message_id)
+        if entry is not None and entry.ref() is not message:
+            # The id of a collected message was reused before its entry was removed.
+            del self._entries[message_id]
+            entry = None
+        fingerprint = _fingerprint(message)
+        if entry is not None:
+            self._entries.move_to_end(message_id)
+            cached = entry.conversions.get(key)
+            if cached is not None and len(cached[0]) == len(fingerprint):
+                if all(a is b for a, b in zip(cached[0], fingerprint, strict=False)):
+                    self.hits += 1
+                    return cached[1]  # type: ignore[no-any-return]
+
+        self.misses += 1
+        converted = convert(message)
+        if entry is None:
+            entry = _Entry(weakref.ref(message, self._remover(message_id)))
+            self._entries[message_id] = entry
+            if len(self._entries) > self._max_messages:
+                self._entries.popitem(last=False)
+        entry.conversions[key] = (fingerprint, converted)
+        return converted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending_removals.clear()
+
+    def _remover(self, message_id: int) -> Callable[["weakref.ref[LLMMessage]"], None]:
+        self_ref = weakref.ref(self)
+
+        def remove(ref: "weakref.ref[LLMMessage]") -> None:
+            cache = self_ref()
+            if cache is not None:
+                cache._pending_removals.append((message_id, ref))
+
+        return remove
+
+    def _remove_pending(self) -> None:
+        while self._pending_removals:
+            message_id, ref = self._pending_removals.pop()
+            entry = self._entries.get(message_id)
+            if entry is not None and entry.ref is ref:
+                del self._entries[message_id]
@@ -0,0 +1,41 @@
+import asyncio
+from typing import List
+
+import tiktoken
+
+# Below this many characters, encoding is faster than handing the work to a thread.
+INLINE_ENCODE_MAX_CHARS = 8192
+
+
+class TokenCounter:
+    """Accumulates the texts to tokenize and the fixed token overheads of a request.
+
+    Collecting the texts first lets :meth:`acount` encode them all in one batch on a
+    worker thread. tiktoken releases the GIL while encoding, so large contexts are
+    counted without blocking the event loop. The batch is encoded sequentially rather
+    than with :meth:`tiktoken.Encoding.encode_batch`, whose thread fan-out competes with
+    the event loop thread for the GIL.
+    """
+
+    def __init__(self, encoding: tiktoken.Encoding) -> None:
+        self.encoding = encoding
+        self.texts: List[str] = []
+        self.fixed_tokens = 0
+        self._chars = 0
+
+    def add_text(self, text: str) -> None:
+        self.texts.append(text)
+        self._chars += len(text)
+
+    def add_tokens(self, num_tokens: int) -> None:
+        self.fixed_tokens += num_tokens
+
+    def count(self) -> int:
+        """Count the tokens on the calling thread."""
+        return self.fixed_tokens + sum(len(self.encoding.encode(text)) for text in self.texts)
+
+    async def acount(self) -> int:
+        """Count the tokens, encoding large batches on a worker thread."""
+        if self._chars <= INLINE_ENCODE_MAX_CHARS:
+            return self.count()
+        return await asyncio.to_thread(self.count)
@@ -1,3 +1,4 @@
+from .._utils.message_cache import PromptCacheStats
 from ._anthropic_client import (
     AnthropicBedrockChatCompletionClient,
     AnthropicChatCompletionClient,
@@ -22,4 +23,5 @@
     "AnthropicBedrockClientConfigurationConfigModel",
     "CreateArgumentsConfigModel",
     "BedrockInfo",
+    "PromptCacheStats",
 ]
@@ -1,5 +1,4 @@
 import asyncio
-import base64
 import inspect
 import json
 import logging
@@ -17,6 +16,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
     overload,
@@ -64,6 +64,8 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.message_cache import MessageConversionCache, PromptCacheStats
+from .._utils.token_counter import TokenCounter
 from . import _model_info
 from .config import (
     AnthropicBedrockClientConfiguration,
@@ -95,6 +97,8 @@
 
 anthropic_init_kwargs = set(inspect.getfullargspec(AsyncAnthropic.__init__).kwonlyargs)
 
+_EPHEMERAL_CACHE_CONTROL: Dict[str, Any] = {"type": "ephemeral"}
+
 
 def _anthropic_client_from_config(config: Mapping[str, Any]) -> AsyncAnthropic:
     # Filter config to only include valid parameters
@@ -128,24 +132,11 @@ def type_to_role(message: LLMMessage) -> str:
 
 def get_mime_type_from_image(image: Image) -> Literal["image/jpeg", "image/png", "image/gif", "image/webp"]:
     """Get a valid Anthropic media type from an Image object."""
-    # Get base64 data first
-    base64_data = image.to_base64()
-
-    # Decode the base64 string
-    image_data = base64.b64decode(base64_data)
-
-    # Check the first few bytes for known signatures
-    if image_data.startswith(b"\xff\xd8\xff"):
-        return "image/jpeg"
-    elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image/png"
-    elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-        return "image/gif"
-    elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
-        return "image/webp"
-    else:
-        # Default to JPEG as a fallback
-        return "image/jpeg"
+    media_type = image.media_type
+    if media_type in ("image/jpeg", "image/png", "image/gif", "image/webp"):
+        return cast(Literal["image/jpeg", "image/png", "image/gif", "image/webp"], media_type)
+    # Default to JPEG as a fallback
+    return "image/jpeg"
 
 
 @overload
@@ -418,8 +409,10 @@ def __init__(
         *,
         create_args: Dict[str, Any],
         model_info: Optional[ModelInfo] = None,
+        prompt_caching: bool = False,
     ):
         self._client = client
+        self._prompt_caching = prompt_caching
 
         if model_info is None:
             try:
@@ -435,6 +428,83 @@ def __init__(
         self._create_args = create_args
         self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
         self._actual_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        self._message_cache: MessageConversionCache[Union[str, List[MessageParam], MessageParam]] = (
+            MessageConversionCache()
+        )
+        self._prompt_cache_stats = PromptCacheStats()
+
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        """Statistics of the reuse of converted messages and of Anthropic's prompt cache.
+
+        Prompt tokens include the tokens read from and written to the cache.
+        """
+        return PromptCacheStats(
+            conversion_hits=self._message_cache.hits,
+            conversion_misses=self._message_cache.misses,
+            prompt_tokens=self._prompt_cache_stats.prompt_tokens,
+            cached_prompt_tokens=self._prompt_cache_stats.cached_prompt_tokens,
+            cache_creation_tokens=self._prompt_cache_stats.cache_creation_tokens,
+        )
+
+    def _record_prompt_cache_usage(
+        self, input_tokens: int, cache_read_tokens: Optional[int], cache_creation_tokens: Optional[int]
+    ) -> int:
+        """Record the prompt cache usage of a response and return its total number of prompt tokens."""
+        # Anthropic does not count the tokens read from or written to the cache as input tokens.
+        prompt_tokens = input_tokens + (cache_read_tokens or 0) + (cache_creation_tokens or 0)
+        self._prompt_cache_stats.prompt_tokens += prompt_tokens
+        self._prompt_cache_stats.cached_prompt_tokens += cache_read_tokens or 0
+        self._prompt_cache_stats.cache_creation_tokens += cache_creation_tokens or 0
+        return prompt_tokens
+
+    def _convert_messages(self, messages: Sequence[LLMMessage]) -> Tuple[Optional[str], List[MessageParam]]:
+        """Convert messages to the system prompt and the Anthropic messages, reusing earlier conversions."""
+        system_message: Optional[str] = None
+        anthropic_messages: List[MessageParam] = []
+        for message in messages:
+            converted = self._message_cache.get_or_convert(message, None, to_anthropic_type)
+            if isinstance(message, SystemMessage):
+                if system_message is not None:
+                    # if that case, system message is must only one
+                    raise ValueError("Multiple system messages are not supported")
+                assert isinstance(converted, str)
+                system_message = converted
+            elif isinstance(converted, list):
+                anthropic_messages.extend(converted)
+            elif isinstance(converted, str):
+                anthropic_messages.append(
+                    MessageParam(role="user" if isinstance(message, UserMessage) else "assistant", content=converted)
+                )
+            else:
+                anthropic_messages.append(converted)
+        return system_message, anthropic_messages
+
+    @staticmethod
+    def _add_cache_control(request_args: Dict[str, Any]) -> None:
+        """Mark the system prompt, the tools and the whole conversation as cacheable prefixes.
+
+        The marked blocks are copies, since the converted messages are shared between requests.
+        """
+        system = request_args.get("system")
+        if isinstance(system, str):
+            request_args["system"] = [{"type": "text", "text": system, "cache_control": _EPHEMERAL_CACHE_CONTROL}]
+        tools = request_args.get("tools")
+        if tools:
+            request_args["tools"] = [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL_CACHE_CONTROL}]
+        messages = request_args["messages"]
+        if messages:
+            last_message = messages[-1]
+            content = last_message["content"]
+            if isinstance(content, str):
+                blocks: List[Any] = [{"type": "text", "text": content}]
+            else:
+                blocks = [
+                    block.model_dump(exclude_none=True) if isinstance(block, BaseModel) else block for block in content
+                ]
+            if blocks:
+                blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL_CACHE_CONTROL}
+                request_args["messages"] = [*messages[:-1], {**last_message, "content": blocks}]
 
     def _serialize_message(self, message: MessageParam) -> Dict[str, Any]:
         """Convert an Anthropic MessageParam to a JSON-serializable format."""
@@ -478,7 +548,14 @@ def _merge_system_messages(self, messages: Sequence[LLMMessage]) -> Sequence[LLM
                 _messages.append(message)
         system_message_content = system_message_content.rstrip()
         if system_message_content != "":
-            system_message = SystemMessage(content=system_message_content)
+            # Keep a single system message as is, so its conversion can be reused.
+            system_message = messages[_first_system_message_idx]
+            if (
+                _first_system_message_idx != _last_system_message_idx
+                or not isinstance(system_message, SystemMessage)
+                or system_message.content != system_message_content
+            ):
+                system_message = SystemMessage(content=system_message_content)
             _messages.insert(_first_system_message_idx, system_message)
         messages = _messages
 
@@ -525,31 +602,10 @@ async def create(
             elif isinstance(json_output, type):
                 raise ValueError("Structured output is currently not supported for Anthropic models")
 
-        # Process system message separately
-        system_message = None
-        anthropic_messages: List[MessageParam] = []
-
         # Merge continuous system messages into a single message
         messages = self._merge_system_messages(messages)
         messages = self._rstrip_last_assistant_message(messages)
-
-        for message in messages:
-            if isinstance(message, SystemMessage):
-                if system_message is not None:
-                    # if that case, system message is must only one
-                    raise ValueError("Multiple system messages are not supported")
-                system_message = to_anthropic_type(message)
-            else:
-                anthropic_message = to_anthropic_type(message)
-                if isinstance(anthropic_message, list):
-                    anthropic_messages.extend(anthropic_message)
-                elif isinstance(anthropic_message, str):
-                    msg = MessageParam(
-                        role="user" if isinstance(message, UserMessage) else "assistant", content=anthropic_message
-                    )
-                    anthropic_messages.append(msg)
-                else:
-                    anthropic_messages.append(anthropic_message)
+        system_message, anthropic_messages = self._convert_messages(messages)
 
         # Check for function calling support
         if self.model_info["function_calling"] is False and len(tools) > 0:
@@ -583,6 +639,9 @@ async def create(
             if param in create_args:
                 request_args[param] = create_args[param]
 
+        if self._prompt_caching:
+            self._add_cache_control(request_args)
+
         # Execute the request
         future: asyncio.Task[Message] = asyncio.ensure_future(self._client.messages.create(**request_args))  # type: ignore
 
@@ -593,7 +652,11 @@ async def create(
 
         # Extract usage statistics
         usage = RequestUsage(
-            prompt_tokens=result.usage.input_tokens,
+            prompt_tokens=self._record_prompt_cache_usage(
+                result.usage.input_tokens,
+                result.usage.cache_read_input_tokens,
+                result.usage.cache_creation_input_tokens,
+            ),
             completion_tokens=result.usage.output_tokens,
         )
         serializable_messages: List[Dict[str, Any]] = [self._serialize_message(msg) for msg in anthropic_messages]
@@ -693,31 +756,10 @@ async def create_stream(
             if isinstance(json_output, type):
                 raise ValueError("Structured output is currently not supported for Anthropic models")
 
-        # Process system message separately
-        system_message = None
-        anthropic_messages: List[MessageParam] = []
-
         # Merge continuous system messages into a single message
         messages = self._merge_system_messages(messages)
         messages = self._rstrip_last_assistant_message(messages)
-
-        for message in messages:
-            if isinstance(message, SystemMessage):
-                if system_message is not None:
-                    # if that case, system message is must only one
-                    raise ValueError("Multiple system messages are not supported")
-                system_message = to_anthropic_type(message)
-            else:
-                anthropic_message = to_anthropic_type(message)
-                if isinstance(anthropic_message, list):
-                    anthropic_messages.extend(anthropic_message)
-                elif isinstance(anthropic_message, str):
-                    msg = MessageParam(
-                        role="user" if isinstance(message, UserMessage) else "assistant", content=anthropic_message
-                    )
-                    anthropic_messages.append(msg)
-                else:
-                    anthropic_messages.append(anthropic_message)
+        system_message, anthropic_messages = self._convert_messages(messages)
 
         # Check for function calling support
         if self.model_info["function_calling"] is False and len(tools) > 0:
@@ -752,6 +794,9 @@ async def create_stream(
             if param in create_args:
                 request_args[param] = create_args[param]
 
+        if self._prompt_caching:
+            self._add_cache_control(request_args)
+
         # Stream the response
         stream_future: asyncio.Task[AsyncStream[RawMessageStreamEvent]] = asyncio.ensure_future(
             cast(Coroutine[Any, Any, AsyncStream[RawMessageStreamEvent]], self._client.messages.create(**request_args))
@@ -767,6 +812,8 @@ async def create_stream(
         current_tool_id: Optional[str] = None
         input_tokens: int = 0
         output_tokens: int = 0
+        cache_read_tokens: Optional[int] = None
+        cache_creation_tokens: Optional[int] = None
         stop_reason: Optional[str] = None
 
         first_chunk = True
@@ -823,12 +870,14 @@ async def create_stream(
                 if hasattr(chunk, "message") and hasattr(chunk.message, "usage"):
                     if hasattr(chunk.message.usage, "input_tokens"):
                         input_tokens = chunk.message.usage.input_tokens
+                    cache_read_tokens = getattr(chunk.message.usage, "cache_read_input_tokens", None)
+                    cache_creation_tokens = getattr(chunk.message.usage, "cache_creation_input_tokens", None)
                     if hasattr(chunk.message.usage, "output_tokens"):
                         output_tokens = chunk.message.usage.output_tokens
 
         # Prepare the final response
         usage = RequestUsage(
-            prompt_tokens=input_tokens,
+            prompt_tokens=self._record_prompt_cache_usage(input_tokens, cache_read_tokens, cache_creation_tokens),
             completion_tokens=output_tokens,
         )
 
@@ -901,13 +950,20 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
         Note: This is an estimation based on common tokenization patterns and may not perfectly
         match Anthropic's exact token counting for Claude models.
         """
+        return self._tally_tokens(messages, tools=tools).count()
+
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        """Like :meth:`count_tokens`, but encodes large inputs in one batch on a worker thread."""
+        return await self._tally_tokens(messages, tools=tools).acount()
+
+    def _tally_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema]) -> TokenCounter:
         # Use cl100k_base encoding as an approximation for Claude's tokenizer
         try:
             encoding = tiktoken.get_encoding("cl100k_base")
         except Exception:
             encoding = tiktoken.get_encoding("gpt2")  # Fallback
 
-        num_tokens = 0
+        counter = TokenCounter(encoding)
 
         # System message tokens (if any)
         system_content = None
@@ -917,7 +973,8 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
                 break
 
         if system_content:
-            num_tokens += len(encoding.encode(system_content)) + 15  # Approximate system message overhead
+            counter.add_text(system_content)
+            counter.add_tokens(15)  # Approximate system message overhead
 
         # Message tokens
         for message in messages:
@@ -925,28 +982,28 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
                 continue  # Already counted
 
             # Base token cost per message
-            num_tokens += 10  # Approximate message role & formatting overhead
+            counter.add_tokens(10)  # Approximate message role & formatting overhead
 
             # Content tokens
             if isinstance(message, UserMessage) or isinstance(message, AssistantMessage):
                 if isinstance(message.content, str):
-                    num_tokens += len(encoding.encode(message.content))
+                    counter.add_text(message.content)
                 elif isinstance(message.content, list):
                     # Handle different content types
                     for part in message.content:
                         if isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
+                            counter.add_text(part)
                         elif isinstance(part, Image):
                             # Estimate vision tokens (simplified)
-                            num_tokens += 512  # Rough estimation for image tokens
+                            counter.add_tokens(512)  # Rough estimation for image tokens
                         elif isinstance(part, FunctionCall):
-                            num_tokens += len(encoding.encode(part.name))
-                            num_tokens += len(encoding.encode(part.arguments))
-                            num_tokens += 10  # Function call overhead
+                            counter.add_text(part.name)
+                            counter.add_text(part.arguments)
+                            counter.add_tokens(10)  # Function call overhead
             elif isinstance(message, FunctionExecutionResultMessage):
                 for result in message.content:
-                    num_tokens += len(encoding.encode(result.content))
-                    num_tokens += 10  # Function result overhead
+                    counter.add_text(result.content)
+                    counter.add_tokens(10)  # Function result overhead
 
         # Tool tokens
         for tool in tools:
@@ -956,9 +1013,9 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
                 tool_schema = tool
 
             # Name and description
-            num_tokens += len(encoding.encode(tool_schema["name"]))
+            counter.add_text(tool_schema["name"])
             if "description" in tool_schema:
-                num_tokens += len(encoding.encode(tool_schema["description"]))
+                counter.add_text(tool_schema["description"])
 
             # Parameters
             if "parameters" in tool_schema:
@@ -966,32 +1023,39 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
 
                 if "properties" in params:
                     for prop_name, prop_schema in params["properties"].items():
-                        num_tokens += len(encoding.encode(prop_name))
+                        counter.add_text(prop_name)
 
                         if "type" in prop_schema:
-                            num_tokens += len(encoding.encode(prop_schema["type"]))
+                            counter.add_text(prop_schema["type"])
 
                         if "description" in prop_schema:
-                            num_tokens += len(encoding.encode(prop_schema["description"]))
+                            counter.add_text(prop_schema["description"])
 
                         # Special handling for enums
                         if "enum" in prop_schema:
                             for value in prop_schema["enum"]:
                                 if isinstance(value, str):
-                                    num_tokens += len(encoding.encode(value))
+                                    counter.add_text(value)
                                 else:
-                                    num_tokens += 2  # Non-string enum values
+                                    counter.add_tokens(2)  # Non-string enum values
 
             # Tool overhead
-            num_tokens += 20
+            counter.add_tokens(20)
 
-        return num_tokens
+        return counter
 
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         """Calculate the remaining tokens based on the model's token limit."""
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
 
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        """Calculate the remaining tokens based on the model's token limit, see :meth:`acount_tokens`."""
+        token_limit = _model_info.get_token_limit(self._create_args["model"])
+        return token_limit - await self.acount_tokens(messages, tools=tools)
+
     def actual_usage(self) -> RequestUsage:
         return self._actual_usage
 
@@ -1023,6 +1087,9 @@ class AnthropicChatCompletionClient(
         top_p (float, optional): Controls diversity via nucleus sampling. Default is 1.0.
         top_k (int, optional): Controls diversity via top-k sampling. Default is -1 (disabled).
         model_info (ModelInfo, optional): The capabilities of the model. Required if using a custom model.
+        prompt_caching (bool, optional): Whether to mark the system prompt, the tools and the conversation so far
+            as cacheable prefixes with `cache_control`, so that the next request of the conversation reads them
+            from Anthropic's prompt cache. See :attr:`prompt_cache_stats` for the cached token ratio. Default is False.
 
     To use this client, you must install the Anthropic extension:
 
@@ -1082,6 +1149,9 @@ def __init__(self, **kwargs: Unpack[AnthropicClientConfiguration]):
             model_info = kwargs["model_info"]
             del copied_args["model_info"]
 
+        prompt_caching = kwargs.get("prompt_caching", False)
+        copied_args.pop("prompt_caching", None)
+
         client = _anthropic_client_from_config(copied_args)
         create_args = _create_args_from_config(copied_args)
 
@@ -1089,6 +1159,7 @@ def __init__(self, **kwargs: Unpack[AnthropicClientConfiguration]):
             client=client,
             create_args=create_args,
             model_info=model_info,
+            prompt_caching=prompt_caching,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -1130,6 +1201,9 @@ class AnthropicBedrockChatCompletionClient(
         top_p (float, optional): Controls diversity via nucleus sampling. Default is 1.0.
         top_k (int, optional): Controls diversity via top-k sampling. Default is -1 (disabled).
         model_info (ModelInfo, optional): The capabilities of the model. Required if using a custom model.
+        prompt_caching (bool, optional): Whether to mark the system prompt, the tools and the conversation so far
+            as cacheable prefixes with `cache_control`, so that the next request of the conversation reads them
+            from Anthropic's prompt cache. See :attr:`prompt_cache_stats` for the cached token ratio. Default is False.
         bedrock_info (BedrockInfo, optional): The capabilities of the model in bedrock. Required if using a model from AWS bedrock.
 
     To use this client, you must install the Anthropic extension:
@@ -1186,6 +1260,9 @@ def __init__(self, **kwargs: Unpack[AnthropicBedrockClientConfiguration]):
             model_info = kwargs["model_info"]
             del copied_args["model_info"]
 
+        prompt_caching = kwargs.get("prompt_caching", False)
+        copied_args.pop("prompt_caching", None)
+
         bedrock_info: Optional[BedrockInfo] = None
         if "bedrock_info" in kwargs:
             bedrock_info = kwargs["bedrock_info"]
@@ -1211,6 +1288,7 @@ def __init__(self, **kwargs: Unpack[AnthropicBedrockClientConfiguration]):
             client=client,
             create_args=create_args,
             model_info=model_info,
+            prompt_caching=prompt_caching,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
@@ -45,6 +45,8 @@ class BaseAnthropicClientConfiguration(CreateArguments, total=False):
     timeout: Optional[float]
     max_retries: Optional[int]
     default_headers: Optional[Dict[str, str]]
+    prompt_caching: bool
+    """Whether to mark the system prompt, the tools and the conversation as cacheable prefixes with `cache_control`."""
 
 
 class AnthropicClientConfiguration(BaseAnthropicClientConfiguration, total=False):
@@ -76,6 +78,7 @@ class BaseAnthropicClientConfigurationConfigModel(CreateArgumentsConfigModel):
     timeout: float | None = None
     max_retries: int | None = None
     default_headers: Dict[str, str] | None = None
+    prompt_caching: bool | None = None
 
 
 class AnthropicClientConfigurationConfigModel(BaseAnthropicClientConfigurationConfigModel):
@@ -222,6 +222,9 @@ def actual_usage(self) -> RequestUsage:
     def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         return self.client.count_tokens(messages, tools=tools)
 
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return await self.client.acount_tokens(messages, tools=tools)
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         warnings.warn("capabilities is deprecated, use model_info instead", DeprecationWarning, stacklevel=2)
@@ -234,6 +237,11 @@ def model_info(self) -> ModelInfo:
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         return self.client.remaining_tokens(messages, tools=tools)
 
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        return await self.client.aremaining_tokens(messages, tools=tools)
+
     def total_usage(self) -> RequestUsage:
         return self.client.total_usage()
 
@@ -1,10 +1,26 @@
 import asyncio
 import logging  # added import
 import re
-from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping, Optional, Sequence, TypedDict, Union, cast
+import threading
+import warnings
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from autogen_core import EVENT_LOGGER_NAME, CancellationToken, FunctionCall, MessageHandlerContext
-from autogen_core.logging import LLMCallEvent
+from autogen_core.logging import LLMCallEvent, LLMStreamEndEvent, LLMStreamStartEvent
 from autogen_core.models import (
     AssistantMessage,
     ChatCompletionClient,
@@ -37,6 +53,18 @@
 
 logger = logging.getLogger(EVENT_LOGGER_NAME)  # initialize logger
 
+ConvertedMessage = Union[
+    ChatCompletionRequestSystemMessage,
+    ChatCompletionRequestUserMessage,
+    ChatCompletionRequestAssistantMessage,
+    ChatCompletionRequestToolMessage,
+    ChatCompletionRequestFunctionMessage,
+]
+
+
+class _StreamEnd:
+    """Queue marker for the end of a generation stream."""
+
 
 def normalize_stop_reason(stop_reason: str | None) -> FinishReasons:
     if stop_reason is None:
@@ -258,6 +286,8 @@ def __init__(
         else:
             raise ValueError("Please provide model_path if ... or provide repo_id and filename if ....")
         self._total_usage = {"prompt_tokens": 0, "completion_tokens": 0}
+        # A Llama instance cannot run several generations at once.
+        self._generation_lock = threading.Lock()
 
     async def create(
         self,
@@ -270,50 +300,14 @@ async def create(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
     ) -> CreateResult:
-        create_args = dict(extra_create_args)
-        # Convert LLMMessage objects to dictionaries with 'role' and 'content'
-        # converted_messages: List[Dict[str, str | Image | list[str | Image] | list[FunctionCall]]] = []
-        converted_messages: list[
-            ChatCompletionRequestSystemMessage
-            | ChatCompletionRequestUserMessage
-            | ChatCompletionRequestAssistantMessage
-            | ChatCompletionRequestUserMessage
-            | ChatCompletionRequestToolMessage
-            | ChatCompletionRequestFunctionMessage
-        ] = []
-        for msg in messages:
-            if isinstance(msg, SystemMessage):
-                converted_messages.append({"role": "system", "content": msg.content})
-            elif isinstance(msg, UserMessage) and isinstance(msg.content, str):
-                converted_messages.append({"role": "user", "content": msg.content})
-            elif isinstance(msg, AssistantMessage) and isinstance(msg.content, str):
-                converted_messages.append({"role": "assistant", "content": msg.content})
-            elif (
-                isinstance(msg, SystemMessage) or isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage)
-            ) and isinstance(msg.content, list):
-                raise ValueError("Multi-part messages such as those containing images are currently not supported.")
-            else:
-                raise ValueError(f"Unsupported message type: {type(msg)}")
+        converted_messages, create_args = self._prepare_create(messages, tools, json_output, extra_create_args)
 
-        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
-            create_args["response_format"] = {"type": "json_object", "schema": json_output.model_json_schema()}
-        elif json_output is True:
-            create_args["response_format"] = {"type": "json_object"}
-        elif json_output is not False and json_output is not None:
-            raise ValueError("json_output must be a boolean, a BaseModel subclass or None.")
+        def generate() -> Any:
+            with self._generation_lock:
+                return self.llm.create_chat_completion(messages=converted_messages, stream=False, **create_args)
 
-        if self.model_info["function_calling"]:
-            # Run this in on the event loop to avoid blocking.
-            response_future = asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm.create_chat_completion(
-                    messages=converted_messages, tools=convert_tools(tools), stream=False, **create_args
-                ),
-            )
-        else:
-            response_future = asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.llm.create_chat_completion(messages=converted_messages, stream=False, **create_args)
-            )
+        # Run this in on the event loop to avoid blocking.
+        response_future = asyncio.get_event_loop().run_in_executor(None, generate)
         if cancellation_token:
             cancellation_token.link_future(response_future)
         response = await response_future
@@ -403,8 +397,191 @@ async def create_stream(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[Union[str, CreateResult], None]:
-        raise NotImplementedError("Stream not yet implemented for LlamaCppChatCompletionClient")
-        yield ""
+        """Create a stream of string chunks from the model ending with a :class:`~autogen_core.models.CreateResult`.
+
+        Generation runs on a worker thread that feeds the chunks to the event loop as they
+        are produced. Cancelling the `cancellation_token`, or closing the generator early,
+        stops the generation after the current token.
+
+        Tool calls and usage are assembled as in :meth:`OpenAIChatCompletionClient.create_stream
+        <autogen_ext.models.openai.OpenAIChatCompletionClient.create_stream>`. llama.cpp does not
+        report usage for streams, so unless a chunk carries usage, the completion tokens are the
+        number of generated chunks and the prompt tokens are estimated with :meth:`count_tokens`.
+        """
+        converted_messages, create_args = self._prepare_create(messages, tools, json_output, extra_create_args)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Dict[str, Any] | BaseException | _StreamEnd] = asyncio.Queue()
+        stop = threading.Event()
+
+        def put(item: Dict[str, Any] | BaseException | _StreamEnd) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # The event loop was closed, nobody is listening anymore.
+                stop.set()
+
+        def generate() -> None:
+            try:
+                with self._generation_lock:
+                    if stop.is_set():
+                        return
+                    chunks = cast(
+                        Iterator[Dict[str, Any]],
+                        self.llm.create_chat_completion(messages=converted_messages, stream=True, **create_args),
+                    )
+                    try:
+                        for chunk in chunks:
+                            put(chunk)
+                            if stop.is_set():
+                                break
+                    finally:
+                        # Closing the generator stops llama.cpp from sampling further tokens.
+                        close = getattr(chunks, "close", None)
+                        if close is not None:
+                            close()
+            except BaseException as e:
+                put(e)
+            finally:
+                put(_StreamEnd())
+
+        if cancellation_token is not None:
+            cancellation_token.add_callback(stop.set)
+        producer = loop.run_in_executor(None, generate)
+
+        logger.info(LLMStreamStartEvent(messages=cast(List[Dict[str, Any]], converted_messages)))
+
+        content_deltas: List[str] = []
+        full_tool_calls: Dict[int, FunctionCall] = {}
+        stop_reason: str | None = None
+        usage: Dict[str, int] | None = None
+        num_token_chunks = 0
+        try:
+            while True:
+                item_future = asyncio.ensure_future(queue.get())
+                if cancellation_token is not None:
+                    cancellation_token.link_future(item_future)
+                item = await item_future
+                if isinstance(item, _StreamEnd):
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                if item.get("usage"):
+                    usage = item["usage"]
+                choices = item.get("choices") or []
+                if not choices:
+                    continue
+                choice = choices[0]
+                if choice.get("finish_reason") is not None:
+                    stop_reason = choice["finish_reason"]
+                delta = choice.get("delta") or {}
+                # Role-only and finish-only chunks carry no generated tokens.
+                if delta.get("content") or delta.get("tool_calls"):
+                    num_token_chunks += 1
+
+                if delta.get("content"):
+                    content_deltas.append(delta["content"])
+                    yield delta["content"]
+                for tool_call_chunk in delta.get("tool_calls") or []:
+                    idx = tool_call_chunk.get("index", 0)
+                    if idx not in full_tool_calls:
+                        full_tool_calls[idx] = FunctionCall(id="", arguments="", name="")
+                    if tool_call_chunk.get("id") is not None:
+                        full_tool_calls[idx].id += tool_call_chunk["id"]
+                    function = tool_call_chunk.get("function") or {}
+                    if function.get("name") is not None:
+                        full_tool_calls[idx].name += function["name"]
+                    if function.get("arguments") is not None:
+                        full_tool_calls[idx].arguments += function["arguments"]
+        finally:
+            # Stop generating if the stream ends early, e.g., on cancellation or when the caller stops iterating.
+            stop.set()
+            if not producer.done():
+                await asyncio.shield(producer)
+
+        if usage is not None:
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+        else:
+            prompt_tokens = self.count_tokens(cast(Any, messages))
+            completion_tokens = num_token_chunks
+        result_usage = RequestUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+        content: Union[str, List[FunctionCall]]
+        thought: str | None = None
+        if full_tool_calls:
+            content = [
+                FunctionCall(id=call.id, arguments=call.arguments, name=normalize_name(call.name))
+                for call in full_tool_calls.values()
+            ]
+            if content_deltas:
+                thought = "".join(content_deltas)
+        else:
+            if content_deltas:
+                content = "".join(content_deltas)
+            else:
+                warnings.warn(
+                    "No text content or tool calls are available. Model returned empty result.",
+                    stacklevel=2,
+                )
+                content = ""
+
+        result = CreateResult(
+            finish_reason=normalize_stop_reason(stop_reason),
+            content=content,
+            usage=result_usage,
+            cached=False,
+            thought=thought,
+        )
+
+        logger.info(
+            LLMStreamEndEvent(
+                response=result.model_dump(),
+                prompt_tokens=result_usage.prompt_tokens,
+                completion_tokens=result_usage.completion_tokens,
+            )
+        )
+
+        self._total_usage["prompt_tokens"] += result_usage.prompt_tokens
+        self._total_usage["completion_tokens"] += result_usage.completion_tokens
+
+        yield result
+
+    def _prepare_create(
+        self,
+        messages: Sequence[LLMMessage],
+        tools: Sequence[Tool | ToolSchema],
+        json_output: Optional[bool | type[BaseModel]],
+        extra_create_args: Mapping[str, Any],
+    ) -> Tuple[List[ConvertedMessage], Dict[str, Any]]:
+        create_args = dict(extra_create_args)
+        # Convert LLMMessage objects to dictionaries with 'role' and 'content'
+        converted_messages: List[ConvertedMessage] = []
+        for msg in messages:
+            if isinstance(msg, SystemMessage):
+                converted_messages.append({"role": "system", "content": msg.content})
+            elif isinstance(msg, UserMessage) and isinstance(msg.content, str):
+                converted_messages.append({"role": "user", "content": msg.content})
+            elif isinstance(msg, AssistantMessage) and isinstance(msg.content, str):
+                converted_messages.append({"role": "assistant", "content": msg.content})
+            elif (
+                isinstance(msg, SystemMessage) or isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage)
+            ) and isinstance(msg.content, list):
+                raise ValueError("Multi-part messages such as those containing images are currently not supported.")
+            else:
+                raise ValueError(f"Unsupported message type: {type(msg)}")
+
+        if isinstance(json_output, type) and issubclass(json_output, BaseModel):
+            create_args["response_format"] = {"type": "json_object", "schema": json_output.model_json_schema()}
+        elif json_output is True:
+            create_args["response_format"] = {"type": "json_object"}
+        elif json_output is not False and json_output is not None:
+            raise ValueError("json_output must be a boolean, a BaseModel subclass or None.")
+
+        if self.model_info["function_calling"]:
+            create_args["tools"] = convert_tools(tools)
+        return converted_messages, create_args
 
     # Implement abstract methods
     def actual_usage(self) -> RequestUsage:
@@ -52,6 +52,7 @@
 from pydantic.json_schema import JsonSchemaValue
 from typing_extensions import Self, Unpack
 
+from .._utils.token_counter import TokenCounter
 from . import _model_info
 from .config import BaseOllamaClientConfiguration, BaseOllamaClientConfigurationConfigModel
 
@@ -253,7 +254,7 @@ def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
+    width, height = image.size
 
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
@@ -388,34 +389,37 @@ def normalize_stop_reason(stop_reason: str | None) -> FinishReasons:
 
 
 # TODO: probably needs work
-def count_tokens_ollama(messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+def _tally_tokens_ollama(
+    messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []
+) -> TokenCounter:
     try:
         encoding = tiktoken.encoding_for_model(model)
     except KeyError:
         trace_logger.warning(f"Model {model} not found. Using cl100k_base encoding.")
         encoding = tiktoken.get_encoding("cl100k_base")
     tokens_per_message = 3
-    num_tokens = 0
+    counter = TokenCounter(encoding)
 
     # Message tokens.
     for message in messages:
-        num_tokens += tokens_per_message
+        counter.add_tokens(tokens_per_message)
         ollama_message = to_ollama_type(message)
         for ollama_message_part in ollama_message:
             if isinstance(message.content, Image):
-                num_tokens += calculate_vision_tokens(message.content)
+                counter.add_tokens(calculate_vision_tokens(message.content))
             elif ollama_message_part.content is not None:
-                num_tokens += len(encoding.encode(ollama_message_part.content))
+                counter.add_text(ollama_message_part.content)
     # TODO: every model family has its own message sequence.
-    num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
+    counter.add_tokens(3)  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
     ollama_tools = convert_tools(tools)
     for tool in ollama_tools:
         function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
+        counter.add_text(function["name"])
+        tool_tokens = 0
         if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
+            counter.add_text(function["description"])
         tool_tokens -= 2
         if "parameters" in function:
             parameters = function["parameters"]
@@ -423,28 +427,39 @@ def count_tokens_ollama(messages: Sequence[LLMMessage], model: str, *, tools: Se
                 assert isinstance(parameters["properties"], dict)
                 for propertiesKey in parameters["properties"]:  # pyright: ignore
                     assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
+                    counter.add_text(propertiesKey)
                     v = parameters["properties"][propertiesKey]  # pyright: ignore
                     for field in v:  # pyright: ignore
                         if field == "type":
                             tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                            counter.add_text(v["type"])  # pyright: ignore
                         elif field == "description":
                             tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                            counter.add_text(v["description"])  # pyright: ignore
                         elif field == "enum":
                             tool_tokens -= 3
                             for o in v["enum"]:  # pyright: ignore
                                 tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                                counter.add_text(o)  # pyright: ignore
                         else:
                             trace_logger.warning(f"Not supported field {field}")
                 tool_tokens += 11
                 if len(parameters["properties"]) == 0:  # pyright: ignore
                     tool_tokens -= 2
-        num_tokens += tool_tokens
-    num_tokens += 12
-    return num_tokens
+        counter.add_tokens(tool_tokens)
+    counter.add_tokens(12)
+    return counter
+
+
+def count_tokens_ollama(messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+    return _tally_tokens_ollama(messages, model, tools=tools).count()
+
+
+async def acount_tokens_ollama(
+    messages: Sequence[LLMMessage], model: str, *, tools: Sequence[Tool | ToolSchema] = []
+) -> int:
+    """Like :func:`count_tokens_ollama`, but encodes large inputs in one batch on a worker thread."""
+    return await _tally_tokens_ollama(messages, model, tools=tools).acount()
 
 
 @dataclass
@@ -856,10 +871,19 @@ def total_usage(self) -> RequestUsage:
     def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         return count_tokens_ollama(messages, self._create_args["model"], tools=tools)
 
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return await acount_tokens_ollama(messages, self._create_args["model"], tools=tools)
+
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
 
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        token_limit = _model_info.get_token_limit(self._create_args["model"])
+        return token_limit - await self.acount_tokens(messages, tools=tools)
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         warnings.warn("capabilities is deprecated, use model_info instead", DeprecationWarning, stacklevel=2)
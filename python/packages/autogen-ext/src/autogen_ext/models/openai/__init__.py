@@ -1,16 +1,22 @@
-from . import _message_transform
-from ._openai_client import (
-    AZURE_OPENAI_USER_AGENT,
-    AzureOpenAIChatCompletionClient,
-    BaseOpenAIChatCompletionClient,
-    OpenAIChatCompletionClient,
-)
-from .config import (
-    AzureOpenAIClientConfigurationConfigModel,
-    BaseOpenAIClientConfigurationConfigModel,
-    CreateArgumentsConfigModel,
-    OpenAIClientConfigurationConfigModel,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .._utils.message_cache import PromptCacheStats
+    from . import _message_transform
+    from ._openai_client import (
+        AZURE_OPENAI_USER_AGENT,
+        AzureOpenAIChatCompletionClient,
+        BaseOpenAIChatCompletionClient,
+        OpenAIChatCompletionClient,
+        downscale_image_for_vision,
+    )
+    from .config import (
+        AzureOpenAIClientConfigurationConfigModel,
+        BaseOpenAIClientConfigurationConfigModel,
+        CreateArgumentsConfigModel,
+        OpenAIClientConfigurationConfigModel,
+    )
 
 __all__ = [
     "OpenAIChatCompletionClient",
@@ -22,4 +28,36 @@
     "CreateArgumentsConfigModel",
     "AZURE_OPENAI_USER_AGENT",
     "_message_transform",
+    "PromptCacheStats",
+    "downscale_image_for_vision",
 ]
+
+# The clients and message transformations import the OpenAI SDK, which is slow to import,
+# so every attribute is imported from its module on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "OpenAIChatCompletionClient": "._openai_client",
+    "AzureOpenAIChatCompletionClient": "._openai_client",
+    "BaseOpenAIChatCompletionClient": "._openai_client",
+    "AZURE_OPENAI_USER_AGENT": "._openai_client",
+    "downscale_image_for_vision": "._openai_client",
+    "AzureOpenAIClientConfigurationConfigModel": ".config",
+    "OpenAIClientConfigurationConfigModel": ".config",
+    "BaseOpenAIClientConfigurationConfigModel": ".config",
+    "CreateArgumentsConfigModel": ".config",
+    "_message_transform": "._message_transform",
+    "PromptCacheStats": "autogen_ext.models._utils.message_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    # Submodules are attributes themselves.
+    value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
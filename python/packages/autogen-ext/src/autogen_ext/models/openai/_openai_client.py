@@ -63,6 +63,7 @@
     completion_create_params,
 )
 from openai.types.chat.chat_completion import Choice
+from openai.types.completion_usage import CompletionUsage
 from openai.types.shared_params import (
     FunctionDefinition,
     FunctionParameters,
@@ -72,9 +73,11 @@
 from pydantic import BaseModel, SecretStr
 from typing_extensions import Self, Unpack
 
+from .._utils.message_cache import MessageConversionCache, PromptCacheStats
 from .._utils.normalize_stop_reason import normalize_stop_reason
 from .._utils.parse_r1_content import parse_r1_content
-from . import _model_info
+from .._utils.token_counter import TokenCounter
+from . import _message_transform, _model_info  # noqa: F401 (registers the message transformers)
 from ._transformation import (
     get_transformer,
 )
@@ -179,55 +182,93 @@ def raise_value_error(message: LLMMessage, context: Dict[str, Any]) -> Sequence[
     return result
 
 
-def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
-    MAX_LONG_EDGE = 2048
-    BASE_TOKEN_COUNT = 85
-    TOKENS_PER_TILE = 170
-    MAX_SHORT_EDGE = 768
-    TILE_SIZE = 512
+_VISION_MAX_LONG_EDGE = 2048
+_VISION_MAX_SHORT_EDGE = 768
+_VISION_TILE_SIZE = 512
+_VISION_BASE_TOKEN_COUNT = 85
+_VISION_TOKENS_PER_TILE = 170
+
 
+def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
     if detail == "low":
-        return BASE_TOKEN_COUNT
+        return _VISION_BASE_TOKEN_COUNT
+    return _vision_tokens_for_size(*image.size)
 
-    width, height = image.image.size
 
+def _vision_tokens_for_size(width: int, height: int) -> int:
     # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
 
-    if width > MAX_LONG_EDGE or height > MAX_LONG_EDGE:
+    if width > _VISION_MAX_LONG_EDGE or height > _VISION_MAX_LONG_EDGE:
         aspect_ratio = width / height
         if aspect_ratio > 1:
             # Width is greater than height
-            width = MAX_LONG_EDGE
-            height = int(MAX_LONG_EDGE / aspect_ratio)
+            width = _VISION_MAX_LONG_EDGE
+            height = int(_VISION_MAX_LONG_EDGE / aspect_ratio)
         else:
             # Height is greater than or equal to width
-            height = MAX_LONG_EDGE
-            width = int(MAX_LONG_EDGE * aspect_ratio)
+            height = _VISION_MAX_LONG_EDGE
+            width = int(_VISION_MAX_LONG_EDGE * aspect_ratio)
 
     # Resize such that the shortest side is MAX_SHORT_EDGE if both dimensions exceed MAX_SHORT_EDGE
     aspect_ratio = width / height
-    if width > MAX_SHORT_EDGE and height > MAX_SHORT_EDGE:
+    if width > _VISION_MAX_SHORT_EDGE and height > _VISION_MAX_SHORT_EDGE:
         if aspect_ratio > 1:
             # Width is greater than height
-            height = MAX_SHORT_EDGE
-            width = int(MAX_SHORT_EDGE * aspect_ratio)
+            height = _VISION_MAX_SHORT_EDGE
+            width = int(_VISION_MAX_SHORT_EDGE * aspect_ratio)
         else:
             # Height is greater than or equal to width
-            width = MAX_SHORT_EDGE
-            height = int(MAX_SHORT_EDGE / aspect_ratio)
+            width = _VISION_MAX_SHORT_EDGE
+            height = int(_VISION_MAX_SHORT_EDGE / aspect_ratio)
 
     # Calculate the number of tiles based on TILE_SIZE
 
-    tiles_width = math.ceil(width / TILE_SIZE)
-    tiles_height = math.ceil(height / TILE_SIZE)
+    tiles_width = math.ceil(width / _VISION_TILE_SIZE)
+    tiles_height = math.ceil(height / _VISION_TILE_SIZE)
     total_tiles = tiles_width * tiles_height
     # Calculate the total tokens based on the number of tiles and the base token count
 
-    total_tokens = BASE_TOKEN_COUNT + TOKENS_PER_TILE * total_tiles
+    total_tokens = _VISION_BASE_TOKEN_COUNT + _VISION_TOKENS_PER_TILE * total_tiles
 
     return total_tokens
 
 
+def downscale_image_for_vision(image: Image, detail: str = "auto", max_tokens: int | None = None) -> Image:
+    """Scale an image down to the size at which an OpenAI vision model processes it.
+
+    The model resizes images to fit in 2048x2048 pixels with a shorter side of at most
+    768 pixels, or in 512x512 pixels for "low" detail, so larger images only cost upload
+    size and encoding time. Apply this when images are ingested, for example to screenshots,
+    so the smaller image is encoded once and reused for every request.
+
+    Args:
+        image (Image): The image to scale.
+        detail (str): The detail level the image will be sent with. Defaults to "auto".
+        max_tokens (int | None): If set, the image is scaled down further, one row or column of
+            tiles at a time, until :func:`calculate_vision_tokens` is at most `max_tokens`,
+            down to a single tile.
+
+    Returns:
+        Image: The scaled image, or `image` itself if it is small enough.
+    """
+    if detail == "low":
+        return image.downscale(max_long_edge=_VISION_TILE_SIZE)
+    width, height = image.size
+    long_edge, short_edge = max(width, height), min(width, height)
+    scale = min(1.0, _VISION_MAX_LONG_EDGE / long_edge, _VISION_MAX_SHORT_EDGE / short_edge)
+    if max_tokens is not None:
+        while True:
+            scaled_width, scaled_height = max(1, round(width * scale)), max(1, round(height * scale))
+            if _vision_tokens_for_size(scaled_width, scaled_height) <= max_tokens:
+                break
+            tiles = max(math.ceil(scaled_width / _VISION_TILE_SIZE), math.ceil(scaled_height / _VISION_TILE_SIZE))
+            if tiles == 1:
+                break
+            # Drop the last row or column of tiles along the longer side.
+            scale = min(scale, (tiles - 1) * _VISION_TILE_SIZE / long_edge)
+    return image.downscale(max_long_edge=int(long_edge * scale))
+
+
 def _add_usage(usage1: RequestUsage, usage2: RequestUsage) -> RequestUsage:
     return RequestUsage(
         prompt_tokens=usage1.prompt_tokens + usage2.prompt_tokens,
@@ -274,14 +315,14 @@ def normalize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:64]
 
 
-def count_tokens_openai(
+def _tally_tokens_openai(
     messages: Sequence[LLMMessage],
     model: str,
     *,
     add_name_prefixes: bool = False,
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
-) -> int:
+) -> TokenCounter:
     try:
         encoding = tiktoken.encoding_for_model(model)
     except KeyError:
@@ -289,11 +330,11 @@ def count_tokens_openai(
         encoding = tiktoken.get_encoding("cl100k_base")
     tokens_per_message = 3
     tokens_per_name = 1
-    num_tokens = 0
+    counter = TokenCounter(encoding)
 
     # Message tokens.
     for message in messages:
-        num_tokens += tokens_per_message
+        counter.add_tokens(tokens_per_message)
         oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
         for oai_message_part in oai_message:
             for key, value in oai_message_part.items():
@@ -311,13 +352,13 @@ def count_tokens_openai(
                     for part, content_part in zip(typed_message_value, message.content, strict=False):
                         if isinstance(content_part, Image):
                             # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
+                            counter.add_tokens(calculate_vision_tokens(content_part))
                         elif isinstance(part, str):
-                            num_tokens += len(encoding.encode(part))
+                            counter.add_text(part)
                         else:
                             try:
                                 serialized_part = json.dumps(part)
-                                num_tokens += len(encoding.encode(serialized_part))
+                                counter.add_text(serialized_part)
                             except TypeError:
                                 trace_logger.warning(f"Could not convert {part} to string, skipping.")
                 else:
@@ -327,18 +368,19 @@ def count_tokens_openai(
                         except TypeError:
                             trace_logger.warning(f"Could not convert {value} to string, skipping.")
                             continue
-                    num_tokens += len(encoding.encode(value))
+                    counter.add_text(value)
                     if key == "name":
-                        num_tokens += tokens_per_name
-    num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
+                        counter.add_tokens(tokens_per_name)
+    counter.add_tokens(3)  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
     oai_tools = convert_tools(tools)
     for tool in oai_tools:
         function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
+        counter.add_text(function["name"])
+        tool_tokens = 0
         if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
+            counter.add_text(function["description"])
         tool_tokens -= 2
         if "parameters" in function:
             parameters = function["parameters"]
@@ -346,28 +388,55 @@ def count_tokens_openai(
                 assert isinstance(parameters["properties"], dict)
                 for propertiesKey in parameters["properties"]:  # pyright: ignore
                     assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
+                    counter.add_text(propertiesKey)
                     v = parameters["properties"][propertiesKey]  # pyright: ignore
                     for field in v:  # pyright: ignore
                         if field == "type":
                             tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                            counter.add_text(v["type"])  # pyright: ignore
                         elif field == "description":
                             tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                            counter.add_text(v["description"])  # pyright: ignore
                         elif field == "enum":
                             tool_tokens -= 3
                             for o in v["enum"]:  # pyright: ignore
                                 tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                                counter.add_text(o)  # pyright: ignore
                         else:
                             trace_logger.warning(f"Not supported field {field}")
                 tool_tokens += 11
                 if len(parameters["properties"]) == 0:  # pyright: ignore
                     tool_tokens -= 2
-        num_tokens += tool_tokens
-    num_tokens += 12
-    return num_tokens
+        counter.add_tokens(tool_tokens)
+    counter.add_tokens(12)
+    return counter
+
+
+def count_tokens_openai(
+    messages: Sequence[LLMMessage],
+    model: str,
+    *,
+    add_name_prefixes: bool = False,
+    tools: Sequence[Tool | ToolSchema] = [],
+    model_family: str = ModelFamily.UNKNOWN,
+) -> int:
+    return _tally_tokens_openai(
+        messages, model, add_name_prefixes=add_name_prefixes, tools=tools, model_family=model_family
+    ).count()
+
+
+async def acount_tokens_openai(
+    messages: Sequence[LLMMessage],
+    model: str,
+    *,
+    add_name_prefixes: bool = False,
+    tools: Sequence[Tool | ToolSchema] = [],
+    model_family: str = ModelFamily.UNKNOWN,
+) -> int:
+    """Like :func:`count_tokens_openai`, but encodes large inputs in one batch on a worker thread."""
+    return await _tally_tokens_openai(
+        messages, model, add_name_prefixes=add_name_prefixes, tools=tools, model_family=model_family
+    ).acount()
 
 
 @dataclass
@@ -429,6 +498,29 @@ def __init__(
         self._create_args = create_args
         self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
         self._actual_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        self._message_cache: MessageConversionCache[Sequence[ChatCompletionMessageParam]] = MessageConversionCache()
+        self._prompt_cache_stats = PromptCacheStats()
+
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        """Statistics of the reuse of converted messages and of the tokens read from OpenAI's prompt cache.
+
+        OpenAI caches prompt prefixes automatically. Converted messages are reused across requests,
+        so the prefix of a conversation is serialized identically every time.
+        """
+        return PromptCacheStats(
+            conversion_hits=self._message_cache.hits,
+            conversion_misses=self._message_cache.misses,
+            prompt_tokens=self._prompt_cache_stats.prompt_tokens,
+            cached_prompt_tokens=self._prompt_cache_stats.cached_prompt_tokens,
+        )
+
+    def _record_prompt_cache_usage(self, usage: CompletionUsage | None) -> None:
+        if usage is None:
+            return
+        self._prompt_cache_stats.prompt_tokens += usage.prompt_tokens
+        if usage.prompt_tokens_details is not None and usage.prompt_tokens_details.cached_tokens:
+            self._prompt_cache_stats.cached_prompt_tokens += usage.prompt_tokens_details.cached_tokens
 
     @classmethod
     def create_from_config(cls, config: Dict[str, Any]) -> ChatCompletionClient:
@@ -549,7 +641,14 @@ def _process_create_args(
                     _messages.append(message)
             system_message_content = system_message_content.rstrip()
             if system_message_content != "":
-                system_message = SystemMessage(content=system_message_content)
+                # Keep a single system message as is, so its conversion can be reused.
+                system_message = messages[_first_system_message_idx]
+                if (
+                    _first_system_message_idx != _last_system_message_idx
+                    or not isinstance(system_message, SystemMessage)
+                    or system_message.content != system_message_content
+                ):
+                    system_message = SystemMessage(content=system_message_content)
                 _messages.insert(_first_system_message_idx, system_message)
             messages = _messages
 
@@ -558,15 +657,18 @@ def _process_create_args(
             # When Claude models last message is AssistantMessage, It could not end with whitespace
             messages = self._rstrip_last_assistant_message(messages)
 
-        oai_messages_nested = [
-            to_oai_type(
-                m,
+        model = create_args.get("model", "unknown")
+
+        def convert(message: LLMMessage) -> Sequence[ChatCompletionMessageParam]:
+            return to_oai_type(
+                message,
                 prepend_name=self._add_name_prefixes,
-                model=create_args.get("model", "unknown"),
+                model=model,
                 model_family=self._model_info["family"],
             )
-            for m in messages
-        ]
+
+        conversion_key = (model, self._model_info["family"], self._add_name_prefixes)
+        oai_messages_nested = [self._message_cache.get_or_convert(m, conversion_key, convert) for m in messages]
 
         oai_messages = [item for sublist in oai_messages_nested for item in sublist]
 
@@ -630,6 +732,7 @@ async def create(
             prompt_tokens=result.usage.prompt_tokens if result.usage is not None else 0,
             completion_tokens=(result.usage.completion_tokens if result.usage is not None else 0),
         )
+        self._record_prompt_cache_usage(result.usage)
 
         logger.info(
             LLMCallEvent(
@@ -919,6 +1022,7 @@ async def create_stream(
         if chunk and chunk.usage:
             prompt_tokens = chunk.usage.prompt_tokens
             completion_tokens = chunk.usage.completion_tokens
+            self._record_prompt_cache_usage(chunk.usage)
         else:
             prompt_tokens = 0
             completion_tokens = 0
@@ -1060,10 +1164,25 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
             model_family=self._model_info["family"],
         )
 
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return await acount_tokens_openai(
+            messages,
+            self._create_args["model"],
+            add_name_prefixes=self._add_name_prefixes,
+            tools=tools,
+            model_family=self._model_info["family"],
+        )
+
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
 
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        token_limit = _model_info.get_token_limit(self._create_args["model"])
+        return token_limit - await self.acount_tokens(messages, tools=tools)
+
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
         warnings.warn(
@@ -1335,6 +1454,7 @@ async def main() -> None:
     component_type = "model"
     component_config_schema = OpenAIClientConfigurationConfigModel
     component_provider_override = "autogen_ext.models.openai.OpenAIChatCompletionClient"
+    component_shareable = True
 
     def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
         if "model" not in kwargs:
@@ -1554,6 +1674,7 @@ class AzureOpenAIChatCompletionClient(
     component_type = "model"
     component_config_schema = AzureOpenAIClientConfigurationConfigModel
     component_provider_override = "autogen_ext.models.openai.AzureOpenAIChatCompletionClient"
+    component_shareable = True
 
     def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
         model_capabilities: Optional[ModelCapabilities] = None  # type: ignore
@@ -0,0 +1,16 @@
+from ._limiter import AdaptiveConcurrencyLimiter, AdaptiveConcurrencyLimiterConfig, RateLimiterStats, RateLimitPermit
+from ._rate_limited_chat_completion_client import (
+    RateLimitedChatCompletionClient,
+    RateLimitedChatCompletionClientConfig,
+    is_throttling_error,
+)
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveConcurrencyLimiterConfig",
+    "RateLimitedChatCompletionClient",
+    "RateLimitedChatCompletionClientConfig",
+    "RateLimiterStats",
+    "RateLimitPermit",
+    "is_throttling_error",
+]
@@ -0,0 +1,266 @@
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class AdaptiveConcurrencyLimiterConfig(BaseModel):
+    """Configuration for :class:`AdaptiveConcurrencyLimiter`."""
+
+    max_concurrency: int = 8
+    min_concurrency: int = 1
+    initial_concurrency: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    latency_target: Optional[float] = None
+    backoff_factor: float = 0.5
+
+
+@dataclass
+class RateLimiterStats:
+    """Statistics of an :class:`AdaptiveConcurrencyLimiter`. Times are in seconds."""
+
+    limit: float = 0.0
+    """The current concurrency limit."""
+    in_flight: int = 0
+    """Number of requests currently running."""
+    queued: int = 0
+    """Number of requests waiting to be admitted."""
+    requests: int = 0
+    """Number of requests admitted."""
+    throttled: int = 0
+    """Number of requests rejected by the server with a 429 status."""
+    slow: int = 0
+    """Number of requests slower than the latency target."""
+    decreases: int = 0
+    """Number of times the concurrency limit was decreased."""
+    total_queue_wait: float = 0.0
+    """Total time requests waited to be admitted."""
+    max_queue_wait: float = 0.0
+    """Longest time a request waited to be admitted."""
+    token_budget_wait: float = 0.0
+    """Total time the head of the queue waited for the token-per-minute budget."""
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.total_queue_wait / self.requests if self.requests else 0.0
+
+
+@dataclass
+class RateLimitPermit:
+    """A request admitted by :meth:`AdaptiveConcurrencyLimiter.acquire`."""
+
+    tokens: int
+    """The number of tokens reserved from the token-per-minute budget."""
+    start_time: float
+    """The monotonic time at which the request was admitted."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """Admission control for model requests with an adaptive concurrency limit and a token budget.
+
+    Requests wait in a queue ordered by priority (lower values first, FIFO within a
+    priority) until the number of requests in flight is below the current limit and,
+    if `tokens_per_minute` is set, enough of the token budget is available.
+
+    The limit follows additive-increase/multiplicative-decrease (AIMD): each successful
+    request raises it by ``1 / limit`` (about one per round of requests) up to
+    `max_concurrency`, and a request throttled by the server (HTTP 429) or slower than
+    `latency_target` multiplies it by `backoff_factor`, down to `min_concurrency`.
+    Only requests admitted after the previous decrease can decrease it again, so a burst
+    of 429s from one round of requests counts as a single congestion signal.
+
+    A limiter can be shared by several :class:`RateLimitedChatCompletionClient` instances
+    that target the same deployment.
+
+    Args:
+        max_concurrency (int): The maximum number of concurrent requests. Defaults to 8.
+        min_concurrency (int): The minimum concurrency limit. Defaults to 1.
+        initial_concurrency (int, optional): The initial concurrency limit. Defaults to `max_concurrency`.
+        tokens_per_minute (int, optional): The token budget per minute, refilled continuously.
+            Defaults to None, which disables the token budget.
+        latency_target (float, optional): Requests slower than this many seconds decrease the
+            concurrency limit. Defaults to None, in which case only 429 responses do.
+        backoff_factor (float): The factor the limit is multiplied by on congestion. Defaults to 0.5.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        initial_concurrency: int | None = None,
+        tokens_per_minute: int | None = None,
+        latency_target: float | None = None,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        if min_concurrency < 1:
+            raise ValueError("min_concurrency must be at least 1.")
+        if max_concurrency < min_concurrency:
+            raise ValueError("max_concurrency must be at least min_concurrency.")
+        if initial_concurrency is not None and not min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError("initial_concurrency must be between min_concurrency and max_concurrency.")
+        if tokens_per_minute is not None and tokens_per_minute < 1:
+            raise ValueError("tokens_per_minute must be at least 1.")
+        if latency_target is not None and latency_target <= 0:
+            raise ValueError("latency_target must be positive.")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1.")
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min_concurrency
+        self._initial_concurrency = initial_concurrency
+        self._tokens_per_minute = tokens_per_minute
+        self._latency_target = latency_target
+        self._backoff_factor = backoff_factor
+
+        self._limit = float(initial_concurrency if initial_concurrency is not None else max_concurrency)
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+        self._last_decrease = float("-inf")
+        self._tokens = float(tokens_per_minute) if tokens_per_minute is not None else 0.0
+        self._last_refill = time.monotonic()
+        self._stats = RateLimiterStats()
+
+    @property
+    def limit(self) -> float:
+        """The current concurrency limit."""
+        return self._limit
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """A snapshot of the limiter statistics."""
+        return RateLimiterStats(
+            limit=self._limit,
+            in_flight=self._in_flight,
+            queued=len(self._waiters),
+            requests=self._stats.requests,
+            throttled=self._stats.throttled,
+            slow=self._stats.slow,
+            decreases=self._stats.decreases,
+            total_queue_wait=self._stats.total_queue_wait,
+            max_queue_wait=self._stats.max_queue_wait,
+            token_budget_wait=self._stats.token_budget_wait,
+        )
+
+    @property
+    def uses_token_budget(self) -> bool:
+        return self._tokens_per_minute is not None
+
+    async def acquire(self, *, priority: int = 0, tokens: int = 0) -> RateLimitPermit:
+        """Wait until a request with `priority` that is estimated to use `tokens` tokens can be sent."""
+        start_time = time.monotonic()
+        entry = (priority, next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    if self._waiters[0] == entry and self._in_flight < int(self._limit):
+                        delay = self._reserve_tokens(tokens)
+                        if delay <= 0:
+                            break
+                        # Wait for the budget to refill; a release may also free some of it.
+                        wait_start = time.monotonic()
+                        try:
+                            await asyncio.wait_for(self._condition.wait(), delay)
+                        except asyncio.TimeoutError:
+                            pass
+                        self._stats.token_budget_wait += time.monotonic() - wait_start
+                        continue
+                    await self._condition.wait()
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            # The next request in line may be admitted too.
+            self._condition.notify_all()
+
+        now = time.monotonic()
+        queue_wait = now - start_time
+        self._stats.requests += 1
+        self._stats.total_queue_wait += queue_wait
+        self._stats.max_queue_wait = max(self._stats.max_queue_wait, queue_wait)
+        return RateLimitPermit(tokens=self._budgeted(tokens), start_time=now)
+
+    async def release(
+        self,
+        permit: RateLimitPermit,
+        *,
+        latency: float | None = None,
+        throttled: bool = False,
+        tokens_used: int | None = None,
+    ) -> None:
+        """Release an admitted request and feed its outcome back into the limit.
+
+        Args:
+            permit (RateLimitPermit): The permit returned by :meth:`acquire`.
+            latency (float, optional): The latency of the request, compared with `latency_target`.
+                Defaults to None, for requests that failed for other reasons than throttling.
+            throttled (bool): Whether the server rejected the request with a 429 status.
+            tokens_used (int, optional): The number of tokens actually used. The difference with the
+                reserved tokens is returned to or taken from the budget.
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if self._tokens_per_minute is not None and tokens_used is not None:
+                self._refill()
+                self._tokens = min(float(self._tokens_per_minute), self._tokens + permit.tokens - tokens_used)
+            slow = latency is not None and self._latency_target is not None and latency > self._latency_target
+            if throttled:
+                self._stats.throttled += 1
+            if slow:
+                self._stats.slow += 1
+            if throttled or slow:
+                if permit.start_time > self._last_decrease and self._limit > self._min_concurrency:
+                    self._limit = max(float(self._min_concurrency), self._limit * self._backoff_factor)
+                    self._last_decrease = time.monotonic()
+                    self._stats.decreases += 1
+            elif latency is not None:
+                self._limit = min(float(self._max_concurrency), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def _budgeted(self, tokens: int) -> int:
+        if self._tokens_per_minute is None:
+            return 0
+        # A request larger than the whole budget is let through once the budget is full.
+        return min(tokens, self._tokens_per_minute)
+
+    def _refill(self) -> None:
+        assert self._tokens_per_minute is not None
+        now = time.monotonic()
+        rate = self._tokens_per_minute / 60.0
+        self._tokens = min(float(self._tokens_per_minute), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def _reserve_tokens(self, tokens: int) -> float:
+        """Take `tokens` from the budget, or return the number of seconds until they are available."""
+        if self._tokens_per_minute is None:
+            return 0.0
+        self._refill()
+        needed = self._budgeted(tokens)
+        if self._tokens >= needed:
+            self._tokens -= needed
+            return 0.0
+        return (needed - self._tokens) / (self._tokens_per_minute / 60.0)
+
+    def to_config(self) -> AdaptiveConcurrencyLimiterConfig:
+        """The settings of the limiter, without its state."""
+        return AdaptiveConcurrencyLimiterConfig(
+            max_concurrency=self._max_concurrency,
+            min_concurrency=self._min_concurrency,
+            initial_concurrency=self._initial_concurrency,
+            tokens_per_minute=self._tokens_per_minute,
+            latency_target=self._latency_target,
+            backoff_factor=self._backoff_factor,
+        )
+
+    @classmethod
+    def from_config(cls, config: AdaptiveConcurrencyLimiterConfig) -> "AdaptiveConcurrencyLimiter":
+        return cls(**config.model_dump())
@@ -0,0 +1,316 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncGenerator, Mapping, Optional, Sequence, Union
+
+from autogen_core import TRACE_LOGGER_NAME, CancellationToken, Component, ComponentModel
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,  # type: ignore
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from ._limiter import AdaptiveConcurrencyLimiter, AdaptiveConcurrencyLimiterConfig, RateLimiterStats, RateLimitPermit
+
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+# Longest Retry-After delay honored before retrying a throttled request.
+_MAX_RETRY_AFTER = 60.0
+
+
+class RateLimitedChatCompletionClientConfig(BaseModel):
+    """Configuration for :class:`RateLimitedChatCompletionClient`."""
+
+    client: ComponentModel
+    limiter: AdaptiveConcurrencyLimiterConfig = AdaptiveConcurrencyLimiterConfig()
+    priority: int = 0
+    max_retries: int = 2
+    retry_backoff: float = 1.0
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether an exception raised by a model client is a rate limit (HTTP 429) response."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code == 429
+
+
+def _retry_after(error: BaseException) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return min(float(headers.get("retry-after")), _MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedChatCompletionClient(ChatCompletionClient, Component[RateLimitedChatCompletionClientConfig]):
+    """
+    A wrapper around a :class:`~autogen_core.models.ChatCompletionClient` that limits how many
+    requests are sent concurrently and how many tokens are used per minute.
+
+    Requests are admitted by an :class:`AdaptiveConcurrencyLimiter`, which lowers the
+    concurrency limit when the server throttles requests (HTTP 429) or responses get slower
+    than `latency_target`, and raises it again while requests succeed. Throttled requests
+    are retried through the limiter up to `max_retries` times, after the server's
+    `Retry-After` delay or an exponential backoff. Since the limiter handles throttling, the
+    retries of the wrapped client's SDK should be disabled, e.g., with `max_retries=0` for
+    :class:`~autogen_ext.models.openai.OpenAIChatCompletionClient`.
+
+    Waiting requests are admitted by priority. Use :meth:`with_priority` to create clients
+    that share the limiter with a different priority, e.g., to serve interactive agents
+    before background evaluations. Create several clients with the same `limiter` to share
+    one budget across wrapped clients that target the same deployment.
+
+    Streams hold their slot until they finish, and report the time to the first chunk
+    as their latency.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from autogen_core.models import UserMessage
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+        from autogen_ext.models.rate_limit import AdaptiveConcurrencyLimiter, RateLimitedChatCompletionClient
+
+
+        async def main() -> None:
+            limiter = AdaptiveConcurrencyLimiter(max_concurrency=16, tokens_per_minute=150_000, latency_target=30)
+            client = RateLimitedChatCompletionClient(
+                OpenAIChatCompletionClient(model="gpt-4o", max_retries=0), limiter=limiter
+            )
+            background_client = client.with_priority(10)
+
+            results = await asyncio.gather(
+                client.create([UserMessage(content="What is the capital of France?", source="user")]),
+                *[background_client.create([UserMessage(content=f"What is {i} + {i}?", source="user")]) for i in range(20)],
+            )
+            print(results[0].content)
+            print(limiter.stats)
+
+
+        asyncio.run(main())
+
+    Args:
+        client (ChatCompletionClient): The client to wrap.
+        limiter (AdaptiveConcurrencyLimiter, optional): The limiter that admits requests.
+            Defaults to a new limiter with default settings.
+        priority (int): The priority of this client's requests. Lower values are served first. Defaults to 0.
+        max_retries (int): How many times a throttled request is retried. Defaults to 2.
+        retry_backoff (float): The delay in seconds before the first retry of a throttled request,
+            doubled on each further retry, when the server does not send `Retry-After`. Defaults to 1.
+    """
+
+    component_type = "chat_completion_client"
+    component_provider_override = "autogen_ext.models.rate_limit.RateLimitedChatCompletionClient"
+    component_config_schema = RateLimitedChatCompletionClientConfig
+
+    def __init__(
+        self,
+        client: ChatCompletionClient,
+        *,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        priority: int = 0,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative.")
+        if retry_backoff < 0:
+            raise ValueError("retry_backoff must be non-negative.")
+        self.client = client
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+        self.priority = priority
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """A snapshot of the statistics of the limiter."""
+        return self.limiter.stats
+
+    def with_priority(self, priority: int) -> "RateLimitedChatCompletionClient":
+        """Create a client for the same wrapped client and limiter with another priority."""
+        return RateLimitedChatCompletionClient(
+            self.client,
+            limiter=self.limiter,
+            priority=priority,
+            max_retries=self._max_retries,
+            retry_backoff=self._retry_backoff,
+        )
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        tokens = await self._estimate_tokens(messages, tools)
+        attempt = 0
+        while True:
+            permit = await self._acquire(tokens, cancellation_token)
+            start_time = time.monotonic()
+            try:
+                result = await self.client.create(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                )
+            except BaseException as e:
+                throttled = isinstance(e, Exception) and is_throttling_error(e)
+                await self.limiter.release(permit, throttled=throttled)
+                if not throttled or attempt >= self._max_retries:
+                    raise
+                await self._backoff(e, attempt, cancellation_token)
+                attempt += 1
+                continue
+            await self.limiter.release(
+                permit, latency=time.monotonic() - start_time, tokens_used=self._tokens_used(result)
+            )
+            return result
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        tokens = await self._estimate_tokens(messages, tools)
+        attempt = 0
+        while True:
+            permit = await self._acquire(tokens, cancellation_token)
+            start_time = time.monotonic()
+            latency: float | None = None
+            tokens_used: int | None = None
+            throttled = False
+            failed = True
+            try:
+                async for chunk in self.client.create_stream(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                ):
+                    if latency is None:
+                        latency = time.monotonic() - start_time
+                    if isinstance(chunk, CreateResult):
+                        tokens_used = self._tokens_used(chunk)
+                    yield chunk
+                failed = False
+                return
+            except Exception as e:
+                # Only retry if the request was throttled before anything was streamed.
+                throttled = is_throttling_error(e)
+                if not throttled or latency is not None or attempt >= self._max_retries:
+                    raise
+                retry_error = e
+            finally:
+                # A stream that broke off after its first chunk does not count as a successful request.
+                await self.limiter.release(
+                    permit, latency=None if failed else latency, throttled=throttled, tokens_used=tokens_used
+                )
+            await self._backoff(retry_error, attempt, cancellation_token)
+            attempt += 1
+
+    async def _acquire(self, tokens: int, cancellation_token: Optional[CancellationToken]) -> RateLimitPermit:
+        future = asyncio.ensure_future(self.limiter.acquire(priority=self.priority, tokens=tokens))
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        return await future
+
+    async def _backoff(
+        self, error: BaseException, attempt: int, cancellation_token: Optional[CancellationToken]
+    ) -> None:
+        delay = _retry_after(error)
+        if delay is None:
+            delay = self._retry_backoff * 2**attempt
+        trace_logger.info(f"Request throttled, retrying in {delay:.2f}s (attempt {attempt + 1}/{self._max_retries}).")
+        future = asyncio.ensure_future(asyncio.sleep(delay))
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        await future
+
+    async def _estimate_tokens(self, messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema]) -> int:
+        if not self.limiter.uses_token_budget:
+            return 0
+        try:
+            return await self.client.acount_tokens(messages, tools=tools)
+        except Exception as e:
+            # Fall back to about four characters per token.
+            trace_logger.debug(f"Could not count tokens, estimating them instead: {e}")
+            return sum(len(str(message.content)) for message in messages) // 4
+
+    @staticmethod
+    def _tokens_used(result: CreateResult) -> int | None:
+        total = result.usage.prompt_tokens + result.usage.completion_tokens
+        # Cached results and some streams report no usage.
+        return total if total > 0 else None
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.count_tokens(messages, tools=tools)
+
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return await self.client.acount_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self.client.remaining_tokens(messages, tools=tools)
+
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        return await self.client.aremaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.client.model_info
+
+    def _to_config(self) -> RateLimitedChatCompletionClientConfig:
+        return RateLimitedChatCompletionClientConfig(
+            client=self.client.dump_component(),
+            limiter=self.limiter.to_config(),
+            priority=self.priority,
+            max_retries=self._max_retries,
+            retry_backoff=self._retry_backoff,
+        )
+
+    @classmethod
+    def _from_config(cls, config: RateLimitedChatCompletionClientConfig) -> Self:
+        return cls(
+            ChatCompletionClient.load_component(config.client),
+            limiter=AdaptiveConcurrencyLimiter.from_config(config.limiter),
+            priority=config.priority,
+            max_retries=config.max_retries,
+            retry_backoff=config.retry_backoff,
+        )
@@ -0,0 +1,10 @@
+from ._latency import BackendStats, LatencyHistogram, RoutingStats
+from ._routing_chat_completion_client import RoutingChatCompletionClient, RoutingChatCompletionClientConfig
+
+__all__ = [
+    "BackendStats",
+    "LatencyHistogram",
+    "RoutingChatCompletionClient",
+    "RoutingChatCompletionClientConfig",
+    "RoutingStats",
+]
@@ -0,0 +1,92 @@
+import bisect
+import math
+from dataclasses import dataclass
+from typing import List
+
+# Bucket boundaries grow geometrically from 10ms, so percentiles are within 20% of the observed latency.
+_MIN_LATENCY = 0.01
+_BUCKET_GROWTH = 1.2
+_NUM_BUCKETS = 64
+
+
+class LatencyHistogram:
+    """A histogram of request latencies with geometrically growing buckets.
+
+    Once `max_samples` latencies are recorded, all counts are halved, so the
+    histogram follows changes in a backend's latency while keeping memory constant.
+
+    Args:
+        max_samples (int): The number of samples after which older samples are decayed. Defaults to 200.
+    """
+
+    _bounds: List[float] = [_MIN_LATENCY * _BUCKET_GROWTH**i for i in range(_NUM_BUCKETS)]
+
+    def __init__(self, max_samples: int = 200) -> None:
+        if max_samples < 2:
+            raise ValueError("max_samples must be at least 2.")
+        self._max_samples = max_samples
+        self._counts = [0.0] * (_NUM_BUCKETS + 1)
+        self._total = 0.0
+
+    @property
+    def count(self) -> float:
+        """The decayed number of recorded samples."""
+        return self._total
+
+    def record(self, latency: float) -> None:
+        """Record a latency in seconds."""
+        self._counts[bisect.bisect_left(self._bounds, latency)] += 1.0
+        self._total += 1.0
+        if self._total >= self._max_samples:
+            self._counts = [count / 2 for count in self._counts]
+            self._total /= 2
+
+    def percentile(self, q: float) -> float | None:
+        """The upper bound of the bucket holding the `q`-th percentile (0 to 100), or None without samples."""
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100.")
+        if self._total == 0:
+            return None
+        rank = self._total * q / 100
+        cumulative = 0.0
+        for i, count in enumerate(self._counts):
+            cumulative += count
+            if count > 0 and cumulative >= rank:
+                return self._bounds[i] if i < _NUM_BUCKETS else math.inf
+        return math.inf
+
+
+@dataclass
+class BackendStats:
+    """Statistics of a backend of a :class:`RoutingChatCompletionClient`. Latencies are in seconds."""
+
+    index: int = 0
+    """The position of the backend in the client list."""
+    healthy: bool = True
+    """Whether the backend is currently receiving requests."""
+    requests: int = 0
+    """Number of requests sent to the backend, including hedged requests."""
+    wins: int = 0
+    """Number of requests whose result was used."""
+    failures: int = 0
+    """Number of requests that raised an error."""
+    cancelled: int = 0
+    """Number of requests cancelled because another backend responded first."""
+    p50_latency: float | None = None
+    """The median latency of the backend, from its latency histogram."""
+    p95_latency: float | None = None
+    """The 95th percentile latency of the backend, from its latency histogram."""
+
+
+@dataclass
+class RoutingStats:
+    """Statistics of a :class:`RoutingChatCompletionClient`."""
+
+    requests: int = 0
+    """Number of requests made to the routing client."""
+    hedged: int = 0
+    """Number of hedged requests sent because the first backend was slow."""
+    hedge_wins: int = 0
+    """Number of requests won by a hedged request."""
+    failovers: int = 0
+    """Number of requests sent to another backend because a backend failed."""
@@ -0,0 +1,451 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from autogen_core import TRACE_LOGGER_NAME, CancellationToken, Component, ComponentModel
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,  # type: ignore
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
+from typing_extensions import Self
+
+from ._latency import BackendStats, LatencyHistogram, RoutingStats
+
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+
+class RoutingChatCompletionClientConfig(BaseModel):
+    """Configuration for :class:`RoutingChatCompletionClient`."""
+
+    clients: List[ComponentModel]
+    hedge_percentile: float = 95.0
+    initial_hedge_delay: Optional[float] = None
+    max_hedges: int = 1
+    min_samples: int = 10
+    max_failures: int = 3
+    cooldown: float = 30.0
+    max_samples: int = 200
+
+
+class _Backend:
+    def __init__(self, index: int, client: ChatCompletionClient, max_samples: int) -> None:
+        self.client = client
+        self.histogram = LatencyHistogram(max_samples)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.stats = BackendStats(index=index)
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+
+@dataclass
+class _Attempt:
+    backend: _Backend
+    cancellation_token: CancellationToken
+    start_time: float
+    hedged: bool
+    stream: AsyncGenerator[Union[str, CreateResult], None] | None = None
+
+
+class RoutingChatCompletionClient(ChatCompletionClient, Component[RoutingChatCompletionClientConfig]):
+    """
+    A client that routes requests across several redundant :class:`~autogen_core.models.ChatCompletionClient`
+    backends, such as several deployments of the same model, and hedges slow requests.
+
+    Each backend keeps a :class:`LatencyHistogram` of its recent latencies. A request is sent to
+    the healthy backend with the lowest median latency; backends with fewer than `min_samples`
+    samples are tried first, so every backend gets measured. If no result arrives within the
+    `hedge_percentile` latency of that backend, a hedged duplicate is sent to the next fastest
+    backend, up to `max_hedges` times. The first result is used and the other requests are
+    cancelled through their :class:`~autogen_core.CancellationToken`. Until a backend has
+    `min_samples` samples, hedging waits `initial_hedge_delay` seconds, or is disabled if it is None.
+
+    If a request fails and no other request for it is running, it is sent to the next backend.
+    A backend that fails `max_failures` times in a row stops receiving requests for `cooldown`
+    seconds, unless all backends are unhealthy.
+
+    For :meth:`create_stream`, the latency is the time to the first chunk: the first stream to
+    produce a chunk is used and the others are cancelled. Errors after the first chunk are raised.
+
+    Hedged requests are billed by the backends that receive them, and are included in
+    :meth:`total_usage`. The backends should use the same model, since tokens are counted and
+    :attr:`model_info` is reported with the first client.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from autogen_core.models import UserMessage
+        from autogen_ext.models.openai import AzureOpenAIChatCompletionClient
+        from autogen_ext.models.routing import RoutingChatCompletionClient
+
+
+        async def main() -> None:
+            client = RoutingChatCompletionClient(
+                [
+                    AzureOpenAIChatCompletionClient(
+                        azure_deployment="gpt-4o",
+                        model="gpt-4o",
+                        api_version="2024-06-01",
+                        azure_endpoint="https://eastus.openai.azure.com/",
+                    ),
+                    AzureOpenAIChatCompletionClient(
+                        azure_deployment="gpt-4o",
+                        model="gpt-4o",
+                        api_version="2024-06-01",
+                        azure_endpoint="https://westus.openai.azure.com/",
+                    ),
+                ],
+                hedge_percentile=95,
+                initial_hedge_delay=10,
+            )
+            result = await client.create([UserMessage(content="What is the capital of France?", source="user")])
+            print(result.content)
+            print(client.stats, client.backend_stats)
+
+
+        asyncio.run(main())
+
+    Args:
+        clients (Sequence[ChatCompletionClient]): The backends, in order of preference when their latencies are unknown.
+        hedge_percentile (float): The percentile of a backend's latency after which a hedged request is sent. Defaults to 95.
+        initial_hedge_delay (float, optional): The delay in seconds after which a hedged request is sent while
+            the backend has fewer than `min_samples` samples. Defaults to None, which disables hedging until then.
+        max_hedges (int): The maximum number of hedged requests per request. Set to 0 to disable hedging. Defaults to 1.
+        min_samples (int): The number of samples needed to route and hedge by a backend's latency. Defaults to 10.
+        max_failures (int): The number of consecutive failures after which a backend is considered unhealthy. Defaults to 3.
+        cooldown (float): The number of seconds an unhealthy backend receives no requests. Defaults to 30.
+        max_samples (int): The number of samples after which the latency histograms decay. Defaults to 200.
+    """
+
+    component_type = "chat_completion_client"
+    component_provider_override = "autogen_ext.models.routing.RoutingChatCompletionClient"
+    component_config_schema = RoutingChatCompletionClientConfig
+
+    def __init__(
+        self,
+        clients: Sequence[ChatCompletionClient],
+        *,
+        hedge_percentile: float = 95.0,
+        initial_hedge_delay: float | None = None,
+        max_hedges: int = 1,
+        min_samples: int = 10,
+        max_failures: int = 3,
+        cooldown: float = 30.0,
+        max_samples: int = 200,
+    ) -> None:
+        if not clients:
+            raise ValueError("At least one client is required.")
+        if not 0 < hedge_percentile <= 100:
+            raise ValueError("hedge_percentile must be between 0 and 100.")
+        if initial_hedge_delay is not None and initial_hedge_delay < 0:
+            raise ValueError("initial_hedge_delay must be non-negative.")
+        if max_hedges < 0:
+            raise ValueError("max_hedges must be non-negative.")
+        if min_samples < 1 or min_samples > max_samples // 2:
+            raise ValueError("min_samples must be between 1 and half of max_samples.")
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1.")
+        if cooldown < 0:
+            raise ValueError("cooldown must be non-negative.")
+        self._backends = [_Backend(i, client, max_samples) for i, client in enumerate(clients)]
+        self._hedge_percentile = hedge_percentile
+        self._initial_hedge_delay = initial_hedge_delay
+        self._max_hedges = max_hedges
+        self._min_samples = min_samples
+        self._max_failures = max_failures
+        self._cooldown = cooldown
+        self._max_samples = max_samples
+        self._stats = RoutingStats()
+        # Streams that lost a race are closed in the background.
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def clients(self) -> List[ChatCompletionClient]:
+        return [backend.client for backend in self._backends]
+
+    @property
+    def stats(self) -> RoutingStats:
+        """A snapshot of the routing statistics."""
+        return RoutingStats(
+            requests=self._stats.requests,
+            hedged=self._stats.hedged,
+            hedge_wins=self._stats.hedge_wins,
+            failovers=self._stats.failovers,
+        )
+
+    @property
+    def backend_stats(self) -> List[BackendStats]:
+        """A snapshot of the statistics of each backend."""
+        now = time.monotonic()
+        return [
+            BackendStats(
+                index=backend.stats.index,
+                healthy=backend.is_healthy(now),
+                requests=backend.stats.requests,
+                wins=backend.stats.wins,
+                failures=backend.stats.failures,
+                cancelled=backend.stats.cancelled,
+                p50_latency=backend.histogram.percentile(50),
+                p95_latency=backend.histogram.percentile(95),
+            )
+            for backend in self._backends
+        ]
+
+    def _rank_backends(self) -> List[_Backend]:
+        """The backends in the order they should receive a request: healthy ones by median latency, then the rest."""
+        now = time.monotonic()
+
+        def score(backend: _Backend) -> float:
+            if backend.histogram.count < self._min_samples:
+                return 0.0
+            return backend.histogram.percentile(50) or 0.0
+
+        healthy = sorted((b for b in self._backends if b.is_healthy(now)), key=score)
+        unhealthy = sorted((b for b in self._backends if not b.is_healthy(now)), key=lambda b: b.unhealthy_until)
+        return healthy + unhealthy
+
+    def _hedge_delay(self, backend: _Backend) -> float | None:
+        if backend.histogram.count < self._min_samples:
+            return self._initial_hedge_delay
+        return backend.histogram.percentile(self._hedge_percentile)
+
+    def _start(self, backend: _Backend, hedged: bool, cancellation_token: Optional[CancellationToken]) -> _Attempt:
+        attempt = _Attempt(backend, CancellationToken(), time.monotonic(), hedged)
+        if cancellation_token is not None:
+            cancellation_token.add_callback(attempt.cancellation_token.cancel)
+        backend.stats.requests += 1
+        if hedged:
+            self._stats.hedged += 1
+            trace_logger.info(f"Sending a hedged request to backend {backend.stats.index}.")
+        return attempt
+
+    def _succeeded(self, attempt: _Attempt) -> None:
+        backend = attempt.backend
+        backend.histogram.record(time.monotonic() - attempt.start_time)
+        backend.consecutive_failures = 0
+        backend.unhealthy_until = 0.0
+        backend.stats.wins += 1
+        if attempt.hedged:
+            self._stats.hedge_wins += 1
+
+    def _failed(self, attempt: _Attempt, error: BaseException) -> None:
+        backend = attempt.backend
+        backend.stats.failures += 1
+        backend.consecutive_failures += 1
+        trace_logger.warning(f"Request to backend {backend.stats.index} failed: {error!r}")
+        if backend.consecutive_failures >= self._max_failures:
+            backend.unhealthy_until = time.monotonic() + self._cooldown
+
+    def _cancel(self, attempt: _Attempt, task: "asyncio.Future[Any]") -> None:
+        # The request took at least this long, so the backend's latency histogram is not biased to the winners.
+        attempt.backend.histogram.record(time.monotonic() - attempt.start_time)
+        attempt.backend.stats.cancelled += 1
+        attempt.cancellation_token.cancel()
+        task.cancel()
+        if attempt.stream is not None:
+            closing = asyncio.ensure_future(self._close_stream(attempt.stream, task))
+            self._closing.add(closing)
+            closing.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_stream(
+        stream: AsyncGenerator[Union[str, CreateResult], None], pending_read: "asyncio.Future[Any]"
+    ) -> None:
+        # A stream cannot be closed while a read is pending.
+        await asyncio.wait([pending_read])
+        await stream.aclose()
+
+    async def _race(
+        self,
+        launch: Callable[[_Attempt], "asyncio.Future[Any]"],
+        cancellation_token: Optional[CancellationToken],
+    ) -> Tuple[_Attempt, Any]:
+        """Run a request on the ranked backends, hedging and failing over, and return the first successful attempt.
+
+        `launch` starts a request on an attempt and returns the future of its first result.
+        """
+        self._stats.requests += 1
+        ranked = self._rank_backends()
+        pending: Dict["asyncio.Future[Any]", _Attempt] = {}
+        next_backend = 0
+        hedges = 0
+        last_error: BaseException | None = None
+        deadline: float | None = None
+
+        def start(hedged: bool) -> None:
+            nonlocal next_backend, deadline
+            attempt = self._start(ranked[next_backend], hedged, cancellation_token)
+            next_backend += 1
+            pending[launch(attempt)] = attempt
+            if not hedged:
+                delay = self._hedge_delay(attempt.backend)
+                deadline = None if delay is None else attempt.start_time + delay
+
+        start(hedged=False)
+        try:
+            while pending:
+                can_hedge = deadline is not None and hedges < self._max_hedges and next_backend < len(ranked)
+                timeout = max(0.0, deadline - time.monotonic()) if can_hedge and deadline is not None else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedges += 1
+                    start(hedged=True)
+                    continue
+                for future in done:
+                    attempt = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except (Exception, asyncio.CancelledError) as e:
+                        self._failed(attempt, e)
+                        last_error = e
+                        continue
+                    return attempt, result
+                if not pending and next_backend < len(ranked):
+                    self._stats.failovers += 1
+                    start(hedged=False)
+            assert last_error is not None
+            raise last_error
+        finally:
+            for future, attempt in pending.items():
+                self._cancel(attempt, future)
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        def launch(attempt: _Attempt) -> "asyncio.Future[CreateResult]":
+            return asyncio.ensure_future(
+                attempt.backend.client.create(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=attempt.cancellation_token,
+                )
+            )
+
+        future = asyncio.ensure_future(self._race(launch, cancellation_token))
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        attempt, result = await future
+        self._succeeded(attempt)
+        assert isinstance(result, CreateResult)
+        return result
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        def launch(attempt: _Attempt) -> "asyncio.Future[Union[str, CreateResult]]":
+            attempt.stream = attempt.backend.client.create_stream(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=extra_create_args,
+                cancellation_token=attempt.cancellation_token,
+            )
+            return asyncio.ensure_future(attempt.stream.__anext__())
+
+        future = asyncio.ensure_future(self._race(launch, cancellation_token))
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        attempt, first_chunk = await future
+        self._succeeded(attempt)
+        assert attempt.stream is not None
+        try:
+            yield first_chunk
+            async for chunk in attempt.stream:
+                yield chunk
+        except Exception as e:
+            self._failed(attempt, e)
+            raise
+        finally:
+            await attempt.stream.aclose()
+
+    async def close(self) -> None:
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        for backend in self._backends:
+            await backend.client.close()
+
+    def actual_usage(self) -> RequestUsage:
+        return self._sum_usage([backend.client.actual_usage() for backend in self._backends])
+
+    def total_usage(self) -> RequestUsage:
+        return self._sum_usage([backend.client.total_usage() for backend in self._backends])
+
+    @staticmethod
+    def _sum_usage(usages: List[RequestUsage]) -> RequestUsage:
+        return RequestUsage(
+            prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+            completion_tokens=sum(usage.completion_tokens for usage in usages),
+        )
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self._backends[0].client.count_tokens(messages, tools=tools)
+
+    async def acount_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return await self._backends[0].client.acount_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return self._backends[0].client.remaining_tokens(messages, tools=tools)
+
+    async def aremaining_tokens(
+        self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []
+    ) -> int:
+        return await self._backends[0].client.aremaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self._backends[0].client.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self._backends[0].client.model_info
+
+    def _to_config(self) -> RoutingChatCompletionClientConfig:
+        return RoutingChatCompletionClientConfig(
+            clients=[backend.client.dump_component() for backend in self._backends],
+            hedge_percentile=self._hedge_percentile,
+            initial_hedge_delay=self._initial_hedge_delay,
+            max_hedges=self._max_hedges,
+            min_samples=self._min_samples,
+            max_failures=self._max_failures,
+            cooldown=self._cooldown,
+            max_samples=self._max_samples,
+        )
+
+    @classmethod
+    def _from_config(cls, config: RoutingChatCompletionClientConfig) -> Self:
+        return cls(
+            [ChatCompletionClient.load_component(client) for client in config.clients],
+            hedge_percentile=config.hedge_percentile,
+            initial_hedge_delay=config.initial_hedge_delay,
+            max_hedges=config.max_hedges,
+            min_samples=config.min_samples,
+            max_failures=config.max_failures,
+            cooldown=config.cooldown,
+            max_samples=config.max_samples,
+        )
@@ -1,10 +1,11 @@
 from ._actor import McpSessionActor
 from ._config import McpServerParams, SseServerParams, StdioServerParams
 from ._factory import mcp_server_tools
+from ._pool import McpSessionPool, McpSessionPoolStats, McpToolCallStats
 from ._session import create_mcp_server_session
 from ._sse import SseMcpToolAdapter
 from ._stdio import StdioMcpToolAdapter
-from ._workbench import McpWorkbench
+from ._workbench import McpWorkbench, PooledMcpWorkbench
 
 __all__ = [
     "create_mcp_server_session",
@@ -16,4 +17,8 @@
     "McpServerParams",
     "mcp_server_tools",
     "McpWorkbench",
+    "McpSessionPool",
+    "McpSessionPoolStats",
+    "McpToolCallStats",
+    "PooledMcpWorkbench",
 ]
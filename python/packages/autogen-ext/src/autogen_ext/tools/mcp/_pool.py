@@ -0,0 +1,347 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Deque, Dict, Mapping, Set
+
+from autogen_core import TRACE_LOGGER_NAME
+from mcp import ClientSession
+from mcp.types import CallToolResult, ListToolsResult
+
+from ._config import McpServerParams
+from ._session import create_mcp_server_session
+
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+
+@dataclass
+class McpToolCallStats:
+    """Latency statistics of the calls made to a single MCP tool."""
+
+    count: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.count if self.count else 0.0
+
+
+@dataclass
+class McpSessionPoolStats:
+    """Statistics of a :class:`McpSessionPool`. Times are in seconds."""
+
+    size: int = 0
+    """Number of sessions currently open or being opened."""
+    idle: int = 0
+    """Number of open sessions not in use."""
+    acquisitions: int = 0
+    """Number of times a session was acquired from the pool."""
+    total_wait_time: float = 0.0
+    """Total time spent waiting to acquire a session, including opening new sessions."""
+    max_wait_time: float = 0.0
+    """Longest time spent waiting to acquire a session."""
+    reconnects: int = 0
+    """Number of sessions discarded because they failed a health check or their connection broke."""
+    tool_calls: Dict[str, McpToolCallStats] = field(default_factory=dict)
+    """Latency statistics keyed by tool name."""
+
+    @property
+    def mean_wait_time(self) -> float:
+        return self.total_wait_time / self.acquisitions if self.acquisitions else 0.0
+
+
+class _PooledSession:
+    """An initialized MCP client session owned by a dedicated task.
+
+    The session's transport must be entered and exited in the same task,
+    so the task keeps it open until :meth:`close` is called.
+    """
+
+    def __init__(self, server_params: McpServerParams) -> None:
+        self._server_params = server_params
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.session: ClientSession | None = None
+
+    async def open(self) -> None:
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        self.session = await ready
+
+    async def _run(self, ready: asyncio.Future[ClientSession]) -> None:
+        try:
+            async with create_mcp_server_session(self._server_params) as session:
+                await session.initialize()
+                ready.set_result(session)
+                await self._stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                trace_logger.warning(f"MCP session closed unexpectedly: {e}")
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def close(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                trace_logger.warning(f"Error closing MCP session: {e}")
+
+
+class McpSessionPool:
+    """A pool of initialized MCP client sessions to a single MCP server.
+
+    Sessions are opened lazily up to `max_sessions`, each call holds a session
+    exclusively, and calls beyond `max_sessions` wait for a session to be released.
+    This lets several agents share one MCP server without queueing behind a single
+    session or paying the server startup cost for every call.
+
+    Sessions whose connection breaks are discarded and replaced on demand. If
+    `health_check_interval` is set, idle sessions are also pinged periodically
+    and the pool is topped back up to `min_sessions`.
+
+    Args:
+        server_params (McpServerParams): The parameters to connect to the MCP server.
+        min_sessions (int): The number of sessions opened on :meth:`start` and kept open. Defaults to 1.
+        max_sessions (int): The maximum number of concurrently open sessions. Defaults to 4.
+        health_check_interval (float | None): Seconds between health checks of idle sessions.
+            Defaults to `None`, which disables periodic health checks.
+        health_check_timeout (float): Seconds to wait for a ping response before a session
+            is considered unhealthy. Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        server_params: McpServerParams,
+        *,
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        health_check_interval: float | None = None,
+        health_check_timeout: float = 5,
+    ) -> None:
+        if min_sessions < 0:
+            raise ValueError("min_sessions must be non-negative.")
+        if max_sessions < 1 or max_sessions < min_sessions:
+            raise ValueError("max_sessions must be at least 1 and at least min_sessions.")
+        self._server_params = server_params
+        self._min_sessions = min_sessions
+        self._max_sessions = max_sessions
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._idle: Deque[_PooledSession] = deque()
+        self._size = 0
+        self._condition = asyncio.Condition()
+        self._health_check_task: asyncio.Task[None] | None = None
+        # Sessions being closed in the background, referenced until they are closed
+        self._closing: Set[asyncio.Task[None]] = set()
+        self._started = False
+        self._stats = McpSessionPoolStats()
+
+    @property
+    def server_params(self) -> McpServerParams:
+        return self._server_params
+
+    @property
+    def min_sessions(self) -> int:
+        return self._min_sessions
+
+    @property
+    def max_sessions(self) -> int:
+        return self._max_sessions
+
+    @property
+    def stats(self) -> McpSessionPoolStats:
+        """A snapshot of the pool statistics."""
+        return McpSessionPoolStats(
+            size=self._size,
+            idle=len(self._idle),
+            acquisitions=self._stats.acquisitions,
+            total_wait_time=self._stats.total_wait_time,
+            max_wait_time=self._stats.max_wait_time,
+            reconnects=self._stats.reconnects,
+            tool_calls={name: McpToolCallStats(**vars(stats)) for name, stats in self._stats.tool_calls.items()},
+        )
+
+    async def start(self) -> None:
+        """Open `min_sessions` sessions and start the periodic health check, if enabled."""
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self._fill()
+        except BaseException:
+            self._started = False
+            raise
+        if self._health_check_interval is not None:
+            self._health_check_task = asyncio.create_task(self._health_check_loop(self._health_check_interval))
+
+    async def stop(self) -> None:
+        """Close all sessions. Sessions in use are closed when they are released."""
+        if not self._started:
+            return
+        self._started = False
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+        async with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        await asyncio.gather(*[pooled.close() for pooled in idle], *self._closing)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[ClientSession, None]:
+        """Acquire a session for exclusive use and release it on exit.
+
+        If the body raises an exception other than a cancellation, the session is
+        pinged before it is returned to the pool and discarded if it is unhealthy.
+        """
+        pooled = await self._acquire()
+        healthy = True
+        try:
+            assert pooled.session is not None
+            yield pooled.session
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            healthy = await self._ping(pooled)
+            raise
+        finally:
+            await self._release(pooled, healthy)
+
+    async def list_tools(self) -> ListToolsResult:
+        async with self.session() as session:
+            return await session.list_tools()
+
+    async def call_tool(self, name: str, arguments: Mapping[str, Any] | None = None) -> CallToolResult:
+        """Call a tool on one of the pooled sessions and record its latency."""
+        async with self.session() as session:
+            stats = self._stats.tool_calls.setdefault(name, McpToolCallStats())
+            start_time = time.perf_counter()
+            try:
+                result = await session.call_tool(name=name, arguments=dict(arguments) if arguments else None)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                latency = time.perf_counter() - start_time
+                stats.count += 1
+                stats.total_latency += latency
+                stats.max_latency = max(stats.max_latency, latency)
+            if result.isError:
+                stats.errors += 1
+            return result
+
+    async def _acquire(self) -> _PooledSession:
+        if not self._started:
+            await self.start()
+        start_time = time.perf_counter()
+        async with self._condition:
+            while True:
+                pooled: _PooledSession | None = None
+                while self._idle:
+                    candidate = self._idle.popleft()
+                    if candidate.alive:
+                        pooled = candidate
+                        break
+                    self._discard(candidate)
+                if pooled is not None or self._size < self._max_sessions:
+                    break
+                await self._condition.wait()
+            if pooled is None:
+                self._size += 1
+        if pooled is None:
+            try:
+                pooled = await self._open()
+            except BaseException:
+                async with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+        wait_time = time.perf_counter() - start_time
+        self._stats.acquisitions += 1
+        self._stats.total_wait_time += wait_time
+        self._stats.max_wait_time = max(self._stats.max_wait_time, wait_time)
+        return pooled
+
+    async def _release(self, pooled: _PooledSession, healthy: bool) -> None:
+        async with self._condition:
+            if healthy and pooled.alive and self._started:
+                self._idle.append(pooled)
+            else:
+                self._discard(pooled)
+            self._condition.notify()
+
+    def _discard(self, pooled: _PooledSession) -> None:
+        """Drop a session from the pool and close it in the background. Must hold the condition lock."""
+        self._size -= 1
+        if self._started:
+            self._stats.reconnects += 1
+        task = asyncio.create_task(pooled.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _open(self) -> _PooledSession:
+        pooled = _PooledSession(self._server_params)
+        await pooled.open()
+        return pooled
+
+    async def _ping(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive or pooled.session is None:
+            return False
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=self._health_check_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _fill(self) -> None:
+        """Open new sessions until there are at least `min_sessions`."""
+        async with self._condition:
+            missing = max(0, self._min_sessions - self._size)
+            self._size += missing
+        results = await asyncio.gather(*[self._open() for _ in range(missing)], return_exceptions=True)
+        async with self._condition:
+            for result in results:
+                if isinstance(result, _PooledSession):
+                    self._idle.append(result)
+                else:
+                    self._size -= 1
+                    trace_logger.warning(f"Failed to open MCP session: {result}")
+            self._condition.notify_all()
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+    async def _health_check_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            async with self._condition:
+                idle = list(self._idle)
+                self._idle.clear()
+            checks = await asyncio.gather(*[self._ping(pooled) for pooled in idle])
+            async with self._condition:
+                for pooled, healthy in zip(idle, checks, strict=True):
+                    if healthy and self._started:
+                        self._idle.append(pooled)
+                    else:
+                        self._discard(pooled)
+                self._condition.notify_all()
+            try:
+                await self._fill()
+            except Exception as e:
+                trace_logger.warning(f"Failed to replenish MCP session pool: {e}")
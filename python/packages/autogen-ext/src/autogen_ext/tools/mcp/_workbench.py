@@ -1,3 +1,4 @@
+import asyncio
 import builtins
 import warnings
 from typing import Any, List, Literal, Mapping
@@ -17,6 +18,59 @@
 
 from ._actor import McpSessionActor
 from ._config import McpServerParams, SseServerParams, StdioServerParams
+from ._pool import McpSessionPool, McpSessionPoolStats
+
+
+def _to_tool_schemas(list_tool_result: ListToolsResult) -> List[ToolSchema]:
+    """Convert the tools listed by an MCP server into tool schemas."""
+    schema: List[ToolSchema] = []
+    for tool in list_tool_result.tools:
+        name = tool.name
+        description = tool.description or ""
+        parameters = ParametersSchema(
+            type="object",
+            properties=tool.inputSchema.get("properties", {}),
+            required=tool.inputSchema.get("required", []),
+            additionalProperties=tool.inputSchema.get("additionalProperties", False),
+        )
+        tool_schema = ToolSchema(
+            name=name,
+            description=description,
+            parameters=parameters,
+        )
+        schema.append(tool_schema)
+    return schema
+
+
+def _to_result_parts(result: CallToolResult) -> List[TextResultContent | ImageResultContent]:
+    """Convert the content of an MCP tool call result into tool result parts."""
+    result_parts: List[TextResultContent | ImageResultContent] = []
+    for content in result.content:
+        if isinstance(content, TextContent):
+            result_parts.append(TextResultContent(content=content.text))
+        elif isinstance(content, ImageContent):
+            result_parts.append(ImageResultContent(content=Image.from_base64(content.data)))
+        elif isinstance(content, EmbeddedResource):
+            # TODO: how to handle embedded resources?
+            # For now we just use text representation.
+            result_parts.append(TextResultContent(content=content.model_dump_json()))
+        else:
+            raise ValueError(f"Unknown content type from server: {type(content)}")
+    return result_parts
+
+
+def _format_errors(error: Exception) -> str:
+    """Recursively format errors into a string."""
+
+    error_message = ""
+    if hasattr(builtins, "ExceptionGroup") and isinstance(error, builtins.ExceptionGroup):
+        # ExceptionGroup is available in Python 3.11+.
+        # TODO: how to make this compatible with Python 3.10?
+        for sub_exception in error.exceptions:  # type: ignore
+            error_message += _format_errors(sub_exception)  # type: ignore
+    else:
+        error_message += f"{str(error)}\n"
+    return error_message
 
 
 class McpWorkbenchConfig(BaseModel):
@@ -171,23 +225,7 @@ async def list_tools(self) -> List[ToolSchema]:
         assert isinstance(
             list_tool_result, ListToolsResult
         ), f"list_tools must return a CallToolResult, instead of : {str(type(list_tool_result))}"
-        schema: List[ToolSchema] = []
-        for tool in list_tool_result.tools:
-            name = tool.name
-            description = tool.description or ""
-            parameters = ParametersSchema(
-                type="object",
-                properties=tool.inputSchema.get("properties", {}),
-                required=tool.inputSchema.get("required", []),
-                additionalProperties=tool.inputSchema.get("additionalProperties", False),
-            )
-            tool_schema = ToolSchema(
-                name=name,
-                description=description,
-                parameters=parameters,
-            )
-            schema.append(tool_schema)
-        return schema
+        return _to_tool_schemas(list_tool_result)
 
     async def call_tool(
         self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
@@ -209,38 +247,14 @@ async def call_tool(
             assert isinstance(
                 result, CallToolResult
             ), f"call_tool must return a CallToolResult, instead of : {str(type(result))}"
-            result_parts: List[TextResultContent | ImageResultContent] = []
             is_error = result.isError
-            for content in result.content:
-                if isinstance(content, TextContent):
-                    result_parts.append(TextResultContent(content=content.text))
-                elif isinstance(content, ImageContent):
-                    result_parts.append(ImageResultContent(content=Image.from_base64(content.data)))
-                elif isinstance(content, EmbeddedResource):
-                    # TODO: how to handle embedded resources?
-                    # For now we just use text representation.
-                    result_parts.append(TextResultContent(content=content.model_dump_json()))
-                else:
-                    raise ValueError(f"Unknown content type from server: {type(content)}")
+            result_parts = _to_result_parts(result)
         except Exception as e:
-            error_message = self._format_errors(e)
+            error_message = _format_errors(e)
             is_error = True
             result_parts = [TextResultContent(content=error_message)]
         return ToolResult(name=name, result=result_parts, is_error=is_error)
 
-    def _format_errors(self, error: Exception) -> str:
-        """Recursively format errors into a string."""
-
-        error_message = ""
-        if hasattr(builtins, "ExceptionGroup") and isinstance(error, builtins.ExceptionGroup):
-            # ExceptionGroup is available in Python 3.11+.
-            # TODO: how to make this compatible with Python 3.10?
-            for sub_exception in error.exceptions:  # type: ignore
-                error_message += self._format_errors(sub_exception)  # type: ignore
-        else:
-            error_message += f"{str(error)}\n"
-        return error_message
-
     async def start(self) -> None:
         if self._actor:
             warnings.warn(
@@ -283,3 +297,147 @@ def _from_config(cls, config: McpWorkbenchConfig) -> Self:
     def __del__(self) -> None:
         # Ensure the actor is stopped when the workbench is deleted
         pass
+
+
+class PooledMcpWorkbenchConfig(BaseModel):
+    server_params: McpServerParams
+    min_sessions: int = 1
+    max_sessions: int = 4
+    health_check_interval: float | None = None
+    health_check_timeout: float = 5
+
+
+class PooledMcpWorkbench(Workbench, Component[PooledMcpWorkbenchConfig]):
+    """
+    A workbench that wraps an MCP server and dispatches tool calls over a
+    :class:`McpSessionPool` of initialized sessions.
+
+    Unlike :class:`McpWorkbench`, which sends every request through a single session,
+    this workbench runs up to `max_sessions` tool calls concurrently. A single instance
+    can be shared by several agents that use the same MCP server. Pool and per-tool
+    latency statistics are available through :attr:`stats`.
+
+    Args:
+        server_params (McpServerParams): The parameters to connect to the MCP server.
+            This can be either a :class:`StdioServerParams` or :class:`SseServerParams`.
+        min_sessions (int): The number of sessions opened on start and kept open. Defaults to 1.
+        max_sessions (int): The maximum number of concurrently open sessions. Defaults to 4.
+        health_check_interval (float | None): Seconds between pings of idle sessions.
+            Broken sessions are replaced. Defaults to `None`, which disables periodic health checks.
+        health_check_timeout (float): Seconds to wait for a ping response before a session
+            is considered unhealthy. Defaults to 5.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_agentchat.agents import AssistantAgent
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+            from autogen_ext.tools.mcp import PooledMcpWorkbench, StdioServerParams
+
+
+            async def main() -> None:
+                model_client = OpenAIChatCompletionClient(model="gpt-4.1-nano")
+                params = StdioServerParams(command="uvx", args=["mcp-server-fetch"], read_timeout_seconds=60)
+
+                # Share one pool of MCP server sessions between several agents.
+                async with PooledMcpWorkbench(params, min_sessions=2, max_sessions=8) as workbench:
+                    agents = [
+                        AssistantAgent(f"assistant_{i}", model_client=model_client, workbench=workbench) for i in range(4)
+                    ]
+                    await asyncio.gather(*[agent.run(task="Summarize https://github.com/") for agent in agents])
+                    print(workbench.stats)
+
+
+            asyncio.run(main())
+    """
+
+    component_provider_override = "autogen_ext.tools.mcp.PooledMcpWorkbench"
+    component_config_schema = PooledMcpWorkbenchConfig
+
+    def __init__(
+        self,
+        server_params: McpServerParams,
+        *,
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        health_check_interval: float | None = None,
+        health_check_timeout: float = 5,
+    ) -> None:
+        if not isinstance(server_params, (StdioServerParams, SseServerParams)):
+            raise ValueError(f"Unsupported server params type: {type(server_params)}")
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._pool = McpSessionPool(
+            server_params,
+            min_sessions=min_sessions,
+            max_sessions=max_sessions,
+            health_check_interval=health_check_interval,
+            health_check_timeout=health_check_timeout,
+        )
+
+    @property
+    def server_params(self) -> McpServerParams:
+        return self._pool.server_params
+
+    @property
+    def stats(self) -> McpSessionPoolStats:
+        """Pool-wait and per-tool latency statistics of the underlying session pool."""
+        return self._pool.stats
+
+    async def list_tools(self) -> List[ToolSchema]:
+        list_tool_result = await self._pool.list_tools()
+        return _to_tool_schemas(list_tool_result)
+
+    async def call_tool(
+        self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
+    ) -> ToolResult:
+        if not cancellation_token:
+            cancellation_token = CancellationToken()
+        try:
+            result_future = asyncio.ensure_future(self._pool.call_tool(name, arguments))
+            cancellation_token.link_future(result_future)
+            result = await result_future
+            is_error = result.isError
+            result_parts = _to_result_parts(result)
+        except Exception as e:
+            error_message = _format_errors(e)
+            is_error = True
+            result_parts = [TextResultContent(content=error_message)]
+        return ToolResult(name=name, result=result_parts, is_error=is_error)
+
+    async def start(self) -> None:
+        await self._pool.start()
+
+    async def stop(self) -> None:
+        await self._pool.stop()
+
+    async def reset(self) -> None:
+        pass
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return McpWorkbenchState().model_dump()
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        pass
+
+    def _to_config(self) -> PooledMcpWorkbenchConfig:
+        return PooledMcpWorkbenchConfig(
+            server_params=self._pool.server_params,
+            min_sessions=self._pool.min_sessions,
+            max_sessions=self._pool.max_sessions,
+            health_check_interval=self._health_check_interval,
+            health_check_timeout=self._health_check_timeout,
+        )
+
+    @classmethod
+    def _from_config(cls, config: PooledMcpWorkbenchConfig) -> Self:
+        return cls(
+            server_params=config.server_params,
+            min_sessions=config.min_sessions,
+            max_sessions=config.max_sessions,
+            health_check_interval=config.health_check_interval,
+            health_check_timeout=config.health_check_timeout,
+        )
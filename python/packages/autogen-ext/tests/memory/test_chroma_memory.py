@@ -240,3 +240,49 @@ async def test_component_serialization(base_config: PersistentChromaDBVectorMemo
 
     await memory.close()
     await loaded_memory.close()
+
+
+@pytest.mark.asyncio
+async def test_add_many_and_query_many(base_config: PersistentChromaDBVectorMemoryConfig) -> None:
+    """Test batched inserts and multi-query lookups."""
+    memory = ChromaDBVectorMemory(config=base_config.model_copy(update={"batch_size": 2}))
+    await memory.clear()
+
+    await memory.add_many(
+        [
+            MemoryContent(content="Paris is the capital of France.", mime_type=MemoryMimeType.TEXT),
+            MemoryContent(content="Berlin is the capital of Germany.", mime_type=MemoryMimeType.TEXT),
+            MemoryContent(content="Jupiter is the largest planet.", mime_type=MemoryMimeType.TEXT),
+            MemoryContent(content="Mars is known as the red planet.", mime_type=MemoryMimeType.TEXT),
+            MemoryContent(content="The Nile is a river in Africa.", mime_type=MemoryMimeType.TEXT),
+        ]
+    )
+
+    results = await memory.query_many(["Tell me about Paris", "Which planet is red?"])
+    assert len(results) == 2
+    assert len(results[0].results) == 3
+    assert "Paris" in str(results[0].results[0].content)
+    assert "Mars" in str(results[1].results[0].content)
+
+    # The single query API returns the same results as the batched one.
+    single = await memory.query("Tell me about Paris")
+    assert [r.content for r in single.results] == [r.content for r in results[0].results]
+
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_cache(base_config: PersistentChromaDBVectorMemoryConfig) -> None:
+    """Test that repeated queries reuse cached embeddings, bounded by the cache size."""
+    memory = ChromaDBVectorMemory(config=base_config.model_copy(update={"query_embedding_cache_size": 2}))
+    await memory.clear()
+    await memory.add(MemoryContent(content="Paris is the capital of France.", mime_type=MemoryMimeType.TEXT))
+
+    await memory.query_many(["first", "second", "first"])
+    assert list(memory._query_embedding_cache) == ["second", "first"]  # type: ignore[reportPrivateUsage]
+
+    await memory.query("third")
+    assert list(memory._query_embedding_cache) == ["first", "third"]  # type: ignore[reportPrivateUsage]
+
+    await memory.close()
+    assert len(memory._query_embedding_cache) == 0  # type: ignore[reportPrivateUsage]
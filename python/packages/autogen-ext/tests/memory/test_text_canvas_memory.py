@@ -1,13 +1,18 @@
 import difflib
+from typing import List
 
 import pytest
+from autogen_agentchat.agents import AssistantAgent
 from autogen_core import CancellationToken
+from autogen_core.memory import ListMemory
 from autogen_core.model_context import UnboundedChatCompletionContext
-from autogen_ext.memory.canvas import TextCanvasMemory
+from autogen_core.models import LLMMessage, SystemMessage
+from autogen_ext.memory.canvas import TextCanvas, TextCanvasMemory
 from autogen_ext.memory.canvas._canvas_writer import (
     ApplyPatchArgs,
     UpdateFileArgs,
 )
+from autogen_ext.models.replay import ReplayChatCompletionClient
 
 
 # ── Fixtures ─────────────────────────────────────────────────────────────────────
@@ -119,3 +124,112 @@ async def test_update_context_injects_snapshot(
     assert result.memories.results
     assert isinstance(result.memories.results[0].content, str)
     assert story_v2.strip() in result.memories.results[0].content
+
+
+def test_revisions_are_stored_as_deltas() -> None:
+    canvas = TextCanvas(snapshot_interval=4)
+    contents = ["".join(f"line {j}\n" for j in range(i, i + 50)) + ("no newline" if i % 3 else "") for i in range(10)]
+    for content in contents:
+        canvas.add_or_update_file("story.md", content)
+
+    assert canvas.list_files() == {"story.md": 10}
+    for revision, content in enumerate(contents, start=1):
+        assert canvas.get_revision_content("story.md", revision) == content
+    assert canvas.get_revision_content("story.md", 11) == ""
+    # Only revisions 1, 5 and 9 are stored in full.
+    history = canvas._files["story.md"]  # type: ignore[reportPrivateUsage]
+    assert sorted(history.snapshots) == [1, 5, 9]
+
+    expected = [
+        "".join(
+            difflib.unified_diff(
+                contents[i - 1].splitlines(keepends=True),
+                contents[i].splitlines(keepends=True),
+                fromfile=f"story.md@r{i}",
+                tofile=f"story.md@r{i + 1}",
+            )
+        )
+        for i in range(1, 10)
+    ]
+    assert canvas.get_revision_diffs("story.md") == expected
+    canvas.add_or_update_file("story.md", contents[0])
+    assert canvas.get_revision_diffs("story.md")[:9] == expected
+    assert canvas.get_diff("story.md", 3, 4) == expected[2]
+    assert canvas.get_diff("story.md", 10, 11) == canvas.get_revision_diffs("story.md")[9]
+
+
+@pytest.mark.asyncio
+async def test_update_context_injects_changes(story_v1: str, story_v2: str) -> None:
+    memory = TextCanvasMemory(context_mode="changes")
+    memory.canvas.add_or_update_file("story.md", story_v1 * 20)
+    memory.canvas.add_or_update_file("notes.md", "Bella is a bunny.\n")
+
+    writer_ctx = UnboundedChatCompletionContext()
+    critic_ctx = UnboundedChatCompletionContext()
+    await memory.update_context(writer_ctx)
+    await memory.update_context(critic_ctx)
+    # Every model context gets the full canvas on its first turn.
+    for ctx in (writer_ctx, critic_ctx):
+        assert "=== CANVAS FILES ===" in ctx._messages[0].content  # type: ignore
+
+    # Nothing is injected when nothing changed.
+    result = await memory.update_context(writer_ctx)
+    assert not result.memories.results
+    assert len(writer_ctx._messages) == 1  # type: ignore
+
+    memory.canvas.add_or_update_file("story.md", story_v2 + story_v1 * 19)
+    memory.canvas.add_or_update_file("ideas.md", "A sunflower.\n")
+    await memory.update_context(writer_ctx)
+    changes = writer_ctx._messages[1].content  # type: ignore
+    assert "=== CANVAS CHANGES ===" in changes
+    assert "File: story.md (rev 1 → rev 2):" in changes
+    assert "+" + story_v2.splitlines()[-1] in changes
+    assert "File: ideas.md (rev 1):\nA sunflower." in changes
+    assert "Unchanged: notes.md (rev 1)" in changes
+    assert len(changes) < len(story_v1 * 20)
+
+    # A cleared model context gets the full canvas again.
+    await critic_ctx.clear()
+    await memory.update_context(critic_ctx)
+    assert "=== CANVAS FILES ===" in critic_ctx._messages[0].content  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_update_context_injects_changes_through_agent(story_v1: str, story_v2: str) -> None:
+    memory = TextCanvasMemory(context_mode="changes")
+    memory.canvas.add_or_update_file("story.md", story_v1 * 20)
+    # With a second memory, each memory updates its own copy of the agent's model context on every turn.
+    agent = AssistantAgent(
+        "writer",
+        model_client=ReplayChatCompletionClient(["One", "Two", "Three", "Four"]),
+        memory=[memory, ListMemory()],
+    )
+
+    def canvas_messages(messages: List[LLMMessage]) -> List[str]:
+        return [m.content for m in messages if isinstance(m, SystemMessage) and "=== CANVAS" in m.content]
+
+    await agent.run(task="Write a story.")
+    # Nothing is injected when nothing changed since the last turn.
+    await agent.run(task="Anything new?")
+    memory.canvas.add_or_update_file("story.md", story_v2 + story_v1 * 19)
+    await agent.run(task="Review the story.")
+
+    injected = canvas_messages(await agent.model_context.get_messages())
+    assert len(injected) == 2
+    assert injected[0].startswith("=== CANVAS FILES ===")
+    assert injected[1].startswith("=== CANVAS CHANGES ===")
+    assert "File: story.md (rev 1 → rev 2):" in injected[1]
+
+    # Another agent sharing the memory gets the full canvas on its own first turn.
+    critic = AssistantAgent("critic", model_client=ReplayChatCompletionClient(["Fine"]), memory=[memory])
+    await critic.run(task="Critique the story.")
+    injected = canvas_messages(await critic.model_context.get_messages())
+    assert len(injected) == 1
+    assert injected[0].startswith("=== CANVAS FILES ===")
+
+    # After the agent's context is cleared, it gets the full canvas again.
+    await agent.model_context.clear()
+    await agent.run(task="Start over.")
+    injected = canvas_messages(await agent.model_context.get_messages())
+    assert len(injected) == 1
+    assert injected[0].startswith("=== CANVAS FILES ===")
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 import os
-from typing import List, Sequence
+from typing import Any, Dict, List, Sequence
 
 import pytest
+from anthropic.resources.messages import AsyncMessages
+from anthropic.types import Message, TextBlock, Usage
 from autogen_core import CancellationToken, FunctionCall
 from autogen_core.models import (
     AssistantMessage,
@@ -680,3 +682,61 @@ def test_rstrip_railing_whitespace_at_last_assistant_content() -> None:
 
     assert isinstance(result[-1].content, str)
     assert result[-1].content == "foobar"
+
+
+@pytest.mark.asyncio
+async def test_anthropic_prompt_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: List[Dict[str, Any]] = []
+
+    async def _mock_create(self: AsyncMessages, **kwargs: Any) -> Message:
+        requests.append(kwargs)
+        return Message(
+            id="msg_1",
+            type="message",
+            role="assistant",
+            model=kwargs["model"],
+            content=[TextBlock(type="text", text="Hello")],
+            stop_reason="end_turn",
+            usage=Usage(
+                input_tokens=10,
+                output_tokens=5,
+                cache_read_input_tokens=60 if len(requests) > 1 else 0,
+                cache_creation_input_tokens=30,
+            ),
+        )
+
+    monkeypatch.setattr(AsyncMessages, "create", _mock_create)
+    client = AnthropicChatCompletionClient(model="claude-3-haiku-20240307", api_key="dummy-key", prompt_caching=True)
+    tool = FunctionTool(_pass_function, description="Process input text", name="process_text")
+    history: List[LLMMessage] = [
+        SystemMessage(content="You are a helpful assistant."),
+        UserMessage(content="Hello", source="user"),
+    ]
+    result = await client.create(history, tools=[tool])
+    assert result.usage.prompt_tokens == 40
+
+    request = requests[0]
+    assert request["system"] == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert request["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert request["messages"][-1]["content"] == [
+        {"type": "text", "text": "Hello", "cache_control": {"type": "ephemeral"}}
+    ]
+
+    history.append(AssistantMessage(content="Hello", source="assistant"))
+    history.append(UserMessage(content="How are you?", source="user"))
+    await client.create(history, tools=[tool])
+    # Only the last message is marked; the cached conversions are not modified.
+    assert requests[1]["messages"][0] == {"role": "user", "content": "Hello"}
+    assert requests[1]["messages"][-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    stats = client.prompt_cache_stats
+    assert (stats.conversion_hits, stats.conversion_misses) == (2, 4)
+    assert stats.prompt_tokens == 140
+    assert stats.cached_prompt_tokens == 60
+    assert stats.cache_creation_tokens == 60
+    assert stats.cached_token_ratio == 60 / 140
+
+    loaded = AnthropicChatCompletionClient.load_component(client.dump_component())
+    assert loaded._prompt_caching  # pyright: ignore[reportPrivateUsage]
@@ -1,14 +1,17 @@
+import asyncio
 import contextlib
 import sys
-from typing import TYPE_CHECKING, Any, ContextManager, Generator, List, Sequence, Union
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Generator, List, Sequence, Union, cast
 
 import pytest
 import torch
 
 # from autogen_agentchat.agents import AssistantAgent
 # from autogen_agentchat.messages import TextMessage
-# from autogen_core import CancellationToken
-from autogen_core.models import RequestUsage, SystemMessage, UserMessage
+from autogen_core import CancellationToken
+from autogen_core.models import CreateResult, RequestUsage, SystemMessage, UserMessage
 from llama_cpp import ChatCompletionRequestResponseFormat
 from pydantic import BaseModel
 
@@ -40,6 +43,15 @@ def __init__(
         self.model_path = model_path
         self.n_ctx = lambda: 1024
         self._structured_response = AgentResponse(thoughts="Test thoughts", content="Test content")
+        self.stream_chunks: List[Dict[str, Any]] = [
+            {"choices": [{"index": 0, "delta": {"role": "assistant"}, "finish_reason": None}]},
+            {"choices": [{"index": 0, "delta": {"content": "Hello "}, "finish_reason": None}]},
+            {"choices": [{"index": 0, "delta": {"content": "World"}, "finish_reason": None}]},
+            {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+        ]
+        self.stream_delay = 0.0
+        self.streamed_chunks = 0
+        self.stream_closed = threading.Event()
 
     # Added tokenize method for testing purposes.
     def tokenize(self, b: bytes) -> list[int]:
@@ -51,7 +63,10 @@ def create_chat_completion(
         tools: List[ChatCompletionMessageToolCalls] | None,
         stream: bool = False,
         response_format: ChatCompletionRequestResponseFormat | None = None,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | Generator[dict[str, Any], None, None]:
+        if stream:
+            return self._stream()
+
         # Return fake non-streaming response.
 
         if response_format is not None:
@@ -67,6 +82,16 @@ def create_chat_completion(
             "choices": [{"message": {"content": "Fake response"}}],
         }
 
+    def _stream(self) -> Generator[dict[str, Any], None, None]:
+        # Yield fake streaming chunks in the format of llama_cpp.CreateChatCompletionStreamResponse.
+        try:
+            for chunk in self.stream_chunks:
+                time.sleep(self.stream_delay)
+                self.streamed_chunks += 1
+                yield chunk
+        finally:
+            self.stream_closed.set()
+
     def __call__(self, prompt: str, stream: bool = True) -> Generator[dict[str, Any], None, None]:
         # Yield fake streaming tokens.
         yield {"choices": [{"text": "Hello "}]}
@@ -119,21 +144,128 @@ async def test_llama_cpp_create_structured_output(
         assert AgentResponse.model_validate_json(result.content).content == "Test content"
 
 
-# Commmented out due to raising not implemented error will leave in case streaming is supported in the future.
-# @pytest.mark.asyncio
-# async def test_llama_cpp_create_stream(
-#     get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
-# ) -> None:
-#     with get_completion_client as Client:
-#         client = Client(filename="dummy")
-#         messages: Sequence[Union[SystemMessage, UserMessage]] = [
-#             SystemMessage(content="Test system"),
-#             UserMessage(content="Test user", source="user"),
-#         ]
-#         collected = ""
-#         async for token in client.create_stream(messages=messages):
-#             collected += token
-#         assert collected == "Hello World"
+@pytest.mark.asyncio
+async def test_llama_cpp_create_stream(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        client = Client(model_path="dummy")
+        messages: Sequence[Union[SystemMessage, UserMessage]] = [
+            SystemMessage(content="Test system"),
+            UserMessage(content="Test user", source="user"),
+        ]
+        collected = ""
+        result: CreateResult | None = None
+        async for token in client.create_stream(messages=messages):
+            if isinstance(token, CreateResult):
+                result = token
+            else:
+                collected += token
+        assert collected == "Hello World"
+        assert result is not None
+        assert result.content == "Hello World"
+        assert result.finish_reason == "stop"
+        # Without usage from the server, only the chunks with generated content are counted.
+        assert result.usage.completion_tokens == 2
+        assert result.usage.prompt_tokens == client.count_tokens(messages)
+        assert client.total_usage().completion_tokens == 2
+
+
+@pytest.mark.asyncio
+async def test_llama_cpp_create_stream_tool_calls(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        client = Client(model_path="dummy")
+        llm = cast(FakeLlama, client.llm)
+        llm.stream_chunks = [
+            {"choices": [{"index": 0, "delta": {"content": "Let me add."}, "finish_reason": None}]},
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": 0,
+                                    "id": "call_1",
+                                    "type": "function",
+                                    "function": {"name": "add", "arguments": ""},
+                                }
+                            ]
+                        },
+                        "finish_reason": None,
+                    }
+                ]
+            },
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"tool_calls": [{"index": 0, "function": {"arguments": '{"num1": 3, '}}]},
+                        "finish_reason": None,
+                    }
+                ]
+            },
+            {
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"tool_calls": [{"index": 0, "function": {"arguments": '"num2": 4}'}}]},
+                        "finish_reason": "tool_calls",
+                    }
+                ],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 9},
+            },
+        ]
+        chunks: List[str | CreateResult] = []
+        async for chunk in client.create_stream(messages=[UserMessage(content="add 3 and 4", source="user")]):
+            chunks.append(chunk)
+        assert chunks[0] == "Let me add."
+        result = chunks[-1]
+        assert isinstance(result, CreateResult)
+        assert isinstance(result.content, list)
+        assert result.content[0].id == "call_1"
+        assert result.content[0].name == "add"
+        assert result.content[0].arguments == '{"num1": 3, "num2": 4}'
+        assert result.thought == "Let me add."
+        assert result.finish_reason == "function_calls"
+        assert result.usage == RequestUsage(prompt_tokens=12, completion_tokens=9)
+
+
+@pytest.mark.asyncio
+async def test_llama_cpp_create_stream_cancellation(
+    get_completion_client: "ContextManager[type[LlamaCppChatCompletionClient]]",
+) -> None:
+    with get_completion_client as Client:
+        client = Client(model_path="dummy")
+        llm = cast(FakeLlama, client.llm)
+        llm.stream_chunks = [
+            {"choices": [{"index": 0, "delta": {"content": f"token{i} "}, "finish_reason": None}]} for i in range(100)
+        ]
+        llm.stream_delay = 0.01
+        cancellation_token = CancellationToken()
+        received: List[str] = []
+        with pytest.raises(asyncio.CancelledError):
+            async for chunk in client.create_stream(
+                messages=[UserMessage(content="Count to 100", source="user")], cancellation_token=cancellation_token
+            ):
+                assert isinstance(chunk, str)
+                received.append(chunk)
+                if len(received) == 2:
+                    cancellation_token.cancel()
+        # Generation stops mid-sequence instead of running to the end.
+        assert llm.stream_closed.wait(timeout=5)
+        assert llm.streamed_chunks < 100
+
+        # Closing the stream early also stops the generation.
+        llm.stream_closed.clear()
+        llm.streamed_chunks = 0
+        stream = client.create_stream(messages=[UserMessage(content="Count to 100", source="user")])
+        await anext(stream)
+        await stream.aclose()
+        assert llm.stream_closed.wait(timeout=5)
+        assert llm.streamed_chunks < 100
 
 
 @pytest.mark.asyncio
@@ -210,24 +342,28 @@ async def test_llama_cpp_integration_non_streaming_structured_output() -> None:
     assert AgentResponse.model_validate_json(result.content)
 
 
-# Commmented out due to raising not implemented error will leave in case streaming is supported in the future.
-# @pytest.mark.asyncio
-# async def test_llama_cpp_integration_streaming() -> None:
-#     if not ((hasattr(torch.backends, "mps") and torch.backends.mps.is_available()) or torch.cuda.is_available()):
-#         pytest.skip("Skipping LlamaCpp integration tests: GPU not available not set")
+@pytest.mark.asyncio
+async def test_llama_cpp_integration_streaming() -> None:
+    if not ((hasattr(torch.backends, "mps") and torch.backends.mps.is_available()) or torch.cuda.is_available()):
+        pytest.skip("Skipping LlamaCpp integration tests: GPU not available not set")
+
+    from autogen_ext.models.llama_cpp._llama_cpp_completion_client import LlamaCppChatCompletionClient
+
+    client = LlamaCppChatCompletionClient(
+        repo_id="unsloth/phi-4-GGUF", filename="phi-4-Q2_K_L.gguf", n_gpu_layers=-1, seed=1337, n_ctx=5000
+    )
+    messages: Sequence[Union[SystemMessage, UserMessage]] = [
+        SystemMessage(content="You are a helpful assistant."),
+        UserMessage(content="Please stream your response.", source="user"),
+    ]
+    collected = ""
+    async for token in client.create_stream(messages=messages):
+        if isinstance(token, str):
+            collected += token
+        else:
+            assert isinstance(token.content, str) and token.content == collected
+    assert isinstance(collected, str) and len(collected.strip()) > 0
 
-#     from autogen_ext.models.llama_cpp._llama_cpp_completion_client import LlamaCppChatCompletionClient
-#     client = LlamaCppChatCompletionClient(
-#         repo_id="unsloth/phi-4-GGUF", filename="phi-4-Q2_K_L.gguf", n_gpu_layers=-1, seed=1337, n_ctx=5000
-#     )
-#     messages: Sequence[Union[SystemMessage, UserMessage]] = [
-#         SystemMessage(content="You are a helpful assistant."),
-#         UserMessage(content="Please stream your response.", source="user"),
-#     ]
-#     collected = ""
-#     async for token in client.create_stream(messages=messages):
-#         collected += token
-#     assert isinstance(collected, str) and len(collected.strip()) > 0
 
 # Commented out tool use as this functionality is not yet implemented for Phi-4.
 # Define tools (functions) for the AssistantAgent
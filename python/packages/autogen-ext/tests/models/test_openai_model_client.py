@@ -2,7 +2,8 @@
 import json
 import logging
 import os
-from typing import Annotated, Any, AsyncGenerator, Dict, List, Literal, Tuple, TypeVar
+import threading
+from typing import Annotated, Any, AsyncGenerator, Callable, Dict, List, Literal, Tuple, TypeVar
 from unittest.mock import MagicMock
 
 import httpx
@@ -23,7 +24,11 @@
 )
 from autogen_core.models._model_client import ModelFamily
 from autogen_core.tools import BaseTool, FunctionTool
-from autogen_ext.models.openai import AzureOpenAIChatCompletionClient, OpenAIChatCompletionClient
+from autogen_ext.models.openai import (
+    AzureOpenAIChatCompletionClient,
+    OpenAIChatCompletionClient,
+    downscale_image_for_vision,
+)
 from autogen_ext.models.openai._model_info import resolve_model
 from autogen_ext.models.openai._openai_client import (
     BaseOpenAIChatCompletionClient,
@@ -59,7 +64,8 @@
 )
 from openai.types.chat.parsed_chat_completion import ParsedChatCompletion, ParsedChatCompletionMessage, ParsedChoice
 from openai.types.chat.parsed_function_tool_call import ParsedFunction, ParsedFunctionToolCall
-from openai.types.completion_usage import CompletionUsage
+from openai.types.completion_usage import CompletionUsage, PromptTokensDetails
+from PIL import Image as PILImage
 from pydantic import BaseModel, Field
 
 ResponseFormatT = TypeVar("ResponseFormatT", bound=BaseModel)
@@ -409,6 +415,62 @@ def tool2(test1: int, test2: List[int]) -> str:
     assert remaining_tokens
 
 
+@pytest.mark.asyncio
+async def test_openai_chat_completion_client_acount_tokens() -> None:
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+
+    def tool1(test: str, test2: str) -> str:
+        return test + test2
+
+    tools = [FunctionTool(tool1, description="example tool 1")]
+    small: List[LLMMessage] = [SystemMessage(content="Hello"), UserMessage(content="Hello", source="user")]
+    # Large enough to be encoded on a worker thread
+    large: List[LLMMessage] = small + [
+        UserMessage(content=f"Paragraph {i}: " + "the quick brown fox jumps over the lazy dog " * 50, source="user")
+        for i in range(20)
+    ]
+    for messages in (small, large):
+        assert await client.acount_tokens(messages, tools=tools) == client.count_tokens(messages, tools=tools)
+        assert await client.aremaining_tokens(messages, tools=tools) == client.remaining_tokens(messages, tools=tools)
+
+
+@pytest.mark.asyncio
+async def test_openai_chat_completion_client_acount_tokens_off_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Large contexts are encoded on a worker thread, so concurrent sessions do not block the event loop."""
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+    messages: List[LLMMessage] = [
+        UserMessage(
+            content=f"Message {i}: " + "lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 400, source="user"
+        )
+        for i in range(40)
+    ]
+    num_sessions = 4
+    loop_thread = threading.get_ident()
+    encode_threads: List[int] = []
+    to_thread = asyncio.to_thread
+
+    async def spy_to_thread(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        def run() -> Any:
+            encode_threads.append(threading.get_ident())
+            return func(*args, **kwargs)
+
+        return await to_thread(run)
+
+    monkeypatch.setattr(asyncio, "to_thread", spy_to_thread)
+
+    sync_counts = [client.count_tokens(messages) for _ in range(num_sessions)]
+    assert encode_threads == []
+    async_counts = await asyncio.gather(*[client.acount_tokens(messages) for _ in range(num_sessions)])
+    assert sync_counts == list(async_counts)
+    assert sync_counts[0] > 100_000
+    assert len(encode_threads) == num_sessions
+    assert loop_thread not in encode_threads
+
+    # Small contexts are still counted inline.
+    await client.acount_tokens([UserMessage(content="Hello", source="user")])
+    assert len(encode_threads) == num_sessions
+
+
 @pytest.mark.parametrize(
     "mock_size, expected_num_tokens",
     [
@@ -426,12 +488,33 @@ def test_openai_count_image_tokens(mock_size: Tuple[int, int], expected_num_toke
 
     mock_image = MagicMock()
     mock_image.image = mock_image_attr
+    # The size is read from the image header, without decoding the image.
+    mock_image.size = mock_size
 
     # Directly call calculate_vision_tokens and check the result
     calculated_tokens = calculate_vision_tokens(mock_image, detail="auto")
     assert calculated_tokens == expected_num_tokens
 
 
+def test_openai_downscale_image_for_vision() -> None:
+    image = Image.from_pil(PILImage.new("RGB", (3840, 2160), "white"))
+    # The model would scale the image to 1365x768, so the image is sent at that size.
+    scaled = downscale_image_for_vision(image)
+    assert scaled.size == (1365, 768)
+    assert calculate_vision_tokens(scaled) == calculate_vision_tokens(image) == 1105
+    assert downscale_image_for_vision(scaled) is scaled
+    assert downscale_image_for_vision(image, detail="low").size == (512, 288)
+
+    # A token budget drops columns of tiles: 3x2 tiles, then 2x2 tiles, then 2x1 tiles.
+    budgeted = downscale_image_for_vision(image, max_tokens=765)
+    assert budgeted.size == (1024, 576)
+    assert calculate_vision_tokens(budgeted) == 765
+    budgeted = downscale_image_for_vision(image, max_tokens=600)
+    assert calculate_vision_tokens(budgeted) <= 600
+    # The budget cannot go below a single tile.
+    assert calculate_vision_tokens(downscale_image_for_vision(image, max_tokens=1)) == 255
+
+
 def test_convert_tools_accepts_both_func_tool_and_schema() -> None:
     def my_function(arg: str, other: Annotated[int, "int arg"], nonrequired: int = 5) -> MyResult:
         return MyResult(result="test")
@@ -2485,4 +2568,56 @@ async def test_multimodal_message_test(
     _ = await ocr_agent.run(task=multi_modal_message)
 
 
+@pytest.mark.asyncio
+async def test_openai_reuses_converted_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: List[str] = []
+
+    async def _mock_create(*args: Any, **kwargs: Any) -> ChatCompletion:
+        requests.append(json.dumps(kwargs["messages"]))
+        return ChatCompletion(
+            id="id1",
+            choices=[
+                Choice(
+                    finish_reason="stop",
+                    index=0,
+                    message=ChatCompletionMessage(content="Hello", role="assistant"),
+                )
+            ],
+            created=0,
+            model="gpt-4o-2024-08-06",
+            object="chat.completion",
+            usage=CompletionUsage(
+                prompt_tokens=100,
+                completion_tokens=5,
+                total_tokens=105,
+                prompt_tokens_details=PromptTokensDetails(cached_tokens=80 if requests[1:] else None),
+            ),
+        )
+
+    monkeypatch.setattr(AsyncCompletions, "create", _mock_create)
+    client = OpenAIChatCompletionClient(model="gpt-4o-2024-08-06", api_key="api_key")
+    history: List[LLMMessage] = [
+        SystemMessage(content="You are a helpful assistant."),
+        UserMessage(content="Hello", source="user"),
+    ]
+    result = await client.create(history)
+    assert isinstance(result.content, str)
+    history.append(AssistantMessage(content=result.content, source="assistant"))
+    history.append(UserMessage(content="How are you?", source="user"))
+    await client.create(history)
+
+    # The conversation prefix is serialized identically, and only the new messages are converted.
+    assert requests[1].startswith(requests[0][:-1])
+    stats = client.prompt_cache_stats
+    assert (stats.conversion_hits, stats.conversion_misses) == (2, 4)
+    assert stats.prompt_tokens == 200
+    assert stats.cached_prompt_tokens == 80
+    assert stats.cached_token_ratio == 0.4
+
+    # Replacing the content of a message invalidates its conversion.
+    history[1].content = "Hi"
+    await client.create(history)
+    assert json.loads(requests[2])[1]["content"] == "Hi"
+
+
 # TODO: add integration tests for Azure OpenAI using AAD token.
@@ -0,0 +1,268 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, AsyncGenerator, Generator, List
+
+import pytest
+from autogen_core import CancellationToken
+from autogen_core.models import ChatCompletionClient, CreateResult, RequestUsage, UserMessage
+from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogen_ext.models.rate_limit import AdaptiveConcurrencyLimiter, RateLimitedChatCompletionClient
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+class _FakeOpenAIServer:
+    """A local OpenAI-compatible server that throttles requests above a concurrency capacity."""
+
+    def __init__(self, capacity: int, latency: float) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttled = 0
+        self.completed = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                with server.lock:
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    throttled = server.in_flight > server.capacity
+                    if throttled:
+                        server.throttled += 1
+                try:
+                    if throttled:
+                        self._send(429, {"error": {"message": "Rate limit exceeded", "type": "rate_limit_exceeded"}})
+                        return
+                    time.sleep(server.latency)
+                    with server.lock:
+                        server.completed += 1
+                    self._send(
+                        200,
+                        {
+                            "id": "chatcmpl-1",
+                            "object": "chat.completion",
+                            "created": 0,
+                            "model": "gpt-4o-2024-08-06",
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {"role": "assistant", "content": "Hello"},
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                            "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+                        },
+                    )
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+
+            def _send(self, status: int, body: Any) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        class Server(ThreadingHTTPServer):
+            # The default backlog of 5 drops connections when many requests start at once.
+            request_queue_size = 128
+
+        self.httpd = Server(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "_FakeOpenAIServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_server() -> Generator[_FakeOpenAIServer, None, None]:
+    with _FakeOpenAIServer(capacity=4, latency=0.05) as server:
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_adapts_to_throttling(fake_server: _FakeOpenAIServer) -> None:
+    openai_client = OpenAIChatCompletionClient(
+        model="gpt-4o", api_key="api_key", base_url=fake_server.base_url, max_retries=0
+    )
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=16)
+    client = RateLimitedChatCompletionClient(openai_client, limiter=limiter, max_retries=10, retry_backoff=0.01)
+
+    results = await asyncio.gather(
+        *[client.create([UserMessage(content=f"Request {i}", source="user")]) for i in range(40)]
+    )
+
+    assert all(result.content == "Hello" for result in results)
+    assert fake_server.completed == 40
+    stats = client.stats
+    assert stats.throttled == fake_server.throttled > 0
+    assert stats.decreases >= 1
+    assert stats.limit < 16
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+    assert stats.requests == 40 + stats.throttled
+    assert stats.max_queue_wait >= stats.mean_queue_wait > 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_raises_after_retries(fake_server: _FakeOpenAIServer) -> None:
+    fake_server.capacity = 0
+    openai_client = OpenAIChatCompletionClient(
+        model="gpt-4o", api_key="api_key", base_url=fake_server.base_url, max_retries=0
+    )
+    client = RateLimitedChatCompletionClient(openai_client, max_retries=2, retry_backoff=0.01)
+    with pytest.raises(Exception) as excinfo:
+        await client.create([UserMessage(content="Hello", source="user")])
+    assert getattr(excinfo.value, "status_code", None) == 429
+    assert client.stats.throttled == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_limiter_priority_lanes() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    order: List[str] = []
+
+    first = await limiter.acquire()
+
+    async def request(name: str, priority: int) -> None:
+        permit = await limiter.acquire(priority=priority)
+        order.append(name)
+        await limiter.release(permit, latency=0.01)
+
+    tasks = [
+        asyncio.create_task(request("background-1", 10)),
+        asyncio.create_task(request("background-2", 10)),
+        asyncio.create_task(request("interactive", 0)),
+    ]
+    await asyncio.sleep(0.01)
+    assert limiter.stats.queued == 3
+    await limiter.release(first, latency=0.01)
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "background-1", "background-2"]
+
+
+@pytest.mark.asyncio
+async def test_limiter_aimd() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, min_concurrency=2, latency_target=1.0)
+    permits = [await limiter.acquire() for _ in range(8)]
+    # Several throttled requests from the same round only decrease the limit once.
+    for permit in permits[:4]:
+        await limiter.release(permit, throttled=True)
+    assert limiter.limit == 4
+    assert limiter.stats.decreases == 1
+    # Successful requests increase the limit additively.
+    for permit in permits[4:]:
+        await limiter.release(permit, latency=0.1)
+    assert 4 < limiter.limit < 5
+    # Requests admitted after the decrease can decrease it again, down to the minimum.
+    for _ in range(3):
+        permit = await limiter.acquire()
+        await limiter.release(permit, latency=2.0)
+    assert limiter.limit == 2
+    assert limiter.stats.slow == 3
+    assert limiter.stats.decreases == 3
+    for _ in range(2):
+        permit = await limiter.acquire()
+        await limiter.release(permit, latency=0.1)
+    assert 2 < limiter.limit < 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_token_budget() -> None:
+    # 600 tokens per minute refill at 10 tokens per second.
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, tokens_per_minute=600)
+    permit = await limiter.acquire(tokens=600)
+    # Reported usage below the estimate returns tokens to the budget.
+    await limiter.release(permit, latency=0.01, tokens_used=595)
+    start = time.monotonic()
+    permit = await limiter.acquire(tokens=10)
+    assert 0.4 < time.monotonic() - start < 2
+    await limiter.release(permit, latency=0.01, tokens_used=10)
+    assert limiter.stats.token_budget_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_cancellation_while_queued() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    client = RateLimitedChatCompletionClient(ReplayChatCompletionClient(["Hello"]), limiter=limiter)
+    permit = await limiter.acquire()
+    cancellation_token = CancellationToken()
+    task = asyncio.create_task(
+        client.create([UserMessage(content="Hello", source="user")], cancellation_token=cancellation_token)
+    )
+    await asyncio.sleep(0.01)
+    assert limiter.stats.queued == 1
+    cancellation_token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.stats.queued == 0
+    await limiter.release(permit)
+    result = await client.create([UserMessage(content="Hello", source="user")])
+    assert result.content == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_stream() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    client = RateLimitedChatCompletionClient(ReplayChatCompletionClient(["Hello world"]), limiter=limiter)
+    stream: AsyncGenerator[str | CreateResult, None] = client.create_stream(
+        [UserMessage(content="Hello", source="user")]
+    )
+    chunks = [chunk async for chunk in stream]
+    assert isinstance(chunks[-1], CreateResult)
+    assert chunks[-1].content == "Hello world"
+    assert limiter.stats.in_flight == 0
+    assert limiter.stats.requests == 1
+
+
+class _BrokenStreamClient(ReplayChatCompletionClient):
+    """Streams one chunk, then fails."""
+
+    async def create_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[str | CreateResult, None]:
+        yield "Hello"
+        raise RuntimeError("Connection reset")
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_client_broken_stream() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, initial_concurrency=2)
+    client = RateLimitedChatCompletionClient(_BrokenStreamClient(["Hello world"]), limiter=limiter)
+    chunks: List[str | CreateResult] = []
+    with pytest.raises(RuntimeError):
+        async for chunk in client.create_stream([UserMessage(content="Hello", source="user")]):
+            chunks.append(chunk)
+    assert chunks == ["Hello"]
+    # The slot is released as a failed request, which does not raise the limit
+    assert limiter.stats.in_flight == 0
+    assert limiter.limit == 2
+
+
+def test_rate_limited_client_component() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, tokens_per_minute=1000, latency_target=5)
+    client = RateLimitedChatCompletionClient(
+        ReplayChatCompletionClient(["Hello"]), limiter=limiter, priority=3, max_retries=1
+    )
+    loaded = ChatCompletionClient.load_component(client.dump_component())
+    assert isinstance(loaded, RateLimitedChatCompletionClient)
+    assert loaded.priority == 3
+    assert loaded.limiter.to_config() == limiter.to_config()
+    assert loaded.total_usage() == RequestUsage(prompt_tokens=0, completion_tokens=0)
@@ -0,0 +1,176 @@
+import asyncio
+import math
+from typing import Any, AsyncGenerator, List, Optional, Sequence, Union
+
+import pytest
+from autogen_core import CancellationToken
+from autogen_core.models import ChatCompletionClient, CreateResult, LLMMessage, UserMessage
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from autogen_ext.models.routing import LatencyHistogram, RoutingChatCompletionClient
+
+
+class _SlowReplayClient(ReplayChatCompletionClient):
+    """A replay client that waits `delays[i]` seconds before the i-th response, or raises if the delay is None."""
+
+    def __init__(self, chat_completions: Sequence[str], delays: List[Optional[float]]) -> None:
+        super().__init__(chat_completions)
+        self.delays = delays
+        self.calls = 0
+        self.cancelled = 0
+
+    async def _wait(self, cancellation_token: Optional[CancellationToken]) -> None:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        if delay is None:
+            raise RuntimeError("Backend unavailable")
+        future = asyncio.ensure_future(asyncio.sleep(delay))
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+    async def create(
+        self, messages: Sequence[LLMMessage], *, cancellation_token: Optional[CancellationToken] = None, **kwargs: Any
+    ) -> CreateResult:
+        await self._wait(cancellation_token)
+        return await super().create(messages, cancellation_token=cancellation_token, **kwargs)
+
+    async def create_stream(
+        self, messages: Sequence[LLMMessage], *, cancellation_token: Optional[CancellationToken] = None, **kwargs: Any
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        await self._wait(cancellation_token)
+        async for chunk in super().create_stream(messages, cancellation_token=cancellation_token, **kwargs):
+            yield chunk
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram(max_samples=100)
+    assert histogram.percentile(50) is None
+    for _ in range(90):
+        histogram.record(0.1)
+    for _ in range(9):
+        histogram.record(2.0)
+    assert 0.1 <= histogram.percentile(50) < 0.12  # type: ignore[operator]
+    assert 2.0 <= histogram.percentile(95) < 2.4  # type: ignore[operator]
+    # Recording the 100th sample halves the counts.
+    histogram.record(10_000)
+    assert histogram.count == 50
+    assert histogram.percentile(100) == math.inf
+
+
+@pytest.mark.asyncio
+async def test_routing_client_hedges_slow_request() -> None:
+    slow = _SlowReplayClient(["slow"] * 10, delays=[5.0])
+    fast = _SlowReplayClient(["fast"] * 10, delays=[0.01])
+    client = RoutingChatCompletionClient([slow, fast], initial_hedge_delay=0.05)
+
+    result = await client.create([UserMessage(content="Hello", source="user")])
+    assert result.content == "fast"
+    await asyncio.sleep(0)
+    assert slow.cancelled == 1
+    assert client.stats.hedged == 1
+    assert client.stats.hedge_wins == 1
+    backend_stats = client.backend_stats
+    assert backend_stats[0].cancelled == 1
+    assert backend_stats[1].wins == 1
+
+
+@pytest.mark.asyncio
+async def test_routing_client_routes_to_fastest_backend() -> None:
+    slow = _SlowReplayClient(["slow"] * 10, delays=[0.05])
+    fast = _SlowReplayClient(["fast"] * 10, delays=[0.001])
+    client = RoutingChatCompletionClient([slow, fast], min_samples=2, max_hedges=0)
+
+    results = [await client.create([UserMessage(content="Hello", source="user")]) for _ in range(6)]
+    # Each backend is measured first, then the fastest one is used.
+    assert [result.content for result in results] == ["slow", "slow", "fast", "fast", "fast", "fast"]
+    assert client.stats.hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_routing_client_hedges_after_percentile() -> None:
+    primary = _SlowReplayClient(["primary"] * 10, delays=[0.001, 0.001, 5.0])
+    secondary = _SlowReplayClient(["secondary"] * 10, delays=[0.05])
+    client = RoutingChatCompletionClient([primary, secondary], min_samples=2, max_samples=20, hedge_percentile=90)
+
+    results = [await client.create([UserMessage(content="Hello", source="user")]) for _ in range(4)]
+    assert [result.content for result in results] == ["primary", "primary", "secondary", "secondary"]
+    assert client.stats.hedged == 0
+    # The primary is the fastest backend, but its next response is slower than its 90th percentile.
+    result = await client.create([UserMessage(content="Hello", source="user")])
+    assert result.content == "secondary"
+    assert client.stats.hedge_wins == 1
+    await asyncio.sleep(0)
+    assert primary.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_routing_client_fails_over_and_marks_unhealthy() -> None:
+    broken = _SlowReplayClient(["broken"] * 10, delays=[None])
+    healthy = _SlowReplayClient(["healthy"] * 10, delays=[0.001])
+    client = RoutingChatCompletionClient([broken, healthy], max_failures=2, cooldown=60)
+
+    for _ in range(3):
+        result = await client.create([UserMessage(content="Hello", source="user")])
+        assert result.content == "healthy"
+    assert broken.calls == 2
+    assert client.stats.failovers == 2
+    assert [stats.healthy for stats in client.backend_stats] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_routing_client_raises_when_all_backends_fail() -> None:
+    client = RoutingChatCompletionClient(
+        [_SlowReplayClient(["a"], delays=[None]), _SlowReplayClient(["b"], delays=[None])]
+    )
+    with pytest.raises(RuntimeError, match="Backend unavailable"):
+        await client.create([UserMessage(content="Hello", source="user")])
+    assert client.stats.failovers == 1
+
+
+@pytest.mark.asyncio
+async def test_routing_client_cancellation() -> None:
+    backends = [_SlowReplayClient(["a"], delays=[5.0]), _SlowReplayClient(["b"], delays=[5.0])]
+    client = RoutingChatCompletionClient(backends, initial_hedge_delay=0.01)
+    cancellation_token = CancellationToken()
+    task = asyncio.create_task(
+        client.create([UserMessage(content="Hello", source="user")], cancellation_token=cancellation_token)
+    )
+    await asyncio.sleep(0.05)
+    cancellation_token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert [backend.cancelled for backend in backends] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_routing_client_stream() -> None:
+    slow = _SlowReplayClient(["slow stream"] * 10, delays=[5.0])
+    fast = _SlowReplayClient(["fast stream"] * 10, delays=[0.01])
+    client = RoutingChatCompletionClient([slow, fast], initial_hedge_delay=0.05)
+
+    chunks = [chunk async for chunk in client.create_stream([UserMessage(content="Hello", source="user")])]
+    assert chunks[:-1] == ["fast ", "stream"]
+    assert isinstance(chunks[-1], CreateResult)
+    assert chunks[-1].content == "fast stream"
+    await client.close()
+    assert slow.cancelled == 1
+    assert client.stats.hedge_wins == 1
+    assert client.total_usage() == fast.total_usage()
+
+
+def test_routing_client_component() -> None:
+    client = RoutingChatCompletionClient(
+        [ReplayChatCompletionClient(["a"]), ReplayChatCompletionClient(["b"])],
+        initial_hedge_delay=2.0,
+        max_hedges=1,
+        cooldown=10,
+    )
+    loaded = ChatCompletionClient.load_component(client.dump_component())
+    assert isinstance(loaded, RoutingChatCompletionClient)
+    assert len(loaded.clients) == 2
+    assert loaded.dump_component() == client.dump_component()
@@ -1,4 +1,10 @@
+import gc
+import pickle
+from typing import List
+
 import pytest
+from autogen_core.models import LLMMessage, UserMessage
+from autogen_ext.models._utils.message_cache import MessageConversionCache
 from autogen_ext.models._utils.parse_r1_content import parse_r1_content
 
 
@@ -41,3 +47,44 @@ def test_parse_r1_content() -> None:
         thought, content = parse_r1_content(content)
         assert thought is None
         assert content == "</think>Hello, <think>world"
+
+
+def test_message_conversion_cache() -> None:
+    cache: MessageConversionCache[str] = MessageConversionCache(max_messages=2)
+    conversions: List[LLMMessage] = []
+
+    def convert(message: LLMMessage) -> str:
+        conversions.append(message)
+        return str(message.content)
+
+    message = UserMessage(content=["Hello", "world"], source="user")
+    first = cache.get_or_convert(message, "gpt-4o", convert)
+    assert cache.get_or_convert(message, "gpt-4o", convert) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Conversions are keyed by the conversion options.
+    cache.get_or_convert(message, "claude", convert)
+    assert cache.misses == 2
+
+    # Replacing a field or changing the content list invalidates the conversion.
+    assert isinstance(message.content, list)
+    message.content.append("again")
+    assert cache.get_or_convert(message, "gpt-4o", convert) == "['Hello', 'world', 'again']"
+    message.source = "other"
+    cache.get_or_convert(message, "gpt-4o", convert)
+    assert cache.misses == 4
+
+    # Least recently used messages are evicted.
+    other_messages = [UserMessage(content=str(i), source="user") for i in range(2)]
+    for other_message in other_messages:
+        cache.get_or_convert(other_message, "gpt-4o", convert)
+    assert len(cache) == 2
+    cache.get_or_convert(message, "gpt-4o", convert)
+    assert cache.misses == 7
+
+    # Entries are removed when their message is collected.
+    del other_messages, other_message, conversions[:]
+    gc.collect()
+    assert len(cache) == 1
+
+    restored = pickle.loads(pickle.dumps(cache))
+    assert len(restored) == 0
@@ -0,0 +1,95 @@
+import pickle
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pytest
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo, MemoryBank, MemoryBankConfig
+from autogen_ext.experimental.task_centric_memory._sqlite_map import SqliteMap
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+
+def test_sqlite_map(tmp_path: Path) -> None:
+    path = str(tmp_path / "map.sqlite")
+    store: SqliteMap[Memo] = SqliteMap(path, encode=lambda memo: [memo.task, memo.insight], decode=lambda v: Memo(*v))
+    store["1"] = Memo(task="Task 1", insight="Insight 1")
+    store["2"] = Memo(task=None, insight="Insight 2")
+    store["1"] = Memo(task="Task 1", insight="Revised insight 1")
+    assert len(store) == 2
+    store.commit()
+    # Changes after the last commit are not saved.
+    store["3"] = Memo(task=None, insight="Insight 3")
+    store.connection.close()
+
+    store = SqliteMap(path, encode=lambda memo: [memo.task, memo.insight], decode=lambda v: Memo(*v))
+    assert len(store) == 2
+    assert "3" not in store
+    assert store["1"] == Memo(task="Task 1", insight="Revised insight 1")
+    assert sorted(store) == ["1", "2"]
+    del store["2"]
+    assert dict(store.items()) == {"1": Memo(task="Task 1", insight="Revised insight 1")}
+    store.clear()
+    assert len(store) == 0
+    store.close()
+
+
+def test_memory_bank_migrates_pickles(tmp_path: Path) -> None:
+    memory_dir = tmp_path / "memory_bank"
+    (memory_dir / "string_map").mkdir(parents=True)
+    memos = {"1": Memo(task="What color do I like?", insight="Deep blue"), "2": Memo(task=None, insight="Cyan")}
+    with open(memory_dir / "uid_memo_dict.pkl", "wb") as f:
+        pickle.dump(memos, f)
+    string_pairs = {"1": ("colors", "1"), "2": ("favorite colors", "2")}
+    with open(memory_dir / "string_map" / "uid_text_dict.pkl", "wb") as f:
+        pickle.dump(string_pairs, f)
+
+    memory_bank = MemoryBank(reset=False, config={"path": str(memory_dir)})
+    assert memory_bank.contains_memos()
+    assert memory_bank.last_memo_id == 2
+    assert dict(memory_bank.uid_memo_dict.items()) == memos
+    assert dict(memory_bank.string_map.uid_text_dict.items()) == string_pairs
+    assert not (memory_dir / "uid_memo_dict.pkl").exists()
+    assert (memory_dir / "uid_memo_dict.pkl.migrated").exists()
+
+    # The migrated memos are loaded from the new store.
+    memory_bank = MemoryBank(reset=False, config={"path": str(memory_dir)})
+    assert memory_bank.uid_memo_dict["1"] == memos["1"]
+    assert memory_bank.string_map.last_string_pair_id == 2
+
+    memory_bank = MemoryBank(reset=True, config={"path": str(memory_dir)})
+    assert not memory_bank.contains_memos()
+    assert len(memory_bank.string_map.uid_text_dict) == 0
+
+
+def _embed(self: Any, input: List[str]) -> List[Any]:
+    # A deterministic stand-in for the default embedding model, which is downloaded on first use.
+    return [np.array([float(len(text)), 10.0 * (sum(map(ord, text)) % 97), 1.0], dtype=np.float32) for text in input]
+
+
+def test_memory_bank_restarts_after_unsaved_memos(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DefaultEmbeddingFunction, "__call__", _embed)
+    config: MemoryBankConfig = {"path": str(tmp_path / "memory_bank"), "save_interval": 10}
+    memory_bank = MemoryBank(reset=True, config=config)
+    memory_bank.add_memo("Insight A", ["topic a"])
+    memory_bank.save_memos()
+    memory_bank.add_memo("Insight B", ["topic b"])
+    # The app crashes before the second memo is saved, so only the vector DB holds its topic.
+    memory_bank._finalizer.detach()  # pyright: ignore[reportPrivateUsage]
+    memory_bank.uid_memo_dict.connection.close()
+    memory_bank.string_map.uid_text_dict.connection.close()
+
+    memory_bank = MemoryBank(reset=False, config=config)
+    assert memory_bank.string_map.vec_db.get(include=[])["ids"] == ["1"]
+    assert (memory_bank.last_memo_id, memory_bank.string_map.last_string_pair_id) == (1, 2)
+    memory_bank.add_memo("Insight C", ["topic c"])
+    # Closing the memory bank saves the memos added since the last save.
+    memory_bank.close()
+
+    memory_bank = MemoryBank(reset=False, config=config)
+    assert dict(memory_bank.uid_memo_dict.items()) == {
+        "1": Memo(task=None, insight="Insight A"),
+        "2": Memo(task=None, insight="Insight C"),
+    }
+    assert memory_bank.get_relevant_memos(["topic c"]) == [Memo(task=None, insight="Insight C")]
+    assert memory_bank.get_relevant_memos(["topic b"]) == []
+    memory_bank.close()
@@ -0,0 +1,99 @@
+import asyncio
+from pathlib import Path
+from typing import Any, List, Sequence
+
+import pytest
+from autogen_core.models import CreateResult, LLMMessage, RequestUsage
+from autogen_ext.experimental.task_centric_memory import MemoryController
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo
+from autogen_ext.experimental.task_centric_memory.utils import ChatCompletionClientRecorder, PageLogger
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+class _ValidatingClient(ReplayChatCompletionClient):
+    """Validates every insight that contains the word 'useful', and tracks the concurrent calls."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+        self.insights: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, messages: Sequence[LLMMessage], **kwargs: Any) -> CreateResult:
+        insight = messages[-1].content[-1]
+        assert isinstance(insight, str)
+        self.insights.append(insight)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later insights finish first, so concurrent calls complete out of order
+        await asyncio.sleep(0.05 / (len(self.insights) + 1))
+        self.in_flight -= 1
+        return CreateResult(
+            finish_reason="stop",
+            content="1" if "useful" in insight else "0",
+            usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+            cached=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_validate_memos_concurrently(tmp_path: Path) -> None:
+    client = _ValidatingClient()
+    memory_controller = MemoryController(
+        reset=True,
+        client=client,
+        config={
+            "max_memos_to_retrieve": 3,
+            "max_concurrent_validations": 2,
+            "MemoryBank": {"path": str(tmp_path / "memory_bank")},
+        },
+        logger=PageLogger(),
+    )
+    insights = ["useful 0", "not 1", "useful 2", "not 3", "useful 4", "useful 5", "useful 6"]
+    memos = [Memo(task=None, insight=insight) for insight in insights]
+
+    validated = await memory_controller._validate_memos(memos, "task", "generalized task")  # pyright: ignore[reportPrivateUsage]
+    # The first three memos to pass are returned in order, and the memos after them are not validated.
+    assert [memo.insight for memo in validated] == ["useful 0", "useful 2", "useful 4"]
+    assert client.insights == insights[:5]
+    assert client.max_in_flight == 2
+
+    # The verdicts are reused for the same generalized task.
+    client.insights.clear()
+    validated = await memory_controller._validate_memos(memos, "task", "generalized task")  # pyright: ignore[reportPrivateUsage]
+    assert [memo.insight for memo in validated] == ["useful 0", "useful 2", "useful 4"]
+    assert client.insights == []
+    validated = await memory_controller._validate_memos(memos[:2], "task", "other task")  # pyright: ignore[reportPrivateUsage]
+    assert [memo.insight for memo in validated] == ["useful 0"]
+    assert client.insights == insights[:2]
+
+
+@pytest.mark.asyncio
+async def test_validate_memos_with_recorder(tmp_path: Path) -> None:
+    insights = ["useful 0", "not 1", "useful 2", "not 3", "useful 4"]
+    memos = [Memo(task=None, insight=insight) for insight in insights]
+    session_file_path = str(tmp_path / "session.json")
+
+    async def validate(client: ChatCompletionClientRecorder) -> List[str]:
+        memory_controller = MemoryController(
+            reset=True,
+            client=client,
+            config={
+                "max_memos_to_retrieve": 3,
+                "max_concurrent_validations": 4,
+                "MemoryBank": {"path": str(tmp_path / "memory_bank")},
+            },
+            logger=PageLogger(),
+        )
+        validated = await memory_controller._validate_memos(memos, "task", "generalized task")  # pyright: ignore[reportPrivateUsage]
+        client.finalize()
+        return [memo.insight for memo in validated]
+
+    # Validations are recorded one at a time, in the order they are made
+    client = _ValidatingClient()
+    assert await validate(ChatCompletionClientRecorder(client, "record", session_file_path)) == insights[::2]
+    assert client.max_in_flight == 1
+
+    # So replaying the session matches every call in order
+    replayed = await validate(ChatCompletionClientRecorder(_ValidatingClient(), "replay", session_file_path))
+    assert replayed == insights[::2]
@@ -0,0 +1,110 @@
+import io
+from pathlib import Path
+from typing import List
+
+from autogen_core import Image
+from autogen_core.models import CreateResult, LLMMessage, RequestUsage, SystemMessage, UserMessage
+from autogen_ext.experimental.task_centric_memory.utils import PageLogger, render_page_log
+from PIL import Image as PILImage
+
+
+def _create_result(content: str) -> CreateResult:
+    return CreateResult(
+        finish_reason="stop",
+        content=content,
+        usage=RequestUsage(prompt_tokens=12, completion_tokens=3),
+        cached=False,
+    )
+
+
+def _jpeg_bytes() -> bytes:
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (8, 8), "red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _run(logger: PageLogger, num_calls: int, image_data: bytes) -> None:
+    logger.enter_function()
+    logger.info("Starting the run.")
+    logger.debug("Some details.")
+    for i in range(num_calls):
+        messages: List[LLMMessage] = [
+            SystemMessage(content="You are a helpful assistant."),
+            UserMessage(content=[f"Question {i}", Image.from_bytes(image_data)], source="User"),
+        ]
+        logger.log_model_call(summary=f"Ask question {i}", input_messages=messages, response=_create_result(f"A{i}"))
+    logger.log_dict_list([{"role": "user", "content": "Hello"}], "message list")
+    logger.leave_function()
+
+
+def test_page_logger_renders_html_from_log(tmp_path: Path) -> None:
+    log_dir = tmp_path / "log"
+    image_data = _jpeg_bytes()
+    logger = PageLogger(config={"level": "DEBUG", "path": str(log_dir)})
+    _run(logger, num_calls=1, image_data=image_data)
+
+    logger.flush()
+    # The HTML pages are only rendered from the log when the logger is finalized.
+    assert [path.name for path in log_dir.glob("*.jsonl")] == ["log-00001.jsonl"]
+    assert not (log_dir / "0  Call Tree.html").exists()
+    logger.finalize()
+
+    call_tree = (log_dir / "0  Call Tree.html").read_text()
+    assert '<a href="1.html">1  _run</a>' in call_tree
+    assert "refresh" not in call_tree
+    function_page = (log_dir / "1.html").read_text()
+    assert "ENTER _run" in function_page
+    assert "Starting the run." in function_page
+    assert "Some details." in function_page
+    assert '<a href="2.html">2  Ask question 0</a>' in function_page
+    assert "LEAVE _run" in function_page
+
+    model_page = (log_dir / "2.html").read_text()
+    assert "12 prompt tokens" in model_page
+    assert "<<<<<  SYSTEM  >>>>>" in model_page
+    assert "Question 0" in model_page
+    assert '<img src="3 image.jpg"' in model_page
+    assert "A0" in model_page
+    # The image is saved as it was encoded.
+    assert (log_dir / "3 image.jpg").read_bytes() == image_data
+    assert '"content": "Hello"' in (log_dir / "4.html").read_text()
+    assert (log_dir / "hash.txt").is_file()
+
+
+def test_page_logger_samples_model_calls(tmp_path: Path) -> None:
+    log_dir = tmp_path / "log"
+    logger = PageLogger(config={"level": "INFO", "path": str(log_dir), "sample_rate": 0.25})
+    _run(logger, num_calls=8, image_data=_jpeg_bytes())
+    logger.finalize()
+
+    function_page = (log_dir / "1.html").read_text()
+    # Every fourth call is logged in full, and the others are summarized on the calling page.
+    assert "Ask question 0: 2 messages, 12 prompt tokens, 3 completion tokens, 2 response characters" in function_page
+    assert "Some details." not in function_page
+    assert len([path for path in log_dir.glob("*.html") if "ASSISTANT RESPONSE" in path.read_text()]) == 2
+    assert len(list(log_dir.glob("* image.jpg"))) == 2
+
+
+def test_page_logger_segments_and_partial_render(tmp_path: Path) -> None:
+    log_dir = tmp_path / "log"
+    logger = PageLogger(
+        config={"level": "INFO", "path": str(log_dir), "max_buffered": 2, "segment_size": 1024, "render_html": False}
+    )
+    logger.enter_function()
+    for i in range(50):
+        logger.info(f"Line {i}")
+
+    # A run in progress can be rendered from the log at any time.
+    logger.flush()
+    assert len(list(log_dir.glob("log-*.jsonl"))) > 1
+    render_page_log(str(log_dir), finished=False)
+    page = (log_dir / "1.html").read_text()
+    assert "Line 49" in page
+    assert "refresh" in page
+
+    logger.leave_function()
+    logger.finalize()
+    render_page_log(str(log_dir))
+    page = (log_dir / "1.html").read_text()
+    assert [line for line in page.split("\n") if line.startswith("Line")] == [f"Line {i}" for i in range(50)]
+    assert "refresh" not in page
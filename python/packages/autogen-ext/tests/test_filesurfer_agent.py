@@ -10,6 +10,7 @@
 from autogen_agentchat import EVENT_LOGGER_NAME
 from autogen_agentchat.messages import TextMessage
 from autogen_ext.agents.file_surfer import FileSurfer
+from autogen_ext.agents.file_surfer._markdown_file_browser import MarkdownFileBrowser
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from openai.resources.chat.completions import AsyncCompletions
 from openai.types.chat.chat_completion import ChatCompletion, Choice
@@ -167,3 +168,73 @@ async def test_file_surfer_serialization() -> None:
 
     # Check that the deserialized agent has the same attributes as the original agent
     assert isinstance(deserialized_agent, FileSurfer)
+
+
+def test_markdown_file_browser_split_and_find(tmp_path: Any) -> None:
+    """Test viewport boundaries and find on page over a document spanning many viewports."""
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    lines = [f"Line {i}: {words[i % len(words)]} {words[(i * 3) % len(words)]}-{i * 7}" for i in range(5000)]
+    lines[1234] = "Line 1234: the needle in the haystack"
+    lines[4321] = "Line 4321: another needle here"
+    test_file = tmp_path / "large.txt"
+    test_file.write_text("\n".join(lines))
+
+    browser = MarkdownFileBrowser(viewport_size=1024, base_path=str(tmp_path))
+    browser.open_path(str(test_file))
+    content = browser.page_content
+
+    # Viewports cover the document contiguously and end on whitespace
+    assert len(browser.viewport_pages) > 50
+    assert browser.viewport_pages[0][0] == 0
+    assert browser.viewport_pages[-1][1] == len(content)
+    for (_, end), (start, _) in zip(browser.viewport_pages, browser.viewport_pages[1:], strict=False):
+        assert end == start
+        assert content[end - 1] in " \t\r\n"
+
+    def page_of(text: str) -> int:
+        offset = content.index(text)
+        return next(i for i, (start, end) in enumerate(browser.viewport_pages) if start <= offset < end)
+
+    first, second = page_of("the needle"), page_of("another needle")
+    viewport = browser.find_on_page("needle")
+    assert viewport is not None and "needle" in viewport
+    assert browser.viewport_current_page == first
+    browser.find_next()
+    assert browser.viewport_current_page == second
+    browser.find_next()
+    assert browser.viewport_current_page == first
+
+    # Phrases, wildcards and misses
+    assert browser.find_on_page("another needle") is not None
+    assert browser.viewport_current_page == second
+    assert browser.find_on_page("hay*") is not None
+    assert browser.viewport_current_page == first
+    assert browser.find_on_page("needle another") is None
+    assert browser.find_on_page("missing") is None
+
+
+def test_markdown_file_browser_document_cache(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unchanged files are not converted again, and changed files are."""
+    test_file = tmp_path / "test.md"
+    test_file.write_text("# Title\n\nFirst version")
+    other_file = tmp_path / "other.md"
+    other_file.write_text("# Other")
+
+    browser = MarkdownFileBrowser(base_path=str(tmp_path))
+    conversions: List[str] = []
+    convert_local = browser._markdown_converter.convert_local  # pyright: ignore[reportPrivateUsage]
+
+    def counting_convert_local(path: str, **kwargs: Any) -> Any:
+        conversions.append(path)
+        return convert_local(path, **kwargs)
+
+    monkeypatch.setattr(browser._markdown_converter, "convert_local", counting_convert_local)  # pyright: ignore[reportPrivateUsage]
+
+    assert "First version" in browser.open_path(str(test_file))
+    browser.open_path(str(other_file))
+    assert "First version" in browser.open_path(str(test_file))
+    assert len(conversions) == 2
+
+    test_file.write_text("# Title\n\nSecond, longer version")
+    assert "Second, longer version" in browser.open_path(str(test_file))
+    assert len(conversions) == 3
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+from typing import List
+
+
+def _imported_modules(statement: str) -> List[str]:
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()
+
+
+def test_openai_client_is_imported_on_first_access() -> None:
+    assert "openai" not in _imported_modules("import autogen_ext.models.openai")
+    assert "openai" not in _imported_modules("from autogen_ext.models.openai.config import CreateArgumentsConfigModel")
+
+    import autogen_ext
+    import autogen_ext.models.openai as openai_models
+
+    assert isinstance(autogen_ext.__version__, str)
+    assert set(openai_models.__all__) <= set(dir(openai_models))
+    for name in openai_models.__all__:
+        assert getattr(openai_models, name) is not None
+    assert openai_models.OpenAIChatCompletionClient.__module__ == "autogen_ext.models.openai._openai_client"
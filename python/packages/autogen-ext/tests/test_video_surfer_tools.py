@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("ffmpeg")
+pytest.importorskip("whisper")
+
+from autogen_ext.agents.video_surfer import tools  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "cache"
+    monkeypatch.setenv("AUTOGEN_VIDEO_SURFER_CACHE_DIR", str(path))
+    monkeypatch.setattr(tools, "_digests", OrderedDict())  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(tools, "_whisper_models", {})  # pyright: ignore[reportPrivateUsage]
+    return path
+
+
+def _rewrite(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_digest_cache(tmp_path: Path) -> None:
+    path = tmp_path / "video.mp4"
+    _rewrite(path, "first", 1_000_000_000)
+    digest = tools._file_digest(str(path))  # pyright: ignore[reportPrivateUsage]
+
+    # Same size and modification time: the memoized digest is returned without rehashing
+    _rewrite(path, "other", 1_000_000_000)
+    assert tools._file_digest(str(path)) == digest  # pyright: ignore[reportPrivateUsage]
+
+    # A new modification time invalidates the entry
+    _rewrite(path, "other", 2_000_000_000)
+    changed = tools._file_digest(str(path))  # pyright: ignore[reportPrivateUsage]
+    assert changed != digest
+
+    # So does a new size
+    _rewrite(path, "longer content", 2_000_000_000)
+    assert tools._file_digest(str(path)) not in (digest, changed)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_file_digest_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_MAX_DIGESTS", 2)
+    paths = [tmp_path / f"video_{i}.mp4" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_bytes(f"video {i}".encode())
+
+    tools._file_digest(str(paths[0]))  # pyright: ignore[reportPrivateUsage]
+    tools._file_digest(str(paths[1]))  # pyright: ignore[reportPrivateUsage]
+    # Using the first entry again makes the second the least recently used one
+    tools._file_digest(str(paths[0]))  # pyright: ignore[reportPrivateUsage]
+    tools._file_digest(str(paths[2]))  # pyright: ignore[reportPrivateUsage]
+
+    cached = {key[0] for key in tools._digests}  # pyright: ignore[reportPrivateUsage]
+    assert cached == {os.path.realpath(paths[0]), os.path.realpath(paths[2])}
+
+
+def test_file_digest_is_thread_safe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tools, "_MAX_DIGESTS", 4)
+    paths = [tmp_path / f"video_{i}.mp4" for i in range(8)]
+    for i, path in enumerate(paths):
+        path.write_bytes(f"video {i}".encode() * 1000)
+    expected = [tools._file_digest(str(path)) for path in paths]  # pyright: ignore[reportPrivateUsage]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: tools._file_digest(str(paths[i % 8])), range(400)))  # pyright: ignore[reportPrivateUsage]
+
+    assert results == [expected[i % 8] for i in range(400)]
+    assert len(tools._digests) <= 4  # pyright: ignore[reportPrivateUsage]
+
+
+def test_extract_audio_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    extracted: List[str] = []
+
+    class FakeStream:
+        def __init__(self, video_path: str) -> None:
+            self.video_path = video_path
+
+        def output(self, path: str, format: str) -> "FakeStream":
+            self.path = path
+            return self
+
+        def run(self, **kwargs: Any) -> None:
+            extracted.append(self.video_path)
+            Path(self.path).write_bytes(Path(self.video_path).read_bytes())
+
+    monkeypatch.setattr(tools.ffmpeg, "input", FakeStream)
+    video = tmp_path / "video.mp4"
+    _rewrite(video, "audio 1", 1_000_000_000)
+
+    tools.extract_audio(str(video), str(tmp_path / "first.mp3"))
+    tools.extract_audio(str(video), str(tmp_path / "second.mp3"))
+    assert extracted == [str(video)]
+    assert (tmp_path / "second.mp3").read_bytes() == b"audio 1"
+
+    _rewrite(video, "audio 2", 2_000_000_000)
+    tools.extract_audio(str(video), str(tmp_path / "third.mp3"))
+    assert len(extracted) == 2
+    assert (tmp_path / "third.mp3").read_bytes() == b"audio 2"
+
+
+class FakeWhisperModel:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def transcribe(self, audio_path: str, **kwargs: Any) -> Dict[str, Any]:
+        with self.lock:
+            self.calls += 1
+        text = Path(audio_path).read_text()
+        return {"segments": [{"start": 0.0, "end": 1.5, "text": text}]}
+
+
+def test_transcript_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    model = FakeWhisperModel()
+    monkeypatch.setattr(tools.whisper, "load_model", lambda name: model)
+    audio = tmp_path / "audio.mp3"
+    _rewrite(audio, "hello", 1_000_000_000)
+
+    assert tools.transcribe_audio_with_timestamps(str(audio)) == "[0.00 - 1.50] hello\n"
+    assert tools.transcribe_audio_with_timestamps(str(audio)) == "[0.00 - 1.50] hello\n"
+    assert model.calls == 1
+
+    _rewrite(audio, "world", 2_000_000_000)
+    assert tools.transcribe_audio_with_timestamps(str(audio)) == "[0.00 - 1.50] world\n"
+    assert model.calls == 2
+
+
+def test_concurrent_transcriptions_load_whisper_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    model = FakeWhisperModel()
+    loads: List[str] = []
+
+    def load_model(name: str) -> FakeWhisperModel:
+        loads.append(name)
+        time.sleep(0.05)
+        return model
+
+    monkeypatch.setattr(tools.whisper, "load_model", load_model)
+    audios = [tmp_path / f"audio_{i}.mp3" for i in range(4)]
+    for i, audio in enumerate(audios):
+        audio.write_text(f"segment {i}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        transcripts = list(
+            executor.map(lambda i: tools.transcribe_audio_with_timestamps(str(audios[i % 4])), range(16))
+        )
+
+    assert loads == [tools.WHISPER_MODEL_NAME]
+    assert transcripts == [f"[0.00 - 1.50] segment {i % 4}\n" for i in range(16)]
+    # Every cache entry is complete, and no temporary files are left behind
+    cached = sorted(path.read_text() for path in Path(os.environ["AUTOGEN_VIDEO_SURFER_CACHE_DIR"]).iterdir())
+    assert cached == sorted(f"[0.00 - 1.50] segment {i}\n" for i in range(4))
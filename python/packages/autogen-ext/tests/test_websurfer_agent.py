@@ -1,8 +1,11 @@
 import asyncio
+import base64
+import io
 import json
 import logging
 from datetime import datetime
-from typing import Any, AsyncGenerator, List
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Tuple
 
 import pytest
 from autogen_agentchat import EVENT_LOGGER_NAME
@@ -10,7 +13,10 @@
     MultiModalMessage,
     TextMessage,
 )
-from autogen_ext.agents.web_surfer import MultimodalWebSurfer
+from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+from autogen_ext.agents.web_surfer._screenshot_pipeline import ScreenshotPipeline
+from autogen_ext.agents.web_surfer._types import DOMRectangle, InteractiveRegion
+from autogen_ext.agents.web_surfer.playwright_controller import PlaywrightController
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from openai.resources.chat.completions import AsyncCompletions
 from openai.types.chat.chat_completion import ChatCompletion, Choice
@@ -18,6 +24,9 @@
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall, Function
 from openai.types.completion_usage import CompletionUsage
+from PIL import Image as PILImage
+from PIL import ImageDraw
+from playwright.async_api import async_playwright
 from pydantic import BaseModel
 
 
@@ -180,3 +189,228 @@ async def test_run_websurfer_declarative(monkeypatch: pytest.MonkeyPatch) -> Non
     loaded_agent = MultimodalWebSurfer.load_component(agent_config)
     assert isinstance(loaded_agent, MultimodalWebSurfer)
     assert loaded_agent.name == "WebSurfer"
+
+
+def _make_region(left: int, top: int, width: int, height: int) -> InteractiveRegion:
+    rect: DOMRectangle = {
+        "x": left,
+        "y": top,
+        "width": width,
+        "height": height,
+        "top": top,
+        "right": left + width,
+        "bottom": top + height,
+        "left": left,
+    }
+    return {"tag_name": "button", "role": "button", "aria_name": "Button", "v_scrollable": False, "rects": [rect]}
+
+
+def _make_screenshot(color: str, size: Tuple[int, int] = (1440, 900)) -> bytes:
+    buffer = io.BytesIO()
+    image = PILImage.new("RGB", size, color)
+    ImageDraw.Draw(image).text((100, 100), "Hello", fill="black")
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_screenshot_pipeline_skips_unchanged_work() -> None:
+    pipeline = ScreenshotPipeline((1224, 765))
+    rects = {"10": _make_region(10, 10, 100, 40), "11": _make_region(10, 2000, 100, 40)}
+    screenshot = _make_screenshot("white")
+
+    som = await pipeline.set_of_mark(screenshot, rects)
+    assert som.visible_rects == ["10"]
+    assert som.rects_below == ["11"]
+    assert som.image.image.size == (1224, 765)
+    assert som.annotated.size == (1440, 900)
+    assert (pipeline.stats.decodes, pipeline.stats.overlays, pipeline.stats.encodes) == (1, 1, 1)
+
+    # Pixel-identical viewport and same regions: nothing is recomputed
+    assert await pipeline.set_of_mark(screenshot, dict(rects)) is som
+    assert pipeline.stats.reused == 1
+    assert (pipeline.stats.decodes, pipeline.stats.overlays, pipeline.stats.encodes) == (1, 1, 1)
+
+    # New regions on the same pixels: the decoded screenshot is reused
+    rects["12"] = _make_region(300, 300, 100, 40)
+    som = await pipeline.set_of_mark(screenshot, rects)
+    assert sorted(som.visible_rects) == ["10", "12"]
+    assert (pipeline.stats.decodes, pipeline.stats.overlays, pipeline.stats.encodes) == (1, 2, 2)
+
+    # New pixels with the same regions: the overlay is reused
+    som = await pipeline.set_of_mark(_make_screenshot("yellow"), rects)
+    assert sorted(som.visible_rects) == ["10", "12"]
+    assert (pipeline.stats.decodes, pipeline.stats.overlays, pipeline.stats.encodes) == (2, 2, 3)
+
+    # PNG observations are passed through without encoding again
+    image = await pipeline.encode(screenshot)
+    assert base64.b64decode(image.to_base64()) == screenshot
+    assert await pipeline.encode(screenshot) is image
+    assert pipeline.stats.encodes == 3
+
+
+@pytest.mark.asyncio
+async def test_screenshot_pipeline_reuses_unchanged_observations() -> None:
+    pipeline = ScreenshotPipeline((1224, 765), image_format="jpeg")
+    screenshot = _make_screenshot("white")
+
+    observation = await pipeline.encode(screenshot)
+    assert pipeline.stats.encodes == 1
+
+    # Encoding a page summary at another size does not evict the observation
+    await pipeline.encode(screenshot, size=(612, 382))
+    assert pipeline.stats.encodes == 2
+
+    # An action that did not change the page gets the same image back, without encoding again
+    assert await pipeline.encode(screenshot) is observation
+    assert pipeline.stats.encodes == 2
+    assert pipeline.stats.reused == 1
+
+    # A changed page is encoded again
+    assert await pipeline.encode(_make_screenshot("yellow")) is not observation
+    assert pipeline.stats.encodes == 3
+
+
+@pytest.mark.asyncio
+async def test_screenshot_pipeline_formats() -> None:
+    rects = {"10": _make_region(10, 10, 100, 40)}
+    # A noisy screenshot, closer to a real page with photos than a blank one
+    buffer = io.BytesIO()
+    PILImage.effect_noise((1440, 900), 64).convert("RGB").save(buffer, format="PNG")
+    screenshot = buffer.getvalue()
+    sizes: Dict[str, int] = {}
+    for image_format, mime_type in (("png", "image/png"), ("jpeg", "image/jpeg")):
+        pipeline = ScreenshotPipeline((1224, 765), image_format=image_format, quality=60)  # type: ignore[arg-type]
+        som = await pipeline.set_of_mark(screenshot, rects)
+        assert som.image.data_uri.startswith(f"data:{mime_type};base64,")
+        sizes[image_format] = len(base64.b64decode(som.image.to_base64()))
+
+        scaled = await pipeline.encode(screenshot, size=(612, 382))
+        assert scaled.data_uri.startswith(f"data:{mime_type};base64,")
+        assert scaled.image.size == (612, 382)
+    assert sizes["jpeg"] < sizes["png"]
+
+    with pytest.raises(ValueError):
+        ScreenshotPipeline((1224, 765), image_format="webp")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        ScreenshotPipeline((1224, 765), quality=0)
+
+
+STATIC_PAGES = [
+    f"""
+<!DOCTYPE html>
+<html><head><title>Page {i}</title></head>
+<body>
+    <h1>Static page {i}</h1>
+    {"".join(f'<p>Paragraph {j} of page {i}. <a href="#p{j}">Link {j}</a> <button>Button {j}</button></p>' for j in range(30))}
+    <input type="text" placeholder="Search page {i}" />
+</body></html>
+"""
+    for i in range(3)
+]
+
+
+@pytest.mark.asyncio
+async def test_screenshot_pipeline_static_pages() -> None:
+    """Benchmark the set-of-mark pipeline against local static pages, revisiting each page several times."""
+    controller = PlaywrightController()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.set_viewport_size({"width": 1440, "height": 900})
+
+        for image_format in ("png", "jpeg"):
+            pipeline = ScreenshotPipeline((1224, 765), image_format=image_format)  # type: ignore[arg-type]
+            for html in STATIC_PAGES:
+                await page.set_content(html)
+                for _ in range(5):
+                    rects = await controller.get_interactive_rects(page)
+                    screenshot = await page.screenshot()
+                    som = await pipeline.set_of_mark(screenshot, rects)
+                    assert len(som.visible_rects) > 0
+            # Each static page is only annotated and encoded once
+            assert pipeline.stats.captures == 15
+            assert pipeline.stats.encodes == len(STATIC_PAGES)
+            assert pipeline.stats.reused == 15 - len(STATIC_PAGES)
+
+        await browser.close()
+
+
+def test_browser_pool_validation() -> None:
+    with pytest.raises(ValueError):
+        BrowserPool(max_browsers=0)
+    with pytest.raises(ValueError):
+        BrowserPool(max_contexts_per_browser=0)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_contexts(tmp_path: Path) -> None:
+    page_path = tmp_path / "page.html"
+    page_path.write_text("<p>Hello</p>")
+    async with BrowserPool(max_browsers=1, max_contexts_per_browser=2) as pool:
+        first = await pool.acquire()
+        second = await pool.acquire()
+        assert first is not second
+        assert pool.stats.browsers == 1
+        assert pool.stats.contexts_in_use == 2
+
+        # The pool is at capacity, so a third agent waits for a release
+        third_task = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.1)
+        assert not third_task.done()
+
+        page = await first.new_page()
+        await page.goto(page_path.as_uri())
+        await page.evaluate("localStorage.setItem('key', 'value')")
+        await first.add_cookies([{"name": "session", "value": "1", "url": "https://example.com"}])
+        await pool.release(first)
+        third = await asyncio.wait_for(third_task, timeout=10)
+        # A fresh context is handed out, without the pages, cookies or storage of the released one
+        assert third is not first
+        assert third.pages == []
+        assert await third.cookies() == []
+        page = await third.new_page()
+        await page.goto(page_path.as_uri())
+        assert await page.evaluate("localStorage.getItem('key')") is None
+        assert pool.stats.recycled_contexts == 1
+
+        # An idle context created with other options makes room for one with the requested options
+        await pool.release(third)
+        assert pool.stats.idle_contexts == 1
+        fourth = await pool.acquire(user_agent="Test agent")
+        page = await fourth.new_page()
+        assert await page.evaluate("navigator.userAgent") == "Test agent"
+        await pool.release(fourth)
+
+        await pool.release(second)
+        with pytest.raises(ValueError):
+            await pool.release(second)
+        assert pool.stats.acquisitions == 4
+        assert pool.stats.contexts_in_use == 0
+        leftover = await pool.acquire()
+    # Releasing a context after the pool was stopped does nothing
+    await pool.release(leftover)
+
+
+@pytest.mark.asyncio
+async def test_run_websurfer_with_browser_pool() -> None:
+    model = "gpt-4o-2024-05-13"
+    async with BrowserPool(max_browsers=1) as pool:
+        surfers = [
+            MultimodalWebSurfer(
+                f"WebSurfer{i}",
+                model_client=OpenAIChatCompletionClient(model=model, api_key=""),
+                browser_pool=pool,
+                start_page="about:blank",
+            )
+            for i in range(3)
+        ]
+        for surfer in surfers:
+            await surfer._lazy_init()  # type: ignore[reportPrivateUsage]
+        assert pool.stats.browsers == 1
+        assert pool.stats.contexts_in_use == 3
+        for surfer in surfers:
+            await surfer.close()
+        assert pool.stats.contexts_in_use == 0
+        assert pool.stats.idle_contexts == 3
@@ -1,5 +1,8 @@
+import asyncio
 import logging
 import os
+import sys
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,7 +10,9 @@
 from autogen_core.tools import Workbench
 from autogen_core.utils import schema_to_pydantic_model
 from autogen_ext.tools.mcp import (
+    McpSessionPool,
     McpWorkbench,
+    PooledMcpWorkbench,
     SseMcpToolAdapter,
     SseServerParams,
     StdioMcpToolAdapter,
@@ -595,3 +600,102 @@ async def test_lazy_init_and_finalize_cleanup() -> None:
     assert workbench._actor._active is True  # type: ignore[reportPrivateUsage]
 
     del workbench
+
+
+_POOL_TEST_SERVER = '''
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("pool-test")
+
+
+@mcp.tool()
+async def sleep_echo(text: str, seconds: float = 0.0) -> str:
+    """Echo the text after sleeping."""
+    await asyncio.sleep(seconds)
+    return text
+
+
+if __name__ == "__main__":
+    mcp.run()
+'''
+
+
+@pytest.fixture
+def pool_server_params(tmp_path: Any) -> StdioServerParams:
+    script = tmp_path / "pool_test_server.py"
+    script.write_text(_POOL_TEST_SERVER)
+    return StdioServerParams(command=sys.executable, args=[str(script)], read_timeout_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_mcp_session_pool_concurrent_calls(pool_server_params: StdioServerParams) -> None:
+    pool = McpSessionPool(pool_server_params, min_sessions=1, max_sessions=3)
+    await pool.start()
+    try:
+        assert pool.stats.size == 1
+        assert pool.stats.idle == 1
+
+        results = await asyncio.gather(
+            *[pool.call_tool("sleep_echo", {"text": str(i), "seconds": 0.2}) for i in range(6)]
+        )
+        assert [result.content[0].text for result in results] == [str(i) for i in range(6)]  # type: ignore[union-attr]
+
+        stats = pool.stats
+        # The pool grows on demand up to max_sessions and keeps the sessions open.
+        assert stats.size == 3
+        assert stats.idle == 3
+        assert stats.acquisitions == 6
+        assert stats.max_wait_time > 0
+        assert stats.tool_calls["sleep_echo"].count == 6
+        assert stats.tool_calls["sleep_echo"].errors == 0
+        assert stats.tool_calls["sleep_echo"].mean_latency >= 0.2
+    finally:
+        await pool.stop()
+    assert pool.stats.size == 0
+
+
+@pytest.mark.asyncio
+async def test_mcp_session_pool_reconnects_broken_session(pool_server_params: StdioServerParams) -> None:
+    pool = McpSessionPool(pool_server_params, min_sessions=1, max_sessions=1)
+    await pool.start()
+    try:
+        # Break the only session by shutting down its transport.
+        broken = pool._idle[0]  # type: ignore[reportPrivateUsage]
+        await broken.close()
+        assert not broken.alive
+
+        result = await pool.call_tool("sleep_echo", {"text": "hello"})
+        assert result.content[0].text == "hello"  # type: ignore[union-attr]
+        assert pool.stats.reconnects == 1
+        assert pool.stats.size == 1
+    finally:
+        await pool.stop()
+    # The broken session was closed in the background, and stop waited for it
+    assert not pool._closing  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_pooled_mcp_workbench(pool_server_params: StdioServerParams) -> None:
+    workbench = PooledMcpWorkbench(pool_server_params, max_sessions=2, health_check_timeout=2)
+    async with workbench:
+        tools = await workbench.list_tools()
+        assert [tool["name"] for tool in tools] == ["sleep_echo"]
+
+        results = await asyncio.gather(*[workbench.call_tool("sleep_echo", {"text": str(i)}) for i in range(4)])
+        assert [result.to_text() for result in results] == ["0", "1", "2", "3"]
+        assert all(not result.is_error for result in results)
+
+        result = await workbench.call_tool("missing_tool", {})
+        assert result.is_error
+        assert workbench.stats.tool_calls["missing_tool"].errors == 1
+
+    config = workbench.dump_component()
+    assert config.provider == "autogen_ext.tools.mcp.PooledMcpWorkbench"
+    assert config.config["health_check_timeout"] == 2
+    async with Workbench.load_component(config) as new_workbench:
+        assert isinstance(new_workbench, PooledMcpWorkbench)
+        assert new_workbench.dump_component().config["health_check_timeout"] == 2
+        result = await new_workbench.call_tool("sleep_echo", {"text": "again"})
+        assert result.to_text() == "again"
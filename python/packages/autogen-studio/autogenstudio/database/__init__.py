@@ -1,5 +1,7 @@
+from .batch_writer import BatchWriter
 from .db_manager import DatabaseManager
 
 __all__ = [
+    "BatchWriter",
     "DatabaseManager",
 ]
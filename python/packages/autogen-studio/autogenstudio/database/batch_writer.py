@@ -0,0 +1,152 @@
+import asyncio
+from typing import List, Optional, Union
+
+from loguru import logger
+
+from ..datamodel import BaseDBModel
+from .db_manager import DatabaseManager
+
+
+class _Flush:
+    """Queue marker asking the writer to write its current batch immediately."""
+
+
+class _Stop:
+    """Queue marker asking the writer to write its current batch and exit."""
+
+
+_QueueItem = Union[BaseDBModel, _Flush, _Stop]
+
+
+class BatchWriter:
+    """
+    Persists append-only records (e.g. streamed messages) from a background task.
+
+    Records are buffered in a bounded queue and written with
+    :meth:`DatabaseManager.bulk_insert` on a worker thread, one transaction per
+    `batch_size` records or per `flush_interval` seconds, whichever comes first.
+    This keeps database round trips off the event loop while a run is streaming.
+    When the buffer is full, :meth:`put` waits for the writer to catch up.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_buffer_size: int = 10000,
+    ) -> None:
+        """
+        Args:
+            db_manager: Database manager used to write the records
+            batch_size: Maximum number of records written in one transaction
+            flush_interval: Maximum time in seconds a record waits for its batch to fill up
+            max_buffer_size: Maximum number of records buffered before `put` blocks
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be non-negative")
+        if max_buffer_size < batch_size:
+            raise ValueError("max_buffer_size must be at least batch_size")
+
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+
+        self._queue: Optional[asyncio.Queue[_QueueItem]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._progress: Optional[asyncio.Condition] = None
+        # Number of records accepted by `put` and number of records handled by the writer (written or failed)
+        self._submitted = 0
+        self._processed = 0
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of records accepted but not yet written"""
+        return self._submitted - self._processed
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=self.max_buffer_size)
+            self._progress = asyncio.Condition()
+            self._task = asyncio.create_task(self._run())
+
+    async def put(self, model: BaseDBModel) -> None:
+        """Buffer a record for writing, waiting if the buffer is full"""
+        self._ensure_started()
+        assert self._queue is not None
+        self._submitted += 1
+        await self._queue.put(model)
+
+    async def flush(self) -> None:
+        """Wait until every record buffered before this call has been written"""
+        if self.pending == 0 or self._task is None:
+            return
+        assert self._queue is not None and self._progress is not None
+        target = self._submitted
+        await self._queue.put(_Flush())
+        async with self._progress:
+            await self._progress.wait_for(lambda: self._processed >= target)
+
+    async def close(self) -> None:
+        """Write all buffered records and stop the background task"""
+        if self._task is None:
+            return
+        assert self._queue is not None
+        task = self._task
+        if not task.done():
+            await self._queue.put(_Stop())
+            await task
+        self._task = None
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        stop = False
+        while not stop:
+            item = await self._queue.get()
+            batch: List[BaseDBModel] = []
+            deadline = loop.time() + self.flush_interval
+            while True:
+                if isinstance(item, _Stop):
+                    stop = True
+                    break
+                if isinstance(item, _Flush):
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                if not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: List[BaseDBModel]) -> None:
+        try:
+            response = await asyncio.to_thread(self.db_manager.bulk_insert, batch)
+            status = response.status
+        except Exception as e:
+            logger.error(f"Error while writing batch of {len(batch)} records: {e}")
+            status = False
+
+        if status:
+            self.written += len(batch)
+        else:
+            self.failed += len(batch)
+
+        assert self._progress is not None
+        async with self._progress:
+            self._processed += len(batch)
+            self._progress.notify_all()
@@ -1,14 +1,16 @@
+import base64
+import binascii
 import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from loguru import logger
 from sqlalchemy import exc, inspect, text
-from sqlmodel import Session, SQLModel, and_, create_engine, select
+from sqlmodel import Session, SQLModel, and_, create_engine, or_, select
 
-from ..datamodel import BaseDBModel, Response, Team
+from ..datamodel import BaseDBModel, Message, Response, Team
 from ..teammanager import TeamManager
 from .schema_manager import SchemaManager
 
@@ -32,7 +34,8 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        # Writes may run on a worker thread (see BatchWriter), so SQLite connections must be shareable.
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -52,6 +55,21 @@ def _should_auto_upgrade(self) -> bool:
         needs_upgrade, _ = self.schema_manager.check_schema_status()
         return needs_upgrade
 
+    def _ensure_indexes(self, table_names: Sequence[str]) -> None:
+        """
+        Create the model indexes missing from existing tables.
+        create_all only adds indexes along with new tables, so databases created
+        before an index was declared would otherwise never get it.
+        """
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            for index in table.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except exc.SQLAlchemyError as e:
+                    logger.warning(f"Could not create index {index.name}: {str(e)}")
+
     def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bool = True) -> Response:
         """
         Initialize database and migrations in the correct order.
@@ -79,6 +97,7 @@ def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bo
                 return Response(message="Failed to initialize migrations", status=False)
 
             # Handle existing database
+            self._ensure_indexes(tables_exist)
             if auto_upgrade or self._should_auto_upgrade():
                 logger.info("Checking database schema...")
                 if self.schema_manager.ensure_schema_up_to_date():
@@ -194,6 +213,33 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def bulk_insert(self, models: Sequence[BaseDBModel]) -> Response:
+        """Insert new entities in a single transaction.
+
+        Unlike :meth:`upsert`, no lookup is done for existing rows and the inserted
+        models are not refreshed, so this is only suitable for append-only records
+        such as streamed messages.
+
+        Args:
+            models (Sequence[SQLModel]): The model instances to insert
+
+        Returns:
+            Response: Contains status, message and the number of inserted rows as data
+        """
+        if not models:
+            return Response(message="Nothing to insert", status=True, data=0)
+
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while inserting {len(models)} rows: {e}")
+                return Response(message=f"Error while inserting rows: {e}", status=False, data=0)
+
+        return Response(message=f"{len(models)} rows inserted successfully", status=True, data=len(models))
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
@@ -231,6 +277,146 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    @staticmethod
+    def encode_cursor(model: BaseDBModel) -> str:
+        """Encode the position of a row as an opaque pagination cursor"""
+        payload = json.dumps([model.created_at.isoformat(), model.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """Decode a pagination cursor created by :meth:`encode_cursor`
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), int(row_id)
+        except (binascii.Error, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        order: str = "asc",
+    ) -> Response:
+        """List one page of entities using keyset pagination on (created_at, id)
+
+        Args:
+            model_class: The model class to list
+            filters: Column equality filters
+            limit: Maximum number of entities to return
+            cursor: The `next_cursor` of the previous page, or None for the first page
+            order: "asc" or "desc" by creation time
+
+        Returns:
+            Response: data is a dict with the page "items" and the "next_cursor",
+                which is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be 'asc' or 'desc'")
+        position = self.decode_cursor(cursor) if cursor else None
+
+        with Session(self.engine) as session:
+            try:
+                statement = select(model_class)  # type: ignore
+                if filters:
+                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
+                    statement = statement.where(and_(*conditions))
+
+                created_at_column = model_class.created_at
+                id_column = model_class.id
+                if position is not None:
+                    created_at, row_id = position
+                    if order == "asc":
+                        after = or_(
+                            created_at_column > created_at,  # type: ignore
+                            and_(created_at_column == created_at, id_column > row_id),  # type: ignore
+                        )
+                    else:
+                        after = or_(
+                            created_at_column < created_at,  # type: ignore
+                            and_(created_at_column == created_at, id_column < row_id),  # type: ignore
+                        )
+                    statement = statement.where(after)
+
+                statement = statement.order_by(
+                    getattr(created_at_column, order)(),
+                    getattr(id_column, order)(),
+                ).limit(limit + 1)
+
+                items = list(session.exec(statement).all())
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while getting page of {model_class.__name__}: {e}")
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False, data=None)
+
+        next_cursor = self.encode_cursor(items[limit - 1]) if len(items) > limit else None
+        return Response(
+            message=f"{model_class.__name__} Retrieved Successfully",
+            status=True,
+            data={"items": items[:limit], "next_cursor": next_cursor},
+        )
+
+    def iter_rows(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        order: str = "asc",
+        batch_size: int = 500,
+    ) -> Iterator[BaseDBModel]:
+        """Iterate over entities ordered by (created_at, id), fetching `batch_size` rows at a time
+
+        Unlike :meth:`get`, rows are not all loaded in memory at once, which makes this
+        suitable for streaming large results. The database session stays open until the
+        iterator is exhausted or closed.
+        """
+        with Session(self.engine) as session:
+            statement = select(model_class)  # type: ignore
+            if filters:
+                conditions = [getattr(model_class, col) == value for col, value in filters.items()]
+                statement = statement.where(and_(*conditions))
+            statement = statement.order_by(
+                getattr(model_class.created_at, order)(),
+                getattr(model_class.id, order)(),
+            ).execution_options(yield_per=batch_size)
+            yield from session.exec(statement)
+
+    def get_messages_for_runs(self, run_ids: Sequence[int]) -> Response:
+        """Get the messages of several runs with a single query
+
+        Returns:
+            Response: data maps each run id to its messages ordered by creation time
+        """
+        messages: Dict[int, List[Message]] = {run_id: [] for run_id in run_ids}
+        if not run_ids:
+            return Response(message="Message Retrieved Successfully", status=True, data=messages)
+
+        with Session(self.engine) as session:
+            try:
+                statement = (
+                    select(Message)
+                    .where(Message.run_id.in_(run_ids))  # type: ignore
+                    .order_by(Message.run_id, Message.created_at, Message.id)  # type: ignore
+                )
+                for message in session.exec(statement):
+                    messages[message.run_id].append(message)  # type: ignore
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while getting messages for runs: {e}")
+                return Response(message="Error while fetching Message", status=False, data=None)
+
+        return Response(message="Message Retrieved Successfully", status=True, data=messages)
+
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
         """Delete an entity"""
         status_message = ""
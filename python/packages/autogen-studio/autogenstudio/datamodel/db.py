@@ -6,7 +6,7 @@
 
 from autogen_core import ComponentModel
 from pydantic import ConfigDict, SecretStr, field_validator
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlmodel import JSON, Column, DateTime, Field, SQLModel, func
 
 from .eval import EvalJudgeCriteria, EvalRunResult, EvalRunStatus, EvalScore, EvalTask
@@ -54,7 +54,11 @@ class Team(BaseDBModel, table=True):
 
 
 class Message(BaseDBModel, table=True):
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        # Covers listing the messages of a run in order
+        Index("ix_message_run_id_created_at", "run_id", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
 
     config: Union[MessageConfig, dict] = Field(
         default_factory=lambda: MessageConfig(source="", content=""), sa_column=Column(JSON)
@@ -91,7 +95,11 @@ class RunStatus(str, Enum):
 class Run(BaseDBModel, table=True):
     """Represents a single execution run within a session"""
 
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        # Covers listing the runs of a session in order
+        Index("ix_run_session_id_created_at", "session_id", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
 
     session_id: Optional[int] = Field(
         default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False)
@@ -1,3 +1,4 @@
+from .team_cache import TeamCache
 from .teammanager import TeamManager
 
-__all__ = ["TeamManager"]
+__all__ = ["TeamManager", "TeamCache"]
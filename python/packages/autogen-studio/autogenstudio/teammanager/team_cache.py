@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from autogen_agentchat.teams import BaseGroupChat
+
+from ..datamodel.types import EnvironmentVariable
+
+logger = logging.getLogger(__name__)
+
+
+async def close_team(team: BaseGroupChat) -> None:
+    """Close every participant of a team"""
+    for agent in team._participants:
+        if hasattr(agent, "close"):
+            await agent.close()
+
+
+@dataclass
+class _TeamTemplate:
+    """The idle instances of one team config, with the time each was released"""
+
+    idle: List[Tuple[BaseGroupChat, float]] = field(default_factory=list)
+
+
+class TeamCache:
+    """Pool of prebuilt team instances, keyed by the hash of their config.
+
+    Loading a team builds every agent, model client, tool and workbench again, so a team
+    that finished a run is reset and kept for the next run of the same config instead.
+
+    Args:
+        max_templates: Number of team configs to keep idle instances for. The least recently
+            used config is evicted first.
+        max_idle_per_template: Number of idle instances to keep for one config. Concurrent runs
+            of the same config each get their own instance.
+        idle_timeout: Seconds after which an idle instance is closed.
+    """
+
+    def __init__(self, max_templates: int = 16, max_idle_per_template: int = 2, idle_timeout: float = 600):
+        self.max_templates = max_templates
+        self.max_idle_per_template = max_idle_per_template
+        self.idle_timeout = idle_timeout
+        self._templates: OrderedDict[str, _TeamTemplate] = OrderedDict()
+        # The config key of every team handed out, by id of the team
+        self._in_use: Dict[int, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self._sweeper: Optional[asyncio.Task[None]] = None
+
+    @staticmethod
+    def config_key(config: dict, env_vars: Optional[List[EnvironmentVariable]] = None) -> str:
+        """Hash of a team config, and the environment variables it is loaded with"""
+        payload = {"config": config, "env": sorted((var.name, var.value) for var in env_vars or [])}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def acquire(self, key: str, factory: Callable[[], BaseGroupChat]) -> BaseGroupChat:
+        """Reset and return an idle instance of the config, or build a new one with the factory"""
+        expired = self._take_expired()
+        template = self._templates.setdefault(key, _TeamTemplate())
+        self._templates.move_to_end(key)
+        while len(self._templates) > self.max_templates:
+            _, evicted = self._templates.popitem(last=False)
+            expired.extend(team for team, _ in evicted.idle)
+        idle = template.idle.pop()[0] if template.idle else None
+
+        for team in expired:
+            await self._close(team)
+
+        if idle is not None:
+            try:
+                await idle.reset()
+                self.hits += 1
+                self._in_use[id(idle)] = key
+                return idle
+            except Exception as e:
+                logger.warning(f"Failed to reset cached team, building a new one: {e}")
+                await self._close(idle)
+
+        self.misses += 1
+        team = factory()
+        self._in_use[id(team)] = key
+        return team
+
+    async def release(self, team: BaseGroupChat, reusable: bool = True) -> None:
+        """Return a team after its run. It is closed unless it is reusable and there is room for it"""
+        key = self._in_use.pop(id(team), None)
+        template = self._templates.get(key) if key is not None else None
+        if reusable and template is not None and len(template.idle) < self.max_idle_per_template:
+            template.idle.append((team, time.monotonic()))
+        else:
+            await self._close(team)
+        await self.sweep()
+
+    async def sweep(self) -> None:
+        """Close the idle instances that exceeded the idle timeout"""
+        for team in self._take_expired():
+            await self._close(team)
+
+    def start_sweeper(self, interval: Optional[float] = None) -> None:
+        """Sweep periodically in the background, so idle instances are closed even when no runs come in.
+        Defaults to sweeping every minute, or every idle timeout if that is shorter."""
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = asyncio.create_task(self._sweep_loop(interval or min(60.0, self.idle_timeout)))
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background sweep started by start_sweeper"""
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is None:
+            return
+        sweeper.cancel()
+        try:
+            await sweeper
+        except asyncio.CancelledError:
+            pass
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Error sweeping idle teams: {e}")
+
+    async def clear(self) -> None:
+        """Close all idle instances"""
+        templates, self._templates = self._templates, OrderedDict()
+        for template in templates.values():
+            for team, _ in template.idle:
+                await self._close(team)
+
+    def _take_expired(self) -> List[BaseGroupChat]:
+        deadline = time.monotonic() - self.idle_timeout
+        expired: List[BaseGroupChat] = []
+        for template in self._templates.values():
+            expired.extend(team for team, released in template.idle if released < deadline)
+            template.idle = [(team, released) for team, released in template.idle if released >= deadline]
+        return expired
+
+    async def _close(self, team: BaseGroupChat) -> None:
+        try:
+            await close_team(team)
+        except Exception as e:
+            logger.error(f"Error closing cached team: {e}")
@@ -3,12 +3,14 @@
 import logging
 import os
 import time
+from inspect import iscoroutinefunction
 from pathlib import Path
 from typing import AsyncGenerator, Callable, List, Optional, Sequence, Union
 
 import aiofiles
 import yaml
 from autogen_agentchat.agents import UserProxyAgent
+from autogen_agentchat.agents._user_proxy_agent import cancellable_input
 from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
 from autogen_agentchat.teams import BaseGroupChat
@@ -17,6 +19,7 @@
 
 from ..datamodel.types import EnvironmentVariable, LLMCallEventMessage, TeamResult
 from ..web.managers.run_context import RunContext
+from .team_cache import TeamCache, close_team
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +39,11 @@ def emit(self, record: logging.LogRecord):
 class TeamManager:
     """Manages team operations including loading configs and running teams"""
 
-    def __init__(self):
+    def __init__(self, team_cache: Optional[TeamCache] = None):
         self._team: Optional[BaseGroupChat] = None
         self._run_context = RunContext()
+        # Teams are loaded again for every run unless a cache is given
+        self._team_cache = team_cache
 
     @staticmethod
     async def load_from_file(path: Union[str, Path]) -> dict:
@@ -92,14 +97,27 @@ async def _create_team(
             for var in env_vars:
                 os.environ[var.name] = var.value
 
-        self._team = BaseGroupChat.load_component(config)
+        if self._team_cache is not None:
+            key = self._team_cache.config_key(config, env_vars)
+            self._team = await self._team_cache.acquire(key, lambda: BaseGroupChat.load_component(config))
+        else:
+            self._team = BaseGroupChat.load_component(config)
 
+        # A cached team still holds the input function of its previous run, so it is set on every acquire
         for agent in self._team._participants:
-            if hasattr(agent, "input_func") and isinstance(agent, UserProxyAgent) and input_func:
-                agent.input_func = input_func
+            if isinstance(agent, UserProxyAgent):
+                agent.input_func = input_func or cancellable_input
+                agent._is_async = iscoroutinefunction(agent.input_func)
 
         return self._team
 
+    async def _release_team(self, team: BaseGroupChat, reusable: bool) -> None:
+        """Return a team to the cache after its run, or close it"""
+        if self._team_cache is not None:
+            await self._team_cache.release(team, reusable=reusable)
+        elif hasattr(team, "_participants"):
+            await close_team(team)
+
     async def run_stream(
         self,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None,
@@ -111,6 +129,7 @@ async def run_stream(
         """Stream team execution results"""
         start_time = time.time()
         team = None
+        completed = False
 
         # Setup logger correctly
         logger = logging.getLogger(EVENT_LOGGER_NAME)
@@ -126,6 +145,7 @@ async def run_stream(
                     break
 
                 if isinstance(message, TaskResult):
+                    completed = True
                     yield TeamResult(task_result=message, usage="", duration=time.time() - start_time)
                 else:
                     yield message
@@ -139,11 +159,9 @@ async def run_stream(
             if llm_event_logger in logger.handlers:
                 logger.handlers.remove(llm_event_logger)
 
-            # Ensure cleanup happens
-            if team and hasattr(team, "_participants"):
-                for agent in team._participants:
-                    if hasattr(agent, "close"):
-                        await agent.close()
+            # Only a team that finished its run can be reset and reused
+            if team:
+                await self._release_team(team, reusable=completed)
 
     async def run(
         self,
@@ -156,15 +174,15 @@ async def run(
         """Run team synchronously"""
         start_time = time.time()
         team = None
+        completed = False
 
         try:
             team = await self._create_team(team_config, input_func, env_vars)
             result = await team.run(task=task, cancellation_token=cancellation_token)
+            completed = True
 
             return TeamResult(task_result=result, usage="", duration=time.time() - start_time)
 
         finally:
-            if team and hasattr(team, "_participants"):
-                for agent in team._participants:
-                    if hasattr(agent, "close"):
-                        await agent.close()
+            if team:
+                await self._release_team(team, reusable=completed)
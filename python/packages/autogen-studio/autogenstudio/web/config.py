@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     CONFIG_DIR: str = "configs"  # Default config directory relative to app_root
     DEFAULT_USER_ID: str = "guestuser@gmail.com"
     UPGRADE_DATABASE: bool = False
+    TEAM_CACHE_SIZE: int = 16  # Team configs with prebuilt instances kept for reuse
+    TEAM_POOL_SIZE: int = 2  # Idle instances kept per team config
+    TEAM_IDLE_TIMEOUT: int = 600  # 10 minutes
 
     model_config = {"env_prefix": "AUTOGENSTUDIO_"}
 
@@ -8,7 +8,7 @@
 from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, status
 
 from ..database import DatabaseManager
-from ..teammanager import TeamManager
+from ..teammanager import TeamCache, TeamManager
 from .auth import AuthConfig, AuthManager, AuthMiddleware
 from .auth.dependencies import get_auth_manager
 from .config import settings
@@ -19,6 +19,7 @@
 # Global manager instances
 _db_manager: Optional[DatabaseManager] = None
 _websocket_manager: Optional[WebSocketManager] = None
+_team_cache: Optional[TeamCache] = None
 _team_manager: Optional[TeamManager] = None
 _auth_manager: Optional[AuthManager] = None
 # Context manager for database sessions
@@ -118,7 +119,7 @@ async def register_auth_dependencies(app: FastAPI, auth_manager: AuthManager) ->
 
 async def init_managers(database_uri: str, config_dir: str | Path, app_root: str | Path) -> None:
     """Initialize all manager instances"""
-    global _db_manager, _websocket_manager, _team_manager
+    global _db_manager, _websocket_manager, _team_manager, _team_cache
 
     logger.info("Initializing managers...")
 
@@ -130,12 +131,20 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
         # init default team config
         await _db_manager.import_teams_from_directory(config_dir, settings.DEFAULT_USER_ID, check_exists=True)
 
+        # Prebuilt teams shared by all runs
+        team_cache = _team_cache = TeamCache(
+            max_templates=settings.TEAM_CACHE_SIZE,
+            max_idle_per_template=settings.TEAM_POOL_SIZE,
+            idle_timeout=settings.TEAM_IDLE_TIMEOUT,
+        )
+        team_cache.start_sweeper()
+
         # Initialize connection manager
-        _websocket_manager = WebSocketManager(db_manager=_db_manager)
+        _websocket_manager = WebSocketManager(db_manager=_db_manager, team_cache=team_cache)
         logger.info("Connection manager initialized")
 
         # Initialize team manager
-        _team_manager = TeamManager()
+        _team_manager = TeamManager(team_cache=team_cache)
         logger.info("Team manager initialized")
 
     except Exception as e:
@@ -146,10 +155,15 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
 
 async def cleanup_managers() -> None:
     """Cleanup and shutdown all manager instances"""
-    global _db_manager, _websocket_manager, _team_manager, _auth_manager
+    global _db_manager, _websocket_manager, _team_manager, _auth_manager, _team_cache
 
     logger.info("Cleaning up managers...")
 
+    # Stop closing idle teams in the background, the connection manager closes the rest
+    if _team_cache:
+        await _team_cache.stop_sweeper()
+        _team_cache = None
+
     # Cleanup connection manager first to ensure all active connections are closed
     if _websocket_manager:
         try:
@@ -21,7 +21,7 @@
 from autogen_core import Image as AGImage
 from fastapi import WebSocket, WebSocketDisconnect
 
-from ...database import DatabaseManager
+from ...database import BatchWriter, DatabaseManager
 from ...datamodel import (
     LLMCallEventMessage,
     Message,
@@ -32,7 +32,7 @@
     SettingsConfig,
     TeamResult,
 )
-from ...teammanager import TeamManager
+from ...teammanager import TeamCache, TeamManager
 from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -41,8 +41,12 @@
 class WebSocketManager:
     """Manages WebSocket connections and message streaming for team task execution"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, team_cache: Optional[TeamCache] = None):
         self.db_manager = db_manager
+        # Prebuilt teams are reset and reused across runs of the same config
+        self._team_cache = team_cache if team_cache is not None else TeamCache()
+        # Streamed messages are persisted in batches from a background task
+        self._message_writer = BatchWriter(db_manager)
         self._connections: Dict[int, WebSocket] = {}
         self._cancellation_tokens: Dict[int, CancellationToken] = {}
         # Track explicitly closed connections
@@ -89,14 +93,17 @@ async def start_stream(
             raise ValueError(f"No active connection for run {run_id}")
 
         with RunContext.populate_context(run_id=run_id):
-            team_manager = TeamManager()
+            team_manager = TeamManager(team_cache=self._team_cache)
             cancellation_token = CancellationToken()
             self._cancellation_tokens[run_id] = cancellation_token
             final_result = None
+            session_id: Optional[int] = None
 
             try:
                 # Update run with task and status
                 run = await self._get_run(run_id)
+                if run is not None:
+                    session_id = run.session_id
 
                 if run is not None and run.user_id:
                     # get user Settings
@@ -136,10 +143,15 @@ async def start_stream(
                                 LLMCallEventMessage,
                             ),
                         ):
-                            await self._save_message(run_id, message)
+                            if run is not None:
+                                await self._save_message(run_id, session_id, message)
                         # Capture final result if it's a TeamResult
                         elif isinstance(message, TeamResult):
                             final_result = message.model_dump()
+
+                # Make sure all messages of the run are persisted before it is marked as done
+                await self._message_writer.flush()
+
                 if not cancellation_token.is_cancelled() and run_id not in self._closed_connections:
                     if final_result:
                         await self._update_run(run_id, RunStatus.COMPLETE, team_result=final_result)
@@ -162,24 +174,25 @@ async def start_stream(
             except Exception as e:
                 logger.error(f"Stream error for run {run_id}: {e}")
                 traceback.print_exc()
+                await self._message_writer.flush()
                 await self._handle_stream_error(run_id, e)
             finally:
                 self._cancellation_tokens.pop(run_id, None)
 
     async def _save_message(
-        self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
+        self,
+        run_id: int,
+        session_id: Optional[int],
+        message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage],
     ) -> None:
-        """Save a message to the database"""
-
-        run = await self._get_run(run_id)
-        if run:
-            db_message = Message(
-                session_id=run.session_id,
-                run_id=run_id,
-                config=self._convert_images_in_dict(message.model_dump()),
-                user_id=None,  # You might want to pass this from somewhere
-            )
-            self.db_manager.upsert(db_message)
+        """Queue a message to be saved to the database by the background writer"""
+        db_message = Message(
+            session_id=session_id,
+            run_id=run_id,
+            config=self._convert_images_in_dict(message.model_dump()),
+            user_id=None,  # You might want to pass this from somewhere
+        )
+        await self._message_writer.put(db_message)
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
@@ -283,7 +296,7 @@ def _convert_images_in_dict(self, obj: Any) -> Any:
             return [self._convert_images_in_dict(item) for item in obj]
         elif isinstance(obj, AGImage):  # Assuming you've imported AGImage
             # Convert the Image object to a serializable format
-            return {"type": "image", "url": f"data:image/png;base64,{obj.to_base64()}", "alt": "Image"}
+            return {"type": "image", "url": obj.data_uri, "alt": "Image"}
         else:
             return obj
 
@@ -466,6 +479,11 @@ async def cleanup(self) -> None:
                     except Exception as e:
                         logger.error(f"Error disconnecting run {run_id}: {e}")
 
+                # Persist any messages still buffered
+                await self._message_writer.close()
+
+                await self._team_cache.clear()
+
         except asyncio.TimeoutError:
             logger.warning("WebSocketManager cleanup timed out")
         except Exception as e:
@@ -1,7 +1,8 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Iterator, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ...datamodel import Message, Run, RunStatus, Session
@@ -57,9 +58,34 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
     return {"status": True, "data": run.data[0]}
 
 
-@router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
+def _stream_messages(db, run_id: int) -> Iterator[str]:
+    """Yield the messages of a run as chunks of a `{"status": true, "data": [...]}` JSON document"""
+    yield '{"status": true, "data": ['
+    for index, message in enumerate(db.iter_rows(Message, filters={"run_id": run_id}, order="asc")):
+        yield ("," if index else "") + message.model_dump_json()
+    yield "]}"
 
-    return {"status": True, "data": messages.data}
+
+@router.get("/{run_id}/messages", response_model=None)
+async def get_run_messages(
+    run_id: int,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db=Depends(get_db),
+) -> Union[Dict, StreamingResponse]:
+    """Get the messages of a run.
+
+    Without `limit`, the whole transcript is streamed as it is read from the database.
+    With `limit`, one page is returned along with a `next_cursor` to pass back for the following page.
+    """
+    if limit is None:
+        return StreamingResponse(_stream_messages(db, run_id), media_type="application/json")
+
+    try:
+        messages = db.get_page(Message, filters={"run_id": run_id}, limit=limit, cursor=cursor, order="asc")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not messages.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching messages")
+
+    return {"status": True, "data": messages.data["items"], "next_cursor": messages.data["next_cursor"]}
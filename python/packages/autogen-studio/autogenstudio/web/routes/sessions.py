@@ -1,21 +1,39 @@
 # api/routes/sessions.py
 import re
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
 
-from ...datamodel import Message, Response, Run, Session
+from ...datamodel import Response, Run, Session
 from ..deps import get_db
 
 router = APIRouter()
 
 
 @router.get("/")
-async def list_sessions(user_id: str, db=Depends(get_db)) -> Dict:
-    """List all sessions for a user"""
-    response = db.get(Session, filters={"user_id": user_id})
-    return {"status": True, "data": response.data}
+async def list_sessions(
+    user_id: str,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db=Depends(get_db),
+) -> Dict:
+    """List sessions for a user, newest first.
+
+    All sessions are returned unless `limit` is set, in which case one page is
+    returned along with a `next_cursor` to pass back for the following page.
+    """
+    if limit is None:
+        response = db.get(Session, filters={"user_id": user_id})
+        return {"status": True, "data": response.data}
+
+    try:
+        response = db.get_page(Session, filters={"user_id": user_id}, limit=limit, cursor=cursor, order="desc")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not response.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching sessions")
+    return {"status": True, "data": response.data["items"], "next_cursor": response.data["next_cursor"]}
 
 
 @router.get("/{session_id}")
@@ -64,8 +82,18 @@ async def delete_session(session_id: int, user_id: str, db=Depends(get_db)) -> D
 
 
 @router.get("/{session_id}/runs")
-async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
-    """Get complete session history organized by runs"""
+async def list_session_runs(
+    session_id: int,
+    user_id: str,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db=Depends(get_db),
+) -> Dict:
+    """Get session history organized by runs.
+
+    All runs are returned unless `limit` is set, in which case one page of runs is
+    returned along with a `next_cursor` to pass back for the following page.
+    """
 
     try:
         # 1. Verify session exists and belongs to user
@@ -76,48 +104,62 @@ async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -
             raise HTTPException(status_code=404, detail="Session not found or access denied")
 
         # 2. Get ordered runs for session
-        runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
-        if not runs.status:
-            raise HTTPException(status_code=500, detail="Database error while fetching runs")
-
-        # 3. Build response with messages per run
+        next_cursor = None
+        if limit is None:
+            runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+            if not runs.status:
+                raise HTTPException(status_code=500, detail="Database error while fetching runs")
+            session_runs = runs.data or []  # It's ok to have no runs
+        else:
+            try:
+                runs = db.get_page(Run, filters={"session_id": session_id}, limit=limit, cursor=cursor, order="asc")
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+            if not runs.status:
+                raise HTTPException(status_code=500, detail="Database error while fetching runs")
+            session_runs = runs.data["items"]
+            next_cursor = runs.data["next_cursor"]
+
+        # 3. Get the messages of all runs in a single query
+        messages = db.get_messages_for_runs([run.id for run in session_runs])
+        if not messages.status:
+            logger.error(f"Failed to fetch messages for session {session_id}")
+            # Continue returning the runs even if their messages could not be fetched
+        run_messages = messages.data or {}
+
+        # 4. Build response with messages per run
         run_data = []
-        if runs.data:  # It's ok to have no runs
-            for run in runs.data:
-                try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": run.status,
-                            "task": run.task,
-                            "team_result": run.team_result,
-                            "messages": messages.data or [],
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing run {run.id}: {str(e)}")
-                    # Include run with error state instead of failing entirely
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": "ERROR",
-                            "task": run.task,
-                            "team_result": None,
-                            "messages": [],
-                            "error": f"Failed to process run: {str(e)}",
-                        }
-                    )
-
-        return {"status": True, "data": {"runs": run_data}}
+        for run in session_runs:
+            try:
+                run_data.append(
+                    {
+                        "id": str(run.id),
+                        "created_at": run.created_at,
+                        "status": run.status,
+                        "task": run.task,
+                        "team_result": run.team_result,
+                        "messages": run_messages.get(run.id, []),
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Error processing run {run.id}: {str(e)}")
+                # Include run with error state instead of failing entirely
+                run_data.append(
+                    {
+                        "id": str(run.id),
+                        "created_at": run.created_at,
+                        "status": "ERROR",
+                        "task": run.task,
+                        "team_result": None,
+                        "messages": [],
+                        "error": f"Failed to process run: {str(e)}",
+                    }
+                )
+
+        data: Dict = {"runs": run_data}
+        if limit is not None:
+            data["next_cursor"] = next_cursor
+        return {"status": True, "data": data}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -1,9 +1,12 @@
 import asyncio 
+import json
+from datetime import datetime
 import pytest
 from sqlmodel import Session, text, select
-from typing import Generator
+from typing import Generator, List
 
-from autogenstudio.database import DatabaseManager
+from autogenstudio.database import BatchWriter, DatabaseManager
+from autogenstudio.datamodel import Response
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
@@ -188,3 +191,256 @@ def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         finally:
             asyncio.run(db.close())
             db.reset_db() 
+
+
+class TestBatchWriter:
+    @pytest.fixture
+    def sample_run(self, test_db: DatabaseManager, test_user: str) -> Run:
+        team = Team(user_id=test_user, component={"name": "Team1", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session1")
+        test_db.upsert(session)
+        run = Run(
+            user_id=test_user,
+            session_id=session.id,
+            status=RunStatus.ACTIVE,
+            task=MessageConfig(content="Task1", source="user").model_dump(),
+        )
+        test_db.upsert(run)
+        return run
+
+    def test_bulk_insert(self, test_db: DatabaseManager, sample_run: Run):
+        """Test inserting several messages in one transaction"""
+        messages = [
+            Message(
+                session_id=sample_run.session_id,
+                run_id=sample_run.id,
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+            for i in range(10)
+        ]
+        response = test_db.bulk_insert(messages)
+        assert response.status is True
+        assert response.data == 10
+
+        result = test_db.get(Message, {"run_id": sample_run.id}, order="asc")
+        assert [m.config["content"] for m in result.data] == [f"Message{i}" for i in range(10)]
+
+        assert test_db.bulk_insert([]).data == 0
+
+    def test_flush_and_close(self, test_db: DatabaseManager, sample_run: Run):
+        """Test that buffered messages are written on flush and on close"""
+        writer = BatchWriter(test_db, batch_size=8, flush_interval=10)
+
+        async def main() -> None:
+            for i in range(20):
+                await writer.put(
+                    Message(
+                        session_id=sample_run.session_id,
+                        run_id=sample_run.id,
+                        config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+                    )
+                )
+            # Flush must not wait for the (long) flush interval to elapse
+            await asyncio.wait_for(writer.flush(), timeout=5)
+            assert writer.pending == 0
+            assert writer.written == 20
+            assert len(test_db.get(Message, {"run_id": sample_run.id}).data) == 20
+
+            await writer.put(
+                Message(
+                    session_id=sample_run.session_id,
+                    run_id=sample_run.id,
+                    config=MessageConfig(content="Message20", source="assistant").model_dump(),
+                )
+            )
+            await writer.close()
+            assert writer.written == 21
+
+        asyncio.run(main())
+
+        result = test_db.get(Message, {"run_id": sample_run.id}, order="asc")
+        assert [m.config["content"] for m in result.data] == [f"Message{i}" for i in range(21)]
+
+    def test_bounded_buffer(self, test_db: DatabaseManager, sample_run: Run):
+        """Test that the buffer never holds more than max_buffer_size messages"""
+        writer = BatchWriter(test_db, batch_size=4, flush_interval=0.01, max_buffer_size=8)
+
+        async def main() -> None:
+            for i in range(50):
+                await writer.put(
+                    Message(
+                        session_id=sample_run.session_id,
+                        run_id=sample_run.id,
+                        config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+                    )
+                )
+                assert writer._queue is not None and writer._queue.qsize() <= 8
+            await writer.close()
+
+        asyncio.run(main())
+        assert writer.written == 50
+        assert writer.failed == 0
+
+    def test_failed_batch(self, test_db: DatabaseManager, sample_run: Run, monkeypatch):
+        """Test that a failed write is counted and does not block flush"""
+        writer = BatchWriter(test_db, batch_size=4)
+        monkeypatch.setattr(test_db, "bulk_insert", lambda models: Response(message="error", status=False))
+
+        async def main() -> None:
+            for _ in range(6):
+                await writer.put(Message(session_id=sample_run.session_id, run_id=sample_run.id))
+            await asyncio.wait_for(writer.flush(), timeout=5)
+            await writer.close()
+
+        asyncio.run(main())
+        assert writer.failed == 6
+        assert writer.written == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_writes(self, test_db: DatabaseManager, sample_run: Run, monkeypatch):
+        """Test that buffered messages are persisted in one transaction per batch"""
+        num_messages = 500
+        batch_sizes: List[int] = []
+        bulk_insert = test_db.bulk_insert
+
+        def counting_bulk_insert(models):
+            batch_sizes.append(len(models))
+            return bulk_insert(models)
+
+        monkeypatch.setattr(test_db, "bulk_insert", counting_bulk_insert)
+        writer = BatchWriter(test_db)
+        for i in range(num_messages):
+            await writer.put(
+                Message(
+                    session_id=sample_run.session_id,
+                    run_id=sample_run.id,
+                    config=MessageConfig(content=f"Message{i} " + "x" * 200, source="assistant").model_dump(),
+                )
+            )
+        await writer.flush()
+        await writer.close()
+
+        # The messages were all buffered before the writer ran, so every batch is full
+        assert batch_sizes == [writer.batch_size] * (num_messages // writer.batch_size)
+        assert writer.written == num_messages
+        assert len(test_db.get(Message, {"run_id": sample_run.id}).data) == num_messages
+
+
+class TestPagination:
+    @pytest.fixture
+    def sample_session(self, test_db: DatabaseManager, test_user: str) -> SessionModel:
+        team = Team(user_id=test_user, component={"name": "Team1", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session1")
+        test_db.upsert(session)
+        return session
+
+    def _add_runs(self, test_db: DatabaseManager, session: SessionModel, num_runs: int, messages_per_run: int) -> list[Run]:
+        runs = []
+        for i in range(num_runs):
+            run = Run(
+                user_id=session.user_id,
+                session_id=session.id,
+                status=RunStatus.COMPLETE,
+                task=MessageConfig(content=f"Task{i}", source="user").model_dump(),
+            )
+            test_db.upsert(run)
+            runs.append(run)
+            test_db.bulk_insert(
+                [
+                    Message(
+                        session_id=session.id,
+                        run_id=run.id,
+                        config=MessageConfig(content=f"Run{i}Message{j}", source="assistant").model_dump(),
+                    )
+                    for j in range(messages_per_run)
+                ]
+            )
+        return runs
+
+    def test_get_page(self, test_db: DatabaseManager, sample_session: SessionModel):
+        """Test walking all runs of a session page by page in both orders"""
+        runs = self._add_runs(test_db, sample_session, num_runs=7, messages_per_run=0)
+
+        for order, expected in (("asc", [run.id for run in runs]), ("desc", [run.id for run in reversed(runs)])):
+            seen = []
+            cursor = None
+            while True:
+                response = test_db.get_page(
+                    Run, filters={"session_id": sample_session.id}, limit=3, cursor=cursor, order=order
+                )
+                assert response.status is True
+                assert len(response.data["items"]) <= 3
+                seen.extend(run.id for run in response.data["items"])
+                cursor = response.data["next_cursor"]
+                if cursor is None:
+                    break
+            assert seen == expected
+
+    def test_get_page_messages_with_same_timestamp(self, test_db: DatabaseManager, sample_session: SessionModel):
+        """Test that rows sharing a creation time are neither skipped nor repeated across pages"""
+        runs = self._add_runs(test_db, sample_session, num_runs=1, messages_per_run=0)
+        created_at = datetime.now()
+        test_db.bulk_insert(
+            [
+                Message(
+                    session_id=sample_session.id,
+                    run_id=runs[0].id,
+                    created_at=created_at,
+                    config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+                )
+                for i in range(5)
+            ]
+        )
+
+        contents = []
+        cursor = None
+        while True:
+            response = test_db.get_page(Message, filters={"run_id": runs[0].id}, limit=2, cursor=cursor)
+            contents.extend(message.config["content"] for message in response.data["items"])
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                break
+        assert contents == [f"Message{i}" for i in range(5)]
+
+    def test_indexes_added_to_existing_database(self, test_db: DatabaseManager, monkeypatch):
+        """Test that initializing a database created before the indexes were declared adds them"""
+        from sqlalchemy import inspect
+
+        indexes = {"message": "ix_message_run_id_created_at", "run": "ix_run_session_id_created_at"}
+        with test_db.engine.begin() as conn:
+            for name in indexes.values():
+                conn.execute(text(f"DROP INDEX {name}"))
+        monkeypatch.setattr(test_db.schema_manager, "check_schema_status", lambda: (False, None))
+
+        for _ in range(2):
+            assert test_db.initialize_database().status is True
+            inspector = inspect(test_db.engine)
+            for table, name in indexes.items():
+                assert name in [index["name"] for index in inspector.get_indexes(table)]
+
+    def test_invalid_cursor(self, test_db: DatabaseManager):
+        with pytest.raises(ValueError):
+            test_db.get_page(Run, cursor="not-a-cursor")
+
+    def test_get_messages_for_runs(self, test_db: DatabaseManager, sample_session: SessionModel):
+        """Test fetching the messages of several runs in one query"""
+        runs = self._add_runs(test_db, sample_session, num_runs=3, messages_per_run=4)
+        response = test_db.get_messages_for_runs([run.id for run in runs] + [12345])
+        assert response.status is True
+        for i, run in enumerate(runs):
+            assert [m.config["content"] for m in response.data[run.id]] == [f"Run{i}Message{j}" for j in range(4)]
+        assert response.data[12345] == []
+
+    def test_stream_run_messages(self, test_db: DatabaseManager, sample_session: SessionModel):
+        """Test that the streamed transcript is a valid JSON document with all messages in order"""
+        from autogenstudio.web.routes.runs import _stream_messages
+
+        runs = self._add_runs(test_db, sample_session, num_runs=2, messages_per_run=1200)
+        document = json.loads("".join(_stream_messages(test_db, runs[1].id)))
+        assert document["status"] is True
+        assert [m["config"]["content"] for m in document["data"]] == [f"Run1Message{j}" for j in range(1200)]
+
+        document = json.loads("".join(_stream_messages(test_db, 12345)))
+        assert document == {"status": True, "data": []}
@@ -5,7 +5,7 @@
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from autogenstudio.teammanager import TeamManager
+from autogenstudio.teammanager import TeamCache, TeamManager
 from autogenstudio.datamodel.types import TeamResult, EnvironmentVariable
 from autogen_core import CancellationToken
 
@@ -147,3 +147,127 @@ async def mock_run_stream(*args, **kwargs):
             # Verify the last message is a TeamResult
             assert isinstance(streamed_messages[-1], type(mock_messages[-1]))
  
+
+
+def _mock_team():
+    team = MagicMock()
+    team.reset = AsyncMock()
+    agent = MagicMock()
+    agent.close = AsyncMock()
+    team._participants = [agent]
+    return team
+
+
+class TestTeamCache:
+
+    @pytest.mark.asyncio
+    async def test_reuses_idle_teams(self):
+        """Test that a released team is reset and reused for the same config"""
+        cache = TeamCache(max_idle_per_template=1)
+        key = cache.config_key({"provider": "team"})
+        assert key == cache.config_key({"provider": "team"})
+        assert key != cache.config_key({"provider": "team"}, [EnvironmentVariable(name="KEY", value="1")])
+
+        first = await cache.acquire(key, _mock_team)
+        # Concurrent runs of one config get their own instances
+        second = await cache.acquire(key, _mock_team)
+        assert first is not second
+        await cache.release(first)
+        await cache.release(second)
+        # The pool only keeps one idle instance
+        second._participants[0].close.assert_awaited_once()
+
+        team = await cache.acquire(key, _mock_team)
+        assert team is first
+        first.reset.assert_awaited_once()
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # A team that did not finish its run is closed
+        await cache.release(team, reusable=False)
+        first._participants[0].close.assert_awaited_once()
+        assert await cache.acquire(key, _mock_team) is not first
+
+    @pytest.mark.asyncio
+    async def test_evicts_teams(self):
+        """Test that idle teams are closed when their config is evicted or they time out"""
+        cache = TeamCache(max_templates=1)
+        first = await cache.acquire("a", _mock_team)
+        await cache.release(first)
+        second = await cache.acquire("b", _mock_team)
+        first._participants[0].close.assert_awaited_once()
+
+        cache.idle_timeout = 0
+        await cache.release(second)
+        await cache.acquire("b", _mock_team)
+        second._participants[0].close.assert_awaited_once()
+
+        await cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_team_manager_with_cache(self):
+        """Test that the team manager only loads an unchanged team once"""
+        team_manager = TeamManager(team_cache=TeamCache())
+        config = {"provider": "team", "config": {}}
+
+        with patch("autogen_agentchat.base.Team.load_component") as mock_load:
+            mock_load.side_effect = lambda _: _mock_team()
+            for _ in range(3):
+                team = await team_manager._create_team(config)
+                await team_manager._release_team(team, reusable=True)
+            assert mock_load.call_count == 1
+            assert team.reset.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sweeper_closes_idle_teams(self):
+        """Test that idle teams time out without another run acquiring a team"""
+        cache = TeamCache(idle_timeout=60)
+        team = await cache.acquire("a", _mock_team)
+        await cache.release(team)
+
+        cache.start_sweeper(interval=0.01)
+        await asyncio.sleep(0.05)
+        team._participants[0].close.assert_not_awaited()
+
+        cache.idle_timeout = 0
+        await asyncio.sleep(0.05)
+        team._participants[0].close.assert_awaited_once()
+
+        await cache.stop_sweeper()
+        await cache.stop_sweeper()
+
+    @pytest.mark.asyncio
+    async def test_team_manager_resets_input_func(self):
+        """Test that a reused user proxy does not keep the input function of the previous run"""
+        from autogen_agentchat.agents import UserProxyAgent
+        from autogen_agentchat.agents._user_proxy_agent import cancellable_input
+
+        team_manager = TeamManager(team_cache=TeamCache())
+        config = {"provider": "team", "config": {}}
+
+        async def websocket_input(prompt, cancellation_token):
+            return "from the websocket"
+
+        def console_input(prompt):
+            return "from the console"
+
+        def team_with_user_proxy():
+            team = _mock_team()
+            team._participants = [UserProxyAgent("user")]
+            return team
+
+        with patch("autogen_agentchat.base.Team.load_component") as mock_load:
+            mock_load.side_effect = lambda _: team_with_user_proxy()
+
+            team = await team_manager._create_team(config, input_func=websocket_input)
+            user_proxy = team._participants[0]
+            assert user_proxy.input_func is websocket_input
+            await team_manager._release_team(team, reusable=True)
+
+            assert await team_manager._create_team(config) is team
+            assert user_proxy.input_func is cancellable_input
+            await team_manager._release_team(team, reusable=True)
+
+            await team_manager._create_team(config, input_func=console_input)
+            assert user_proxy.input_func is console_input
+            assert await user_proxy._get_input("", None) == "from the console"
+            assert mock_load.call_count == 1